@@ -0,0 +1,265 @@
+# noqa: INP001
+r"""Script to benchmark some resolvers against their naive
+implementation."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import math
+import statistics
+import timeit
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from omegaconf import OmegaConf
+import torch
+
+from hya.numpy import array_to_base64, to_array_resolver
+from hya.resolvers import (
+    add_resolver,
+    argmax_resolver,
+    iter_join_resolver,
+    max_resolver,
+    mean_resolver,
+    mul_resolver,
+    quantile_resolver,
+    std_resolver,
+    sum_resolver,
+)
+from hya.torch import to_tensor_resolver
+from hya.utils.cache import get_result_cache, memoize
+from hya.utils.tensor_pack import TensorPack
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+def measure(func: Callable[..., Any], *args: Any, number: int = 5) -> float:
+    r"""Return the best execution time of a function call.
+
+    Args:
+        func: The function to call.
+        *args: The positional arguments of the function.
+        number: The number of times the function is called.
+
+    Returns:
+        The best execution time in seconds.
+    """
+    return min(timeit.repeat(lambda: func(*args), number=1, repeat=number))
+
+
+def compare(name: str, baseline: Callable[..., Any], func: Callable[..., Any], *args: Any) -> None:
+    r"""Log the execution time of a function and its baseline.
+
+    Args:
+        name: The name of the benchmark.
+        baseline: The baseline implementation.
+        func: The implementation to benchmark.
+        *args: The positional arguments of the functions.
+    """
+    baseline_time = measure(baseline, *args)
+    func_time = measure(func, *args)
+    logger.info(
+        f"{name:<40} baseline: {baseline_time * 1e3:10.3f} ms  "
+        f"resolver: {func_time * 1e3:10.3f} ms  speedup: {baseline_time / func_time:8.1f}x"
+    )
+
+
+def fold_add(*args: Any) -> Any:
+    r"""Add the values with a left fold, like the previous
+    implementation of ``add_resolver``."""
+    output = args[0]
+    for arg in args[1:]:
+        output += arg
+    return output
+
+
+def fold_mul(*args: Any) -> Any:
+    r"""Multiply the values with a left fold, like the previous
+    implementation of ``mul_resolver``."""
+    output = args[0]
+    for arg in args[1:]:
+        output *= arg
+    return output
+
+
+def naive_iter_join(iterable: Any, separator: str) -> str:
+    r"""Join the items, like the previous implementation of
+    ``iter_join_resolver``."""
+    return separator.join(map(str, iterable))
+
+
+def naive_argmax(values: Any) -> int:
+    r"""Return the index of the maximum value with Python."""
+    return max(range(len(values)), key=values.__getitem__)
+
+
+def naive_quantile(values: Any, q: list[float]) -> list[float]:
+    r"""Return the quantiles with ``statistics``."""
+    quartiles = statistics.quantiles(values, n=4, method="inclusive")
+    return [quartiles[int(prob * 4) - 1] for prob in q]
+
+
+def benchmark_add_mul() -> None:
+    r"""Benchmark ``add_resolver`` and ``mul_resolver``."""
+    for n in [2, 10, 100, 1_000, 10_000]:
+        compare(f"add ints (n={n:,})", fold_add, add_resolver, *range(n))
+        compare(f"add floats (n={n:,})", fold_add, add_resolver, *[0.1] * n)
+        compare(f"add strs (n={n:,})", fold_add, add_resolver, *["abcd"] * n)
+        compare(f"add tuples (n={n:,})", fold_add, add_resolver, *[(1, 2, 3)] * n)
+        compare(f"mul floats (n={n:,})", fold_mul, mul_resolver, *[1.0001] * n)
+
+
+def benchmark_iter_join() -> None:
+    r"""Benchmark ``iter_join_resolver``."""
+    for n in [1_000, 100_000, 1_000_000]:
+        names = OmegaConf.create({"names": [f"shard-{i:06d}.tar" for i in range(n)]}).names
+        compare(f"iter_join ListConfig (n={n:,})", naive_iter_join, iter_join_resolver, names, ",")
+
+
+def benchmark_reductions() -> None:
+    r"""Benchmark the reduction resolvers on a config entry with 1M
+    values, like custom resolvers implemented with ``math`` and
+    ``statistics``."""
+    n = 1_000_000
+    values = OmegaConf.create({"scores": [(i * 7919 % n) / n for i in range(n)]}).scores
+    q = [0.25, 0.5, 0.75]
+    compare(f"sum ListConfig (n={n:,})", math.fsum, sum_resolver, values)
+    compare(f"mean ListConfig (n={n:,})", statistics.fmean, mean_resolver, values)
+    compare(f"std ListConfig (n={n:,})", statistics.pstdev, std_resolver, values)
+    compare(f"quantile ListConfig (n={n:,})", naive_quantile, quantile_resolver, values, q)
+    compare(f"argmax ListConfig (n={n:,})", naive_argmax, argmax_resolver, values)
+    compare(f"max ListConfig (n={n:,})", max, max_resolver, values)
+
+
+def benchmark_to_array() -> None:
+    r"""Benchmark ``to_array_resolver`` on config entries, like
+    ``numpy.array``."""
+    for n in [1_000, 100_000, 1_000_000]:
+        values = OmegaConf.create({"data": [i * 0.5 for i in range(n)]}).data
+        compare(f"np.array ListConfig (n={n:,})", np.array, to_array_resolver, values)
+    matrix = OmegaConf.create({"matrix": [[float(i)] * 100 for i in range(1_000)]}).matrix
+    compare("np.array nested ListConfig (1,000x100)", np.array, to_array_resolver, matrix)
+
+
+def benchmark_to_tensor() -> None:
+    r"""Benchmark ``to_tensor_resolver`` on config entries and arrays,
+    like ``torch.tensor``."""
+    for n in [1_000, 100_000]:
+        values = OmegaConf.create({"data": [i * 0.5 for i in range(n)]}).data
+        compare(f"torch.tensor ListConfig (n={n:,})", torch.tensor, to_tensor_resolver, values)
+    array = np.random.default_rng(0).normal(size=1_000_000)
+    compare("torch.tensor ndarray (n=1,000,000)", torch.tensor, to_tensor_resolver, array)
+
+
+def resolve_key(interpolation: str) -> Any:
+    r"""Create a config with an interpolation and resolve it."""
+    return OmegaConf.create({"key": interpolation}).key
+
+
+def benchmark_constructors() -> None:
+    r"""Benchmark the array constructors, like ``hya.np.zeros``, and the
+    arrays written as literal lists."""
+    for n in [100, 1_000]:
+        literal = f"${{hya.np.array:[{', '.join(['0'] * n)}]}}"
+        zeros = f"${{hya.np.zeros:{n}}}"
+        logger.info(
+            f"{f'np.array literal vs np.zeros (n={n:,})':<40} "
+            f"literal: {measure(resolve_key, literal) * 1e3:10.3f} ms  "
+            f"zeros: {measure(resolve_key, zeros) * 1e3:10.3f} ms"
+        )
+
+
+def create_and_resolve(data: Any, interpolation: str) -> Any:
+    r"""Create a config with a data value and an interpolation, and
+    resolve it."""
+    return OmegaConf.create({"data": data, "key": interpolation}).key
+
+
+def benchmark_frombytes() -> None:
+    r"""Benchmark the arrays encoded in base64 with ``hya.np.frombytes``,
+    and the arrays stored as lists."""
+    for n in [1_000, 100_000]:
+        values = np.random.default_rng(0).normal(size=n)
+        compare(
+            f"list vs np.frombytes (n={n:,})",
+            functools.partial(create_and_resolve, values.tolist(), "${hya.np.array:${data}}"),
+            functools.partial(
+                create_and_resolve, array_to_base64(values), "${hya.np.frombytes:${data},float64}"
+            ),
+        )
+
+
+def resolve_configs(configs: list[Any]) -> list[Any]:
+    r"""Resolve the ``array`` entry of the configs."""
+    return [config.array for config in configs]
+
+
+def benchmark_memoize() -> None:
+    r"""Benchmark the process-wide result cache on sweep configs that
+    contain the same ``hya.np.array`` interpolation."""
+    OmegaConf.register_new_resolver(
+        "bench.memoized_array", memoize("bench.memoized_array")(to_array_resolver), replace=True
+    )
+    table = list(range(10_000))
+    n = 20
+    configs = {
+        key: [
+            OmegaConf.create({"lr": i, "table": table, "array": f"${{{key}:${{table}}}}"})
+            for i in range(n)
+        ]
+        for key in ["hya.np.array", "bench.memoized_array"]
+    }
+    compare(
+        f"np.array in {n} configs (n={len(table):,})",
+        lambda: resolve_configs(configs["hya.np.array"]),
+        lambda: resolve_configs(configs["bench.memoized_array"]),
+    )
+    logger.info(f"{get_result_cache().stats}")
+
+
+def move_tensors(tensors: dict[str, torch.Tensor], device: str) -> dict[str, torch.Tensor]:
+    r"""Move the tensors to a device one by one."""
+    return {key: tensor.to(device) for key, tensor in tensors.items()}
+
+
+def benchmark_tensor_pack() -> None:
+    r"""Benchmark the transfer of many small tensors packed in a
+    ``TensorPack``, and the transfer of the tensors one by one.
+
+    Without GPU, the tensors are moved to the ``meta`` device, which
+    measures the overhead of the allocations and the calls.
+    """
+    device = "cuda" if torch.cuda.is_available() else "meta"
+    n = 1_000
+    tensors = {f"layers.{i}.scale": torch.rand(16) for i in range(n)}
+    pack = TensorPack(tensors)
+    logger.info(
+        f"{f'TensorPack pack (n={n:,})':<40} time: {measure(TensorPack, tensors) * 1e3:10.3f} ms"
+    )
+    compare(
+        f"tensors vs TensorPack .to({device}) (n={n:,})",
+        lambda: move_tensors(tensors, device),
+        lambda: pack.to(device),
+    )
+
+
+def main() -> None:
+    r"""Run the benchmarks."""
+    benchmark_add_mul()
+    benchmark_iter_join()
+    benchmark_reductions()
+    benchmark_to_array()
+    benchmark_to_tensor()
+    benchmark_constructors()
+    benchmark_frombytes()
+    benchmark_memoize()
+    benchmark_tensor_pack()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
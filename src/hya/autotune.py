@@ -0,0 +1,468 @@
+r"""Implement a resolver to select the best candidate value with a
+micro-benchmark, and to cache the result on disk.
+
+A probe is a function that runs a micro-benchmark for a candidate
+value, e.g. a number of threads. The probes are registered in the
+probe registry, and ``hya.autotune:<probe>,<candidates>`` returns the
+candidate with the lowest cost. The result is stored in a JSON cache
+file keyed by the hostname, the CPU model, the probe, its version and
+the candidates, so the probe runs once per machine.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "AUTOTUNE_CACHE_ENV",
+    "Probe",
+    "autotune",
+    "autotune_resolver",
+    "clear_autotune_results",
+    "get_autotune_cache_path",
+    "get_machine_key",
+    "get_probe_registry",
+    "register_probe",
+]
+
+import contextlib
+import functools
+import json
+import logging
+import os
+from pathlib import Path
+import platform
+import socket
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from hya.registry import ResolverRegistry
+from hya.utils.containers import to_primitive
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+AUTOTUNE_CACHE_ENV = "HYA_AUTOTUNE_CACHE"
+
+_LOCK = threading.RLock()
+# The results loaded or computed in this process, indexed by cache
+# file and key.
+_RESULTS: dict[tuple[str, str], Any] = {}
+
+
+class Probe:
+    r"""Implement a micro-benchmark used to select the best candidate
+    value.
+
+    Args:
+        func: The function that runs the benchmark for a candidate
+            value. If it returns a number, this number is the cost
+            of the candidate, otherwise the cost is the execution
+            time of the function.
+        version: The version of the probe. Changing the version
+            invalidates the cached results of the probe.
+        repeat: The number of times the benchmark is run for each
+            candidate. The cost of a candidate is its lowest cost.
+
+    Example:
+        ```pycon
+        >>> from hya.autotune import Probe
+        >>> probe = Probe(lambda candidate: abs(candidate - 3), version="2")
+        >>> probe
+        Probe(version=2, repeat=3)
+        >>> probe.measure(5)
+        2
+
+        ```
+    """
+
+    def __init__(
+        self, func: Callable[[Any], float | None], version: str = "1", repeat: int = 3
+    ) -> None:
+        if repeat < 1:
+            msg = f"repeat must be greater than 0 but received {repeat}"
+            raise ValueError(msg)
+        self._func = func
+        self._version = str(version)
+        self._repeat = repeat
+
+    def __call__(self, candidate: Any) -> float | None:
+        return self._func(candidate)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(version={self._version}, repeat={self._repeat})"
+
+    @property
+    def version(self) -> str:
+        r"""The version of the probe."""
+        return self._version
+
+    def measure(self, candidate: Any) -> float:
+        r"""Compute the cost of a candidate value.
+
+        Args:
+            candidate: The candidate value.
+
+        Returns:
+            The lowest cost over the repetitions of the benchmark.
+        """
+        costs = []
+        for _ in range(self._repeat):
+            start = time.perf_counter()
+            cost = self._func(candidate)
+            costs.append(time.perf_counter() - start if cost is None else cost)
+        return min(costs)
+
+
+def autotune(probe: str, candidates: Sequence[Any], cache_path: Path | str | None = None) -> Any:
+    r"""Return the candidate value with the lowest cost for a probe.
+
+    The result is read from the cache file if the probe already ran
+    on this machine with the same version and candidates. Otherwise,
+    the probe runs for all the candidates, and the result is written
+    to the cache file. The probes run one at a time in a process, so
+    they do not compete for the resources they measure. The probe
+    runs under an exclusive lock on a sibling ``.lock`` file of the
+    cache file, and the cache file is read again once the lock is
+    acquired, so when several processes miss the cache at the same
+    time, the probe runs in one of them and the others use its
+    result.
+
+    Args:
+        probe: The name of the probe in the probe registry.
+        candidates: The candidate values. They must be
+            JSON-serializable.
+        cache_path: The path to the cache file. ``None`` means the
+            path returned by ``get_autotune_cache_path``.
+
+    Returns:
+        The best candidate value.
+
+    Raises:
+        ValueError: if the probe is not registered or if there are
+            no candidates.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from hya.autotune import autotune, register_probe
+        >>> @register_probe("doc_closest_to_3", exist_ok=True)
+        ... def closest_to_3(candidate):
+        ...     return abs(candidate - 3)
+        ...
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     autotune("doc_closest_to_3", [1, 2, 4, 8], Path(tmpdir, "autotune.json"))
+        ...
+        2
+
+        ```
+    """
+    registry = get_probe_registry()
+    if not registry.has_resolver(probe):
+        msg = f"Unknown probe '{probe}'. The registered probes are {sorted(registry.state)}"
+        raise ValueError(msg)
+    candidates = list(to_primitive(candidates))
+    if not candidates:
+        msg = f"No candidates to autotune the probe '{probe}'"
+        raise ValueError(msg)
+    probe_func = registry.state[probe]
+    if not isinstance(probe_func, Probe):
+        probe_func = Probe(probe_func)
+    path = Path(cache_path or get_autotune_cache_path()).expanduser()
+    key = json.dumps(
+        [*get_machine_key(), probe, probe_func.version, candidates], separators=(",", ":")
+    )
+    result_key = (path.as_posix(), key)
+    with _LOCK:
+        if result_key not in _RESULTS:
+            result = _load_results(path).get(key)
+            if result is None:
+                with _lock_file(path.with_name(f"{path.name}.lock")):
+                    result = _load_results(path).get(key)
+                    if result is None:
+                        result = _run_probe(probe, probe_func, candidates)
+                        _save_result(path, key, result)
+            _RESULTS[result_key] = result
+        return _RESULTS[result_key]["value"]
+
+
+def autotune_resolver(probe: str, candidates: Sequence[Any]) -> Any:
+    r"""Return the candidate value with the lowest cost for a probe.
+
+    The probe runs once per machine, and the result is cached in the
+    file returned by ``get_autotune_cache_path``. See ``autotune``
+    for more details.
+
+    Args:
+        probe: The name of the probe in the probe registry.
+        candidates: The candidate values.
+
+    Returns:
+        The best candidate value.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> from hya.autotune import register_probe
+        >>> @register_probe("doc_closest_to_5", exist_ok=True)
+        ... def closest_to_5(candidate):
+        ...     return abs(candidate - 5)
+        ...
+        >>> conf = OmegaConf.create({"key": "${hya.autotune:doc_closest_to_5,[1,4,16]}"})
+        >>> conf.key  # doctest: +SKIP
+        4
+
+        ```
+    """
+    return autotune(probe, candidates)
+
+
+def clear_autotune_results() -> None:
+    r"""Clear the results cached in memory.
+
+    The results are read again from the cache file the next time
+    they are used. The cache file is not modified.
+
+    Example:
+        ```pycon
+        >>> from hya.autotune import clear_autotune_results
+        >>> clear_autotune_results()
+
+        ```
+    """
+    with _LOCK:
+        _RESULTS.clear()
+
+
+def get_autotune_cache_path() -> Path:
+    r"""Return the path to the autotune cache file.
+
+    Returns:
+        The path in the ``HYA_AUTOTUNE_CACHE`` environment variable
+            if it is set, otherwise ``hya/autotune.json`` in the
+            user cache directory (``XDG_CACHE_HOME`` or
+            ``~/.cache``).
+
+    Example:
+        ```pycon
+        >>> from hya.autotune import get_autotune_cache_path
+        >>> get_autotune_cache_path().name  # doctest: +SKIP
+        'autotune.json'
+
+        ```
+    """
+    if path := os.environ.get(AUTOTUNE_CACHE_ENV):
+        return Path(path).expanduser()
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache")
+    return Path(cache_home).joinpath("hya", "autotune.json")
+
+
+@functools.lru_cache
+def get_machine_key() -> tuple[str, str]:
+    r"""Return the key identifying the machine in the autotune cache.
+
+    Returns:
+        A tuple with the hostname and the CPU model.
+
+    Example:
+        ```pycon
+        >>> from hya.autotune import get_machine_key
+        >>> hostname, cpu_model = get_machine_key()
+
+        ```
+    """
+    return (socket.gethostname(), _get_cpu_model())
+
+
+def get_probe_registry() -> ResolverRegistry:
+    r"""Get or create the global probe registry.
+
+    The probe registry maps the probe names to the probes used by
+    ``hya.autotune``. The probes can be registered with
+    ``register_probe`` or directly with the registry.
+
+    Returns:
+        The probe registry.
+
+    Example:
+        ```pycon
+        >>> from hya.autotune import get_probe_registry
+        >>> registry = get_probe_registry()
+        >>> @registry.register("doc_probe", exist_ok=True)
+        ... def probe(candidate):
+        ...     return candidate
+        ...
+
+        ```
+    """
+    if not hasattr(get_probe_registry, "_registry"):
+        get_probe_registry._registry = ResolverRegistry()
+    return get_probe_registry._registry
+
+
+def register_probe(
+    name: str, version: str = "1", repeat: int = 3, exist_ok: bool = False
+) -> Callable[[Callable[[Any], float | None]], Callable[[Any], float | None]]:
+    r"""Register a probe in the probe registry.
+
+    This function returns a decorator that wraps the function in a
+    ``Probe`` and registers it. The decorated function is returned
+    unchanged.
+
+    Args:
+        name: The name of the probe.
+        version: The version of the probe. Changing the version
+            invalidates the cached results of the probe.
+        repeat: The number of times the benchmark is run for each
+            candidate.
+        exist_ok: If ``False``, a ``RuntimeError`` is raised if a
+            probe is already registered with the same name.
+
+    Returns:
+        The decorator to register the probe.
+
+    Example:
+        ```pycon
+        >>> from hya.autotune import get_probe_registry, register_probe
+        >>> @register_probe("doc_sleep", version="2", exist_ok=True)
+        ... def sleep(candidate):
+        ...     pass
+        ...
+        >>> get_probe_registry().state["doc_sleep"]
+        Probe(version=2, repeat=3)
+
+        ```
+    """
+
+    def wrap(func: Callable[[Any], float | None]) -> Callable[[Any], float | None]:
+        get_probe_registry().register(name, exist_ok=exist_ok)(
+            Probe(func, version=version, repeat=repeat)
+        )
+        return func
+
+    return wrap
+
+
+def _get_cpu_model() -> str:
+    r"""Return the CPU model of the machine.
+
+    Returns:
+        The CPU model from ``/proc/cpuinfo`` if available, otherwise
+            the processor name or the machine type from
+            ``platform``.
+    """
+    try:
+        with Path("/proc/cpuinfo").open() as file:
+            for line in file:
+                if line.startswith("model name"):
+                    return line.partition(":")[2].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _load_results(path: Path) -> dict[str, Any]:
+    r"""Load the results from a cache file.
+
+    Args:
+        path: The path to the cache file.
+
+    Returns:
+        The results indexed by key, or an empty dictionary if the
+            file does not exist or is invalid.
+    """
+    try:
+        results = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return results if isinstance(results, dict) else {}
+
+
+def _run_probe(name: str, probe: Probe, candidates: list[Any]) -> dict[str, Any]:
+    r"""Run a probe for all the candidates.
+
+    Args:
+        name: The name of the probe.
+        probe: The probe.
+        candidates: The candidate values.
+
+    Returns:
+        The result with the best candidate value and the cost of
+            each candidate.
+    """
+    logger.info(f"Autotuning '{name}' with the candidates {candidates}...")
+    costs = [probe.measure(candidate) for candidate in candidates]
+    value = candidates[costs.index(min(costs))]
+    logger.info(f"Autotuned '{name}': {value}")
+    return {"value": value, "costs": costs}
+
+
+def _save_result(path: Path, key: str, result: dict[str, Any]) -> None:
+    r"""Add a result to a cache file.
+
+    The file is read again before the update so the results written
+    by other processes are kept, and the new content is written to
+    a temporary file and then atomically moved to the cache file.
+    The caller holds the lock of the cache file, so two processes
+    that update the cache file at the same time do not drop the
+    results of each other. The errors are logged, so the result can
+    be used even if it cannot be cached.
+
+    Args:
+        path: The path to the cache file.
+        key: The key of the result.
+        result: The result to cache.
+    """
+    results = _load_results(path)
+    results[key] = result
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(results, file, indent=2, sort_keys=True)
+            Path(tmp_path).replace(path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+    except (OSError, TypeError, ValueError) as exc:
+        logger.warning(f"Failed to write the autotune cache file {path}: {exc}")
+
+
+@contextlib.contextmanager
+def _lock_file(path: Path) -> Iterator[None]:
+    r"""Hold an exclusive lock on a file shared by the processes.
+
+    The lock is a no-op on the platforms without ``fcntl``, and if
+    the lock file cannot be created, e.g. in a read-only directory.
+    In the latter case, the error is logged.
+
+    Args:
+        path: The path to the lock file. It and its parent directory
+            are created if they do not exist.
+    """
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file = path.open("a")
+    except OSError as exc:
+        logger.warning(f"Failed to create the lock file {path}: {exc}")
+        yield
+        return
+    with file:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
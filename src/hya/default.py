@@ -7,7 +7,7 @@ __all__ = ["get_default_registry"]
 
 from typing import TYPE_CHECKING, Any
 
-from hya import resolvers
+from hya import autotune, files, resolvers, sequences, system, units
 from hya.imports import is_braceexpand_available, is_numpy_available, is_torch_available
 from hya.registry import ResolverRegistry
 
@@ -62,25 +62,44 @@ def _register_default_resolvers(registry: ResolverRegistry) -> None:
     """
     res = {
         "hya.add": resolvers.add_resolver,
+        "hya.argmax": resolvers.argmax_resolver,
         "hya.asinh": resolvers.asinh_resolver,
+        "hya.autotune": autotune.autotune_resolver,
+        "hya.available_memory": system.available_memory_resolver,
         "hya.ceildiv": resolvers.ceildiv_resolver,
+        "hya.cpu_affinity_count": system.cpu_affinity_count_resolver,
+        "hya.cpu_count": system.cpu_count_resolver,
+        "hya.duration": units.duration_resolver,
         "hya.exp": resolvers.exp_resolver,
+        "hya.fit_batch": units.fit_batch_resolver,
         "hya.floordiv": resolvers.floordiv_resolver,
+        "hya.glob": files.glob_resolver,
+        "hya.include": files.include_resolver,
         "hya.len": resolvers.len_resolver,
+        "hya.linspace": sequences.linspace_resolver,
         "hya.iter_join": resolvers.iter_join_resolver,
         "hya.log": resolvers.log_resolver,
         "hya.log10": resolvers.log10_resolver,
+        "hya.logspace": sequences.logspace_resolver,
         "hya.max": resolvers.max_resolver,
+        "hya.mean": resolvers.mean_resolver,
         "hya.min": resolvers.min_resolver,
         "hya.mul": resolvers.mul_resolver,
         "hya.neg": resolvers.neg_resolver,
         "hya.path": resolvers.path_resolver,
         "hya.pi": resolvers.pi_resolver,
         "hya.pow": resolvers.pow_resolver,
+        "hya.quantile": resolvers.quantile_resolver,
+        "hya.range": sequences.range_resolver,
+        "hya.read_bytes": files.read_bytes_resolver,
+        "hya.read_text": files.read_text_resolver,
         "hya.sqrt": resolvers.sqrt_resolver,
         "hya.sha256": resolvers.sha256_resolver,
         "hya.sinh": resolvers.sinh_resolver,
+        "hya.size": units.size_resolver,
+        "hya.std": resolvers.std_resolver,
         "hya.sub": resolvers.sub_resolver,
+        "hya.sum": resolvers.sum_resolver,
         "hya.to_path": resolvers.to_path_resolver,
         "hya.truediv": resolvers.truediv_resolver,
     }
@@ -126,9 +145,35 @@ def _add_numpy_resolvers(resolvers: dict[str, Callable[[...], Any]]) -> None:
         return
 
     # Local import because it is an optional resolver
-    from hya.numpy import to_array_resolver  # noqa: PLC0415
-
+    from hya.numpy import (  # noqa: PLC0415
+        arange_resolver,
+        eye_resolver,
+        frombytes_resolver,
+        full_resolver,
+        interned_array_resolver,
+        linspace_resolver,
+        load_resolver,
+        memmap_resolver,
+        numpy_dtype_resolver,
+        ones_resolver,
+        shared_array_resolver,
+        to_array_resolver,
+        zeros_resolver,
+    )
+
+    resolvers["hya.np.arange"] = arange_resolver
     resolvers["hya.np.array"] = to_array_resolver
+    resolvers["hya.np.dtype"] = numpy_dtype_resolver
+    resolvers["hya.np.eye"] = eye_resolver
+    resolvers["hya.np.frombytes"] = frombytes_resolver
+    resolvers["hya.np.full"] = full_resolver
+    resolvers["hya.np.interned_array"] = interned_array_resolver
+    resolvers["hya.np.linspace"] = linspace_resolver
+    resolvers["hya.np.load"] = load_resolver
+    resolvers["hya.np.memmap"] = memmap_resolver
+    resolvers["hya.np.ones"] = ones_resolver
+    resolvers["hya.np.shared_array"] = shared_array_resolver
+    resolvers["hya.np.zeros"] = zeros_resolver
 
 
 def _add_torch_resolvers(resolvers: dict[str, Callable[[...], Any]]) -> None:
@@ -146,10 +191,21 @@ def _add_torch_resolvers(resolvers: dict[str, Callable[[...], Any]]) -> None:
         return
 
     # Local import because it is an optional resolver
-    from hya.torch import to_tensor_resolver, torch_dtype_resolver  # noqa: PLC0415
-
+    from hya.torch import (  # noqa: PLC0415
+        device_resolver,
+        load_resolver,
+        num_threads_resolver,
+        shared_tensor_resolver,
+        to_tensor_resolver,
+        torch_dtype_resolver,
+    )
+
+    resolvers["hya.torch.shared_tensor"] = shared_tensor_resolver
     resolvers["hya.torch.tensor"] = to_tensor_resolver
     resolvers["hya.torch.dtype"] = torch_dtype_resolver
+    resolvers["hya.torch.load"] = load_resolver
+    resolvers["hya.torch.device"] = device_resolver
+    resolvers["hya.torch.num_threads"] = num_threads_resolver
 
 
 # Register the available resolvers
@@ -0,0 +1,626 @@
+r"""Implement resolvers to query files and directories.
+
+The resolvers in this module only rely on the standard library. The
+directory listings and the file contents are cached in memory so the
+same directory or file is not read again while it does not change.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "DirectoryIndex",
+    "glob_resolver",
+    "include_resolver",
+    "prefetch_includes",
+    "read_bytes_resolver",
+    "read_text_resolver",
+]
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import fnmatch
+import mmap
+import os
+from pathlib import Path
+import re
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from omegaconf import Container, OmegaConf
+import yaml
+
+from hya.utils.cache import LRUCache, get_file_key
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from omegaconf import DictConfig, ListConfig
+
+_MAGIC_PATTERN = re.compile(r"[*?[]")
+_INCLUDE_PATTERN = re.compile(r"\$\{hya\.include:\s*([^${}]+?)\s*\}")
+
+# Files smaller than this size are read directly instead of being memory-mapped.
+MMAP_MIN_SIZE = 1 << 20
+
+
+class _DirectoryEntry(NamedTuple):
+    r"""Store the indexed content of a directory."""
+
+    mtime_ns: int
+    names: tuple[str, ...]
+    dir_names: frozenset[str]
+    matches: LRUCache[str, tuple[str, ...]]
+
+
+class DirectoryIndex:
+    r"""Implement an in-memory index of directory listings.
+
+    Each directory is scanned once with ``os.scandir`` and the
+    listing is reused until the modification time of the directory
+    changes, i.e. until an entry is added, removed or renamed. The
+    matches of each pattern are also cached per directory, so
+    repeating the same glob only costs one ``stat`` call per
+    visited directory. The number of indexed directories and the
+    number of cached patterns per directory are bounded, and the
+    least recently used ones are evicted first, so a long-running
+    process globbing over many directories uses a bounded amount of
+    memory.
+
+    Args:
+        max_dirs: The maximum number of indexed directories.
+        max_patterns: The maximum number of cached patterns per
+            directory.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from hya.files import DirectoryIndex
+        >>> index = DirectoryIndex()
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     for name in ["b.txt", "a.txt", "c.csv"]:
+        ...         Path(tmpdir).joinpath(name).touch()
+        ...     [Path(path).name for path in index.glob(f"{tmpdir}/*.txt")]
+        ...
+        ['a.txt', 'b.txt']
+
+        ```
+    """
+
+    def __init__(self, max_dirs: int = 4096, max_patterns: int = 64) -> None:
+        self._entries: LRUCache[str, _DirectoryEntry] = LRUCache(max_size=max_dirs)
+        self._max_patterns = max_patterns
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        r"""Remove all the indexed directories.
+
+        Example:
+            ```pycon
+            >>> from hya.files import DirectoryIndex
+            >>> index = DirectoryIndex()
+            >>> index.clear()
+            >>> len(index)
+            0
+
+            ```
+        """
+        self._entries.clear()
+
+    def glob(self, pattern: str) -> list[str]:
+        r"""Return the sorted list of paths matching a pattern.
+
+        The pattern follows the ``glob.glob`` syntax with the
+        ``*``, ``?`` and ``[...]`` wildcards. The wildcards are
+        applied per path component, and the names starting with a
+        dot are only matched if the pattern component also starts
+        with a dot. Like ``glob.glob``, the matching paths keep the
+        literal components of the pattern as they are written, e.g.
+        ``./data/*`` returns paths starting with ``./data/``.
+
+        Args:
+            pattern: The pattern to match.
+
+        Returns:
+            The sorted list of matching paths.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from hya.files import DirectoryIndex
+            >>> index = DirectoryIndex()
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     Path(tmpdir).joinpath("data.txt").touch()
+            ...     [Path(path).name for path in index.glob(f"{tmpdir}/*")]
+            ...
+            ['data.txt']
+
+            ```
+        """
+        dir_only = pattern.endswith(os.sep)
+        # The pattern is not converted to a ``Path`` because it drops
+        # the ``.`` components, which are kept in the matching paths.
+        pattern = os.path.expanduser(pattern)  # noqa: PTH111
+        anchor = Path(pattern).anchor
+        parts = [part for part in pattern[len(anchor) :].split(os.sep) if part]  # noqa: PTH206
+        if not parts:
+            return [anchor] if anchor else []
+        prefixes = [anchor]
+
+        paths: list[str] = []
+        for i, part in enumerate(parts):
+            is_last = i == len(parts) - 1
+            part_dir_only = dir_only or not is_last
+            if _MAGIC_PATTERN.search(part) is None:
+                # Literal components are checked with a single stat call
+                # instead of indexing the parent directory.
+                paths = [
+                    f"{prefix}{part}"
+                    for prefix in prefixes
+                    if _exists(f"{prefix}{part}", dir_only=part_dir_only)
+                ]
+            else:
+                paths = [
+                    f"{prefix}{name}"
+                    for prefix in prefixes
+                    for name in self._match(prefix or os.curdir, part, dir_only=part_dir_only)
+                ]
+            prefixes = [f"{path}{os.sep}" for path in paths]
+        return sorted(prefixes if dir_only else paths)
+
+    def _match(self, directory: str, part: str, dir_only: bool) -> tuple[str, ...]:
+        r"""Return the names in a directory matching a wildcard
+        path component.
+
+        Args:
+            directory: The directory to scan.
+            part: The path component with wildcards to match.
+            dir_only: If ``True``, only the sub-directories are
+                returned.
+
+        Returns:
+            The matching names.
+        """
+        entry = self._get_entry(directory)
+        if entry is None:
+            return ()
+        names = entry.matches.get(part)
+        if names is None:
+            names = tuple(fnmatch.filter(entry.names, part))
+            if not part.startswith("."):
+                names = tuple(name for name in names if not name.startswith("."))
+            entry.matches.put(part, names)
+        if dir_only:
+            return tuple(name for name in names if name in entry.dir_names)
+        return names
+
+    def _get_entry(self, directory: str) -> _DirectoryEntry | None:
+        r"""Return the up-to-date index of a directory.
+
+        Args:
+            directory: The directory to index.
+
+        Returns:
+            The index of the directory or ``None`` if the path is
+                not a directory.
+        """
+        try:
+            mtime_ns = Path(directory).stat().st_mtime_ns
+        except OSError:
+            return None
+        entry = self._entries.get(directory)
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            return entry
+
+        try:
+            with os.scandir(directory) as it:
+                scanned = [(item.name, _is_dir(item)) for item in it]
+        except OSError:
+            return None
+        names = tuple(sorted(name for name, _ in scanned))
+        entry = _DirectoryEntry(
+            mtime_ns=mtime_ns,
+            names=names,
+            dir_names=frozenset(name for name, is_dir in scanned if is_dir),
+            matches=LRUCache(max_size=self._max_patterns),
+        )
+        self._entries.put(directory, entry)
+        return entry
+
+
+def _exists(path: str, dir_only: bool) -> bool:
+    r"""Indicate if a path exists.
+
+    Args:
+        path: The path to check.
+        dir_only: If ``True``, the path must be a directory.
+
+    Returns:
+        ``True`` if the path exists, otherwise ``False``.
+    """
+    return Path(path).is_dir() if dir_only else Path(path).exists()
+
+
+def _is_dir(entry: os.DirEntry) -> bool:
+    r"""Indicate if a directory entry is a directory, following
+    symlinks.
+
+    Args:
+        entry: The directory entry.
+
+    Returns:
+        ``True`` if the entry is a directory, otherwise ``False``.
+    """
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+_DIRECTORY_INDEX = DirectoryIndex()
+
+
+def glob_resolver(pattern: str, rank: int = 0, world_size: int = 1) -> list[str]:
+    r"""Return the sorted list of paths matching a glob pattern.
+
+    The directory listings are indexed in memory and invalidated
+    when the modification time of a directory changes, so repeated
+    globs over large directories are served from memory. The
+    matches can be sharded across ranks, where each rank receives
+    every ``world_size``-th path starting at index ``rank``.
+
+    Args:
+        pattern: The glob pattern. The ``*``, ``?`` and ``[...]``
+            wildcards are supported in every path component.
+        rank: The rank of the current process.
+        world_size: The number of ranks.
+
+    Returns:
+        The sorted list of matching paths for the given rank.
+
+    Raises:
+        ValueError: if ``world_size`` is not positive or if
+            ``rank`` is not in ``[0, world_size)``.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     for i in range(4):
+        ...         Path(tmpdir).joinpath(f"shard-{i}.tar").touch()
+        ...     conf = OmegaConf.create(
+        ...         {"files": f"${{hya.glob:{tmpdir}/shard-*.tar,1,2}}"}
+        ...     )
+        ...     [Path(path).name for path in conf.files]
+        ...
+        ['shard-1.tar', 'shard-3.tar']
+
+        ```
+    """
+    if world_size < 1:
+        msg = f"world_size must be a positive integer but received {world_size}"
+        raise ValueError(msg)
+    if not 0 <= rank < world_size:
+        msg = f"rank must be in [0, {world_size}) but received {rank}"
+        raise ValueError(msg)
+    return _DIRECTORY_INDEX.glob(pattern)[rank::world_size]
+
+
+_CONTENT_CACHE: LRUCache[tuple, bytes | str] = LRUCache(max_size=256, max_bytes=64 << 20)
+_YAML_CACHE: LRUCache[tuple[str, int, int], Any] = LRUCache(max_size=1024)
+
+
+def include_resolver(path: str, _parent_: Container | None = None) -> DictConfig | ListConfig:
+    r"""Load a YAML fragment into a config node.
+
+    The parsed fragments are cached in memory and the cache entry is
+    keyed by the path, the modification time and the size of the
+    file, so the same fragment included by many configs is parsed
+    only once. Each call returns a new node, so modifying an
+    included node does not change the other configs. The
+    interpolations in the fragment are resolved against the config
+    including it, like any other node of this config.
+
+    Args:
+        path: The path to the YAML file.
+        _parent_: The parent node of the interpolation. It is
+            automatically provided by OmegaConf.
+
+    Returns:
+        The content of the YAML file as a config node.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("optimizer.yaml")
+        ...     _ = path.write_text("name: sgd\nlr: ${lr}\n")
+        ...     conf = OmegaConf.create({"lr": 0.1, "optimizer": f"${{hya.include:{path}}}"})
+        ...     OmegaConf.to_container(conf.optimizer, resolve=True)
+        ...
+        {'name': 'sgd', 'lr': 0.1}
+
+        ```
+    """
+    return OmegaConf.create(_load_yaml(path), parent=_parent_)
+
+
+def prefetch_includes(config: Any, max_workers: int | None = None) -> list[str]:
+    r"""Parse concurrently the YAML fragments included by a config.
+
+    This function finds the ``${hya.include:<path>}`` interpolations
+    of a config, including the ones in the included fragments, and
+    parses the fragments on a thread pool so they are already cached
+    when the config is resolved. The include interpolations whose
+    path contains another interpolation are ignored. The fragments
+    that cannot be loaded are skipped, and the error is raised when
+    the config is resolved.
+
+    Args:
+        config: The config to scan. It can be a ``DictConfig``, a
+            ``ListConfig`` or a primitive container.
+        max_workers: The maximum number of threads used to parse
+            the fragments. ``None`` means the default number of
+            threads of ``ThreadPoolExecutor``.
+
+    Returns:
+        The sorted list of included paths found in the config.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> import hya
+        >>> from hya.files import prefetch_includes
+        >>> from omegaconf import OmegaConf
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("model.yaml")
+        ...     _ = path.write_text("layers: 12\n")
+        ...     conf = OmegaConf.create({"model": f"${{hya.include:{path}}}"})
+        ...     [Path(p).name for p in prefetch_includes(conf)]
+        ...
+        ['model.yaml']
+
+        ```
+    """
+    if isinstance(config, Container):
+        config = OmegaConf.to_container(config, resolve=False)
+    paths = _find_includes(config)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: dict[Future, str] = {executor.submit(_load_yaml, path): path for path in paths}
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                futures.pop(future)
+                try:
+                    content = future.result()
+                except (OSError, yaml.YAMLError):
+                    continue
+                for path in _find_includes(content) - paths:
+                    paths.add(path)
+                    futures[executor.submit(_load_yaml, path)] = path
+    return sorted(paths)
+
+
+def _find_includes(obj: Any) -> set[str]:
+    r"""Find the paths of the include interpolations in a primitive
+    container.
+
+    Args:
+        obj: The primitive container to scan.
+
+    Returns:
+        The set of included paths.
+    """
+    if isinstance(obj, str):
+        return set(_INCLUDE_PATTERN.findall(obj))
+    if isinstance(obj, dict):
+        obj = list(obj.values())
+    if isinstance(obj, (list, tuple)):
+        return set().union(*(_find_includes(item) for item in obj))
+    return set()
+
+
+def _load_yaml(path: str) -> Any:
+    r"""Load a YAML file as a primitive container and cache the
+    result.
+
+    Args:
+        path: The path to the YAML file.
+
+    Returns:
+        The content of the YAML file as a primitive container.
+    """
+    file_key = get_file_key(path)
+    content = _YAML_CACHE.get(file_key)
+    if content is None:
+        content = OmegaConf.to_container(OmegaConf.load(file_key[0]), resolve=False)
+        _YAML_CACHE.put(file_key, content)
+    return content
+
+
+def read_bytes_resolver(path: str, start: int | None = None, stop: int | None = None) -> bytes:
+    r"""Return the content of a file as bytes.
+
+    The content is cached in memory and the cache entry is keyed by
+    the path, the modification time and the size of the file, so a
+    file is not read again while it does not change. Large files are
+    memory-mapped so reading a byte range only loads the requested
+    pages.
+
+    Args:
+        path: The path to the file.
+        start: The offset of the first byte to read. ``None`` means
+            the beginning of the file.
+        stop: The offset after the last byte to read. ``None``
+            means the end of the file.
+
+    Returns:
+        The content of the file in the byte range ``[start, stop)``.
+
+    Raises:
+        ValueError: if ``start`` or ``stop`` is negative.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("key.bin")
+        ...     _ = path.write_bytes(b"0123456789")
+        ...     conf = OmegaConf.create({"key": f"${{hya.read_bytes:{path},2,5}}"})
+        ...     conf.key
+        ...
+        b'234'
+
+        ```
+    """
+    _check_range(start, stop)
+    file_key = get_file_key(path)
+    key = (file_key, "bytes", start, stop)
+    data = _CONTENT_CACHE.get(key)
+    if data is None:
+        data = _read(file_key, start, stop, lines=False)
+        _CONTENT_CACHE.put(key, data)
+    return data
+
+
+def read_text_resolver(
+    path: str, start: int | None = None, stop: int | None = None, encoding: str = "utf-8"
+) -> str:
+    r"""Return the content of a file as a string.
+
+    The content is cached in memory and the cache entry is keyed by
+    the path, the modification time and the size of the file, so a
+    file is not read again while it does not change. Large files are
+    memory-mapped so reading a line range only loads the pages up to
+    the last requested line.
+
+    Args:
+        path: The path to the file.
+        start: The index of the first line to read. ``None`` means
+            the first line of the file.
+        stop: The index after the last line to read. ``None`` means
+            the end of the file.
+        encoding: The encoding used to decode the file.
+
+    Returns:
+        The lines ``[start, stop)`` of the file, including their
+            line breaks.
+
+    Raises:
+        ValueError: if ``start`` or ``stop`` is negative.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("vocab.txt")
+        ...     _ = path.write_text("cat\ndog\nbird\n")
+        ...     conf = OmegaConf.create({"key": f"${{hya.read_text:{path},1,3}}"})
+        ...     conf.key.splitlines()
+        ...
+        ['dog', 'bird']
+
+        ```
+    """
+    _check_range(start, stop)
+    file_key = get_file_key(path)
+    key = (file_key, "text", start, stop, encoding)
+    text = _CONTENT_CACHE.get(key)
+    if text is None:
+        text = _read(file_key, start, stop, lines=True).decode(encoding)
+        _CONTENT_CACHE.put(key, text)
+    return text
+
+
+def _check_range(start: int | None, stop: int | None) -> None:
+    r"""Check a range of bytes or lines is valid.
+
+    Args:
+        start: The start of the range.
+        stop: The end of the range.
+
+    Raises:
+        ValueError: if ``start`` or ``stop`` is negative.
+    """
+    if (start is not None and start < 0) or (stop is not None and stop < 0):
+        msg = f"start and stop must be non-negative but received start={start} and stop={stop}"
+        raise ValueError(msg)
+
+
+def _read(
+    file_key: tuple[str, int, int], start: int | None, stop: int | None, lines: bool
+) -> bytes:
+    r"""Read a range of bytes or lines from a file.
+
+    Args:
+        file_key: The key of the file returned by ``get_file_key``.
+        start: The start of the range.
+        stop: The end of the range.
+        lines: If ``True``, the range is expressed in lines,
+            otherwise in bytes.
+
+    Returns:
+        The content of the file in the range.
+    """
+    path, _, size = file_key
+    with Path(path).open("rb") as file:
+        # Empty files cannot be memory-mapped.
+        if size < max(MMAP_MIN_SIZE, 1):
+            return _slice(file.read(), start, stop, lines)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return _slice(buffer, start, stop, lines)
+
+
+def _slice(buffer: bytes | mmap.mmap, start: int | None, stop: int | None, lines: bool) -> bytes:
+    r"""Return a range of bytes or lines from a buffer.
+
+    Args:
+        buffer: The buffer to slice.
+        start: The start of the range.
+        stop: The end of the range.
+        lines: If ``True``, the range is expressed in lines,
+            otherwise in bytes.
+
+    Returns:
+        The content of the buffer in the range.
+    """
+    if lines:
+        begin = _find_line(buffer, start or 0, 0)
+        end = None if stop is None else _find_line(buffer, max(stop - (start or 0), 0), begin)
+        return buffer[begin:end]
+    return buffer[start:stop]
+
+
+def _find_line(buffer: bytes | mmap.mmap, num_lines: int, offset: int) -> int:
+    r"""Return the offset of the line starting ``num_lines`` lines
+    after the offset.
+
+    Args:
+        buffer: The buffer to scan.
+        num_lines: The number of lines to skip.
+        offset: The offset where to start scanning.
+
+    Returns:
+        The offset of the line, or the size of the buffer if there
+            are not enough lines.
+    """
+    for _ in range(num_lines):
+        index = buffer.find(b"\n", offset)
+        if index < 0:
+            return len(buffer)
+        offset = index + 1
+    return offset
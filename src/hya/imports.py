@@ -5,9 +5,11 @@ from __future__ import annotations
 __all__ = [
     "check_braceexpand",
     "check_numpy",
+    "check_safetensors",
     "check_torch",
     "is_braceexpand_available",
     "is_numpy_available",
+    "is_safetensors_available",
     "is_torch_available",
 ]
 
@@ -99,6 +101,49 @@ def is_numpy_available() -> bool:
     return find_spec("numpy") is not None
 
 
+#######################
+#     safetensors     #
+#######################
+
+
+def check_safetensors() -> None:
+    r"""Check if the ``safetensors`` package is installed.
+
+    Raises:
+        RuntimeError: if the ``safetensors`` package is not installed.
+
+    Example:
+        ```pycon
+        >>> from hya.imports import check_safetensors
+        >>> check_safetensors()
+
+        ```
+    """
+    if not is_safetensors_available():
+        msg = (
+            "'safetensors' package is required but not installed. "
+            "You can install `safetensors` package with the command:\n\n"
+            "pip install safetensors\n"
+        )
+        raise RuntimeError(msg)
+
+
+def is_safetensors_available() -> bool:
+    r"""Indicate if the safetensors package is installed or not.
+
+    Returns:
+        ``True`` if ``safetensors`` is installed, otherwise ``False``.
+
+    Example:
+        ```pycon
+        >>> from hya.imports import is_safetensors_available
+        >>> is_safetensors_available()
+
+        ```
+    """
+    return find_spec("safetensors") is not None
+
+
 #################
 #     torch     #
 #################
@@ -10,9 +10,26 @@ configuration files.         registry.register_resolvers()
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import base64
+import functools
+import hashlib
+import math
+from typing import TYPE_CHECKING, Any
+
+from omegaconf.errors import InterpolationResolutionError
 
 from hya.imports import check_numpy, is_numpy_available
+from hya.utils.cache import InternTable, LRUCache, get_file_key, get_intern_table
+from hya.utils.containers import to_primitive
+from hya.utils.disk_cache import hash_arguments
+from hya.utils.dtypes import (
+    NUMPY_DTYPE_PREFIXES,
+    TORCH_DTYPE_NAMES,
+    TORCH_DTYPE_PREFIXES,
+    build_dtype_table,
+    get_dtype_name,
+)
+from hya.utils.shared_memory import get_shared_buffer
 
 if TYPE_CHECKING or is_numpy_available():
     import numpy as np
@@ -20,20 +37,132 @@ else:  # pragma: no cover
     from hya.utils.fallback.numpy import numpy as np
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from numpy.typing import ArrayLike
 
 
-def to_array_resolver(data: ArrayLike) -> np.ndarray:
+@functools.lru_cache(maxsize=1)
+def get_dtype_table() -> dict[str, np.dtype]:
+    r"""Get the table to look up the NumPy data types by name.
+
+    The table is built once from the names known by NumPy.
+
+    Returns:
+        The NumPy data types indexed by name (e.g. "float32",
+            "double" or "f4"), prefixed name (e.g. "np.float32"),
+            alias (e.g. "fp16") and PyTorch name (e.g.
+            "torch.float"). The PyTorch names have the PyTorch
+            meaning, e.g. "torch.float" is "float32" while
+            "np.float" is "float64".
+
+    Example:
+        ```pycon
+        >>> from hya.numpy import get_dtype_table
+        >>> table = get_dtype_table()
+        >>> table["fp16"], table["np.float32"], table["torch.float"]
+        (dtype('float16'), dtype('float32'), dtype('float32'))
+
+        ```
+    """
+    check_numpy()
+    dtypes = {
+        name: np.dtype(dtype) for name, dtype in np.sctypeDict.items() if isinstance(name, str)
+    }
+    foreign_names = {
+        f"{prefix}{name}": dtype_name
+        for name, dtype_name in TORCH_DTYPE_NAMES.items()
+        for prefix in TORCH_DTYPE_PREFIXES
+    }
+    return build_dtype_table(dtypes, NUMPY_DTYPE_PREFIXES, foreign_names)
+
+
+def numpy_dtype_resolver(target: Any) -> np.dtype:
+    r"""Create a ``numpy.dtype`` from its string representation.
+
+    This resolver looks up the dtype in the table returned by
+    ``get_dtype_table``, so the lookup is a dictionary access. The
+    names that are not in the table, e.g. "<f4" or "U10", are
+    parsed by ``numpy.dtype``.
+
+    Args:
+        target: The target data type, e.g. "float32", "fp16",
+            "np.int64" or "torch.float32". A ``numpy.dtype`` or a
+            NumPy scalar type is also accepted.
+
+    Returns:
+        The corresponding ``numpy.dtype`` object.
+
+    Raises:
+        InterpolationResolutionError: If the target doesn't
+            correspond to a valid NumPy dtype.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.np.dtype:float32}"})
+        >>> conf.key
+        dtype('float32')
+        >>> conf = OmegaConf.create({"key": "${hya.np.dtype:fp16}"})
+        >>> conf.key
+        dtype('float16')
+
+        ```
+    """
+    # ``get_dtype_table`` checks that numpy is installed when the table is built.
+    table = get_dtype_table()
+    dtype = table.get(target) if isinstance(target, str) else None
+    if dtype is not None:
+        return dtype
+    name = get_dtype_name(target)
+    dtype = table.get(name)
+    if dtype is not None:
+        return dtype
+    try:
+        return np.dtype(name)
+    except TypeError as exc:
+        msg = f"Incorrect dtype {target}"
+        raise InterpolationResolutionError(msg) from exc
+
+
+def to_array_resolver(
+    data: ArrayLike,
+    dtype: Any = None,
+    shape: int | Sequence[int] | None = None,
+    order: str = "C",
+) -> np.ndarray:
     r"""Implement a resolver to transform the input to a
     ``numpy.ndarray``.
 
+    A ``ListConfig`` is converted to a list of primitive values in
+    one pass before it is given to NumPy, so NumPy does not access
+    the OmegaConf nodes one by one. A ``range`` is converted with
+    ``numpy.arange`` and the lazy sequences of ``hya.sequences`` are
+    computed with vectorized operations, so no intermediate Python
+    list is created.
+
     Args:
         data: Specifies the data to transform in ``numpy.ndarray``.
             This value should be compatible with ``numpy.array``
+        dtype: The data type of the array, e.g. ``float32`` or
+            ``fp16``. See ``numpy_dtype_resolver`` for the supported
+            names. ``None`` means the data type is inferred from the
+            data.
+        shape: The shape of the array. The data are reshaped to this
+            shape, e.g. to build a matrix from a flat list. ``None``
+            means the shape of the data.
+        order: The memory layout of the array, ``C`` for row-major
+            or ``F`` for column-major. It is also the order used to
+            read the data when they are reshaped.
 
     Returns:
         The input in a ``numpy.ndarray`` object.
 
+    Raises:
+        ValueError: if the order is invalid or if the data cannot be
+            reshaped to the shape.
+
     Example:
         ```pycon
         >>> import hya
@@ -41,8 +170,684 @@ def to_array_resolver(data: ArrayLike) -> np.ndarray:
         >>> conf = OmegaConf.create({"key": "${hya.np.array:[1, 2, 3]}"})
         >>> conf.key
         array([1, 2, 3])
+        >>> conf = OmegaConf.create({"key": "${hya.np.array:[1, 2, 3, 4, 5, 6],float32,[2, 3]}"})
+        >>> conf.key
+        array([[1., 2., 3.],
+               [4., 5., 6.]], dtype=float32)
+
+        ```
+    """
+    check_numpy()
+    if order not in {"C", "F"}:
+        msg = f"Incorrect order {order!r}. The valid orders are 'C' and 'F'"
+        raise ValueError(msg)
+    dtype = _get_dtype(dtype)
+    if isinstance(data, range):
+        array = np.arange(data.start, data.stop, data.step, dtype=dtype)
+    else:
+        # The lazy sequences implement ``__array__``.
+        array = np.array(to_primitive(data), dtype=dtype, order=order)
+    if shape is not None:
+        array = np.reshape(array, to_primitive(shape), order=order)
+        if order == "F":
+            array = np.asfortranarray(array)
+    return array
+
+
+def frombytes_resolver(
+    data: str, dtype: Any, shape: int | Sequence[int] | None = None
+) -> np.ndarray:
+    r"""Implement a resolver to decode an array encoded in base64.
+
+    The array is decoded with ``numpy.frombuffer``, so the elements
+    are not parsed one by one. The data must contain the elements of
+    the array in little-endian byte order, e.g. as encoded by
+    ``array_to_base64``. The base64 padding characters (``=``) are
+    optional, so a short encoded array can be written in an
+    interpolation without quotes. A long encoded array should be
+    stored in another config value, e.g.
+    ``${hya.np.frombytes:${.data},float32}``, because OmegaConf
+    parses the interpolations one character at a time.
+
+    Args:
+        data: The elements of the array encoded in base64.
+        dtype: The data type of the array, e.g. ``float32`` or
+            ``fp16``. See ``numpy_dtype_resolver`` for the supported
+            names.
+        shape: The shape of the array. ``None`` means a 1D array.
+
+    Returns:
+        The read-only decoded array.
+
+    Raises:
+        ValueError: if the data are not valid base64, or if their
+            size does not match the data type or the shape.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.np.frombytes:AACAPwAAAEAAAEBAAACAQA,float32,[2, 2]}"})
+        >>> conf.key
+        array([[1., 2.],
+               [3., 4.]], dtype=float32)
 
         ```
     """
     check_numpy()
-    return np.array(data)
+    dtype = numpy_dtype_resolver(dtype).newbyteorder("<")
+    buffer = base64.b64decode(data + "=" * (-len(data) % 4), validate=True)
+    array = np.frombuffer(buffer, dtype=dtype)
+    if shape is not None:
+        array = array.reshape(to_primitive(shape))
+    return array
+
+
+def array_to_base64(array: ArrayLike) -> str:
+    r"""Encode an array in base64 to store it in a config.
+
+    The elements are encoded in little-endian byte order, and the
+    array can be decoded with the ``hya.np.frombytes`` resolver. The
+    data type and the shape of the array are not encoded.
+
+    Args:
+        array: The array to encode.
+
+    Returns:
+        The elements of the array encoded in base64.
+
+    Raises:
+        ValueError: if the array contains Python objects.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from hya.numpy import array_to_base64
+        >>> array_to_base64(np.array([[1, 2], [3, 4]], dtype=np.float32))
+        'AACAPwAAAEAAAEBAAACAQA=='
+
+        ```
+    """
+    check_numpy()
+    array = np.asarray(array)
+    if array.dtype.hasobject:
+        msg = f"Cannot encode an array of Python objects (dtype={array.dtype})"
+        raise ValueError(msg)
+    data = array.astype(array.dtype.newbyteorder("<"), copy=False).tobytes()
+    return base64.b64encode(data).decode("ascii")
+
+
+def zeros_resolver(shape: int | Sequence[int], dtype: Any = None) -> np.ndarray:
+    r"""Implement a resolver to create an array filled with zeros.
+
+    Args:
+        shape: The shape of the array.
+        dtype: The data type of the array, e.g. ``float32`` or
+            ``fp16``. ``None`` means ``float64``.
+
+    Returns:
+        The array filled with zeros.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.np.zeros:[2, 3],int64}"})
+        >>> conf.key
+        array([[0, 0, 0],
+               [0, 0, 0]])
+
+        ```
+    """
+    check_numpy()
+    return np.zeros(to_primitive(shape), dtype=_get_dtype(dtype))
+
+
+def ones_resolver(shape: int | Sequence[int], dtype: Any = None) -> np.ndarray:
+    r"""Implement a resolver to create an array filled with ones.
+
+    Args:
+        shape: The shape of the array.
+        dtype: The data type of the array, e.g. ``float32`` or
+            ``fp16``. ``None`` means ``float64``.
+
+    Returns:
+        The array filled with ones.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.np.ones:3,float32}"})
+        >>> conf.key
+        array([1., 1., 1.], dtype=float32)
+
+        ```
+    """
+    check_numpy()
+    return np.ones(to_primitive(shape), dtype=_get_dtype(dtype))
+
+
+def full_resolver(shape: int | Sequence[int], fill_value: Any, dtype: Any = None) -> np.ndarray:
+    r"""Implement a resolver to create an array filled with a value.
+
+    Args:
+        shape: The shape of the array.
+        fill_value: The value of the elements of the array.
+        dtype: The data type of the array, e.g. ``float32`` or
+            ``fp16``. ``None`` means the data type is inferred from
+            the fill value.
+
+    Returns:
+        The array filled with the value.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.np.full:[2, 2],0.5}"})
+        >>> conf.key
+        array([[0.5, 0.5],
+               [0.5, 0.5]])
+
+        ```
+    """
+    check_numpy()
+    return np.full(to_primitive(shape), fill_value, dtype=_get_dtype(dtype))
+
+
+def arange_resolver(
+    start: float, stop: float | None = None, step: float = 1, dtype: Any = None
+) -> np.ndarray:
+    r"""Implement a resolver to create an array with evenly spaced
+    values in the interval ``[start, stop)``.
+
+    Args:
+        start: The start of the interval. It is the end of the
+            interval if ``stop`` is ``None``, and the interval
+            starts at 0.
+        stop: The end of the interval.
+        step: The spacing between the values.
+        dtype: The data type of the array, e.g. ``float32`` or
+            ``fp16``. ``None`` means the data type is inferred from
+            the other arguments.
+
+    Returns:
+        The array with evenly spaced values.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.np.arange:2,10,3}"})
+        >>> conf.key
+        array([2, 5, 8])
+
+        ```
+    """
+    check_numpy()
+    return np.arange(start, stop, step, dtype=_get_dtype(dtype))
+
+
+def linspace_resolver(
+    start: float, stop: float, num: int = 50, endpoint: bool = True, dtype: Any = None
+) -> np.ndarray:
+    r"""Implement a resolver to create an array with evenly spaced
+    values over an interval.
+
+    Unlike ``hya.linspace``, which returns a lazy sequence, the
+    values are computed when the resolver is called.
+
+    Args:
+        start: The first value.
+        stop: The last value, if ``endpoint`` is ``True``.
+        num: The number of values.
+        endpoint: If ``True``, ``stop`` is the last value, otherwise
+            it is not included.
+        dtype: The data type of the array, e.g. ``float32`` or
+            ``fp16``. ``None`` means ``float64``.
+
+    Returns:
+        The array with evenly spaced values.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.np.linspace:0,1,5}"})
+        >>> conf.key
+        array([0.  , 0.25, 0.5 , 0.75, 1.  ])
+
+        ```
+    """
+    check_numpy()
+    return np.linspace(start, stop, num, endpoint=endpoint, dtype=_get_dtype(dtype))
+
+
+def eye_resolver(n: int, m: int | None = None, k: int = 0, dtype: Any = None) -> np.ndarray:
+    r"""Implement a resolver to create a 2D array with ones on a
+    diagonal and zeros elsewhere.
+
+    Args:
+        n: The number of rows.
+        m: The number of columns. ``None`` means ``n``.
+        k: The index of the diagonal. 0 is the main diagonal, a
+            positive value is an upper diagonal, and a negative value
+            is a lower diagonal.
+        dtype: The data type of the array, e.g. ``float32`` or
+            ``fp16``. ``None`` means ``float64``.
+
+    Returns:
+        The 2D array.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.np.eye:3,null,0,int64}"})
+        >>> conf.key
+        array([[1, 0, 0],
+               [0, 1, 0],
+               [0, 0, 1]])
+
+        ```
+    """
+    check_numpy()
+    return np.eye(n, m, k, dtype=_get_dtype(dtype))
+
+
+def _get_dtype(dtype: Any) -> np.dtype | None:
+    r"""Return the NumPy data type of a resolver argument.
+
+    Args:
+        dtype: The data type or its name.
+
+    Returns:
+        The NumPy data type, or ``None`` if ``dtype`` is ``None``.
+    """
+    return None if dtype is None else numpy_dtype_resolver(dtype)
+
+
+_LOAD_CACHE: LRUCache[tuple, Any] = LRUCache(max_size=256)
+_MMAP_MODES = (None, "r", "r+", "c")
+# The arrays loaded with these modes are writable, so they are not
+# cached because the changes made by one config would be visible to
+# the other configs.
+_WRITABLE_MMAP_MODES = (None, "r+", "c")
+
+
+def load_resolver(path: str, mmap_mode: str | None = "r", member: str | None = None) -> Any:
+    r"""Implement a resolver to load an array from a ``.npy`` or
+    ``.npz`` file.
+
+    A ``.npy`` file is memory-mapped by default, so no data is read
+    until the pages of the array are accessed. The members of a
+    ``.npz`` file are read when they are accessed. The values loaded
+    in read-only mode (``r``) are cached in memory and the cache
+    entry is keyed by the path, the modification time and the size
+    of the file, so the configs loading the same file share the same
+    mapping, and the file is loaded again when it changes. The
+    arrays loaded with the other modes are writable, so they are not
+    cached, and each call returns a new array.
+
+    Args:
+        path: The path to the ``.npy`` or ``.npz`` file.
+        mmap_mode: The mode used to memory-map a ``.npy`` file,
+            ``r`` (read-only), ``r+`` (read-write) or ``c``
+            (copy-on-write). ``None`` means the array is read in
+            memory. A ``.npz`` file is never memory-mapped, and its
+            member loaded with ``r`` is read-only.
+        member: The name of the array to load from a ``.npz`` file.
+            ``None`` means the whole ``.npz`` file is returned and
+            its members are read when they are accessed.
+
+    Returns:
+        The array of a ``.npy`` file, the lazily loaded ``.npz`` file,
+            or one of its arrays if ``member`` is set.
+
+    Raises:
+        ValueError: if ``mmap_mode`` is invalid.
+        TypeError: if ``member`` is set for a ``.npy`` file.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> import numpy as np
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("table.npy")
+        ...     np.save(path, np.arange(6).reshape(2, 3))
+        ...     conf = OmegaConf.create({"key": f"${{hya.np.load:{path}}}"})
+        ...     conf.key
+        ...
+        memmap([[0, 1, 2],
+                [3, 4, 5]])
+
+        ```
+    """
+    check_numpy()
+    if mmap_mode not in _MMAP_MODES:
+        msg = f"Incorrect mmap_mode {mmap_mode!r}. The valid modes are {list(_MMAP_MODES)}"
+        raise ValueError(msg)
+    file_key = get_file_key(path)
+    key = (file_key, mmap_mode, member)
+    value = _LOAD_CACHE.get(key)
+    if value is not None:
+        return value
+    if member is None:
+        value = np.load(file_key[0], mmap_mode=mmap_mode, allow_pickle=False)
+        if isinstance(value, np.ndarray) and mmap_mode in _WRITABLE_MMAP_MODES:
+            return value
+    else:
+        value = _load_member(load_resolver(path, mmap_mode), member)
+        if mmap_mode in _WRITABLE_MMAP_MODES:
+            return value
+        value.flags.writeable = False
+    _LOAD_CACHE.put(key, value)
+    return value
+
+
+def memmap_resolver(
+    path: str, dtype: Any, shape: int | Sequence[int], offset: int = 0
+) -> np.memmap | np.ndarray:
+    r"""Implement a resolver to memory-map an array stored in a raw
+    binary file.
+
+    The array is mapped in read-only mode, so no data is read until
+    its pages are accessed. The size of the file is checked against
+    the size of the array before the file is mapped. The mappings
+    are cached in memory and the cache entry is keyed by the path,
+    the modification time and the size of the file, so the configs
+    mapping the same array share the same mapping.
+
+    Args:
+        path: The path to the binary file.
+        dtype: The data type of the array, e.g. ``float32`` or
+            ``fp16``. See ``numpy_dtype_resolver`` for the supported
+            names.
+        shape: The shape of the array. One of the dimensions can be
+            ``-1``, and it is inferred from the size of the file.
+        offset: The offset of the array in the file in bytes.
+
+    Returns:
+        The read-only array.
+
+    Raises:
+        ValueError: if the offset is negative, if the shape is
+            invalid, or if the size of the file does not match the
+            size of the array.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> import numpy as np
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("features.bin")
+        ...     np.arange(6, dtype=np.float32).tofile(path)
+        ...     conf = OmegaConf.create({"key": f"${{hya.np.memmap:{path},float32,[2, 3]}}"})
+        ...     conf.key
+        ...
+        memmap([[0., 1., 2.],
+                [3., 4., 5.]], dtype=float32)
+
+        ```
+    """
+    check_numpy()
+    if offset < 0:
+        msg = f"offset must be non-negative but received {offset}"
+        raise ValueError(msg)
+    dtype = numpy_dtype_resolver(dtype)
+    shape = to_primitive(shape)
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    file_key = get_file_key(path)
+    key = (file_key, "memmap", dtype, shape, offset)
+    array = _LOAD_CACHE.get(key)
+    if array is None:
+        shape = _get_memmap_shape(shape, dtype.itemsize, file_key[2] - offset)
+        if 0 in shape:
+            array = np.empty(shape, dtype=dtype)
+            array.flags.writeable = False
+        else:
+            array = np.memmap(file_key[0], dtype=dtype, mode="r", offset=offset, shape=shape)
+        _LOAD_CACHE.put(key, array)
+    return array
+
+
+def _get_memmap_shape(shape: tuple[int, ...], itemsize: int, nbytes: int) -> tuple[int, ...]:
+    r"""Return the shape of a memory-mapped array and check it matches
+    the size of the data.
+
+    Args:
+        shape: The shape of the array. One of the dimensions can be
+            ``-1``, and it is inferred from the size of the data.
+        itemsize: The size of an element in bytes.
+        nbytes: The size of the data in bytes.
+
+    Returns:
+        The shape of the array.
+
+    Raises:
+        ValueError: if the shape is invalid or if it does not match
+            the size of the data.
+    """
+    if shape.count(-1) > 1 or any(dim < -1 for dim in shape):
+        msg = f"Incorrect shape {shape}. The dimensions must be non-negative or a single -1"
+        raise ValueError(msg)
+    if -1 in shape:
+        # The size of the array without the inferred dimension.
+        block = math.prod(dim for dim in shape if dim != -1) * itemsize
+        if block and nbytes >= 0 and nbytes % block == 0:
+            shape = tuple(nbytes // block if dim == -1 else dim for dim in shape)
+    if -1 in shape or math.prod(shape) * itemsize != nbytes:
+        msg = (
+            f"The data size ({nbytes:,} bytes) does not match the array of shape {shape} "
+            f"and itemsize {itemsize}"
+        )
+        raise ValueError(msg)
+    return shape
+
+
+def _load_member(data: Any, member: str) -> np.ndarray:
+    r"""Load an array from a ``.npz`` file.
+
+    Args:
+        data: The loaded ``.npz`` file.
+        member: The name of the array.
+
+    Returns:
+        The array.
+
+    Raises:
+        TypeError: if the data is not a ``.npz`` file.
+    """
+    if not isinstance(data, np.lib.npyio.NpzFile):
+        msg = f"member can only be used with a .npz file but received member={member!r}"
+        raise TypeError(msg)
+    return data[member]
+
+
+def shared_array_resolver(data: ArrayLike) -> np.ndarray:
+    r"""Implement a resolver to transform the input to a read-only
+    ``numpy.ndarray`` stored in shared memory.
+
+    The array is stored in a shared memory segment keyed by a hash of
+    the input. The first process that resolves the value creates the
+    array, and the other processes, e.g. the data loader workers,
+    attach to the same memory without creating the array again. The
+    segment is freed when the process that created it exits and all
+    the other processes are detached. The input is converted with
+    ``to_array_resolver`` if it cannot be hashed.
+
+    Args:
+        data: Specifies the data to transform in ``numpy.ndarray``.
+            This value should be compatible with ``numpy.array``
+
+    Returns:
+        The input in a read-only ``numpy.ndarray`` object.
+
+    Raises:
+        ValueError: if the array contains Python objects.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.np.shared_array:[1, 2, 3]}"})
+        >>> conf.key
+        array([1, 2, 3])
+
+        ```
+    """
+    check_numpy()
+    try:
+        key = f"hya.np.shared_array:{hash_arguments(data)}"
+    except TypeError:
+        array = to_array_resolver(data)
+    else:
+        metadata, buffer = get_shared_buffer(key, lambda: _encode_array(to_array_resolver(data)))
+        array = np.frombuffer(buffer, dtype=metadata["dtype"]).reshape(metadata["shape"])
+    array.flags.writeable = False
+    return array
+
+
+def interned_array_resolver(
+    data: ArrayLike,
+    dtype: Any = None,
+    shape: int | Sequence[int] | None = None,
+    order: str = "C",
+) -> np.ndarray:
+    r"""Implement a resolver to transform the input to an interned
+    read-only ``numpy.ndarray``.
+
+    The input is converted like ``to_array_resolver``, and the arrays
+    with the same content, data type, shape and memory layout are
+    replaced by a single read-only instance, so the configs creating
+    the same array share the same memory. See ``intern_array`` for
+    more information.
+
+    Args:
+        data: Specifies the data to transform in ``numpy.ndarray``.
+            This value should be compatible with ``numpy.array``
+        dtype: The data type of the array. ``None`` means the data
+            type is inferred from the data.
+        shape: The shape of the array. ``None`` means the shape of
+            the data.
+        order: The memory layout of the array, ``C`` or ``F``.
+
+    Returns:
+        The interned read-only ``numpy.ndarray`` object.
+
+    Raises:
+        ValueError: if the array contains Python objects.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create(
+        ...     {"a": "${hya.np.interned_array:[1, 2, 3]}", "b": "${hya.np.interned_array:[1, 2, 3]}"}
+        ... )
+        >>> conf.a
+        array([1, 2, 3])
+        >>> conf.a is conf.b
+        True
+
+        ```
+    """
+    return intern_array(to_array_resolver(data, dtype, shape, order))
+
+
+def intern_array(array: np.ndarray, table: InternTable | None = None) -> np.ndarray:
+    r"""Return the interned instance of an array.
+
+    The key of an array is a hash of its content, computed without
+    copying the C-contiguous and Fortran-contiguous arrays, its data
+    type, shape and strides. The first array with a given key is
+    added to the table, and the interned array is returned for all
+    the arrays with the same key. The interned array is read-only: the
+    input array is interned as it is if it is read-only and owns its
+    data, otherwise a read-only copy is interned, so the input array
+    is never modified. The table holds the arrays through weak
+    references, so an array is freed when no config uses it.
+
+    Args:
+        array: The array to intern.
+        table: The intern table. ``None`` means the table returned
+            by ``get_intern_table``.
+
+    Returns:
+        The interned read-only array.
+
+    Raises:
+        ValueError: if the array contains Python objects.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from hya.numpy import intern_array
+        >>> array = intern_array(np.arange(4))
+        >>> intern_array(np.arange(4)) is array
+        True
+        >>> array.flags.writeable
+        False
+        >>> data = np.arange(4)
+        >>> intern_array(data) is array, data.flags.writeable
+        (True, True)
+
+        ```
+    """
+    if array.dtype.hasobject:
+        msg = f"Cannot intern an array of Python objects (dtype={array.dtype})"
+        raise ValueError(msg)
+    if array.flags.c_contiguous:
+        content = array
+    elif array.flags.f_contiguous:
+        # The transpose of a Fortran-contiguous array is C-contiguous
+        # and points to the same memory.
+        content = array.T
+    else:
+        content = np.ascontiguousarray(array)
+    digest = hashlib.blake2b(content, digest_size=32).digest()
+    key = (array.dtype.str, array.shape, array.strides, digest)
+    return (get_intern_table() if table is None else table).intern(key, array, _freeze_array)
+
+
+def _freeze_array(array: np.ndarray) -> np.ndarray:
+    r"""Return a read-only array with the same content as an array.
+
+    Args:
+        array: The array.
+
+    Returns:
+        The array itself if it is read-only and owns its data,
+            otherwise a read-only copy of the array.
+    """
+    if array.flags.writeable or not array.flags.owndata:
+        array = array.copy(order="K")
+        array.flags.writeable = False
+    return array
+
+
+def _encode_array(array: np.ndarray) -> tuple[dict[str, Any], np.ndarray]:
+    r"""Encode an array to store it in shared memory.
+
+    Args:
+        array: The array to encode.
+
+    Returns:
+        A tuple with the dtype and shape of the array, and its data
+            as a contiguous array of bytes.
+
+    Raises:
+        ValueError: if the array contains Python objects.
+    """
+    if array.dtype.hasobject:
+        msg = f"Cannot share an array of Python objects (dtype={array.dtype})"
+        raise ValueError(msg)
+    metadata = {"dtype": array.dtype.str, "shape": list(array.shape)}
+    return metadata, np.ascontiguousarray(array).reshape(-1).view(np.uint8)
@@ -8,6 +8,9 @@ from typing import Any, TypeVar
 
 from omegaconf import OmegaConf
 
+from hya.utils import cache
+from hya.utils.disk_cache import persistent_cache
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -70,7 +73,9 @@ class ResolverRegistry:
         """
         return key in self._state
 
-    def register(self, key: str, exist_ok: bool = False) -> Callable[[F], F]:
+    def register(
+        self, key: str, exist_ok: bool = False, persistent: bool = False, memoize: bool = False
+    ) -> Callable[[F], F]:
         """Register a resolver to registry with the specified key.
 
         This method returns a decorator that can be used to register resolver functions.
@@ -81,6 +86,18 @@ class ResolverRegistry:
             exist_ok: If False, a RuntimeError is raised if you try to register
                 a new resolver with an existing key. If True, the existing
                 resolver will be overridden.
+            persistent: If True, the results of the resolver are cached on disk
+                and shared between processes. The results are keyed by the
+                resolver key, the hash of the resolver code and the hash of the
+                arguments. The resolver stored in the registry is wrapped, and
+                the returned resolver is unchanged. See
+                ``hya.utils.disk_cache.persistent_cache`` for more details.
+            memoize: If True, the results of the resolver are cached in memory
+                and shared by all the configs of the process, so the same
+                interpolation in many configs is resolved once. The cached
+                value is returned to all the configs, so it should not be
+                modified in place. See ``hya.utils.cache.memoize`` for more
+                details.
 
         Returns:
             A decorator function that registers the resolver and returns it unchanged.
@@ -88,6 +105,8 @@ class ResolverRegistry:
         Raises:
             TypeError: If the resolver is not callable.
             RuntimeError: If the key already exists and exist_ok is False.
+            ValueError: If persistent or memoize is True and the resolver
+                results depend on the config.
 
         Example:
             ```pycon
@@ -115,7 +134,8 @@ class ResolverRegistry:
                 )
                 raise RuntimeError(msg)
 
-            self._state[key] = resolver
+            wrapped = persistent_cache(key)(resolver) if persistent else resolver
+            self._state[key] = cache.memoize(key)(wrapped) if memoize else wrapped
             return resolver
 
         return wrap
@@ -1,24 +1,59 @@
-r"""Implement some resolvers using features from standard libraries."""
+r"""Implement some resolvers using features from standard libraries.
+
+Some resolvers use NumPy for faster code paths when the ``numpy``
+package is available, but NumPy is not required. The math resolvers
+accept a list, a ``ListConfig`` or a ``numpy.ndarray`` of numbers, and
+are then applied elementwise with NumPy ufuncs, so a whole schedule is
+transformed in one interpolation. The reduction resolvers (``sum``,
+``mean``, ``std``, ``quantile``, ``argmax``, ``max``, ``min``) reduce a
+sequence of numbers with NumPy or with ``math.fsum`` and
+``statistics``.
+"""
 
 from __future__ import annotations
 
+import copy
 import hashlib
+import itertools
 import logging
 import math
+import operator
 from pathlib import Path
+import statistics
 from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote, urlparse
 
+from omegaconf import ListConfig
+
+from hya.imports import is_numpy_available
+from hya.sequences import LazySequence
+from hya.utils.containers import to_primitive
+
+if TYPE_CHECKING or is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    from hya.utils.fallback.numpy import numpy as np
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Sequence
 
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_INT_TYPES = {bool, int}
+_NUMBER_TYPES = {bool, float, int}
+_JOIN_CHUNK_SIZE = 65536
+
 
 def add_resolver(*args: Any) -> Any:
     r"""Return the addition of several objects.
 
+    The addition runs in linear time of the total size of the
+    inputs, and the inputs are never modified. Numbers are added
+    with ``sum`` or ``math.fsum``, strings, lists and tuples are
+    concatenated in one pass, and NumPy arrays are accumulated in a
+    single output array.
+
     Args:
         *args: The values to add.
 
@@ -35,23 +70,72 @@ def add_resolver(*args: Any) -> Any:
         >>> conf = OmegaConf.create({"key": "${hya.add:1,2,3,4}"})
         >>> conf.key
         10
+        >>> conf = OmegaConf.create({"key": "${hya.add:[1,2],[3],[4,5]}"})
+        >>> conf.key
+        [1, 2, 3, 4, 5]
 
         ```
     """
-    output = args[0]
-    for arg in args[1:]:
-        output += arg
-    return output
+    types = set(map(type, args))
+    if types <= _INT_TYPES:
+        return sum(args)
+    if types <= _NUMBER_TYPES:
+        return _fsum(args)
+    if types == {str}:
+        return "".join(args)
+    if types <= {list, ListConfig} or types == {tuple}:
+        items = itertools.chain.from_iterable(args)
+        return tuple(items) if types == {tuple} else list(items)
+    if _is_array_reduction(args):
+        return _reduce_arrays(np.add, args, identity=0)
+    return _fold(operator.add, operator.iadd, args)
+
+
+def argmax_resolver(data: Sequence[float] | np.ndarray) -> int:
+    r"""Return the index of the maximum value of a sequence.
 
+    Args:
+        data: The sequence of numbers, e.g. a list, a ``ListConfig``
+            or a ``numpy.ndarray``.
+
+    Returns:
+        The index of the first occurrence of the maximum value. The
+            index is in the flattened array for multi-dimensional
+            arrays.
 
-def asinh_resolver(number: float) -> float:
+    Raises:
+        ValueError: if the sequence is empty.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.argmax:[3,1,4,1,5,9,2]}"})
+        >>> conf.key
+        5
+
+        ```
+    """
+    return _reduce(
+        data,
+        func=lambda values: max(range(len(values)), key=values.__getitem__),
+        array_func=lambda array: int(array.argmax()),
+        name="argmax",
+        vectorize=True,
+    )
+
+
+def asinh_resolver(
+    number: float | Sequence[float] | np.ndarray,
+) -> float | list[float] | np.ndarray:
     r"""Return the inverse hyperbolic sine.
 
     Args:
-        number: The number to transform.
+        number: The number to transform, or a list or array of
+            numbers to transform elementwise.
 
     Returns:
-        The inverse hyperbolic sine of the input number.
+        The inverse hyperbolic sine of the input number(s).
 
     Example:
         ```pycon
@@ -63,7 +147,7 @@ def asinh_resolver(number: float) -> float:
 
         ```
     """
-    return math.asinh(number)
+    return _elementwise(math.asinh, "arcsinh", number)
 
 
 def ceildiv_resolver(dividend: float, divisor: float) -> float:
@@ -98,14 +182,15 @@ def ceildiv_resolver(dividend: float, divisor: float) -> float:
     return -(dividend // -divisor)
 
 
-def exp_resolver(number: float) -> float:
+def exp_resolver(number: float | Sequence[float] | np.ndarray) -> float | list[float] | np.ndarray:
     r"""Return the exponential value of the input.
 
     Args:
-        number: The number to transform.
+        number: The number to transform, or a list or array of
+            numbers to transform elementwise.
 
     Returns:
-        The exponential value of the input.
+        The exponential value of the input(s).
 
     Example:
         ```pycon
@@ -114,10 +199,13 @@ def exp_resolver(number: float) -> float:
         >>> conf = OmegaConf.create({"key": "${hya.exp:0}"})
         >>> conf.key
         1.0
+        >>> conf = OmegaConf.create({"key": "${hya.exp:[0,0]}"})
+        >>> conf.key
+        [1.0, 1.0]
 
         ```
     """
-    return math.exp(number)
+    return _elementwise(math.exp, "exp", number)
 
 
 def floordiv_resolver(dividend: float, divisor: float) -> float:
@@ -171,12 +259,20 @@ def len_resolver(obj: Any) -> int:
     return len(obj)
 
 
-def iter_join_resolver(iterable: Iterable[Any], separator: str) -> str:
+def iter_join_resolver(
+    iterable: Iterable[Any], separator: str, format_spec: str | None = None
+) -> str:
     r"""Convert all items in an iterable to strings and join them.
 
     This resolver takes an iterable (e.g., list, tuple) and concatenates
     all elements into a single string, separated by the specified separator.
-    Each element is converted to a string using str().
+    Each element is converted to a string using str(), or using format()
+    if a format specification is given.
+
+    A ``ListConfig`` is converted to a list in one pass before joining
+    its items, and the iterables without a length (e.g., the output of
+    ``hya.braceexpand``) are joined by chunks so the string
+    representations of all the items are never stored at once.
 
     Args:
         iterable: Any iterable object where all the returned values
@@ -184,6 +280,8 @@ def iter_join_resolver(iterable: Iterable[Any], separator: str) -> str:
             include lists, tuples, or OmegaConf ListConfig objects.
         separator: The separator string to use between the items.
             Can be any string including empty string, space, comma, etc.
+        format_spec: An optional format specification used to convert
+            each item to a string, e.g. ``03d`` or ``.2f``.
 
     Returns:
         A single string with all iterable elements joined by the separator.
@@ -198,21 +296,36 @@ def iter_join_resolver(iterable: Iterable[Any], separator: str) -> str:
         >>> conf = OmegaConf.create({"path": "${hya.iter_join:[data,models,v1],/}"})
         >>> conf.path
         data/models/v1
+        >>> conf = OmegaConf.create({"key": "${hya.iter_join:[1,2,3],-,03d}"})
+        >>> conf.key
+        001-002-003
 
         ```
     """
-    return separator.join(map(str, iterable))
-
-
-def log_resolver(number: float, base: float = math.e) -> float:
+    items = to_primitive(iterable)
+    # OmegaConf parses a numeric format specification, e.g. a width, as an integer.
+    convert = str if format_spec is None else operator.methodcaller("__format__", str(format_spec))
+    if isinstance(items, (list, tuple)):
+        return separator.join(map(convert, items))
+    strings = map(convert, items)
+    chunks = []
+    while chunk := list(itertools.islice(strings, _JOIN_CHUNK_SIZE)):
+        chunks.append(separator.join(chunk))
+    return separator.join(chunks)
+
+
+def log_resolver(
+    number: float | Sequence[float] | np.ndarray, base: float = math.e
+) -> float | list[float] | np.ndarray:
     r"""Compute logarithm of the input value to the given base.
 
     Args:
-        number: The number to transform.
+        number: The number to transform, or a list or array of
+            numbers to transform elementwise.
         base: The base.
 
     Returns:
-        The logarithm of the input value to the given base.
+        The logarithm of the input value(s) to the given base.
 
     Example:
         ```pycon
@@ -224,17 +337,22 @@ def log_resolver(number: float, base: float = math.e) -> float:
 
         ```
     """
-    return math.log(number, base)
+    if base == math.e:
+        return _elementwise(math.log, "log", number)
+    return _elementwise(lambda x: math.log(x, base), lambda x: np.log(x) / np.log(base), number)
 
 
-def log10_resolver(number: float) -> float:
+def log10_resolver(
+    number: float | Sequence[float] | np.ndarray,
+) -> float | list[float] | np.ndarray:
     r"""Compute base 10 logarithm of the input value.
 
     Args:
-        number: The number to transform.
+        number: The number to transform, or a list or array of
+            numbers to transform elementwise.
 
     Returns:
-        The base 10 logarithm of the input value.
+        The base 10 logarithm of the input value(s).
 
     Example:
         ```pycon
@@ -246,17 +364,25 @@ def log10_resolver(number: float) -> float:
 
         ```
     """
-    return math.log10(number)
+    return _elementwise(math.log10, "log10", number)
 
 
 def max_resolver(*args: Any) -> Any:
-    r"""Return the maximum between multiple values.
+    r"""Return the maximum between multiple values, or the maximum
+    value of a sequence.
+
+    A single sequence (list, ``ListConfig``, ``numpy.ndarray``, ...)
+    is reduced over its values. The ``ListConfig`` are converted to a
+    list in one pass, and the arrays are reduced with NumPy.
 
     Args:
-        *args: The values.
+        *args: The values, or a single sequence of values.
 
     Returns:
-        ``max(arg1, arg2, arg3, ..., argN)``
+        ``max(arg1, arg2, arg3, ..., argN)`` or ``max(sequence)``
+
+    Raises:
+        ValueError: if the sequence is empty.
 
     Example:
         ```pycon
@@ -265,20 +391,64 @@ def max_resolver(*args: Any) -> Any:
         >>> conf = OmegaConf.create({"key": "${hya.max:1,2,3}"})
         >>> conf.key
         3
+        >>> conf = OmegaConf.create({"values": [3, 1, 2], "key": "${hya.max:${values}}"})
+        >>> conf.key
+        3
 
         ```
     """
+    if len(args) == 1:
+        return _reduce(args[0], func=max, array_func=lambda array: array.max().item(), name="max")
     return max(*args)
 
 
+def mean_resolver(data: Sequence[float] | np.ndarray) -> float:
+    r"""Return the arithmetic mean of a sequence of numbers.
+
+    Args:
+        data: The sequence of numbers, e.g. a list, a ``ListConfig``
+            or a ``numpy.ndarray``.
+
+    Returns:
+        The mean of the values.
+
+    Raises:
+        ValueError: if the sequence is empty.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.mean:[1,2,3,4]}"})
+        >>> conf.key
+        2.5
+
+        ```
+    """
+    return _reduce(
+        data,
+        func=statistics.fmean,
+        array_func=lambda array: array.mean(dtype=np.float64).item(),
+        name="mean",
+    )
+
+
 def min_resolver(*args: Any) -> Any:
-    r"""Return the minimum between multiple values.
+    r"""Return the minimum between multiple values, or the minimum
+    value of a sequence.
+
+    A single sequence (list, ``ListConfig``, ``numpy.ndarray``, ...)
+    is reduced over its values. The ``ListConfig`` are converted to a
+    list in one pass, and the arrays are reduced with NumPy.
 
     Args:
-        *args: The values.
+        *args: The values, or a single sequence of values.
 
     Returns:
-        ``min(arg1, arg2, arg3, ..., argN)``
+        ``min(arg1, arg2, arg3, ..., argN)`` or ``min(sequence)``
+
+    Raises:
+        ValueError: if the sequence is empty.
 
     Example:
         ```pycon
@@ -287,15 +457,25 @@ def min_resolver(*args: Any) -> Any:
         >>> conf = OmegaConf.create({"key": "${hya.min:1,2,3}"})
         >>> conf.key
         1
+        >>> conf = OmegaConf.create({"values": [3, 1, 2], "key": "${hya.min:${values}}"})
+        >>> conf.key
+        1
 
         ```
     """
+    if len(args) == 1:
+        return _reduce(args[0], func=min, array_func=lambda array: array.min().item(), name="min")
     return min(*args)
 
 
 def mul_resolver(*args: Any) -> Any:
     r"""Return the multiplication of several objects.
 
+    The multiplication runs in linear time of the number of inputs,
+    and the inputs are never modified. Numbers are multiplied with
+    ``math.prod``, and NumPy arrays are accumulated in a single
+    output array.
+
     Args:
         *args: The values to multiply.
 
@@ -315,20 +495,22 @@ def mul_resolver(*args: Any) -> Any:
 
         ```
     """
-    output = args[0]
-    for arg in args[1:]:
-        output *= arg
-    return output
+    if set(map(type, args)) <= _NUMBER_TYPES:
+        return math.prod(args)
+    if _is_array_reduction(args):
+        return _reduce_arrays(np.multiply, args, identity=1)
+    return _fold(operator.mul, operator.imul, args)
 
 
-def neg_resolver(number: float) -> float:
+def neg_resolver(number: float | Sequence[float] | np.ndarray) -> float | list[float] | np.ndarray:
     r"""Return the negation (``-number``).
 
     Args:
-        number: The number to transform.
+        number: The number to transform, or a list or array of
+            numbers to transform elementwise.
 
     Returns:
-        The negated input number.
+        The negated input number(s).
 
     Example:
         ```pycon
@@ -340,7 +522,7 @@ def neg_resolver(number: float) -> float:
 
         ```
     """
-    return -number
+    return _elementwise(operator.neg, _negative, number)
 
 
 def path_resolver(path: str) -> Path:
@@ -397,9 +579,14 @@ def pi_resolver() -> float:
     return math.pi
 
 
-def pow_resolver(value: float, exponent: float) -> float:
+def pow_resolver(
+    value: float | Sequence[float] | np.ndarray, exponent: float | Sequence[float] | np.ndarray
+) -> float | list[float] | np.ndarray:
     r"""Return a value to a given power.
 
+    The value and the exponent can be lists or arrays, in which
+    case the power is computed elementwise with broadcasting.
+
     Args:
         value: The value or base.
         exponent: The exponent.
@@ -414,21 +601,75 @@ def pow_resolver(value: float, exponent: float) -> float:
         >>> conf = OmegaConf.create({"key": "${hya.pow:2,3}"})
         >>> conf.key
         8
+        >>> conf = OmegaConf.create({"key": "${hya.pow:10,[-1,-2,-3]}"})
+        >>> conf.key
+        [0.1, 0.01, 0.001]
 
         ```
     """
-    return value**exponent
+    return _elementwise(operator.pow, _power, value, exponent)
+
 
+def quantile_resolver(
+    data: Sequence[float] | np.ndarray, q: float | Sequence[float]
+) -> float | list[float]:
+    r"""Return the quantiles of a sequence of numbers.
+
+    The quantiles are computed with the linear interpolation between
+    the closest values, like the default method of
+    ``numpy.quantile``.
+
+    Args:
+        data: The sequence of numbers, e.g. a list, a ``ListConfig``
+            or a ``numpy.ndarray``.
+        q: The probability or the sequence of probabilities of the
+            quantiles to compute. The values must be in ``[0, 1]``.
 
-def sqrt_resolver(number: float) -> float:
+    Returns:
+        The quantile, or the list of quantiles if ``q`` is a
+            sequence.
+
+    Raises:
+        ValueError: if the sequence is empty or if a probability is
+            not in ``[0, 1]``.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.quantile:[1,2,3,4,5],0.5}"})
+        >>> conf.key
+        3.0
+        >>> conf = OmegaConf.create({"key": "${hya.quantile:[1,2,3,4,5],[0.1,0.9]}"})
+        >>> conf.key
+        [1.4, 4.6]
+
+        ```
+    """
+    q = to_primitive(q)
+    probs = list(q) if isinstance(q, (list, tuple)) else [q]
+    if any(not 0 <= prob <= 1 for prob in probs):
+        msg = f"The quantile probabilities must be in [0, 1] but received {q}"
+        raise ValueError(msg)
+    output = _reduce(
+        data,
+        func=lambda values: _quantiles(sorted(values), probs),
+        array_func=lambda array: np.quantile(array, probs).tolist(),
+        name="quantile",
+        vectorize=True,
+    )
+    return output if isinstance(q, (list, tuple)) else output[0]
+
+
+def sqrt_resolver(number: float | Sequence[float] | np.ndarray) -> float | list[float] | np.ndarray:
     r"""Return the square root of a number.
 
     Args:
         number: The number to compute the
-            square root.
+            square root, or a list or array of numbers.
 
     Returns:
-        The square root of the input number.
+        The square root of the input number(s).
 
     Example:
         ```pycon
@@ -440,7 +681,7 @@ def sqrt_resolver(number: float) -> float:
 
         ```
     """
-    return math.sqrt(number)
+    return _elementwise(math.sqrt, "sqrt", number)
 
 
 def sha256_resolver(obj: Any) -> str:
@@ -472,14 +713,15 @@ def sha256_resolver(obj: Any) -> str:
     return hashlib.sha256(bytes(str(obj), "utf-8")).hexdigest()
 
 
-def sinh_resolver(number: float) -> float:
+def sinh_resolver(number: float | Sequence[float] | np.ndarray) -> float | list[float] | np.ndarray:
     r"""Return the hyperbolic sine.
 
     Args:
-        number: The number to transform.
+        number: The number to transform, or a list or array of
+            numbers to transform elementwise.
 
     Returns:
-        The hyperbolic sine of the input number.
+        The hyperbolic sine of the input number(s).
 
     Example:
         ```pycon
@@ -491,7 +733,48 @@ def sinh_resolver(number: float) -> float:
 
         ```
     """
-    return math.sinh(number)
+    return _elementwise(math.sinh, "sinh", number)
+
+
+def std_resolver(data: Sequence[float] | np.ndarray, ddof: int = 0) -> float:
+    r"""Return the standard deviation of a sequence of numbers.
+
+    Args:
+        data: The sequence of numbers, e.g. a list, a ``ListConfig``
+            or a ``numpy.ndarray``.
+        ddof: The delta degrees of freedom. The divisor used in the
+            computation is ``N - ddof``, where ``N`` is the number of
+            values. ``0`` computes the population standard deviation
+            and ``1`` the sample standard deviation.
+
+    Returns:
+        The standard deviation of the values.
+
+    Raises:
+        ValueError: if the number of values is not greater than
+            ``ddof``.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.std:[2,4,4,4,5,5,7,9]}"})
+        >>> conf.key
+        2.0
+
+        ```
+    """
+
+    def std(values: Sequence[float]) -> float:
+        _check_ddof(len(values), ddof)
+        mean = statistics.fmean(values)
+        return math.sqrt(math.fsum((value - mean) ** 2 for value in values) / (len(values) - ddof))
+
+    def array_std(array: np.ndarray) -> float:
+        _check_ddof(array.size, ddof)
+        return array.std(ddof=ddof, dtype=np.float64).item()
+
+    return _reduce(data, func=std, array_func=array_std, name="std", vectorize=True)
 
 
 def sub_resolver(object1: Any, object2: Any) -> Any:
@@ -517,6 +800,44 @@ def sub_resolver(object1: Any, object2: Any) -> Any:
     return object1 - object2
 
 
+def sum_resolver(data: Sequence[float] | np.ndarray) -> float:
+    r"""Return the sum of a sequence of numbers.
+
+    The integers are summed exactly with ``sum``, and the floats with
+    ``math.fsum`` to avoid the loss of precision of the naive
+    summation.
+
+    Args:
+        data: The sequence of numbers, e.g. a list, a ``ListConfig``
+            or a ``numpy.ndarray``.
+
+    Returns:
+        The sum of the values. The sum of an empty sequence is ``0``.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.sum:[1,2,3,4]}"})
+        >>> conf.key
+        10
+        >>> conf = OmegaConf.create({"key": "${hya.sum:[0.1,0.2,0.3]}"})
+        >>> conf.key
+        0.6
+
+        ```
+    """
+
+    def fsum(values: Sequence[float]) -> float:
+        output = sum(values)
+        # The sum is exact if all the values are integers.
+        return output if isinstance(output, int) else _fsum(values)
+
+    return _reduce(
+        data, func=fsum, array_func=lambda array: array.sum().item(), name="sum", allow_empty=True
+    )
+
+
 def to_path_resolver(path: str) -> Path:
     r"""Convert a path string (including URLs) into a ``pathlib.Path``.
 
@@ -571,3 +892,297 @@ def truediv_resolver(dividend: float, divisor: float) -> float:
         ```
     """
     return dividend / divisor
+
+
+def _check_ddof(size: int, ddof: int) -> None:
+    r"""Check the number of values is greater than the delta degrees
+    of freedom.
+
+    Args:
+        size: The number of values.
+        ddof: The delta degrees of freedom.
+
+    Raises:
+        ValueError: if the number of values is not greater than
+            ``ddof``.
+    """
+    if size <= ddof:
+        msg = f"The number of values ({size:,}) must be greater than ddof ({ddof})"
+        raise ValueError(msg)
+
+
+def _elementwise(func: Callable[..., Any], array_func: str | Callable[..., Any], *args: Any) -> Any:
+    r"""Apply a math function to numbers or elementwise to lists and
+    arrays.
+
+    The elementwise outputs are the same as the outputs of ``func``:
+    the NumPy floating point errors are raised, e.g. ``sqrt([-1])``
+    raises a ``ValueError`` like ``math.sqrt(-1)``.
+
+    Args:
+        func: The function to apply to numbers, e.g. ``math.exp``.
+        array_func: The function to apply to arrays, or the name of
+            the NumPy function, e.g. ``"exp"``.
+        *args: The inputs of the function.
+
+    Returns:
+        The output of ``func`` if no input is a sequence or an array,
+            otherwise the elementwise output as a ``numpy.ndarray``
+            if one of the inputs is an array or a lazy sequence, or
+            as a list. The other objects, e.g. the tensors, are
+            passed to ``func`` as they are.
+
+    Raises:
+        ValueError: if an input is outside the domain of the function.
+        OverflowError: if an output is too large.
+    """
+    if not any(_is_array_like(arg) for arg in args):
+        return func(*args)
+    args = tuple(to_primitive(arg) for arg in args)
+    if not is_numpy_available():
+        return _map_nested(func, *args)
+    if isinstance(array_func, str):
+        array_func = getattr(np, array_func)
+    try:
+        with np.errstate(divide="raise", over="raise", invalid="raise"):
+            output = array_func(*(np.asarray(arg) for arg in args))
+    except FloatingPointError as exc:
+        if "overflow" in str(exc):
+            raise OverflowError(str(exc)) from exc
+        raise ValueError(str(exc)) from exc
+    if any(not isinstance(arg, (list, tuple)) and _is_array_like(arg) for arg in args):
+        return output
+    return output.tolist()
+
+
+def _fold(op: Callable[[Any, Any], Any], iop: Callable[[Any, Any], Any], args: tuple) -> Any:
+    r"""Fold the values with a binary operator without modifying them.
+
+    The first operation creates a new object with ``op``, and the
+    next operations update this object in-place with ``iop`` so
+    mutable sequences are not copied at each step.
+
+    Args:
+        op: The binary operator, e.g. ``operator.add``.
+        iop: The in-place binary operator, e.g. ``operator.iadd``.
+        args: The values to fold.
+
+    Returns:
+        The folded value.
+    """
+    if len(args) == 1:
+        return copy.copy(args[0])
+    output = op(args[0], args[1])
+    for arg in args[2:]:
+        output = iop(output, arg)
+    return output
+
+
+def _fsum(values: Sequence[float]) -> float:
+    r"""Compute an accurate sum of floats.
+
+    ``math.fsum`` raises an error if the values contain infinities of
+    opposite signs or if a partial sum overflows, so the values are
+    summed with ``sum`` in these cases, e.g. ``inf + -inf`` is
+    ``nan``.
+
+    Args:
+        values: The values to sum.
+
+    Returns:
+        The sum of the values.
+    """
+    try:
+        return math.fsum(values)
+    except (ValueError, OverflowError):
+        return sum(values)
+
+
+def _is_array_reduction(args: tuple) -> bool:
+    r"""Indicate if the values can be reduced as NumPy arrays.
+
+    Args:
+        args: The values to check.
+
+    Returns:
+        ``True`` if at least one value is a ``numpy.ndarray`` and
+            all the other values are arrays or numbers, otherwise
+            ``False``.
+    """
+    return (
+        is_numpy_available()
+        and any(isinstance(arg, np.ndarray) for arg in args)
+        and all(isinstance(arg, (np.ndarray, np.generic, int, float, complex)) for arg in args)
+    )
+
+
+def _is_array_like(obj: Any) -> bool:
+    r"""Indicate if an object is a sequence or an array of numbers.
+
+    Args:
+        obj: The object to check.
+
+    Returns:
+        ``True`` if the object is a list, a tuple, a ``ListConfig``,
+            a ``numpy.ndarray`` or a lazy sequence, otherwise
+            ``False``. The other objects with ``__array__``, e.g. the
+            tensors, are not converted to NumPy arrays, so they keep
+            their type and their autograd graph.
+    """
+    if isinstance(obj, (list, tuple, ListConfig)):
+        return True
+    return is_numpy_available() and isinstance(obj, (np.ndarray, LazySequence))
+
+
+def _map_nested(func: Callable[..., Any], *args: Any) -> Any:
+    r"""Apply a function elementwise to nested lists, broadcasting the
+    numbers.
+
+    Args:
+        func: The function to apply to the numbers.
+        *args: The numbers or nested lists of numbers.
+
+    Returns:
+        The output of the function with the same nested structure as
+            the inputs.
+    """
+    sequences = [arg for arg in args if isinstance(arg, (list, tuple))]
+    if not sequences:
+        return func(*args)
+    return [
+        _map_nested(func, *(arg[i] if isinstance(arg, (list, tuple)) else arg for arg in args))
+        for i in range(len(sequences[0]))
+    ]
+
+
+def _negative(value: np.ndarray) -> np.ndarray:
+    r"""Compute the elementwise negation of an array.
+
+    Unlike ``numpy.negative``, the booleans are negated as integers
+    like the Python ``-`` operator.
+
+    Args:
+        value: The values.
+
+    Returns:
+        The elementwise negation.
+    """
+    if value.dtype == bool:
+        value = value.astype(int)
+    return np.negative(value)
+
+
+def _power(value: np.ndarray, exponent: np.ndarray) -> np.ndarray:
+    r"""Compute the elementwise power of arrays.
+
+    Unlike ``numpy.power``, the integers to negative integer powers
+    are computed with floats like the Python ``**`` operator, and
+    the integer powers that overflow the integer data type are
+    computed exactly with Python integers.
+
+    Args:
+        value: The values or bases.
+        exponent: The exponents.
+
+    Returns:
+        The elementwise power.
+    """
+    if not (np.issubdtype(value.dtype, np.integer) and np.issubdtype(exponent.dtype, np.integer)):
+        return np.power(value, exponent)
+    if np.any(exponent < 0):
+        return np.float_power(value, exponent)
+    with np.errstate(over="ignore"):
+        magnitude = np.power(np.abs(value).astype(float), exponent)
+    if np.any(magnitude > np.iinfo(np.result_type(value, exponent)).max):
+        return np.power(value.astype(object), exponent.astype(object))
+    return np.power(value, exponent)
+
+
+def _quantiles(values: Sequence[float], probs: Sequence[float]) -> list[float]:
+    r"""Compute quantiles of sorted values with linear interpolation.
+
+    Args:
+        values: The sorted values.
+        probs: The probabilities of the quantiles.
+
+    Returns:
+        The quantiles.
+    """
+    output = []
+    for prob in probs:
+        position = prob * (len(values) - 1)
+        low = math.floor(position)
+        high = min(low + 1, len(values) - 1)
+        output.append(values[low] + (values[high] - values[low]) * (position - low))
+    return output
+
+
+def _reduce(
+    data: Any,
+    *,
+    func: Callable[[Sequence[Any]], Any],
+    array_func: Callable[[np.ndarray], Any],
+    name: str,
+    allow_empty: bool = False,
+    vectorize: bool = False,
+) -> Any:
+    r"""Reduce a sequence of values with Python or NumPy.
+
+    The objects implementing ``__array__`` (``numpy.ndarray``, lazy
+    sequences, ...) are reduced with NumPy. The other sequences are
+    converted to a list or a tuple, and are reduced with Python, or
+    with NumPy if ``vectorize`` is ``True``. Converting a list to an
+    array is slower than the Python implementation of the simple
+    reductions like ``sum`` or ``max``, but faster than the ones
+    that sort or iterate several times over the values.
+
+    Args:
+        data: The sequence of values to reduce.
+        func: The reduction of a list or tuple of values.
+        array_func: The reduction of a ``numpy.ndarray``.
+        name: The name of the reduction, used in the error messages.
+        allow_empty: If ``True``, the empty sequences are reduced,
+            otherwise an error is raised.
+        vectorize: If ``True``, the lists are converted to a
+            ``numpy.ndarray`` when NumPy is available.
+
+    Returns:
+        The reduced value.
+
+    Raises:
+        ValueError: if the sequence is empty and ``allow_empty`` is
+            ``False``.
+    """
+    if hasattr(data, "__array__") and is_numpy_available():
+        values = np.asarray(data)
+    else:
+        values = to_primitive(data)
+        if not isinstance(values, (list, tuple, range)):
+            values = list(values)
+        if vectorize and is_numpy_available():
+            values = np.asarray(values)
+    is_array = isinstance(values, np.ndarray)
+    if not allow_empty and not (values.size if is_array else len(values)):
+        msg = f"Cannot compute the {name} of an empty sequence"
+        raise ValueError(msg)
+    return array_func(values) if is_array else func(values)
+
+
+def _reduce_arrays(ufunc: np.ufunc, args: tuple, identity: float) -> np.ndarray:
+    r"""Reduce NumPy arrays with a binary ufunc in a single output
+    array.
+
+    Args:
+        ufunc: The binary ufunc, e.g. ``numpy.add``.
+        args: The arrays or numbers to reduce.
+        identity: The identity value of the ufunc.
+
+    Returns:
+        The reduced array, with the broadcasted shape and the
+            promoted dtype of the inputs.
+    """
+    shape = np.broadcast_shapes(*(np.shape(arg) for arg in args))
+    output = np.full(shape, identity, dtype=np.result_type(*args))
+    for arg in args:
+        ufunc(output, arg, out=output)
+    return output
@@ -0,0 +1,347 @@
+r"""Implement resolvers to create lazy numeric sequences.
+
+The sequences returned by these resolvers do not store their values:
+the length, the indexing and the slicing are computed in constant time,
+and the values are only computed when they are accessed. They can be
+converted to a ``numpy.ndarray`` or a ``torch.Tensor`` without creating
+an intermediate Python list.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "LazySequence",
+    "LinspaceSequence",
+    "LogspaceSequence",
+    "linspace_resolver",
+    "logspace_resolver",
+    "range_resolver",
+]
+
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, overload
+
+from hya.imports import check_numpy, is_numpy_available
+
+if TYPE_CHECKING or is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    from hya.utils.fallback.numpy import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class LazySequence(Sequence[float]):
+    r"""Define the base class of the lazy numeric sequences.
+
+    A lazy sequence is defined by a function that computes the value
+    at an index, and by the range of indices of the sequence. Slicing
+    a lazy sequence only slices the range of indices.
+
+    Args:
+        indices: The indices of the sequence. ``None`` means all the
+            indices of the full sequence.
+    """
+
+    def __init__(self, indices: range | None = None) -> None:
+        self._indices = range(self._full_length()) if indices is None else indices
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        check_numpy()
+        indices = np.arange(
+            self._indices.start, self._indices.stop, self._indices.step, dtype=np.float64
+        )
+        return self.evaluate(indices).astype(dtype or np.float64, copy=False)
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> LazySequence: ...  # pragma: no cover
+
+    def __getitem__(self, index: int | slice) -> float | LazySequence:
+        if isinstance(index, slice):
+            return self._with_indices(self._indices[index])
+        return self.evaluate(self._indices[index])
+
+    def __iter__(self) -> Iterator[float]:
+        return map(self.evaluate, self._indices)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{key}={value}" for key, value in self._get_params().items())
+        indices = self._indices
+        if indices == range(self._full_length()):
+            return f"{self.__class__.__qualname__}({args})"
+        return (
+            f"{self.__class__.__qualname__}({args})[{indices.start}:{indices.stop}:{indices.step}]"
+        )
+
+    @property
+    def indices(self) -> range:
+        r"""The indices of the sequence in the full sequence."""
+        return self._indices
+
+    @abstractmethod
+    def evaluate(self, index: Any) -> Any:
+        r"""Compute the values of the full sequence at some indices.
+
+        The indices can be a number or an array (``numpy.ndarray``,
+        ``torch.Tensor``) of floats, so the values are computed with
+        the same formula for single values and arrays.
+
+        Args:
+            index: The indices in the full sequence.
+
+        Returns:
+            The values at the indices.
+        """
+
+    @abstractmethod
+    def _full_length(self) -> int:
+        r"""Return the length of the full sequence."""
+
+    @abstractmethod
+    def _get_params(self) -> dict[str, Any]:
+        r"""Return the parameters of the full sequence."""
+
+    def _with_indices(self, indices: range) -> LazySequence:
+        r"""Return the same sequence restricted to some indices.
+
+        Args:
+            indices: The indices of the new sequence.
+
+        Returns:
+            The new sequence.
+        """
+        return self.__class__(**self._get_params(), indices=indices)
+
+
+class LinspaceSequence(LazySequence):
+    r"""Implement a lazy sequence of evenly spaced numbers over an
+    interval.
+
+    The values are computed with the same formula as
+    ``numpy.linspace``.
+
+    Args:
+        start: The first value of the sequence.
+        stop: The last value of the sequence if ``endpoint`` is
+            ``True``.
+        num: The number of values.
+        endpoint: If ``True``, ``stop`` is the last value,
+            otherwise it is excluded.
+        indices: The indices of the sequence. ``None`` means all the
+            indices of the full sequence.
+
+    Example:
+        ```pycon
+        >>> from hya.sequences import LinspaceSequence
+        >>> seq = LinspaceSequence(0, 1, num=5)
+        >>> len(seq)
+        5
+        >>> list(seq)
+        [0.0, 0.25, 0.5, 0.75, 1.0]
+        >>> list(seq[::2])
+        [0.0, 0.5, 1.0]
+
+        ```
+    """
+
+    def __init__(
+        self,
+        start: float,
+        stop: float,
+        num: int = 50,
+        endpoint: bool = True,
+        *,
+        indices: range | None = None,
+    ) -> None:
+        if num < 0:
+            msg = f"num must be non-negative but received {num}"
+            raise ValueError(msg)
+        self._start = start
+        self._stop = stop
+        self._num = num
+        self._endpoint = endpoint
+        div = num - 1 if endpoint else num
+        self._step = (stop - start) / div if div > 0 else 0.0
+        super().__init__(indices)
+
+    def evaluate(self, index: Any) -> Any:
+        value = index * self._step + self._start
+        if not self._endpoint or self._num < 2:
+            return value
+        if isinstance(index, (int, float)):
+            return float(self._stop) if index == self._num - 1 else value
+        value[index == self._num - 1] = self._stop
+        return value
+
+    def _full_length(self) -> int:
+        return self._num
+
+    def _get_params(self) -> dict[str, Any]:
+        return {
+            "start": self._start,
+            "stop": self._stop,
+            "num": self._num,
+            "endpoint": self._endpoint,
+        }
+
+
+class LogspaceSequence(LinspaceSequence):
+    r"""Implement a lazy sequence of numbers spaced evenly on a log
+    scale.
+
+    The values are computed with the same formula as
+    ``numpy.logspace``, i.e. ``base ** linspace(start, stop, num)``.
+
+    Args:
+        start: The exponent of the first value of the sequence.
+        stop: The exponent of the last value of the sequence if
+            ``endpoint`` is ``True``.
+        num: The number of values.
+        endpoint: If ``True``, ``base ** stop`` is the last value,
+            otherwise it is excluded.
+        base: The base of the log space.
+        indices: The indices of the sequence. ``None`` means all the
+            indices of the full sequence.
+
+    Example:
+        ```pycon
+        >>> from hya.sequences import LogspaceSequence
+        >>> seq = LogspaceSequence(0, 3, num=4)
+        >>> list(seq)
+        [1.0, 10.0, 100.0, 1000.0]
+        >>> seq[-1]
+        1000.0
+
+        ```
+    """
+
+    def __init__(
+        self,
+        start: float,
+        stop: float,
+        num: int = 50,
+        endpoint: bool = True,
+        base: float = 10.0,
+        *,
+        indices: range | None = None,
+    ) -> None:
+        self._base = base
+        super().__init__(start=start, stop=stop, num=num, endpoint=endpoint, indices=indices)
+
+    def evaluate(self, index: Any) -> Any:
+        return self._base ** super().evaluate(index)
+
+    def _get_params(self) -> dict[str, Any]:
+        return super()._get_params() | {"base": self._base}
+
+
+def linspace_resolver(
+    start: float, stop: float, num: int = 50, endpoint: bool = True
+) -> LinspaceSequence:
+    r"""Return a lazy sequence of evenly spaced numbers over an
+    interval.
+
+    The sequence supports ``len``, indexing and slicing in constant
+    time without computing all its values, and the values are equal
+    to the values of ``numpy.linspace``.
+
+    Args:
+        start: The first value of the sequence.
+        stop: The last value of the sequence if ``endpoint`` is
+            ``True``.
+        num: The number of values.
+        endpoint: If ``True``, ``stop`` is the last value,
+            otherwise it is excluded.
+
+    Returns:
+        The lazy sequence.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.linspace:0,1,5}"})
+        >>> conf.key
+        LinspaceSequence(start=0, stop=1, num=5, endpoint=True)
+        >>> list(conf.key)
+        [0.0, 0.25, 0.5, 0.75, 1.0]
+
+        ```
+    """
+    return LinspaceSequence(start=start, stop=stop, num=num, endpoint=endpoint)
+
+
+def logspace_resolver(
+    start: float, stop: float, num: int = 50, endpoint: bool = True, base: float = 10.0
+) -> LogspaceSequence:
+    r"""Return a lazy sequence of numbers spaced evenly on a log scale.
+
+    The sequence supports ``len``, indexing and slicing in constant
+    time without computing all its values, and the values are equal
+    to the values of ``numpy.logspace``.
+
+    Args:
+        start: The exponent of the first value of the sequence.
+        stop: The exponent of the last value of the sequence if
+            ``endpoint`` is ``True``.
+        num: The number of values.
+        endpoint: If ``True``, ``base ** stop`` is the last value,
+            otherwise it is excluded.
+        base: The base of the log space.
+
+    Returns:
+        The lazy sequence.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.logspace:-4,-1,4}"})
+        >>> list(conf.key)
+        [0.0001, 0.001, 0.01, 0.1]
+
+        ```
+    """
+    return LogspaceSequence(start=start, stop=stop, num=num, endpoint=endpoint, base=base)
+
+
+def range_resolver(start: int, stop: int | None = None, step: int = 1) -> range:
+    r"""Return a lazy sequence of integers.
+
+    This resolver returns a Python ``range``, which supports ``len``,
+    indexing and slicing in constant time without storing its
+    values.
+
+    Args:
+        start: The first value of the sequence, or the end of the
+            sequence if ``stop`` is ``None``.
+        stop: The end of the sequence (excluded).
+        step: The difference between two consecutive values.
+
+    Returns:
+        The range of integers.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.range:5}"})
+        >>> conf.key
+        range(0, 5)
+        >>> conf = OmegaConf.create({"key": "${hya.range:2,10,3}"})
+        >>> list(conf.key)
+        [2, 5, 8]
+
+        ```
+    """
+    if stop is None:
+        return range(start)
+    return range(start, stop, step)
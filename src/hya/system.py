@@ -0,0 +1,403 @@
+r"""Implement resolvers to size the worker pools and batches from the
+resources available to the process.
+
+``os.cpu_count`` returns the number of CPUs of the machine, which
+ignores the CPU affinity of the process and the CPU quota and memory
+limit of its container. These resolvers read the CPU affinity
+(``os.sched_getaffinity``), the cgroup v1 and v2 limits
+(``cpu.max``, ``memory.max``, ...) and ``/proc/meminfo``. The values
+are computed once per process, and are computed again in the child
+processes after a fork.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "CGROUP_ROOT",
+    "PROC_ROOT",
+    "available_memory_resolver",
+    "cpu_affinity_count_resolver",
+    "cpu_count_resolver",
+    "get_available_memory",
+    "get_cgroup_available_memory",
+    "get_cgroup_cpu_quota",
+    "get_cpu_affinity_count",
+    "get_cpu_count",
+    "get_meminfo_available",
+]
+
+import functools
+import math
+import os
+from pathlib import Path
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+PROC_ROOT = "/proc"
+
+
+def available_memory_resolver() -> int:
+    r"""Return the memory available to the process in bytes.
+
+    The available memory is the minimum between the available memory
+    of the machine and the memory that can still be allocated before
+    reaching the memory limit of the cgroup of the process.
+
+    Returns:
+        The available memory in bytes.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.available_memory:}"})
+        >>> conf.key  # doctest: +SKIP
+        16777216000
+
+        ```
+    """
+    return get_available_memory()
+
+
+def cpu_affinity_count_resolver() -> int:
+    r"""Return the number of CPUs the process is allowed to run on.
+
+    Returns:
+        The number of CPUs in the CPU affinity of the process.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.cpu_affinity_count:}"})
+        >>> conf.key  # doctest: +SKIP
+        8
+
+        ```
+    """
+    return get_cpu_affinity_count()
+
+
+def cpu_count_resolver() -> int:
+    r"""Return the number of CPUs usable by the process.
+
+    Unlike ``os.cpu_count``, the number of CPUs takes into account
+    the CPU affinity of the process and the CPU quota of its cgroup,
+    so it can be used to size the worker pools in a container.
+
+    Returns:
+        The number of usable CPUs.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.cpu_count:}"})
+        >>> conf.key  # doctest: +SKIP
+        4
+
+        ```
+    """
+    return get_cpu_count()
+
+
+@functools.lru_cache
+def get_available_memory(cgroup_root: str = CGROUP_ROOT, proc_root: str = PROC_ROOT) -> int:
+    r"""Return the memory available to the process in bytes.
+
+    The value is cached per process.
+
+    Args:
+        cgroup_root: The mount point of the cgroup filesystem.
+        proc_root: The mount point of the proc filesystem.
+
+    Returns:
+        The minimum between the available memory of the machine and
+            the available memory of the cgroup. If
+            ``/proc/meminfo`` cannot be read, the available memory
+            of the machine is computed with ``os.sysconf``.
+
+    Example:
+        ```pycon
+        >>> from hya.system import get_available_memory
+        >>> get_available_memory() > 0
+        True
+
+        ```
+    """
+    memory = get_meminfo_available(proc_root)
+    if memory is None:
+        memory = _get_sysconf_memory()
+    cgroup_memory = get_cgroup_available_memory(cgroup_root)
+    if cgroup_memory is not None:
+        memory = min(memory, cgroup_memory)
+    return memory
+
+
+def get_cgroup_available_memory(cgroup_root: str = CGROUP_ROOT) -> int | None:
+    r"""Return the memory available in the cgroup of the process in
+    bytes.
+
+    The available memory is the memory limit minus the memory usage
+    of the cgroup. The inactive file cache is not counted in the
+    usage because it can be reclaimed.
+
+    Args:
+        cgroup_root: The mount point of the cgroup filesystem.
+
+    Returns:
+        The available memory, or ``None`` if the cgroup has no
+            memory limit or the limit cannot be read.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from hya.system import get_cgroup_available_memory
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     _ = Path(tmpdir, "memory.max").write_text("1073741824\n")
+        ...     _ = Path(tmpdir, "memory.current").write_text("268435456\n")
+        ...     get_cgroup_available_memory(tmpdir)
+        ...
+        805306368
+
+        ```
+    """
+    root = Path(cgroup_root)
+    for limit_file, usage_file, stat_file, inactive_key in [
+        # cgroup v2
+        ("memory.max", "memory.current", "memory.stat", "inactive_file"),
+        # cgroup v1
+        (
+            "memory/memory.limit_in_bytes",
+            "memory/memory.usage_in_bytes",
+            "memory/memory.stat",
+            "total_inactive_file",
+        ),
+    ]:
+        limit = _read_int(root.joinpath(limit_file))
+        if limit is None:
+            continue
+        usage = _read_int(root.joinpath(usage_file)) or 0
+        inactive = _read_key_values(root.joinpath(stat_file)).get(inactive_key, 0)
+        return max(limit - max(usage - inactive, 0), 0)
+    return None
+
+
+def get_cgroup_cpu_quota(cgroup_root: str = CGROUP_ROOT) -> float | None:
+    r"""Return the CPU quota of the cgroup of the process.
+
+    Args:
+        cgroup_root: The mount point of the cgroup filesystem.
+
+    Returns:
+        The CPU quota as a number of CPUs, e.g. ``1.5`` if the
+            process can use 150ms of CPU time every 100ms, or
+            ``None`` if the cgroup has no CPU quota or the quota
+            cannot be read.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from hya.system import get_cgroup_cpu_quota
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     _ = Path(tmpdir, "cpu.max").write_text("150000 100000\n")
+        ...     get_cgroup_cpu_quota(tmpdir)
+        ...
+        1.5
+
+        ```
+    """
+    root = Path(cgroup_root)
+    # cgroup v2: "<quota> <period>" where the quota is "max" if unlimited
+    values = _read_text(root.joinpath("cpu.max")).split()
+    if len(values) == 2:
+        return _get_quota(values[0], values[1])
+    # cgroup v1: the quota is -1 if unlimited
+    for directory in ["cpu", "cpu,cpuacct", "cpuacct,cpu"]:
+        quota = _read_text(root.joinpath(directory, "cpu.cfs_quota_us")).strip()
+        period = _read_text(root.joinpath(directory, "cpu.cfs_period_us")).strip()
+        if quota and period:
+            return _get_quota(quota, period)
+    return None
+
+
+@functools.lru_cache
+def get_cpu_affinity_count() -> int:
+    r"""Return the number of CPUs the process is allowed to run on.
+
+    The value is cached per process.
+
+    Returns:
+        The number of CPUs in the CPU affinity of the process, or
+            the number of CPUs of the machine if the CPU affinity is
+            not available on the platform.
+
+    Example:
+        ```pycon
+        >>> from hya.system import get_cpu_affinity_count
+        >>> get_cpu_affinity_count() >= 1
+        True
+
+        ```
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1  # pragma: no cover
+
+
+@functools.lru_cache
+def get_cpu_count(cgroup_root: str = CGROUP_ROOT) -> int:
+    r"""Return the number of CPUs usable by the process.
+
+    The value is cached per process.
+
+    Args:
+        cgroup_root: The mount point of the cgroup filesystem.
+
+    Returns:
+        The minimum between the number of CPUs in the CPU affinity
+            of the process and the CPU quota of its cgroup rounded
+            up. The value is at least ``1``.
+
+    Example:
+        ```pycon
+        >>> from hya.system import get_cpu_count
+        >>> get_cpu_count() >= 1
+        True
+
+        ```
+    """
+    count = get_cpu_affinity_count()
+    quota = get_cgroup_cpu_quota(cgroup_root)
+    if quota is not None:
+        count = min(count, max(math.ceil(quota), 1))
+    return count
+
+
+def get_meminfo_available(proc_root: str = PROC_ROOT) -> int | None:
+    r"""Return the available memory of the machine from
+    ``/proc/meminfo``.
+
+    Args:
+        proc_root: The mount point of the proc filesystem.
+
+    Returns:
+        The value of ``MemAvailable`` in bytes, or ``None`` if it
+            cannot be read.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from hya.system import get_meminfo_available
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     _ = Path(tmpdir, "meminfo").write_text("MemAvailable:    2048 kB\n")
+        ...     get_meminfo_available(tmpdir)
+        ...
+        2097152
+
+        ```
+    """
+    value = _read_key_values(Path(proc_root).joinpath("meminfo")).get("MemAvailable")
+    return None if value is None else value * 1024
+
+
+def _clear_caches() -> None:
+    r"""Clear the cached values, so they are computed again in a new
+    process."""
+    get_available_memory.cache_clear()
+    get_cpu_affinity_count.cache_clear()
+    get_cpu_count.cache_clear()
+
+
+def _get_quota(quota: str, period: str) -> float | None:
+    r"""Compute a CPU quota as a number of CPUs.
+
+    Args:
+        quota: The CPU time per period in microseconds, or ``"max"``
+            or a negative value if unlimited.
+        period: The period in microseconds.
+
+    Returns:
+        The CPU quota, or ``None`` if it is unlimited or invalid.
+    """
+    try:
+        quota_us, period_us = int(quota), int(period)
+    except ValueError:
+        return None
+    if quota_us <= 0 or period_us <= 0:
+        return None
+    return quota_us / period_us
+
+
+def _get_sysconf_memory() -> int:
+    r"""Return the available memory of the machine with
+    ``os.sysconf``.
+
+    Returns:
+        The available memory in bytes, the total memory if the
+            available memory is not supported by the platform, or
+            ``0`` if neither is supported.
+    """
+    for name in ["SC_AVPHYS_PAGES", "SC_PHYS_PAGES"]:
+        try:
+            return os.sysconf(name) * os.sysconf("SC_PAGE_SIZE")
+        except (ValueError, OSError, AttributeError):  # noqa: PERF203
+            continue
+    return 0  # pragma: no cover
+
+
+def _read_int(path: Path) -> int | None:
+    r"""Read an integer from a file.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        The integer, or ``None`` if the file cannot be read or does
+            not contain an integer (e.g. ``"max"``).
+    """
+    try:
+        return int(_read_text(path))
+    except ValueError:
+        return None
+
+
+def _read_key_values(path: Path) -> dict[str, int]:
+    r"""Read the integer values of a file with one ``key value``
+    pair per line, like ``memory.stat`` or ``/proc/meminfo``.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        The integer values by key. The file units (e.g. ``kB``) are
+            ignored.
+    """
+    output = {}
+    for line in _read_text(path).splitlines():
+        values = line.split()
+        if len(values) >= 2 and values[1].isdigit():
+            output[values[0].rstrip(":")] = int(values[1])
+    return output
+
+
+def _read_text(path: Path) -> str:
+    r"""Read a text file.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        The content of the file, or an empty string if the file
+            cannot be read.
+    """
+    try:
+        return path.read_text()
+    except OSError:
+        return ""
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_clear_caches)
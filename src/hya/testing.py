@@ -3,7 +3,7 @@ r"""Define PyTest fixtures for testing optional dependencies.
 This module provides pytest markers and fixtures that help with testing
 the hya library under different dependency configurations. The fixtures
 allow tests to be conditionally skipped based on whether optional
-packages (braceexpand, numpy, torch) are available in the test
+packages (braceexpand, numpy, safetensors, torch) are available in the test
 environment.
 
 These fixtures are useful for ensuring tests only run when the required
@@ -18,13 +18,20 @@ __all__ = [
     "braceexpand_not_available",
     "numpy_available",
     "numpy_not_available",
+    "safetensors_available",
+    "safetensors_not_available",
     "torch_available",
     "torch_not_available",
 ]
 
 import pytest
 
-from hya.imports import is_braceexpand_available, is_numpy_available, is_torch_available
+from hya.imports import (
+    is_braceexpand_available,
+    is_numpy_available,
+    is_safetensors_available,
+    is_torch_available,
+)
 
 braceexpand_available: pytest.MarkDecorator = pytest.mark.skipif(
     not is_braceexpand_available(), reason="Require braceexpand"
@@ -38,6 +45,12 @@ numpy_available: pytest.MarkDecorator = pytest.mark.skipif(
 numpy_not_available: pytest.MarkDecorator = pytest.mark.skipif(
     is_numpy_available(), reason="Skip if numpy is available"
 )
+safetensors_available: pytest.MarkDecorator = pytest.mark.skipif(
+    not is_safetensors_available(), reason="Require safetensors"
+)
+safetensors_not_available: pytest.MarkDecorator = pytest.mark.skipif(
+    is_safetensors_available(), reason="Skip if safetensors is available"
+)
 torch_available: pytest.MarkDecorator = pytest.mark.skipif(
     not is_torch_available(), reason="Require torch"
 )
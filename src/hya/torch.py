@@ -1,4 +1,5 @@
-r"""Implement PyTorch resolvers for tensor creation and dtype handling.
+r"""Implement PyTorch resolvers for tensor creation, dtype handling and
+device selection.
 
 This module provides OmegaConf resolvers that use PyTorch for tensor
 operations and data type specifications. The resolvers are registered
@@ -8,25 +9,75 @@ PyTorch tensors and specify dtypes directly from configuration files.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+import contextlib
+import functools
+import inspect
+import os
 from typing import TYPE_CHECKING, Any
+import zipfile
 
 from omegaconf.errors import InterpolationResolutionError
 
-from hya.imports import check_torch, is_torch_available
+from hya.imports import check_safetensors, check_torch, is_numpy_available, is_torch_available
+from hya.sequences import LazySequence
+from hya.system import get_cpu_count
+from hya.utils.cache import LRUCache, get_file_key
+from hya.utils.containers import to_primitive
+from hya.utils.disk_cache import hash_arguments
+from hya.utils.dtypes import (
+    NUMPY_DTYPE_PREFIXES,
+    TORCH_DTYPE_NAMES,
+    TORCH_DTYPE_PREFIXES,
+    build_dtype_table,
+    get_dtype_name,
+)
+from hya.utils.shared_memory import get_shared_buffer
 
 if TYPE_CHECKING or is_torch_available():
     import torch
 else:  # pragma: no cover
     from hya.utils.fallback.torch import torch
 
+if TYPE_CHECKING or is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    from hya.utils.fallback.numpy import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-def to_tensor_resolver(data: Any) -> torch.Tensor:
+
+def to_tensor_resolver(
+    data: Any, dtype: Any = None, device: Any = None, pin_memory: bool = False
+) -> torch.Tensor:
     r"""Implement a resolver to transform the input to a
     ``torch.Tensor``.
 
+    A ``ListConfig`` is converted to a list of primitive values in
+    one pass before it is given to PyTorch, so PyTorch does not
+    access the OmegaConf nodes one by one. A ``range`` is converted
+    with ``torch.arange`` and the lazy sequences of ``hya.sequences``
+    are computed with vectorized operations, so no intermediate
+    Python list is created. A writable ``numpy.ndarray``, e.g.
+    created by ``hya.np.zeros``, is converted with
+    ``torch.from_numpy``, and a writable buffer, e.g. a
+    ``bytearray``, is converted with ``torch.frombuffer``, so the
+    tensor shares the memory of the input and no data are copied.
+    The read-only arrays and buffers are copied.
+
     Args:
         data: Specifies the data to transform in ``torch.Tensor``.
             This value should be compatible with ``torch.tensor``
+        dtype: The data type of the tensor, e.g. ``float32`` or
+            ``bf16``. See ``torch_dtype_resolver`` for the supported
+            names. ``None`` means the data type is inferred from the
+            data, and it is ``uint8`` for the buffers.
+        device: The device of the tensor, e.g. ``cpu`` or
+            ``cuda:0``. ``None`` means the tensor is on the CPU.
+        pin_memory: If ``True``, the tensor is copied to pinned
+            memory, which speeds up the copies to the accelerators.
+            It requires an accelerator and a CPU tensor.
 
     Returns:
         The input in a ``torch.Tensor`` object.
@@ -38,32 +89,323 @@ def to_tensor_resolver(data: Any) -> torch.Tensor:
         >>> conf = OmegaConf.create({"key": "${hya.torch.tensor:[1,2,3,4,5]}"})
         >>> conf.key
         tensor([1, 2, 3, 4, 5])
+        >>> conf = OmegaConf.create({"key": "${hya.torch.tensor:[1,2,3],bf16,cpu}"})
+        >>> conf.key
+        tensor([1., 2., 3.], dtype=torch.bfloat16)
+
+        ```
+    """
+    check_torch()
+    dtype = None if dtype is None else torch_dtype_resolver(dtype)
+    tensor = _to_tensor(data, dtype)
+    if dtype is not None or device is not None:
+        # ``Tensor.to`` returns the tensor itself if it already has the
+        # data type and the device.
+        tensor = tensor.to(device=device, dtype=dtype)
+    if pin_memory:
+        tensor = tensor.pin_memory()
+    return tensor
+
+
+def _to_tensor(data: Any, dtype: torch.dtype | None) -> torch.Tensor:
+    r"""Transform the input to a ``torch.Tensor`` without copying the
+    arrays and buffers when possible.
+
+    Args:
+        data: The data to transform in ``torch.Tensor``.
+        dtype: The data type of the tensor, or ``None`` to infer it
+            from the data. The arrays and buffers may not have this
+            data type.
+
+    Returns:
+        The input in a ``torch.Tensor`` object.
+    """
+    if isinstance(data, range):
+        return torch.arange(data.start, data.stop, data.step, dtype=dtype)
+    if isinstance(data, LazySequence):
+        indices = data.indices
+        values = data.evaluate(
+            torch.arange(indices.start, indices.stop, indices.step, dtype=torch.float64)
+        )
+        return values.to(dtype or torch.get_default_dtype())
+    # The read-only arrays and buffers are copied because PyTorch does
+    # not support read-only tensors.
+    if is_numpy_available() and isinstance(data, np.ndarray):
+        if data.flags.writeable:
+            with contextlib.suppress(TypeError, ValueError):
+                return torch.from_numpy(data)
+        return torch.tensor(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return _buffer_to_tensor(data, dtype or torch.uint8)
+    return torch.tensor(to_primitive(data), dtype=dtype)
+
+
+def _buffer_to_tensor(data: bytes | bytearray | memoryview, dtype: torch.dtype) -> torch.Tensor:
+    r"""Transform a buffer to a 1D ``torch.Tensor``.
+
+    Args:
+        data: The buffer. It is copied if it is read-only.
+        dtype: The data type of the tensor.
+
+    Returns:
+        The tensor sharing the memory of the buffer, or of its copy.
+    """
+    buffer = memoryview(data).cast("B")
+    if buffer.readonly:
+        buffer = bytearray(buffer)
+    # ``torch.frombuffer`` does not support the empty buffers.
+    if not buffer:
+        return torch.empty(0, dtype=dtype)
+    return torch.frombuffer(buffer, dtype=dtype)
+
+
+def shared_tensor_resolver(data: Any) -> torch.Tensor:
+    r"""Implement a resolver to transform the input to a
+    ``torch.Tensor`` stored in shared memory.
+
+    The tensor is stored in a shared memory segment keyed by a hash
+    of the input. The first process that resolves the value creates
+    the tensor, and the other processes, e.g. the data loader
+    workers, attach to the same memory without creating the tensor
+    again. The segment is freed when the process that created it
+    exits and all the other processes are detached. The input is
+    converted with ``to_tensor_resolver`` if it cannot be hashed.
+
+    The tensor should not be modified in place because the changes
+    are visible to all the processes.
+
+    Args:
+        data: Specifies the data to transform in ``torch.Tensor``.
+            This value should be compatible with ``torch.tensor``
+
+    Returns:
+        The input in a ``torch.Tensor`` object.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.torch.shared_tensor:[1,2,3,4,5]}"})
+        >>> conf.key
+        tensor([1, 2, 3, 4, 5])
+
+        ```
+    """
+    check_torch()
+    try:
+        key = f"hya.torch.shared_tensor:{hash_arguments(data)}"
+    except TypeError:
+        return to_tensor_resolver(data)
+    metadata, buffer = get_shared_buffer(key, lambda: _encode_tensor(to_tensor_resolver(data)))
+    dtype = getattr(torch, metadata["dtype"])
+    if not buffer.nbytes:
+        return torch.empty(metadata["shape"], dtype=dtype)
+    return torch.frombuffer(buffer, dtype=dtype).reshape(metadata["shape"])
+
+
+_LOAD_CACHE: LRUCache[tuple, Any] = LRUCache(max_size=256)
+
+
+def load_resolver(path: str, key: str | None = None) -> Any:
+    r"""Implement a resolver to load tensors from a PyTorch or
+    safetensors file.
+
+    A PyTorch file is loaded with ``torch.load(mmap=True,
+    weights_only=True)``, so the tensors are memory-mapped and their
+    data are only read when they are accessed, and the file cannot
+    execute arbitrary code. The tensors are read in memory without
+    mapping with ``torch<2.1``, which does not support ``mmap``. A
+    ``.safetensors`` file is opened with
+    ``safetensors.safe_open``, and only the selected tensors are
+    read. Each call returns new tensors, so modifying the tensors of
+    a config does not change the tensors of the other configs. The
+    memory-mapped PyTorch files are mapped again for each call with
+    a private copy-on-write mapping, so the configs loading the same
+    file share the pages of the file until they are modified. The
+    files loaded without mapping and the ``safetensors`` handles are
+    cached in memory, and the cache entry is keyed by the path, the
+    modification time and the size of the file, so the file is
+    loaded again when it changes. The cached tensors are cloned for
+    each call.
+
+    Args:
+        path: The path to the file. The files with the
+            ``.safetensors`` suffix are loaded with ``safetensors``.
+        key: The key of the entry to load, e.g. the name of a
+            tensor. The keys of the nested dictionaries are separated
+            by dots, e.g. ``state_dict.encoder.weight``. ``None``
+            means the whole content of the file is returned.
+
+    Returns:
+        The content of the file or the selected entry. The content
+            of a ``.safetensors`` file is a dictionary of tensors.
+
+    Raises:
+        KeyError: if the key is not in the file.
+        RuntimeError: if the file is a ``.safetensors`` file and
+            ``safetensors`` is not installed, or if the file was
+            saved with the legacy (non-zip) format of ``torch.save``,
+            which cannot be memory-mapped.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> import torch
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("model.pt")
+        ...     torch.save({"encoder.weight": torch.ones(2, 2), "step": 10}, path)
+        ...     conf = OmegaConf.create({"key": f"${{hya.torch.load:{path},encoder.weight}}"})
+        ...     conf.key
+        ...
+        tensor([[1., 1.],
+                [1., 1.]])
 
         ```
     """
     check_torch()
-    return torch.tensor(data)
+    file_key = get_file_key(path)
+    if file_key[0].endswith(".safetensors"):
+        return _load_safetensors(file_key, key)
+    if _supports_mmap():
+        # Each mapping is private, so the tensors are not shared.
+        data = _load_torch(file_key[0])
+        return data if key is None else _select(data, key)
+    data = _LOAD_CACHE.get((file_key, "data"))
+    if data is None:
+        data = _load_torch(file_key[0])
+        _LOAD_CACHE.put((file_key, "data"), data)
+    return _clone_tensors(data if key is None else _select(data, key))
+
+
+def _load_torch(path: str) -> Any:
+    r"""Load a PyTorch file with memory mapping if it is supported.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        The content of the file.
+
+    Raises:
+        RuntimeError: if the file was saved with the legacy format.
+    """
+    if not _supports_mmap():
+        return torch.load(path, map_location="cpu", weights_only=True)
+    if not zipfile.is_zipfile(path):
+        msg = (
+            f"Cannot memory-map {path} because it was saved with the legacy format of "
+            "torch.save. Save it again with torch.save(obj, path) (torch>=1.6) to load it "
+            "with hya.torch.load"
+        )
+        raise RuntimeError(msg)
+    return torch.load(path, map_location="cpu", mmap=True, weights_only=True)
+
+
+def _load_safetensors(file_key: tuple[str, int, int], key: str | None) -> Any:
+    r"""Load tensors from a safetensors file.
+
+    Args:
+        file_key: The key of the file returned by ``get_file_key``.
+        key: The name of the tensor to load, or ``None`` to load all
+            the tensors.
+
+    Returns:
+        The tensor, or the dictionary of tensors if ``key`` is
+            ``None``.
+
+    Raises:
+        KeyError: if the tensor is not in the file.
+    """
+    check_safetensors()
+    # Local import because safetensors is an optional dependency.
+    from safetensors import safe_open  # noqa: PLC0415
+
+    handle = _LOAD_CACHE.get((file_key, "handle"))
+    if handle is None:
+        handle = safe_open(file_key[0], framework="pt")
+        _LOAD_CACHE.put((file_key, "handle"), handle)
+    # The tensors returned by the handle share their memory between
+    # the calls, so they are cloned.
+    if key is None:
+        return {name: handle.get_tensor(name).clone() for name in handle.keys()}  # noqa: SIM118
+    if key in handle.keys():  # noqa: SIM118
+        return handle.get_tensor(key).clone()
+    msg = f"{key!r} is not in {file_key[0]}"
+    raise KeyError(msg)
+
+
+def _clone_tensors(data: Any) -> Any:
+    r"""Clone the tensors of a loaded file.
+
+    Args:
+        data: The content of the file, or one of its entries.
+
+    Returns:
+        The data where the tensors, including the tensors in the
+            nested dictionaries, lists and tuples, are cloned.
+    """
+    if isinstance(data, torch.Tensor):
+        return data.clone()
+    if isinstance(data, Mapping):
+        return type(data)((key, _clone_tensors(value)) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return type(data)(_clone_tensors(value) for value in data)
+    return data
 
 
-def torch_dtype_resolver(target: str) -> torch.dtype:
+def _select(data: Any, key: str) -> Any:
+    r"""Select an entry of a loaded file.
+
+    Args:
+        data: The content of the file.
+        key: The key of the entry. The keys of the nested
+            dictionaries are separated by dots.
+
+    Returns:
+        The entry.
+
+    Raises:
+        KeyError: if the key is not in the data.
+    """
+    if isinstance(data, Mapping):
+        if key in data:
+            return data[key]
+        # The keys can contain dots, e.g. the keys of a state dict, so
+        # the longest prefixes are tried first.
+        parts = key.split(".")
+        for index in range(len(parts) - 1, 0, -1):
+            prefix = ".".join(parts[:index])
+            if prefix in data:
+                with contextlib.suppress(KeyError):
+                    return _select(data[prefix], ".".join(parts[index:]))
+    msg = f"{key!r} is not in the loaded data"
+    raise KeyError(msg)
+
+
+def torch_dtype_resolver(target: Any) -> torch.dtype:
     r"""Create a ``torch.dtype`` from its string representation.
 
-    This resolver converts a string name to the corresponding PyTorch
-    data type object. The string must match an attribute name in the
-    torch module that represents a dtype (e.g., "float32", "int64").
+    This resolver looks up the dtype in the table returned by
+    ``get_dtype_table``, so the lookup is a dictionary access. The
+    table contains the names of the dtypes in the torch module
+    (e.g. "float32", "float", "long"), the same names with the
+    ``torch.``, ``np.`` or ``numpy.`` prefix, the aliases such as
+    "fp16" or "bf16", and the NumPy type codes such as "<f4" or
+    "f8".
 
     Args:
-        target: The target data type as a string. Must be a valid
-            torch dtype attribute name such as "float", "float32",
-            "float64", "int32", "int64", "bool", etc. The string
-            should match the attribute name in torch (e.g., use
-            "float32" not "torch.float32").
+        target: The target data type, e.g. "float32", "fp16",
+            "torch.bfloat16" or "<f8". A ``torch.dtype``, a
+            ``numpy.dtype`` or a NumPy scalar type is also accepted.
 
     Returns:
         The corresponding torch.dtype object.
 
     Raises:
-        InterpolationResolutionError: If the target string doesn't
+        InterpolationResolutionError: If the target doesn't
             correspond to a valid torch dtype.
 
     Example:
@@ -76,22 +418,88 @@ def torch_dtype_resolver(target: str) -> torch.dtype:
         >>> conf = OmegaConf.create({"key": "${hya.torch.dtype:int64}"})
         >>> conf.key
         torch.int64
+        >>> conf = OmegaConf.create({"key": "${hya.torch.dtype:bf16}"})
+        >>> conf.key
+        torch.bfloat16
 
         ```
     """
-    check_torch()
-    if not hasattr(torch, target) or not isinstance(getattr(torch, target), torch.dtype):
-        msg = f"Incorrect dtype {target}. The available dtypes are {get_dtypes()}"
+    # ``get_dtype_table`` checks that torch is installed when the table is built.
+    table = get_dtype_table()
+    dtype = table.get(target) if isinstance(target, str) else None
+    if dtype is not None:
+        return dtype
+    if isinstance(target, torch.dtype):
+        return target
+    dtype = table.get(get_dtype_name(target))
+    if dtype is None:
+        names = sorted({str(dtype).removeprefix("torch.") for dtype in get_dtypes()})
+        msg = f"Incorrect dtype {target}. The available dtypes are {names}"
         raise InterpolationResolutionError(msg)
-    return getattr(torch, target)
+    return dtype
+
+
+@functools.lru_cache(maxsize=1)
+def get_dtype_table() -> dict[str, torch.dtype]:
+    r"""Get the table to look up the PyTorch data types by name.
+
+    The table is built once by introspecting the torch module.
+
+    Returns:
+        The PyTorch data types indexed by name, prefixed name
+            (e.g. "torch.float32"), alias (e.g. "fp16"), NumPy name
+            (e.g. "np.byte") and NumPy type code (e.g. "<f4" or
+            "f4"). The NumPy names have the NumPy meaning, e.g.
+            "np.float" is ``torch.float64`` while "float" is
+            ``torch.float32``.
+
+    Example:
+        ```pycon
+        >>> import torch
+        >>> from hya.torch import get_dtype_table
+        >>> table = get_dtype_table()
+        >>> table["fp16"], table["torch.float32"], table["<f8"]
+        (torch.float16, torch.float32, torch.float64)
+
+        ```
+    """
+    check_torch()
+    dtypes = {}
+    for attr in dir(torch):
+        dtype = getattr(torch, attr)
+        if isinstance(dtype, torch.dtype):
+            dtypes[attr] = dtype
+    # The canonical names, e.g. "float32", have the same meaning in
+    # NumPy and PyTorch, so they are resolved without NumPy.
+    names = {name: name for name in TORCH_DTYPE_NAMES.values()}
+    if is_numpy_available():
+        names.update(
+            (name, np.dtype(dtype).name)
+            for name, dtype in np.sctypeDict.items()
+            if isinstance(name, str)
+        )
+    foreign_names = {
+        f"{prefix}{name}": dtype_name
+        for name, dtype_name in names.items()
+        for prefix in NUMPY_DTYPE_PREFIXES
+    }
+    table = build_dtype_table(dtypes, TORCH_DTYPE_PREFIXES, foreign_names)
+    if is_numpy_available():
+        for dtype in set(dtypes.values()):
+            try:
+                code = np.dtype(str(dtype).removeprefix("torch.")).str
+            except TypeError:
+                continue
+            table.setdefault(code, dtype)
+            table.setdefault(code[1:], dtype)
+    return table
 
 
 def get_dtypes() -> set[torch.dtype]:
     r"""Get all available PyTorch data types.
 
-    This function introspects the torch module to find all available
-    dtype objects. It's useful for validation and error messages when
-    working with torch dtype resolvers.
+    It's useful for validation and error messages when working with
+    torch dtype resolvers.
 
     Returns:
         A set containing all PyTorch dtype objects available in the
@@ -109,9 +517,260 @@ def get_dtypes() -> set[torch.dtype]:
         ```
     """
     check_torch()
-    dtypes = set()
-    for attr in dir(torch):
-        dt = getattr(torch, attr)
-        if isinstance(dt, torch.dtype):
-            dtypes.add(dt)
-    return dtypes
+    return set(get_dtype_table().values())
+
+
+def device_resolver(device: Any = "auto") -> torch.device:
+    r"""Implement a resolver to create a ``torch.device``.
+
+    ``auto`` selects the device with the device probe, see
+    ``probe_device`` and ``set_auto_probe``. The selected device is
+    cached per process, so the backends are probed once even if
+    many config nodes use this resolver.
+
+    Args:
+        device: The device, e.g. ``cpu``, ``cuda:1`` or ``auto``.
+
+    Returns:
+        The device.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.torch.device:cpu}"})
+        >>> conf.key
+        device(type='cpu')
+        >>> conf = OmegaConf.create({"key": "${hya.torch.device:auto}"})
+        >>> conf.key  # doctest: +SKIP
+        device(type='cuda', index=0)
+
+        ```
+    """
+    check_torch()
+    if device == "auto":
+        return get_auto_device()
+    return torch.device(device)
+
+
+def num_threads_resolver(num_threads: Any = "auto") -> int:
+    r"""Implement a resolver to compute the number of threads used by
+    the intra-op parallelism of PyTorch.
+
+    ``auto`` computes the number of threads with the thread probe,
+    see ``probe_num_threads`` and ``set_auto_probe``. The number of
+    threads is cached per process, and is computed again in the
+    child processes after a fork. The resolver does not change the
+    number of threads of PyTorch, the value is given to
+    ``torch.set_num_threads`` by the application.
+
+    Args:
+        num_threads: The number of threads, or ``auto``.
+
+    Returns:
+        The number of threads.
+
+    Raises:
+        ValueError: if the number of threads is lower than 1.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.torch.num_threads:4}"})
+        >>> conf.key
+        4
+        >>> conf = OmegaConf.create({"key": "${hya.torch.num_threads:auto}"})
+        >>> conf.key  # doctest: +SKIP
+        8
+
+        ```
+    """
+    if num_threads == "auto":
+        return get_auto_num_threads()
+    num_threads = int(num_threads)
+    if num_threads < 1:
+        msg = f"The number of threads must be greater than 0 (received: {num_threads})"
+        raise ValueError(msg)
+    return num_threads
+
+
+@functools.lru_cache
+def get_auto_device() -> torch.device:
+    r"""Return the device selected by the device probe.
+
+    The value is cached per process.
+
+    Returns:
+        The selected device.
+
+    Example:
+        ```pycon
+        >>> from hya.torch import get_auto_device
+        >>> get_auto_device()  # doctest: +SKIP
+        device(type='cuda', index=0)
+
+        ```
+    """
+    check_torch()
+    return torch.device(_AUTO_PROBES["device"]())
+
+
+@functools.lru_cache
+def get_auto_num_threads() -> int:
+    r"""Return the number of threads computed by the thread probe.
+
+    The value is cached per process, and is computed again in the
+    child processes after a fork.
+
+    Returns:
+        The number of threads. The value is at least ``1``.
+
+    Example:
+        ```pycon
+        >>> from hya.torch import get_auto_num_threads
+        >>> get_auto_num_threads() >= 1
+        True
+
+        ```
+    """
+    return max(int(_AUTO_PROBES["num_threads"]()), 1)
+
+
+def probe_device() -> torch.device:
+    r"""Select the device used by ``hya.torch.device:auto``.
+
+    The device is the GPU of the local rank (``LOCAL_RANK``
+    environment variable) if CUDA is available, the MPS device if it
+    is available, and the CPU otherwise.
+
+    Returns:
+        The selected device.
+
+    Example:
+        ```pycon
+        >>> from hya.torch import probe_device
+        >>> probe_device()  # doctest: +SKIP
+        device(type='cuda', index=0)
+
+        ```
+    """
+    check_torch()
+    if torch.cuda.is_available():
+        return torch.device("cuda", _get_env_int("LOCAL_RANK", 0) % torch.cuda.device_count())
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return torch.device("mps")
+    return torch.device("cpu")
+
+
+def probe_num_threads() -> int:
+    r"""Compute the number of threads used by
+    ``hya.torch.num_threads:auto``.
+
+    The CPUs usable by the process, i.e. its CPU affinity limited by
+    the CPU quota of its cgroup (see ``hya.system.get_cpu_count``),
+    are shared between the processes of the node
+    (``LOCAL_WORLD_SIZE`` environment variable).
+
+    Returns:
+        The number of threads. The value is at least ``1``.
+
+    Example:
+        ```pycon
+        >>> from hya.torch import probe_num_threads
+        >>> probe_num_threads() >= 1
+        True
+
+        ```
+    """
+    return max(get_cpu_count() // max(_get_env_int("LOCAL_WORLD_SIZE", 1), 1), 1)
+
+
+def set_auto_probe(name: str, probe: Callable[[], Any] | None) -> None:
+    r"""Set the probe used to resolve ``auto`` and clear the cached
+    value.
+
+    It is useful to test the configs on a machine without GPU, or to
+    implement a site-specific selection.
+
+    Args:
+        name: The name of the probe, ``device`` or ``num_threads``.
+        probe: The function called without argument to compute the
+            value, i.e. a device or a number of threads. ``None``
+            restores the default probe.
+
+    Raises:
+        KeyError: if the probe name is invalid.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> from hya.torch import set_auto_probe
+        >>> set_auto_probe("device", lambda: "cuda:1")
+        >>> OmegaConf.create({"key": "${hya.torch.device:auto}"}).key
+        device(type='cuda', index=1)
+        >>> set_auto_probe("device", None)
+
+        ```
+    """
+    if name not in _DEFAULT_AUTO_PROBES:
+        msg = f"Incorrect probe name: {name!r}. The valid names are: {sorted(_DEFAULT_AUTO_PROBES)}"
+        raise KeyError(msg)
+    _AUTO_PROBES[name] = probe or _DEFAULT_AUTO_PROBES[name]
+    get_auto_device.cache_clear()
+    get_auto_num_threads.cache_clear()
+
+
+_DEFAULT_AUTO_PROBES: dict[str, Callable[[], Any]] = {
+    "device": probe_device,
+    "num_threads": probe_num_threads,
+}
+_AUTO_PROBES = dict(_DEFAULT_AUTO_PROBES)
+
+
+def _encode_tensor(tensor: torch.Tensor) -> tuple[dict[str, Any], Any]:
+    r"""Encode a tensor to store it in shared memory.
+
+    Args:
+        tensor: The tensor to encode.
+
+    Returns:
+        A tuple with the dtype and shape of the tensor, and its data
+            as a contiguous array of bytes.
+    """
+    metadata = {"dtype": str(tensor.dtype).removeprefix("torch."), "shape": list(tensor.shape)}
+    return metadata, tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy()
+
+
+def _get_env_int(name: str, default: int) -> int:
+    r"""Read an integer from an environment variable.
+
+    Args:
+        name: The name of the environment variable.
+        default: The value returned if the variable is not set or
+            is not an integer.
+
+    Returns:
+        The integer value.
+    """
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+@functools.lru_cache(maxsize=1)
+def _supports_mmap() -> bool:
+    r"""Indicate if ``torch.load`` supports memory mapping.
+
+    Returns:
+        ``True`` if ``torch.load`` has the ``mmap`` argument, which
+            was added in ``torch 2.1``, otherwise ``False``.
+    """
+    return "mmap" in inspect.signature(torch.load).parameters
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=get_auto_num_threads.cache_clear)
@@ -0,0 +1,267 @@
+r"""Implement resolvers to parse sizes and durations, and to compute
+the batch size that fits in a memory budget.
+
+The sizes (e.g. ``"12GiB"``) and the durations (e.g. ``"250ms"``) are
+parsed with regular expressions compiled once when the module is
+imported, and the parsed values are cached.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "DURATION_UNITS",
+    "SIZE_UNITS",
+    "duration_resolver",
+    "fit_batch_resolver",
+    "parse_duration",
+    "parse_size",
+    "size_resolver",
+]
+
+import functools
+import math
+import re
+
+SIZE_UNITS = {
+    "": 1,
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000**2,
+    "gb": 1000**3,
+    "tb": 1000**4,
+    "k": 1024,
+    "m": 1024**2,
+    "g": 1024**3,
+    "t": 1024**4,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+    "tib": 1024**4,
+}
+DURATION_UNITS = {
+    "ns": 1e-9,
+    "us": 1e-6,
+    "ms": 1e-3,
+    "": 1.0,
+    "s": 1.0,
+    "m": 60.0,
+    "min": 60.0,
+    "h": 3600.0,
+}
+
+_QUANTITY_PATTERN = re.compile(
+    r"\s*(?P<value>[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*(?P<unit>[a-zA-Z]*)\s*"
+)
+
+
+def duration_resolver(duration: str | float) -> float:
+    r"""Return a duration in seconds.
+
+    Args:
+        duration: The duration, e.g. ``"250ms"``, ``"1.5s"``,
+            ``"2min"``, or a number of seconds. The supported units
+            are ``ns``, ``us``, ``ms``, ``s``, ``m`` or ``min``, and
+            ``h``.
+
+    Returns:
+        The duration in seconds.
+
+    Raises:
+        ValueError: if the duration cannot be parsed.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.duration:250ms}"})
+        >>> conf.key
+        0.25
+
+        ```
+    """
+    return parse_duration(duration)
+
+
+def fit_batch_resolver(
+    budget: str | int,
+    per_sample: str | float,
+    safety: float = 0.9,
+    multiple: int = 1,
+) -> int:
+    r"""Return the largest batch size that fits in a memory budget.
+
+    The batch size is the number of samples that fit in
+    ``safety * budget`` bytes, rounded down to a multiple of
+    ``multiple``.
+
+    Args:
+        budget: The memory budget, e.g. ``"12GiB"``, or a number of
+            bytes, e.g. ``${hya.available_memory:}``.
+        per_sample: The memory used per sample, e.g. ``"48MiB"``,
+            or a number of bytes.
+        safety: The fraction of the budget that can be used, in
+            ``(0, 1]``.
+        multiple: The batch size is rounded down to a multiple of
+            this value, e.g. the number of devices.
+
+    Returns:
+        The batch size.
+
+    Raises:
+        ValueError: if an argument is invalid, or if the budget is
+            too small to fit ``multiple`` samples.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.fit_batch:12GiB,48MiB}"})
+        >>> conf.key
+        230
+        >>> conf = OmegaConf.create({"key": "${hya.fit_batch:12GiB,48MiB,0.8,64}"})
+        >>> conf.key
+        192
+
+        ```
+    """
+    if not 0 < safety <= 1:
+        msg = f"safety must be in (0, 1] but received {safety}"
+        raise ValueError(msg)
+    if multiple < 1:
+        msg = f"multiple must be greater than 0 but received {multiple}"
+        raise ValueError(msg)
+    budget_bytes = parse_size(budget)
+    sample_bytes = parse_size(per_sample)
+    if budget_bytes < 0:
+        msg = f"budget must be greater than or equal to 0 but received {budget}"
+        raise ValueError(msg)
+    if sample_bytes <= 0:
+        msg = f"per_sample must be greater than 0 but received {per_sample}"
+        raise ValueError(msg)
+    batch_size = math.floor(budget_bytes * safety / sample_bytes) // multiple * multiple
+    if batch_size == 0:
+        msg = (
+            f"The memory budget ({budget}) with a safety factor of {safety} is too small "
+            f"to fit a batch of {multiple} samples of {per_sample}"
+        )
+        raise ValueError(msg)
+    return batch_size
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_duration(duration: str | float) -> float:
+    r"""Parse a duration.
+
+    Args:
+        duration: The duration, e.g. ``"250ms"``, ``"1.5s"``,
+            ``"2min"``, or a number of seconds.
+
+    Returns:
+        The duration in seconds.
+
+    Raises:
+        ValueError: if the duration cannot be parsed.
+
+    Example:
+        ```pycon
+        >>> from hya.units import parse_duration
+        >>> parse_duration("1.5s")
+        1.5
+        >>> parse_duration("2min")
+        120.0
+
+        ```
+    """
+    return _parse_quantity(duration, DURATION_UNITS, name="duration") * 1.0
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_size(size: str | float) -> int:
+    r"""Parse a size in bytes.
+
+    The units are case-insensitive. ``KB``, ``MB``, ``GB`` and
+    ``TB`` are powers of 1000, and ``KiB``, ``MiB``, ``GiB``,
+    ``TiB`` and the single-letter units ``K``, ``M``, ``G`` and
+    ``T`` are powers of 1024.
+
+    Args:
+        size: The size, e.g. ``"12GiB"``, ``"1.5 MB"``, or a
+            number of bytes.
+
+    Returns:
+        The size in bytes, rounded down to an integer.
+
+    Raises:
+        ValueError: if the size cannot be parsed.
+
+    Example:
+        ```pycon
+        >>> from hya.units import parse_size
+        >>> parse_size("12GiB")
+        12884901888
+        >>> parse_size("1.5 MB")
+        1500000
+
+        ```
+    """
+    return math.floor(_parse_quantity(size, SIZE_UNITS, name="size"))
+
+
+def size_resolver(size: str | float) -> int:
+    r"""Return a size in bytes.
+
+    Args:
+        size: The size, e.g. ``"12GiB"``, ``"1.5 MB"``, or a
+            number of bytes. See ``parse_size`` for the supported
+            units.
+
+    Returns:
+        The size in bytes.
+
+    Raises:
+        ValueError: if the size cannot be parsed.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> conf = OmegaConf.create({"key": "${hya.size:4KiB}"})
+        >>> conf.key
+        4096
+
+        ```
+    """
+    return parse_size(size)
+
+
+def _parse_quantity(quantity: str | float, units: dict[str, float], name: str) -> float:
+    r"""Parse a quantity with an optional unit.
+
+    Args:
+        quantity: The quantity to parse, e.g. ``"12GiB"``, or a
+            number in the base unit.
+        units: The multipliers of the units, indexed by the
+            lowercase unit names.
+        name: The name of the quantity, used in the error messages.
+
+    Returns:
+        The quantity in the base unit.
+
+    Raises:
+        ValueError: if the quantity cannot be parsed.
+    """
+    if isinstance(quantity, (int, float)) and not isinstance(quantity, bool):
+        return quantity
+    match = _QUANTITY_PATTERN.fullmatch(str(quantity))
+    unit = match.group("unit").lower() if match else None
+    if unit not in units:
+        msg = (
+            f"Incorrect {name}: {quantity!r}. The supported units are "
+            f"{sorted(unit for unit in units if unit)}"
+        )
+        raise ValueError(msg)
+    value = match.group("value")
+    # Multiply integers exactly to avoid the float rounding of large sizes.
+    if value.isdigit() and isinstance(units[unit], int):
+        return int(value) * units[unit]
+    return float(value) * units[unit]
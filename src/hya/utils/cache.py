@@ -0,0 +1,698 @@
+r"""Implement in-memory caches shared by the resolvers."""
+
+from __future__ import annotations
+
+__all__ = [
+    "CacheStats",
+    "InternTable",
+    "LRUCache",
+    "ResultCache",
+    "get_file_key",
+    "get_intern_table",
+    "get_nbytes",
+    "get_result_cache",
+    "memoize",
+]
+
+from collections import OrderedDict
+import functools
+from pathlib import Path
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
+import weakref
+
+from hya.utils.disk_cache import check_cacheable, hash_arguments
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+K = TypeVar("K")
+V = TypeVar("V")
+F = TypeVar("F", bound="Callable[..., Any]")
+
+
+class CacheStats(NamedTuple):
+    r"""Define the statistics of a ``ResultCache`` or an
+    ``InternTable``.
+
+    Args:
+        hits: The number of lookups that found a value.
+        misses: The number of lookups that did not find a value.
+        nbytes_saved: The total size in bytes of the values returned
+            by the lookups that found a value.
+        size: The number of values in the cache.
+        nbytes: The total size in bytes of the values held by the
+            cache. A ``ResultCache`` excludes the values held by weak
+            references, and an ``InternTable`` includes all its
+            values.
+    """
+
+    hits: int
+    misses: int
+    nbytes_saved: int
+    size: int
+    nbytes: int
+
+
+class LRUCache(Generic[K, V]):
+    r"""Implement a thread-safe least recently used (LRU) cache.
+
+    The cache is bounded by the number of items and optionally by
+    the total size of the values. The least recently used items are
+    evicted first when one of the bounds is exceeded. A value larger
+    than ``max_bytes`` is never stored.
+
+    Args:
+        max_size: The maximum number of items in the cache.
+        max_bytes: The maximum total size of the values in bytes.
+            ``None`` means the size of the values is not bounded.
+        sizeof: The function used to compute the size of a value
+            in bytes.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.cache import LRUCache
+        >>> cache = LRUCache(max_size=2)
+        >>> cache.put("a", 1)
+        >>> cache.put("b", 2)
+        >>> cache.put("c", 3)
+        >>> cache.get("a") is None
+        True
+        >>> cache.get("c")
+        3
+
+        ```
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        max_bytes: int | None = None,
+        sizeof: Callable[[V], int] = sys.getsizeof,
+    ) -> None:
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._items: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(size={len(self):,}, max_size={self._max_size:,}, "
+            f"nbytes={self._nbytes:,}, max_bytes={self._max_bytes})"
+        )
+
+    @property
+    def nbytes(self) -> int:
+        r"""The total size of the cached values in bytes."""
+        return self._nbytes
+
+    def clear(self) -> None:
+        r"""Remove all the items from the cache.
+
+        Example:
+            ```pycon
+            >>> from hya.utils.cache import LRUCache
+            >>> cache = LRUCache(max_size=2)
+            >>> cache.put("a", 1)
+            >>> cache.clear()
+            >>> len(cache)
+            0
+
+            ```
+        """
+        with self._lock:
+            self._items.clear()
+            self._nbytes = 0
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        r"""Return the value associated to a key and mark it as the
+        most recently used.
+
+        Args:
+            key: The key to look up.
+            default: The value returned if the key is not in the
+                cache.
+
+        Returns:
+            The cached value or the default value.
+
+        Example:
+            ```pycon
+            >>> from hya.utils.cache import LRUCache
+            >>> cache = LRUCache(max_size=2)
+            >>> cache.put("a", 1)
+            >>> cache.get("a")
+            1
+            >>> cache.get("b", -1)
+            -1
+
+            ```
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return default
+            self._items.move_to_end(key)
+            return item[0]
+
+    def pop(self, key: K, default: Any = None) -> V | Any:
+        r"""Remove a key from the cache and return its value.
+
+        Args:
+            key: The key to remove.
+            default: The value returned if the key is not in the
+                cache.
+
+        Returns:
+            The removed value or the default value.
+
+        Example:
+            ```pycon
+            >>> from hya.utils.cache import LRUCache
+            >>> cache = LRUCache(max_size=2)
+            >>> cache.put("a", 1)
+            >>> cache.pop("a")
+            1
+            >>> "a" in cache
+            False
+
+            ```
+        """
+        with self._lock:
+            item = self._items.pop(key, None)
+            if item is None:
+                return default
+            self._nbytes -= item[1]
+            return item[0]
+
+    def put(self, key: K, value: V) -> None:
+        r"""Add a value to the cache and evict the least recently used
+        items if needed.
+
+        Args:
+            key: The key associated to the value.
+            value: The value to cache.
+
+        Example:
+            ```pycon
+            >>> from hya.utils.cache import LRUCache
+            >>> cache = LRUCache(max_size=2)
+            >>> cache.put("a", 1)
+            >>> "a" in cache
+            True
+
+            ```
+        """
+        nbytes = self._sizeof(value) if self._max_bytes is not None else 0
+        if self._max_bytes is not None and nbytes > self._max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._items[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while len(self._items) > self._max_size or (
+                self._max_bytes is not None and self._nbytes > self._max_bytes
+            ):
+                _, (_, evicted) = self._items.popitem(last=False)
+                self._nbytes -= evicted
+
+
+class ResultCache(Generic[K]):
+    r"""Implement a thread-safe cache of resolver results.
+
+    The small values are kept in a least recently used (LRU) cache
+    bounded by the number of items and the total size of the values.
+    The large values are held through weak references, so they are
+    not kept in memory by the cache, and they stay in the cache while
+    another object uses them, e.g. a config. The large values that
+    do not support weak references are kept in the LRU cache.
+
+    Args:
+        max_size: The maximum number of values in the LRU cache.
+        max_bytes: The maximum total size of the values in the LRU
+            cache in bytes.
+        weak_bytes: The size in bytes above which the values are
+            held through weak references.
+        sizeof: The function used to compute the size of a value
+            in bytes.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.cache import ResultCache
+        >>> cache = ResultCache()
+        >>> cache.put("a", "abc")
+        >>> cache.get("a")
+        'abc'
+        >>> cache.get("b", -1)
+        -1
+        >>> cache.stats
+        CacheStats(hits=1, misses=1, nbytes_saved=3, size=1, nbytes=3)
+
+        ```
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        max_bytes: int = 256 << 20,
+        weak_bytes: int = 1 << 20,
+        sizeof: Callable[[Any], int] | None = None,
+    ) -> None:
+        self._sizeof = sizeof or get_nbytes
+        self._weak_bytes = weak_bytes
+        self._strong: LRUCache[K, tuple[Any, int]] = LRUCache(
+            max_size=max_size, max_bytes=max_bytes, sizeof=lambda item: item[1]
+        )
+        self._weak: dict[K, tuple[weakref.ref, int]] = {}
+        # The weak reference callbacks can run in any thread when a
+        # value is garbage collected, including a thread holding the
+        # lock, so the lock is reentrant.
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._nbytes_saved = 0
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._strong or key in self._weak
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._strong) + len(self._weak)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}({self.stats})"
+
+    @property
+    def stats(self) -> CacheStats:
+        r"""The statistics of the cache."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                nbytes_saved=self._nbytes_saved,
+                size=len(self),
+                nbytes=self._strong.nbytes,
+            )
+
+    def clear(self) -> None:
+        r"""Remove all the values from the cache and reset the
+        statistics.
+
+        Example:
+            ```pycon
+            >>> from hya.utils.cache import ResultCache
+            >>> cache = ResultCache()
+            >>> cache.put("a", 1)
+            >>> cache.clear()
+            >>> len(cache)
+            0
+
+            ```
+        """
+        with self._lock:
+            self._strong.clear()
+            self._weak.clear()
+            self._hits = 0
+            self._misses = 0
+            self._nbytes_saved = 0
+
+    def get(self, key: K, default: Any = None) -> Any:
+        r"""Return the value associated to a key.
+
+        Args:
+            key: The key to look up.
+            default: The value returned if the key is not in the
+                cache.
+
+        Returns:
+            The cached value or the default value.
+
+        Example:
+            ```pycon
+            >>> from hya.utils.cache import ResultCache
+            >>> cache = ResultCache()
+            >>> cache.put("a", 1)
+            >>> cache.get("a")
+            1
+
+            ```
+        """
+        with self._lock:
+            item = self._strong.get(key)
+            if item is None and (weak_item := self._weak.get(key)) is not None:
+                value = weak_item[0]()
+                item = None if value is None else (value, weak_item[1])
+            if item is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._nbytes_saved += item[1]
+            return item[0]
+
+    def put(self, key: K, value: Any) -> None:
+        r"""Add a value to the cache.
+
+        Args:
+            key: The key associated to the value.
+            value: The value to cache.
+
+        Example:
+            ```pycon
+            >>> from hya.utils.cache import ResultCache
+            >>> cache = ResultCache()
+            >>> cache.put("a", 1)
+            >>> "a" in cache
+            True
+
+            ```
+        """
+        nbytes = self._sizeof(value)
+        if nbytes >= self._weak_bytes:
+            try:
+                ref = weakref.ref(value, functools.partial(self._remove_weak, key))
+            except TypeError:
+                pass
+            else:
+                with self._lock:
+                    self._strong.pop(key)
+                    self._weak[key] = (ref, nbytes)
+                return
+        with self._lock:
+            self._weak.pop(key, None)
+            self._strong.put(key, (value, nbytes))
+
+    def _remove_weak(self, key: K, ref: weakref.ref) -> None:
+        r"""Remove a value held through a weak reference after it is
+        garbage collected.
+
+        Args:
+            key: The key associated to the value.
+            ref: The weak reference to the value.
+        """
+        with self._lock:
+            item = self._weak.get(key)
+            if item is not None and item[0] is ref:
+                del self._weak[key]
+
+
+class InternTable(Generic[K]):
+    r"""Implement a thread-safe table of interned values.
+
+    The table returns the same instance for all the values with the
+    same key, e.g. a hash of their content, so the equal values
+    share the same memory. The values are held through weak
+    references, so a value is removed from the table when no other
+    object uses it.
+
+    Args:
+        sizeof: The function used to compute the size of a value
+            in bytes.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.cache import InternTable
+        >>> class Value:
+        ...     pass
+        ...
+        >>> table = InternTable()
+        >>> value = table.intern("a", Value())
+        >>> table.intern("a", Value()) is value
+        True
+        >>> table.stats.hits
+        1
+
+        ```
+    """
+
+    def __init__(self, sizeof: Callable[[Any], int] | None = None) -> None:
+        self._sizeof = sizeof or get_nbytes
+        self._values: weakref.WeakValueDictionary[K, Any] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._nbytes_saved = 0
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}({self.stats})"
+
+    @property
+    def stats(self) -> CacheStats:
+        r"""The statistics of the table."""
+        with self._lock:
+            values = list(self._values.values())
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                nbytes_saved=self._nbytes_saved,
+                size=len(values),
+                nbytes=sum(self._sizeof(value) for value in values),
+            )
+
+    def clear(self) -> None:
+        r"""Remove all the values from the table and reset the
+        statistics.
+
+        Example:
+            ```pycon
+            >>> from hya.utils.cache import InternTable
+            >>> table = InternTable()
+            >>> table.clear()
+            >>> len(table)
+            0
+
+            ```
+        """
+        with self._lock:
+            self._values.clear()
+            self._hits = 0
+            self._misses = 0
+            self._nbytes_saved = 0
+
+    def intern(self, key: K, value: Any, factory: Callable[[Any], Any] | None = None) -> Any:
+        r"""Return the interned value associated to a key, and intern
+        the value if the key is not in the table.
+
+        Args:
+            key: The key of the value. Two values with the same key
+                must be equal.
+            value: The value to intern. It must support weak
+                references.
+            factory: An optional function called with ``value`` when
+                the key is not in the table, whose output is interned
+                instead of ``value``, e.g. to intern a read-only copy.
+                It is not called when the key is in the table.
+
+        Returns:
+            The interned value.
+
+        Raises:
+            TypeError: if the value does not support weak references.
+
+        Example:
+            ```pycon
+            >>> from hya.utils.cache import InternTable
+            >>> class Value:
+            ...     pass
+            ...
+            >>> table = InternTable()
+            >>> value = Value()
+            >>> table.intern("a", value) is value
+            True
+
+            ```
+        """
+        with self._lock:
+            interned = self._values.get(key)
+            if interned is None:
+                if factory is not None:
+                    value = factory(value)
+                self._values[key] = value
+                self._misses += 1
+                return value
+            self._hits += 1
+            self._nbytes_saved += self._sizeof(interned)
+            return interned
+
+
+def get_file_key(path: Path | str) -> tuple[str, int, int]:
+    r"""Return a key identifying the current version of a file.
+
+    The key changes when the file is modified or replaced, so it can
+    be used to cache values computed from the content of the file.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        A tuple with the absolute path, the modification time in
+            nanoseconds and the size in bytes of the file.
+
+    Raises:
+        OSError: if the file cannot be accessed.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from hya.utils.cache import get_file_key
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("data.txt")
+        ...     _ = path.write_text("abc")
+        ...     get_file_key(path)[2]
+        ...
+        3
+
+        ```
+    """
+    path = Path(path).expanduser().absolute()
+    stat = path.stat()
+    return (path.as_posix(), stat.st_mtime_ns, stat.st_size)
+
+
+def get_nbytes(value: Any) -> int:
+    r"""Return the approximate size of a value in bytes.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The size of the data of the arrays and tensors, the length
+            of the strings and bytes, and the size of the object
+            returned by ``sys.getsizeof`` for the other values.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.cache import get_nbytes
+        >>> get_nbytes(b"abc")
+        3
+
+        ```
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+def get_result_cache() -> ResultCache:
+    r"""Get or create the process-wide cache of resolver results.
+
+    This cache is shared by all the configs of the process and it is
+    used by the resolvers registered with ``memoize=True``.
+
+    Returns:
+        The result cache.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.cache import get_result_cache
+        >>> hits, misses, nbytes_saved, size, nbytes = get_result_cache().stats
+
+        ```
+    """
+    if not hasattr(get_result_cache, "_cache"):
+        get_result_cache._cache = ResultCache()
+    return get_result_cache._cache
+
+
+def get_intern_table() -> InternTable:
+    r"""Get or create the process-wide table of interned values.
+
+    This table is shared by all the configs of the process and it is
+    used by the ``hya.np.interned_array`` resolver.
+
+    Returns:
+        The intern table.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.cache import get_intern_table
+        >>> hits, misses, nbytes_saved, size, nbytes = get_intern_table().stats
+
+        ```
+    """
+    if not hasattr(get_intern_table, "_table"):
+        get_intern_table._table = InternTable()
+    return get_intern_table._table
+
+
+def memoize(key: str, cache: ResultCache | None = None) -> Callable[[F], F]:
+    r"""Return a decorator to cache the results of a resolver in
+    memory.
+
+    The results are keyed by the resolver key and the canonical hash
+    of the arguments, so the same interpolation in many configs is
+    resolved once. The cached value is returned to all the callers,
+    so a mutable result should not be modified in place. The calls
+    whose arguments cannot be hashed are not cached.
+
+    Args:
+        key: The key of the resolver.
+        cache: The result cache. ``None`` means the cache returned
+            by ``get_result_cache`` when the resolver is called.
+
+    Returns:
+        The decorator.
+
+    Raises:
+        ValueError: if the resolver uses the ``_node_``,
+            ``_parent_`` or ``_root_`` arguments, because its result
+            depends on the config.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.cache import ResultCache, memoize
+        >>> cache = ResultCache()
+        >>> square = memoize("square", cache)(lambda x: x * x)
+        >>> square(4)
+        16
+        >>> square(4)
+        16
+        >>> cache.stats.hits
+        1
+
+        ```
+    """
+
+    def wrap(resolver: F) -> F:
+        check_cacheable(key, resolver)
+
+        @functools.wraps(resolver)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                cache_key = (key, hash_arguments(*args, **kwargs))
+            except TypeError:
+                return resolver(*args, **kwargs)
+            result_cache = get_result_cache() if cache is None else cache
+            output = result_cache.get(cache_key, _MISSING)
+            if output is _MISSING:
+                output = resolver(*args, **kwargs)
+                result_cache.put(cache_key, output)
+            return output
+
+        return wrapper
+
+    return wrap
+
+
+_MISSING = object()
@@ -0,0 +1,76 @@
+r"""Implement utility functions to convert OmegaConf containers."""
+
+from __future__ import annotations
+
+__all__ = ["to_primitive"]
+
+from typing import Any
+
+from omegaconf import Container, DictConfig, ListConfig, OmegaConf
+
+_SCALAR_TYPES = {bool, bytes, float, int, type(None)}
+
+
+def to_primitive(data: Any) -> Any:
+    r"""Convert OmegaConf containers to primitive containers.
+
+    A ``ListConfig`` is converted to a list in one pass over its
+    nodes: the literal values are read directly from the nodes, and
+    only the interpolations and missing values go through the
+    regular OmegaConf node access. This is much faster than
+    iterating over the ``ListConfig`` or calling
+    ``OmegaConf.to_container`` for large lists. A ``DictConfig`` is
+    converted with ``OmegaConf.to_container``. The other values are
+    returned unchanged.
+
+    Args:
+        data: The data to convert.
+
+    Returns:
+        The data where the OmegaConf containers are converted to
+            primitive containers.
+
+    Example:
+        ```pycon
+        >>> from omegaconf import OmegaConf
+        >>> from hya.utils.containers import to_primitive
+        >>> conf = OmegaConf.create({"a": 4, "b": [1, 2, [3], "${a}"]})
+        >>> to_primitive(conf.b)
+        [1, 2, [3], 4]
+        >>> to_primitive((1, 2))
+        (1, 2)
+
+        ```
+    """
+    if isinstance(data, ListConfig):
+        return _list_to_primitive(data)
+    if isinstance(data, DictConfig):
+        return OmegaConf.to_container(data, resolve=True)
+    return data
+
+
+def _list_to_primitive(data: ListConfig) -> list | None:
+    r"""Convert a ``ListConfig`` to a list.
+
+    Args:
+        data: The ``ListConfig`` to convert.
+
+    Returns:
+        The list or ``None`` if the ``ListConfig`` is ``None``.
+    """
+    if data._is_none() or data._is_missing() or data._is_interpolation():
+        return OmegaConf.to_container(data, resolve=True)
+    # The private ``_content`` attribute stores the nodes, so the literal
+    # values can be read without resolving each node.
+    nodes = data._content
+    output = [node._value() for node in nodes]
+    # Fast path for the lists of numbers, where no value needs to be
+    # converted or resolved.
+    if set(map(type, output)) <= _SCALAR_TYPES:
+        return output
+    for index, (node, value) in enumerate(zip(nodes, output)):
+        if isinstance(node, Container):
+            output[index] = to_primitive(node)
+        elif isinstance(value, str) and ("${" in value or value == "???"):
+            output[index] = to_primitive(data[index])
+    return output
@@ -0,0 +1,605 @@
+r"""Implement a persistent cache to store the resolver results on disk.
+
+The results are pickled and stored in a SQLite database, which can be
+safely used by many processes and threads on the same node. The cache
+is bounded by the total size of the values, and the least recently
+used values are evicted first.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "DISK_CACHE_ENV",
+    "DiskCache",
+    "check_cacheable",
+    "get_code_hash",
+    "get_default_disk_cache",
+    "hash_arguments",
+    "persistent_cache",
+]
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import logging
+import os
+from pathlib import Path, PurePath
+import pickle
+import sqlite3
+import threading
+import time
+from types import CodeType
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from hya.imports import is_numpy_available
+from hya.utils.containers import to_primitive
+
+if TYPE_CHECKING or is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    from hya.utils.fallback.numpy import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound="Callable[..., Any]")
+
+DISK_CACHE_ENV = "HYA_DISK_CACHE"
+
+# The special arguments that OmegaConf passes to the resolvers. The
+# results of the resolvers using them depend on the config, so they
+# cannot be cached.
+_SPECIAL_ARGUMENTS = {"_node_", "_parent_", "_root_"}
+
+
+class DiskCache:
+    r"""Implement a persistent least recently used (LRU) cache backed by
+    a SQLite database.
+
+    The values are pickled. The database uses the write-ahead log, so
+    the readers do not block the writers, and each update runs in a
+    transaction, so the cache is never left in a partial state. A
+    value larger than ``max_bytes`` is never stored.
+
+    Args:
+        path: The path to the SQLite database. The parent directory
+            is created if it does not exist.
+        max_bytes: The maximum total size of the pickled values in
+            bytes.
+        timeout: The number of seconds to wait for a lock held by
+            another connection before raising an error.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from hya.utils.disk_cache import DiskCache
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     cache = DiskCache(Path(tmpdir, "cache.sqlite"))
+        ...     cache.put("a", [1, 2, 3])
+        ...     cache.get("a")
+        ...     cache.close()
+        ...
+        [1, 2, 3]
+
+        ```
+    """
+
+    def __init__(self, path: Path | str, max_bytes: int = 1 << 30, timeout: float = 60.0) -> None:
+        self._path = Path(path).expanduser()
+        self._max_bytes = max_bytes
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def __contains__(self, key: str) -> bool:
+        query = "SELECT 1 FROM entries WHERE key = ?"
+        return self._get_connection().execute(query, (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._get_connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path.as_posix()}, "
+            f"max_bytes={self._max_bytes:,})"
+        )
+
+    @property
+    def nbytes(self) -> int:
+        r"""The total size of the cached values in bytes."""
+        query = "SELECT COALESCE(SUM(size), 0) FROM entries"
+        return self._get_connection().execute(query).fetchone()[0]
+
+    @property
+    def path(self) -> Path:
+        r"""The path to the SQLite database."""
+        return self._path
+
+    def clear(self) -> None:
+        r"""Remove all the items from the cache.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from hya.utils.disk_cache import DiskCache
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     cache = DiskCache(Path(tmpdir, "cache.sqlite"))
+            ...     cache.put("a", 1)
+            ...     cache.clear()
+            ...     len(cache)
+            ...     cache.close()
+            ...
+            0
+
+            ```
+        """
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        r"""Close the connection of the current thread to the
+        database."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            connection.close()
+        self._local.connection = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        r"""Return the value associated to a key and mark it as the
+        most recently used.
+
+        Args:
+            key: The key to look up.
+            default: The value returned if the key is not in the
+                cache.
+
+        Returns:
+            The cached value or the default value. The default value
+                is also returned if the cached value cannot be
+                unpickled, and the entry is removed.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from hya.utils.disk_cache import DiskCache
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     cache = DiskCache(Path(tmpdir, "cache.sqlite"))
+            ...     cache.get("a", -1)
+            ...     cache.close()
+            ...
+            -1
+
+            ```
+        """
+        # The statements run in autocommit mode, so the readers do not
+        # wait for each other.
+        connection = self._get_connection()
+        row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        connection.execute("UPDATE entries SET access_time = ? WHERE key = ?", (time.time(), key))
+        try:
+            return pickle.loads(row[0])  # noqa: S301
+        except Exception:  # noqa: BLE001
+            logger.warning(f"Failed to unpickle the cached value of {key!r}, removing it")
+            with self._transaction() as connection:
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return default
+
+    def put(self, key: str, value: Any) -> None:
+        r"""Add a value to the cache and evict the least recently used
+        items if needed.
+
+        Args:
+            key: The key associated to the value.
+            value: The value to cache. It must be picklable.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from hya.utils.disk_cache import DiskCache
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     cache = DiskCache(Path(tmpdir, "cache.sqlite"))
+            ...     cache.put("a", 1)
+            ...     "a" in cache
+            ...     cache.close()
+            ...
+            True
+
+            ```
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self._max_bytes:
+            return
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, access_time) VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            # Keep the most recently used entries whose cumulative size fits in the budget.
+            connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM ("
+                "SELECT key, SUM(size) OVER (ORDER BY access_time DESC, key) AS total "
+                "FROM entries) WHERE total > ?)",
+                (self._max_bytes,),
+            )
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        r"""Return a context manager running a transaction with the
+        connection of the current thread.
+
+        The transaction takes the write lock immediately, so
+        concurrent updates wait for each other instead of failing
+        when they upgrade a read lock.
+
+        Yields:
+            The connection to the database.
+        """
+        connection = self._get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.rollback()
+            raise
+        connection.commit()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        r"""Return the connection of the current thread to the database.
+
+        The connections are not shared between threads, and a new
+        connection is created in the child processes after a fork.
+
+        Returns:
+            The connection to the database.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, access_time REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_access_time ON entries (access_time)"
+        )
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+
+def check_cacheable(key: str, resolver: Callable[..., Any]) -> None:
+    r"""Check that the results of a resolver can be cached.
+
+    The results of the resolvers using the ``_node_``, ``_parent_``
+    or ``_root_`` arguments depend on the config, so they cannot be
+    cached.
+
+    Args:
+        key: The key of the resolver.
+        resolver: The resolver.
+
+    Raises:
+        ValueError: if the results of the resolver cannot be cached.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.disk_cache import check_cacheable
+        >>> check_cacheable("double", lambda x: x * 2)
+
+        ```
+    """
+    try:
+        parameters = inspect.signature(resolver).parameters
+    except (TypeError, ValueError):
+        return
+    if _SPECIAL_ARGUMENTS.intersection(parameters):
+        msg = (
+            f"The results of the resolver '{key}' cannot be cached because it uses "
+            f"the arguments {sorted(_SPECIAL_ARGUMENTS)}"
+        )
+        raise ValueError(msg)
+
+
+def get_code_hash(func: Callable[..., Any]) -> str:
+    r"""Return a hash of the code of a function.
+
+    The hash changes when the bytecode of the function, including its
+    constants and nested functions, is modified, or when its default
+    values or the values of its closure variables change. It does not
+    change when the function is moved in its file, or when the
+    functions it calls are modified. The default and closure values
+    that cannot be hashed canonically, e.g. arbitrary objects, only
+    contribute their type to the hash, and only the code of the
+    functions in the closure is hashed.
+
+    Args:
+        func: The function.
+
+    Returns:
+        The hexadecimal hash of the code.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.disk_cache import get_code_hash
+        >>> get_code_hash(lambda x: x + 1) == get_code_hash(lambda x: x + 1)
+        True
+        >>> get_code_hash(lambda x: x + 1) == get_code_hash(lambda x: x + 2)
+        False
+        >>> get_code_hash(lambda x, y=1: x + y) == get_code_hash(lambda x, y=2: x + y)
+        False
+
+        ```
+    """
+    with contextlib.suppress(ValueError):
+        func = inspect.unwrap(func)
+    digest = hashlib.sha256()
+    code = getattr(func, "__code__", None)
+    if code is None:
+        digest.update(f"{type(func).__module__}.{type(func).__qualname__}".encode())
+    else:
+        _update_code_hash(digest, code)
+        for value in getattr(func, "__defaults__", None) or ():
+            _update_value_hash(digest, value)
+        kwdefaults = getattr(func, "__kwdefaults__", None) or {}
+        for name in sorted(kwdefaults):
+            digest.update(f"{name}=".encode())
+            _update_value_hash(digest, kwdefaults[name])
+        for cell in getattr(func, "__closure__", None) or ():
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                # The cell of a variable that is not assigned yet.
+                digest.update(b"empty;")
+                continue
+            _update_value_hash(digest, value)
+    return digest.hexdigest()
+
+
+def get_default_disk_cache() -> DiskCache:
+    r"""Get or create the default disk cache.
+
+    The database is the path in the ``HYA_DISK_CACHE`` environment
+    variable if it is set, otherwise ``hya/resolvers.sqlite`` in the
+    user cache directory (``XDG_CACHE_HOME`` or ``~/.cache``). A new
+    cache is created if the path changes.
+
+    Returns:
+        The default disk cache.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.disk_cache import get_default_disk_cache
+        >>> get_default_disk_cache().path.name  # doctest: +SKIP
+        'resolvers.sqlite'
+
+        ```
+    """
+    if path := os.environ.get(DISK_CACHE_ENV):
+        path = Path(path).expanduser()
+    else:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache")
+        path = Path(cache_home).joinpath("hya", "resolvers.sqlite")
+    return _get_disk_cache(path)
+
+
+def hash_arguments(*args: Any, **kwargs: Any) -> str:
+    r"""Return a canonical hash of the arguments of a function call.
+
+    The OmegaConf containers are converted to primitive containers,
+    so equal arguments have the same hash whether they come from a
+    config or not. The dictionary keys are sorted.
+
+    Args:
+        *args: The positional arguments.
+        **kwargs: The keyword arguments.
+
+    Returns:
+        The hexadecimal hash of the arguments.
+
+    Raises:
+        TypeError: if an argument cannot be hashed canonically.
+
+    Example:
+        ```pycon
+        >>> from omegaconf import OmegaConf
+        >>> from hya.utils.disk_cache import hash_arguments
+        >>> conf = OmegaConf.create({"a": [1, 2, {"b": 3, "c": 4}]})
+        >>> hash_arguments(conf.a) == hash_arguments([1, 2, {"c": 4, "b": 3}])
+        True
+        >>> hash_arguments([1, 2]) == hash_arguments((1, 2))
+        False
+
+        ```
+    """
+    digest = hashlib.sha256()
+    _update_hash(digest, args)
+    _update_hash(digest, kwargs)
+    return digest.hexdigest()
+
+
+def persistent_cache(key: str, cache: DiskCache | None = None) -> Callable[[F], F]:
+    r"""Return a decorator to cache the results of a resolver on disk.
+
+    The results are keyed by the resolver key, the hash of the code
+    of the resolver and the canonical hash of its arguments. The
+    calls whose arguments or result cannot be hashed or pickled are
+    not cached. If the database cannot be opened, read or written,
+    e.g. the path is not writable or the database is locked, a
+    warning is logged and the resolver is called without cache.
+
+    Args:
+        key: The key of the resolver.
+        cache: The disk cache. ``None`` means the cache returned by
+            ``get_default_disk_cache`` when the resolver is called.
+
+    Returns:
+        The decorator.
+
+    Raises:
+        ValueError: if the resolver uses the ``_node_``,
+            ``_parent_`` or ``_root_`` arguments, because its result
+            depends on the config.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from hya.utils.disk_cache import DiskCache, persistent_cache
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     cache = DiskCache(Path(tmpdir, "cache.sqlite"))
+        ...     square = persistent_cache("square", cache)(lambda x: x * x)
+        ...     square(4)
+        ...     len(cache)
+        ...     cache.close()
+        ...
+        16
+        1
+
+        ```
+    """
+
+    def wrap(resolver: F) -> F:
+        check_cacheable(key, resolver)
+        code_hash = get_code_hash(resolver)
+
+        @functools.wraps(resolver)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                cache_key = f"{key}:{code_hash}:{hash_arguments(*args, **kwargs)}"
+            except TypeError:
+                return resolver(*args, **kwargs)
+            disk_cache = get_default_disk_cache() if cache is None else cache
+            try:
+                output = disk_cache.get(cache_key, _MISSING)
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning(f"Failed to read the disk cache {disk_cache.path}: {exc}")
+                return resolver(*args, **kwargs)
+            if output is _MISSING:
+                output = resolver(*args, **kwargs)
+                try:
+                    disk_cache.put(cache_key, output)
+                except (pickle.PicklingError, TypeError, AttributeError) as exc:
+                    logger.debug(f"Failed to cache the result of '{key}': {exc}")
+                except (OSError, sqlite3.Error) as exc:
+                    logger.warning(f"Failed to write the disk cache {disk_cache.path}: {exc}")
+            return output
+
+        return wrapper
+
+    return wrap
+
+
+_MISSING = object()
+
+
+@functools.lru_cache
+def _get_disk_cache(path: Path) -> DiskCache:
+    r"""Return the disk cache for a path.
+
+    Args:
+        path: The path to the SQLite database.
+
+    Returns:
+        The disk cache.
+    """
+    return DiskCache(path)
+
+
+def _update_code_hash(digest: Any, code: CodeType) -> None:
+    r"""Update a hash with the bytecode of a code object.
+
+    The line numbers and the file name are ignored.
+
+    Args:
+        digest: The hash object to update.
+        code: The code object to hash.
+    """
+    digest.update(code.co_code)
+    digest.update(
+        repr(
+            (code.co_names, code.co_varnames, code.co_freevars, code.co_cellvars, code.co_argcount)
+        ).encode()
+    )
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_code_hash(digest, const)
+        else:
+            digest.update(f"{type(const).__name__}:{const!r};".encode())
+
+
+def _update_hash(digest: Any, obj: Any) -> None:
+    r"""Update a hash with the canonical representation of an object.
+
+    Args:
+        digest: The hash object to update.
+        obj: The object to hash.
+
+    Raises:
+        TypeError: if the object cannot be hashed canonically.
+    """
+    obj = to_primitive(obj)
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        digest.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, (bytes, bytearray)):
+        digest.update(f"bytes:{len(obj)}:".encode())
+        digest.update(obj)
+    elif isinstance(obj, PurePath):
+        digest.update(f"path:{obj.as_posix()!r};".encode())
+    elif isinstance(obj, range):
+        digest.update(f"range:{obj.start}:{obj.stop}:{obj.step};".encode())
+    elif isinstance(obj, (list, tuple)):
+        digest.update(f"{type(obj).__name__}:{len(obj)}:".encode())
+        for item in obj:
+            _update_hash(digest, item)
+    elif isinstance(obj, dict):
+        digest.update(f"dict:{len(obj)}:".encode())
+        for item_key, value in sorted(obj.items(), key=lambda item: repr(item[0])):
+            _update_hash(digest, item_key)
+            _update_hash(digest, value)
+    elif is_numpy_available() and isinstance(obj, np.ndarray) and obj.dtype != object:
+        digest.update(f"ndarray:{obj.dtype.str}:{obj.shape}:".encode())
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    else:
+        msg = f"Cannot hash an object of type {type(obj).__qualname__}"
+        raise TypeError(msg)
+
+
+def _update_value_hash(digest: Any, value: Any) -> None:
+    r"""Update a hash with a default value or a closure value of a
+    function.
+
+    The functions contribute their code, the values that can be
+    hashed canonically contribute their canonical representation,
+    and the other values only contribute their type, because their
+    representation can change between the processes, e.g. with
+    their memory address.
+
+    Args:
+        digest: The hash object to update.
+        value: The value to hash.
+    """
+    code = getattr(value, "__code__", None)
+    if isinstance(code, CodeType):
+        digest.update(b"code:")
+        _update_code_hash(digest, code)
+        return
+    value_digest = hashlib.sha256()
+    try:
+        _update_hash(value_digest, value)
+    except TypeError:
+        digest.update(f"type:{type(value).__module__}.{type(value).__qualname__};".encode())
+    else:
+        digest.update(b"value:")
+        digest.update(value_digest.digest())
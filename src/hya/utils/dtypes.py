@@ -0,0 +1,160 @@
+r"""Implement the dtype name tables shared by the NumPy and PyTorch
+resolvers."""
+
+from __future__ import annotations
+
+__all__ = [
+    "DTYPE_ALIASES",
+    "NUMPY_DTYPE_PREFIXES",
+    "TORCH_DTYPE_NAMES",
+    "TORCH_DTYPE_PREFIXES",
+    "build_dtype_table",
+    "get_dtype_name",
+]
+
+import contextlib
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from hya.imports import is_numpy_available
+
+if TYPE_CHECKING or is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    from hya.utils.fallback.numpy import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+T = TypeVar("T")
+
+# The aliases have the same meaning in NumPy and PyTorch. The names
+# with different meanings, e.g. ``float`` or ``byte``, are resolved by
+# each library.
+DTYPE_ALIASES = {
+    "bf16": "bfloat16",
+    "bool_": "bool",
+    "cdouble": "complex128",
+    "cfloat": "complex64",
+    "double": "float64",
+    "fp16": "float16",
+    "fp32": "float32",
+    "fp64": "float64",
+    "half": "float16",
+    "short": "int16",
+    "single": "float32",
+}
+NUMPY_DTYPE_PREFIXES = ("np.", "numpy.")
+TORCH_DTYPE_PREFIXES = ("torch.",)
+# The names of the PyTorch dtypes known by NumPy, with the name of the
+# NumPy dtype of the same meaning, e.g. ``torch.float`` is ``float32``
+# while ``np.float`` is ``float64``. It resolves the ``torch.`` names
+# in the NumPy table without importing PyTorch.
+TORCH_DTYPE_NAMES = {
+    "bool": "bool",
+    "cdouble": "complex128",
+    "cfloat": "complex64",
+    "complex128": "complex128",
+    "complex64": "complex64",
+    "double": "float64",
+    "float": "float32",
+    "float16": "float16",
+    "float32": "float32",
+    "float64": "float64",
+    "half": "float16",
+    "int": "int32",
+    "int16": "int16",
+    "int32": "int32",
+    "int64": "int64",
+    "int8": "int8",
+    "long": "int64",
+    "short": "int16",
+    "uint16": "uint16",
+    "uint32": "uint32",
+    "uint64": "uint64",
+    "uint8": "uint8",
+}
+
+
+def build_dtype_table(
+    dtypes: dict[str, T],
+    prefixes: Sequence[str] = (),
+    foreign_names: Mapping[str, str] | None = None,
+) -> dict[str, T]:
+    r"""Build a table to look up the dtypes by name.
+
+    The table contains the names of the dtypes, the aliases of
+    ``DTYPE_ALIASES``, the same names with the prefixes of the
+    library, and the names of the dtypes of another library. A name
+    of ``dtypes`` is never overridden by an alias.
+
+    Args:
+        dtypes: The dtypes indexed by name.
+        prefixes: The prefixes of the library of the dtypes, e.g.
+            ``TORCH_DTYPE_PREFIXES``.
+        foreign_names: The prefixed names of the dtypes of another
+            library, e.g. ``torch.float``, with the name in
+            ``dtypes`` of the dtype of the same meaning, e.g.
+            ``float32``. The names whose dtype is not in ``dtypes``
+            are ignored.
+
+    Returns:
+        The dtypes indexed by name, alias, prefixed name and foreign
+            name.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.dtypes import build_dtype_table
+        >>> table = build_dtype_table(
+        ...     {"float16": "f2", "float32": "f4"},
+        ...     prefixes=("torch.",),
+        ...     foreign_names={"np.single": "float32"},
+        ... )
+        >>> table["fp16"], table["torch.half"], table["np.single"]
+        ('f2', 'f2', 'f4')
+        >>> "np.float16" in table
+        False
+
+        ```
+    """
+    table = dict(dtypes)
+    for alias, name in DTYPE_ALIASES.items():
+        if name in dtypes:
+            table.setdefault(alias, dtypes[name])
+    for name, dtype in list(table.items()):
+        for prefix in prefixes:
+            table.setdefault(f"{prefix}{name}", dtype)
+    for foreign_name, name in (foreign_names or {}).items():
+        if name in dtypes:
+            table.setdefault(foreign_name, dtypes[name])
+    return table
+
+
+def get_dtype_name(dtype: Any) -> str:
+    r"""Return the name used to look up a dtype in a dtype table.
+
+    Args:
+        dtype: The dtype, e.g. a name, a ``numpy.dtype``, a NumPy
+            scalar type or a ``torch.dtype``.
+
+    Returns:
+        The name of the dtype.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from hya.utils.dtypes import get_dtype_name
+        >>> get_dtype_name("fp16")
+        'fp16'
+        >>> get_dtype_name(np.dtype("float32"))
+        'float32'
+        >>> get_dtype_name(np.int64)
+        'int64'
+
+        ```
+    """
+    if isinstance(dtype, str):
+        return dtype.strip()
+    if is_numpy_available():
+        with contextlib.suppress(TypeError):
+            return np.dtype(dtype).name
+    return str(dtype)
@@ -0,0 +1,267 @@
+r"""Implement named shared memory segments to share the resolved values
+between processes.
+
+A value is stored in a ``multiprocessing.shared_memory`` segment whose
+name is derived from a content key, e.g. a hash of the resolver
+arguments. The first process that resolves the value creates the
+segment, and the other processes, e.g. the data loader workers that
+resolve the same config, attach to it without computing the value
+again. The segments are unlinked when the process that created them
+exits.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "SHARED_MEMORY_PREFIX",
+    "get_shared_buffer",
+    "get_shared_memory_name",
+    "release_shared_memory",
+]
+
+import atexit
+import contextlib
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SHARED_MEMORY_PREFIX = "hya_"
+
+# The segment starts with the size of the JSON header, which is written
+# last, so a size of 0 means the segment is not ready. The data starts
+# at the first aligned offset after the header.
+_HEADER_SIZE = struct.Struct("<Q")
+_ALIGNMENT = 64
+
+
+class _SharedMemory(SharedMemory):
+    r"""Implement a shared memory segment that is not closed when it is
+    garbage collected while some buffers still point to its memory,
+    e.g. at interpreter shutdown."""
+
+    def __del__(self) -> None:
+        with contextlib.suppress(BufferError):
+            super().__del__()
+
+
+_LOCK = threading.Lock()
+# The locks held while a segment is created, indexed by name. The
+# factories run outside the global lock, so a slow factory does not
+# block the other segments, and a factory can use other segments.
+_NAME_LOCKS: dict[str, threading.Lock] = {}
+# The segments opened by this process. They are kept open until the
+# process exits because the returned buffers point to their memory.
+_SEGMENTS: dict[str, _SharedMemory] = {}
+# The segments created by a process, indexed by name. The forked
+# processes inherit this dictionary, so the process ID is stored to
+# unlink the segments only in the process that created them.
+_OWNED: dict[str, int] = {}
+
+
+def get_shared_buffer(
+    key: str,
+    factory: Callable[[], tuple[dict[str, Any], Any]],
+    timeout: float = 60.0,
+) -> tuple[dict[str, Any], memoryview]:
+    r"""Return the data of the shared memory segment associated to a
+    key, and create the segment if it does not exist.
+
+    Args:
+        key: The content key of the value. Two values with the same
+            key must be equal.
+        factory: The function called to compute the value if the
+            segment does not exist. It returns the metadata of the
+            value, which must be JSON-serializable, and its data as
+            a C-contiguous object supporting the buffer protocol.
+        timeout: The number of seconds to wait for another process
+            to finish writing the segment.
+
+    Returns:
+        A tuple with the metadata and the data of the value. The
+            data points to the shared memory, so the changes are
+            visible to all the processes.
+
+    Raises:
+        TimeoutError: if the segment is not ready before the timeout.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.shared_memory import get_shared_buffer
+        >>> metadata, data = get_shared_buffer("doc_key", lambda: ({"name": "doc"}, b"abc"))
+        >>> metadata
+        {'name': 'doc'}
+        >>> bytes(data)
+        b'abc'
+
+        ```
+    """
+    name = get_shared_memory_name(key)
+    with _LOCK:
+        segment = _SEGMENTS.get(name)
+        name_lock = _NAME_LOCKS.setdefault(name, threading.Lock())
+    if segment is None:
+        with name_lock:
+            segment = _SEGMENTS.get(name)
+            created = False
+            while segment is None:
+                segment = _attach(name)
+                if segment is None:
+                    metadata, data = factory()
+                    segment = _create(name, metadata, data)
+                    created = segment is not None
+            with _LOCK:
+                _SEGMENTS[name] = segment
+                if created:
+                    _OWNED[name] = os.getpid()
+    return _read(segment, timeout)
+
+
+def get_shared_memory_name(key: str) -> str:
+    r"""Return the name of the shared memory segment associated to a
+    key.
+
+    The name is short enough for the platforms that limit the size of
+    the shared memory names, e.g. macOS.
+
+    Args:
+        key: The content key.
+
+    Returns:
+        The name of the segment.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.shared_memory import get_shared_memory_name
+        >>> get_shared_memory_name("my_key")
+        'hya_...'
+
+        ```
+    """
+    return SHARED_MEMORY_PREFIX + hashlib.sha256(key.encode()).hexdigest()[:24]
+
+
+def release_shared_memory() -> None:
+    r"""Unlink the shared memory segments created by the current
+    process.
+
+    This function is called when the process exits. The processes
+    that are attached to a segment can still use it, and its memory
+    is freed when all of them are detached.
+
+    Example:
+        ```pycon
+        >>> from hya.utils.shared_memory import release_shared_memory
+        >>> release_shared_memory()
+
+        ```
+    """
+    pid = os.getpid()
+    with _LOCK:
+        for name, owner in list(_OWNED.items()):
+            if owner != pid:
+                continue
+            # The segment is not closed because the values returned by
+            # ``get_shared_buffer`` may still point to its memory.
+            with contextlib.suppress(FileNotFoundError):
+                _SEGMENTS[name].unlink()
+            del _OWNED[name]
+
+
+def _align(size: int) -> int:
+    r"""Round up a size to the alignment of the data.
+
+    Args:
+        size: The size in bytes.
+
+    Returns:
+        The aligned size.
+    """
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+
+def _attach(name: str) -> _SharedMemory | None:
+    r"""Attach to an existing shared memory segment.
+
+    The segment is not registered in the resource tracker, so it is
+    not unlinked when the current process exits.
+
+    Args:
+        name: The name of the segment.
+
+    Returns:
+        The segment, or ``None`` if it does not exist.
+    """
+    try:
+        if sys.version_info >= (3, 13):
+            return _SharedMemory(name, track=False)
+        segment = _SharedMemory(name)
+    except FileNotFoundError:
+        return None
+    if os.name == "posix":
+        # Local import because the resource tracker is only used on POSIX.
+        from multiprocessing import resource_tracker  # noqa: PLC0415
+
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def _create(name: str, metadata: dict[str, Any], data: Any) -> _SharedMemory | None:
+    r"""Create a shared memory segment and write a value in it.
+
+    Args:
+        name: The name of the segment.
+        metadata: The metadata of the value.
+        data: The data of the value.
+
+    Returns:
+        The segment, or ``None`` if another process created it
+            first.
+    """
+    data = memoryview(data).cast("B")
+    header = json.dumps({"metadata": metadata, "nbytes": data.nbytes}).encode()
+    offset = _align(_HEADER_SIZE.size + len(header))
+    try:
+        segment = _SharedMemory(name, create=True, size=offset + data.nbytes)
+    except FileExistsError:
+        return None
+    segment.buf[_HEADER_SIZE.size : _HEADER_SIZE.size + len(header)] = header
+    segment.buf[offset : offset + data.nbytes] = data
+    segment.buf[: _HEADER_SIZE.size] = _HEADER_SIZE.pack(len(header))
+    return segment
+
+
+def _read(segment: SharedMemory, timeout: float) -> tuple[dict[str, Any], memoryview]:
+    r"""Read a value from a shared memory segment.
+
+    Args:
+        segment: The segment.
+        timeout: The number of seconds to wait for the segment to be
+            ready.
+
+    Returns:
+        A tuple with the metadata and the data of the value.
+
+    Raises:
+        TimeoutError: if the segment is not ready before the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while not (size := _HEADER_SIZE.unpack_from(segment.buf)[0]):
+        if time.monotonic() > deadline:
+            msg = f"The shared memory segment {segment.name} is not ready after {timeout}s"
+            raise TimeoutError(msg)
+        time.sleep(0.001)
+    header = json.loads(bytes(segment.buf[_HEADER_SIZE.size : _HEADER_SIZE.size + size]))
+    offset = _align(_HEADER_SIZE.size + size)
+    return header["metadata"], segment.buf[offset : offset + header["nbytes"]]
+
+
+atexit.register(release_shared_memory)
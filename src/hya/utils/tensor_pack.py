@@ -0,0 +1,353 @@
+r"""Implement a pack of tensors stored in a few contiguous buffers.
+
+A config can create hundreds of small tensors, e.g. per-layer scales
+or masks, and each tensor has its own storage. A ``TensorPack`` copies
+the tensors to one contiguous buffer per device and data type, and
+returns views of these buffers, so the tensors are stored in a few
+allocations, and they are moved to another device with one transfer
+per buffer.
+"""
+
+from __future__ import annotations
+
+__all__ = ["TensorPack", "pack_tensors"]
+
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+from omegaconf import DictConfig, ListConfig, OmegaConf
+
+from hya.imports import check_torch, is_torch_available
+
+if TYPE_CHECKING or is_torch_available():
+    import torch
+else:  # pragma: no cover
+    from hya.utils.fallback.torch import torch
+
+# The tensors start at an offset multiple of this number of bytes in
+# the buffers, so the vectorized operations can use aligned loads.
+_ALIGNMENT = 64
+
+
+class TensorPack(Mapping[str, "torch.Tensor"]):
+    r"""Implement a pack of tensors stored in one contiguous buffer per
+    device and data type.
+
+    The tensors are copied to the buffers, and the pack returns views
+    of the buffers. A tensor used for several keys is copied once, and
+    its keys return the same view. The sparse tensors are not packed,
+    and they are returned as they are. The packed tensors are
+    constants, so the tensors requiring gradients are rejected.
+
+    Args:
+        tensors: The tensors to pack, indexed by name.
+
+    Raises:
+        ValueError: if a strided tensor requires gradients.
+
+    Example:
+        ```pycon
+        >>> import torch
+        >>> from hya.utils.tensor_pack import TensorPack
+        >>> pack = TensorPack({"a": torch.ones(2), "b": torch.zeros(2, 2), "c": torch.arange(3)})
+        >>> pack["b"]
+        tensor([[0., 0.],
+                [0., 0.]])
+        >>> len(pack.buffers)
+        2
+
+        ```
+    """
+
+    def __init__(self, tensors: Mapping[str, torch.Tensor]) -> None:
+        check_torch()
+        # The index of each distinct tensor in the layout.
+        indices: dict[int, int] = {}
+        sizes: dict[tuple[torch.device, torch.dtype], int] = {}
+        # The group, offset, shape and stride of each distinct tensor.
+        self._layout: list[tuple[tuple[torch.device, torch.dtype], int, tuple, tuple]] = []
+        self._slots: dict[str, int] = {}
+        self._others: dict[str, torch.Tensor] = {}
+        for key, tensor in tensors.items():
+            if tensor.layout != torch.strided:
+                self._others[key] = tensor
+                continue
+            if tensor.requires_grad:
+                msg = (
+                    f"Cannot pack the tensor {key!r} because it requires gradients. "
+                    "Pack a detached tensor instead"
+                )
+                raise ValueError(msg)
+            if id(tensor) not in indices:
+                group = (tensor.device, tensor.dtype)
+                step = max(_ALIGNMENT // tensor.element_size(), 1)
+                offset = -(-sizes.get(group, 0) // step) * step
+                sizes[group] = offset + tensor.numel()
+                indices[id(tensor)] = len(self._layout)
+                shape = tuple(tensor.shape)
+                self._layout.append((group, offset, shape, _get_contiguous_stride(shape)))
+            self._slots[key] = indices[id(tensor)]
+        self._buffers = {
+            group: torch.empty(size, dtype=group[1], device=group[0])
+            for group, size in sizes.items()
+        }
+        self._keys = list(tensors)
+        self._views = self._create_views()
+        with torch.no_grad():
+            for key, tensor in tensors.items():
+                if indices.pop(id(tensor), None) is not None:
+                    self._views[key].copy_(tensor)
+
+    def __getitem__(self, key: str) -> torch.Tensor:
+        view = self._views.get(key)
+        if view is None:
+            return self._others[key]
+        return view
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(size={len(self):,}, "
+            f"num_buffers={len(self._buffers):,}, nbytes={self.nbytes:,})"
+        )
+
+    @property
+    def buffers(self) -> dict[tuple[torch.device, torch.dtype], torch.Tensor]:
+        r"""The buffers storing the packed tensors, indexed by device
+        and data type."""
+        return dict(self._buffers)
+
+    @property
+    def nbytes(self) -> int:
+        r"""The total size of the buffers in bytes."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def to(self, device: torch.device | str, non_blocking: bool = False) -> TensorPack:
+        r"""Move the packed tensors to a device.
+
+        The buffers are moved with one transfer each, and the tensors
+        of the new pack are views of the moved buffers. The pack is
+        returned as it is if the tensors are already on the device.
+
+        Args:
+            device: The target device.
+            non_blocking: If ``True``, the transfers are asynchronous
+                when it is possible, e.g. from pinned memory to a
+                GPU.
+
+        Returns:
+            The pack of the moved tensors. The tensors that are not
+                packed are moved one by one.
+
+        Example:
+            ```pycon
+            >>> import torch
+            >>> from hya.utils.tensor_pack import TensorPack
+            >>> pack = TensorPack({"a": torch.ones(2), "b": torch.zeros(3)})
+            >>> pack.to("cpu")["a"]
+            tensor([1., 1.])
+
+            ```
+        """
+        device = torch.device(device)
+        moved = {
+            group: buffer.to(device, non_blocking=non_blocking)
+            for group, buffer in self._buffers.items()
+        }
+        others = {
+            key: tensor.to(device, non_blocking=non_blocking)
+            for key, tensor in self._others.items()
+        }
+        if all(moved[group] is buffer for group, buffer in self._buffers.items()) and all(
+            others[key] is tensor for key, tensor in self._others.items()
+        ):
+            return self
+        # The buffers of the same data type on different source devices
+        # are on the same device after the transfer, so they are merged
+        # and the offsets of their tensors are shifted.
+        buffers: dict[tuple[torch.device, torch.dtype], torch.Tensor] = {}
+        shifts: dict[tuple[torch.device, torch.dtype], tuple] = {}
+        for group, buffer in moved.items():
+            new_group = (buffer.device, group[1])
+            shift = 0
+            if new_group in buffers:
+                buffer, shift = _concat_buffers(buffers[new_group], buffer)  # noqa: PLW2901
+            buffers[new_group] = buffer
+            shifts[group] = (new_group, shift)
+        pack = self.__class__({})
+        pack._buffers = buffers
+        pack._layout = [
+            (shifts[group][0], offset + shifts[group][1], shape, stride)
+            for group, offset, shape, stride in self._layout
+        ]
+        pack._slots = dict(self._slots)
+        pack._keys = list(self._keys)
+        pack._others = others
+        pack._views = pack._create_views()
+        return pack
+
+    def _create_views(self) -> dict[str, torch.Tensor]:
+        r"""Create the views of the packed tensors.
+
+        The keys of the same tensor return the same view.
+
+        Returns:
+            The views indexed by key.
+        """
+        views = [
+            self._buffers[group].as_strided(shape, stride, offset)
+            for group, offset, shape, stride in self._layout
+        ]
+        return {key: views[index] for key, index in self._slots.items()}
+
+
+def pack_tensors(config: Any) -> tuple[Any, TensorPack]:
+    r"""Resolve a config and pack its tensors.
+
+    The config is converted to primitive containers, and its tensors,
+    e.g. created by ``hya.torch.tensor``, are packed in a
+    ``TensorPack``. The keys of the pack are the paths of the tensors
+    in the config, e.g. ``model.layers.0.scale``.
+
+    Args:
+        config: The config, or a primitive container.
+
+    Returns:
+        A tuple with the resolved config, where the tensors are
+            replaced by views of the packed buffers, and the pack.
+
+    Raises:
+        ValueError: if two tensors have the same path, e.g. the
+            tensors of the keys ``a.b`` and ``a`` -> ``b``, or if a
+            tensor requires gradients.
+
+    Example:
+        ```pycon
+        >>> import hya
+        >>> from omegaconf import OmegaConf
+        >>> from hya.utils.tensor_pack import pack_tensors
+        >>> conf = OmegaConf.create(
+        ...     {
+        ...         "scales": ["${hya.torch.tensor:[1.0]}", "${hya.torch.tensor:[2.0, 3.0]}"],
+        ...         "mask": "${hya.torch.tensor:[true, false]}",
+        ...     }
+        ... )
+        >>> data, pack = pack_tensors(conf)
+        >>> data["scales"]
+        [tensor([1.]), tensor([2., 3.])]
+        >>> sorted(pack)
+        ['mask', 'scales.0', 'scales.1']
+        >>> len(pack.buffers)
+        2
+
+        ```
+    """
+    if isinstance(config, (DictConfig, ListConfig)):
+        config = OmegaConf.to_container(config, resolve=True)
+    tensors: dict[str, torch.Tensor] = {}
+    _find_tensors(config, "", tensors)
+    pack = TensorPack(tensors)
+    return _replace_tensors(config, "", pack), pack
+
+
+def _find_tensors(data: Any, path: str, tensors: dict[str, torch.Tensor]) -> None:
+    r"""Find the tensors in primitive containers.
+
+    Args:
+        data: The data to explore.
+        path: The path of the data.
+        tensors: The dictionary where the tensors are added, indexed
+            by path.
+
+    Raises:
+        ValueError: if two tensors have the same path.
+    """
+    if isinstance(data, torch.Tensor):
+        if path in tensors:
+            msg = (
+                f"Two tensors have the same path {path!r}. The keys containing dots "
+                "cannot be distinguished from the nested keys"
+            )
+            raise ValueError(msg)
+        tensors[path] = data
+    elif isinstance(data, Mapping):
+        for key, value in data.items():
+            _find_tensors(value, _join(path, key), tensors)
+    elif isinstance(data, (list, tuple)):
+        for index, value in enumerate(data):
+            _find_tensors(value, _join(path, index), tensors)
+
+
+def _replace_tensors(data: Any, path: str, pack: TensorPack) -> Any:
+    r"""Replace the tensors in primitive containers by their packed
+    views.
+
+    Args:
+        data: The data where the tensors are replaced.
+        path: The path of the data.
+        pack: The pack of the tensors.
+
+    Returns:
+        The data where the tensors are replaced.
+    """
+    if isinstance(data, torch.Tensor):
+        return pack[path]
+    if isinstance(data, Mapping):
+        return {key: _replace_tensors(value, _join(path, key), pack) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return type(data)(
+            _replace_tensors(value, _join(path, index), pack) for index, value in enumerate(data)
+        )
+    return data
+
+
+def _concat_buffers(first: torch.Tensor, second: torch.Tensor) -> tuple[torch.Tensor, int]:
+    r"""Concatenate two buffers of the same device and data type.
+
+    Args:
+        first: The first buffer.
+        second: The second buffer.
+
+    Returns:
+        A tuple with the concatenated buffer, and the aligned offset
+            of the second buffer in it.
+    """
+    step = max(_ALIGNMENT // first.element_size(), 1)
+    shift = -(-first.numel() // step) * step
+    buffer = torch.empty(shift + second.numel(), dtype=first.dtype, device=first.device)
+    buffer[: first.numel()].copy_(first)
+    buffer[shift:].copy_(second)
+    return buffer, shift
+
+
+def _get_contiguous_stride(shape: tuple[int, ...]) -> tuple[int, ...]:
+    r"""Return the stride of a contiguous tensor.
+
+    Args:
+        shape: The shape of the tensor.
+
+    Returns:
+        The stride of the tensor.
+    """
+    stride = [1] * len(shape)
+    for i in range(len(shape) - 2, -1, -1):
+        stride[i] = stride[i + 1] * max(shape[i + 1], 1)
+    return tuple(stride)
+
+
+def _join(path: str, key: Any) -> str:
+    r"""Return the path of a child.
+
+    Args:
+        path: The path of the parent.
+        key: The key of the child in the parent.
+
+    Returns:
+        The path of the child.
+    """
+    return f"{path}.{key}" if path else str(key)
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from omegaconf import OmegaConf
+
+
+def test_autotune_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.autotune")
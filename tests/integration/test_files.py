@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from omegaconf import OmegaConf
+
+
+def test_glob_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.glob")
+
+
+def test_read_bytes_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.read_bytes")
+
+
+def test_read_text_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.read_text")
+
+
+def test_include_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.include")
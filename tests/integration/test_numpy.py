@@ -8,3 +8,63 @@ from hya.testing import numpy_available
 @numpy_available
 def test_array_resolver() -> None:
     assert OmegaConf.has_resolver("hya.np.array")
+
+
+@numpy_available
+def test_shared_array_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.shared_array")
+
+
+@numpy_available
+def test_dtype_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.dtype")
+
+
+@numpy_available
+def test_load_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.load")
+
+
+@numpy_available
+def test_memmap_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.memmap")
+
+
+@numpy_available
+def test_arange_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.arange")
+
+
+@numpy_available
+def test_eye_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.eye")
+
+
+@numpy_available
+def test_full_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.full")
+
+
+@numpy_available
+def test_linspace_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.linspace")
+
+
+@numpy_available
+def test_ones_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.ones")
+
+
+@numpy_available
+def test_zeros_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.zeros")
+
+
+@numpy_available
+def test_frombytes_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.frombytes")
+
+
+@numpy_available
+def test_interned_array_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.np.interned_array")
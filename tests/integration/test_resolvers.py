@@ -7,6 +7,10 @@ def test_add_resolver() -> None:
     assert OmegaConf.has_resolver("hya.add")
 
 
+def test_argmax_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.argmax")
+
+
 def test_asinh_resolver() -> None:
     assert OmegaConf.has_resolver("hya.asinh")
 
@@ -43,6 +47,10 @@ def test_max_resolver() -> None:
     assert OmegaConf.has_resolver("hya.max")
 
 
+def test_mean_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.mean")
+
+
 def test_min_resolver() -> None:
     assert OmegaConf.has_resolver("hya.min")
 
@@ -67,6 +75,10 @@ def test_pow_resolver() -> None:
     assert OmegaConf.has_resolver("hya.pow")
 
 
+def test_quantile_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.quantile")
+
+
 def test_sqrt_resolver() -> None:
     assert OmegaConf.has_resolver("hya.sqrt")
 
@@ -79,10 +91,18 @@ def test_sinh_resolver() -> None:
     assert OmegaConf.has_resolver("hya.sinh")
 
 
+def test_std_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.std")
+
+
 def test_sub_resolver() -> None:
     assert OmegaConf.has_resolver("hya.sub")
 
 
+def test_sum_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.sum")
+
+
 def test_to_path_resolver() -> None:
     assert OmegaConf.has_resolver("hya.to_path")
 
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from omegaconf import OmegaConf
+
+
+def test_linspace_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.linspace")
+
+
+def test_logspace_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.logspace")
+
+
+def test_range_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.range")
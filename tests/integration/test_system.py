@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from omegaconf import OmegaConf
+
+
+def test_available_memory_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.available_memory")
+
+
+def test_cpu_affinity_count_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.cpu_affinity_count")
+
+
+def test_cpu_count_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.cpu_count")
@@ -13,3 +13,23 @@ def test_tensor_resolver() -> None:
 @torch_available
 def test_dtype_resolver() -> None:
     assert OmegaConf.has_resolver("hya.torch.dtype")
+
+
+@torch_available
+def test_shared_tensor_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.torch.shared_tensor")
+
+
+@torch_available
+def test_load_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.torch.load")
+
+
+@torch_available
+def test_device_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.torch.device")
+
+
+@torch_available
+def test_num_threads_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.torch.num_threads")
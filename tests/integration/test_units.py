@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from omegaconf import OmegaConf
+
+
+def test_duration_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.duration")
+
+
+def test_fit_batch_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.fit_batch")
+
+
+def test_size_resolver() -> None:
+    assert OmegaConf.has_resolver("hya.size")
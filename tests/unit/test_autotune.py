@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import json
+import os
+import multiprocessing
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+from omegaconf import OmegaConf
+from omegaconf.errors import InterpolationResolutionError
+
+from hya.autotune import (
+    AUTOTUNE_CACHE_ENV,
+    Probe,
+    autotune,
+    clear_autotune_results,
+    get_autotune_cache_path,
+    get_machine_key,
+    get_probe_registry,
+    register_probe,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path]:
+    path = tmp_path.joinpath("cache", "autotune.json")
+    monkeypatch.setenv(AUTOTUNE_CACHE_ENV, path.as_posix())
+    clear_autotune_results()
+    yield path
+    clear_autotune_results()
+
+
+@pytest.fixture
+def probe() -> Mock:
+    probe = Mock(side_effect=lambda candidate: abs(candidate - 5))
+    register_probe("test_closest_to_5", repeat=1, exist_ok=True)(probe)
+    return probe
+
+
+def autotune_random(
+    path: str, candidates: list[int], calls_path: str, queue: multiprocessing.Queue
+) -> None:
+    def probe(candidate: int) -> float:
+        with Path(calls_path).open("a") as file:
+            file.write(f"{candidate}\n")
+        time.sleep(0.05)
+        # The best candidate depends on the process.
+        return (candidate * os.getpid()) % 7
+
+    register_probe("test_random", repeat=1, exist_ok=True)(probe)
+    queue.put(autotune("test_random", candidates, cache_path=path))
+
+
+def run_autotune_processes(path: Path, candidates: list[list[int]], calls_path: Path) -> list[int]:
+    # The processes are forked so they do not import the packages again.
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    processes = [
+        context.Process(
+            target=autotune_random,
+            args=(path.as_posix(), values, calls_path.as_posix(), queue),
+        )
+        for values in candidates
+    ]
+    for process in processes:
+        process.start()
+    values = [queue.get(timeout=60) for _ in processes]
+    for process in processes:
+        process.join()
+    assert all(process.exitcode == 0 for process in processes)
+    return values
+
+
+###########################
+#     Tests for Probe     #
+###########################
+
+
+def test_probe_call() -> None:
+    assert Probe(lambda candidate: candidate * 2)(3) == 6
+
+
+def test_probe_repr() -> None:
+    assert repr(Probe(lambda candidate: candidate, version="3", repeat=2)) == (
+        "Probe(version=3, repeat=2)"
+    )
+
+
+def test_probe_version() -> None:
+    assert Probe(lambda candidate: candidate, version=2).version == "2"
+
+
+def test_probe_measure_cost() -> None:
+    costs = iter([3.0, 1.0, 2.0])
+    assert Probe(lambda _: next(costs), repeat=3).measure(0) == 1.0
+
+
+def test_probe_measure_time() -> None:
+    assert Probe(lambda seconds: time.sleep(seconds), repeat=1).measure(0.01) >= 0.01
+
+
+def test_probe_incorrect_repeat() -> None:
+    with pytest.raises(ValueError, match="repeat must be greater than 0"):
+        Probe(lambda candidate: candidate, repeat=0)
+
+
+##############################
+#     Tests for autotune     #
+##############################
+
+
+def test_autotune(probe: Mock) -> None:
+    assert autotune("test_closest_to_5", [1, 4, 16]) == 4
+    assert probe.call_count == 3
+
+
+def test_autotune_cached_in_memory(probe: Mock, cache_path: Path) -> None:
+    assert autotune("test_closest_to_5", [1, 4, 16]) == 4
+    cache_path.unlink()
+    assert autotune("test_closest_to_5", [1, 4, 16]) == 4
+    assert probe.call_count == 3
+
+
+def test_autotune_cached_on_disk(probe: Mock) -> None:
+    assert autotune("test_closest_to_5", [1, 4, 16]) == 4
+    clear_autotune_results()
+    assert autotune("test_closest_to_5", [1, 4, 16]) == 4
+    assert probe.call_count == 3
+
+
+def test_autotune_cache_file(probe: Mock, cache_path: Path) -> None:
+    autotune("test_closest_to_5", [1, 4, 16])
+    results = json.loads(cache_path.read_text())
+    assert len(results) == 1
+    key, result = next(iter(results.items()))
+    assert json.loads(key) == [*get_machine_key(), "test_closest_to_5", "1", [1, 4, 16]]
+    assert result == {"value": 4, "costs": [4, 1, 11]}
+    assert probe.call_count == 3
+
+
+def test_autotune_different_candidates(probe: Mock) -> None:
+    assert autotune("test_closest_to_5", [1, 4, 16]) == 4
+    assert autotune("test_closest_to_5", [2, 7]) == 7
+    assert probe.call_count == 5
+
+
+def test_autotune_new_version(probe: Mock, cache_path: Path) -> None:
+    assert autotune("test_closest_to_5", [1, 4, 16]) == 4
+    register_probe("test_closest_to_5", version="2", repeat=1, exist_ok=True)(probe)
+    assert autotune("test_closest_to_5", [1, 4, 16]) == 4
+    assert probe.call_count == 6
+    assert len(json.loads(cache_path.read_text())) == 2
+
+
+def test_autotune_cache_path(probe: Mock, tmp_path: Path) -> None:
+    path = tmp_path.joinpath("other.json")
+    assert autotune("test_closest_to_5", [1, 4, 16], cache_path=path) == 4
+    assert path.is_file()
+    assert probe.call_count == 3
+
+
+def test_autotune_invalid_cache_file(probe: Mock, cache_path: Path) -> None:
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text("not json")
+    assert autotune("test_closest_to_5", [1, 4, 16]) == 4
+    assert len(json.loads(cache_path.read_text())) == 1
+    assert probe.call_count == 3
+
+
+@pytest.mark.usefixtures("probe")
+def test_autotune_keep_other_results(cache_path: Path) -> None:
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(json.dumps({"other": {"value": 1, "costs": [0]}}))
+    autotune("test_closest_to_5", [1, 4, 16])
+    assert "other" in json.loads(cache_path.read_text())
+
+
+def test_autotune_lock_file(probe: Mock, cache_path: Path) -> None:
+    assert autotune("test_closest_to_5", [1, 4, 16]) == 4
+    assert cache_path.with_name("autotune.json.lock").is_file()
+    assert probe.call_count == 3
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="requires fork")
+def test_autotune_processes_same_probe(cache_path: Path, tmp_path: Path) -> None:
+    calls_path = tmp_path.joinpath("calls.txt")
+    values = run_autotune_processes(cache_path, [[1, 2, 3, 4]] * 4, calls_path)
+    # The probe runs in one process, and the other processes use its result.
+    assert len(set(values)) == 1
+    assert sorted(calls_path.read_text().split()) == ["1", "2", "3", "4"]
+    assert len(json.loads(cache_path.read_text())) == 1
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="requires fork")
+def test_autotune_processes_different_candidates(cache_path: Path, tmp_path: Path) -> None:
+    calls_path = tmp_path.joinpath("calls.txt")
+    run_autotune_processes(cache_path, [[1, 2], [1, 3], [1, 4], [1, 5]], calls_path)
+    assert len(json.loads(cache_path.read_text())) == 4
+
+
+def test_autotune_read_only_cache(
+    probe: Mock, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    tmp_path.joinpath("file").touch()
+    path = tmp_path.joinpath("file", "autotune.json")
+    assert autotune("test_closest_to_5", [1, 4, 16], cache_path=path) == 4
+    assert "Failed to write the autotune cache file" in caplog.text
+    assert probe.call_count == 3
+
+
+def test_autotune_plain_function() -> None:
+    get_probe_registry().register("test_plain", exist_ok=True)(lambda candidate: -candidate)
+    assert autotune("test_plain", [1, 3, 2]) == 3
+
+
+def test_autotune_list_config(probe: Mock) -> None:
+    candidates = OmegaConf.create({"candidates": [1, 4, 16]}).candidates
+    assert autotune("test_closest_to_5", candidates) == 4
+    assert probe.call_count == 3
+
+
+def test_autotune_unknown_probe() -> None:
+    with pytest.raises(ValueError, match="Unknown probe 'missing'"):
+        autotune("missing", [1, 2])
+
+
+@pytest.mark.usefixtures("probe")
+def test_autotune_no_candidates() -> None:
+    with pytest.raises(ValueError, match="No candidates to autotune the probe"):
+        autotune("test_closest_to_5", [])
+
+
+#######################################
+#     Tests for autotune_resolver     #
+#######################################
+
+
+def test_autotune_resolver(probe: Mock) -> None:
+    assert OmegaConf.create({"key": "${hya.autotune:test_closest_to_5,[1,4,16]}"}).key == 4
+    assert probe.call_count == 3
+
+
+def test_autotune_resolver_unknown_probe() -> None:
+    with pytest.raises(InterpolationResolutionError, match="Unknown probe 'missing'"):
+        OmegaConf.create({"key": "${hya.autotune:missing,[1,2]}"}).key  # noqa: B018
+
+
+#############################################
+#     Tests for get_autotune_cache_path     #
+#############################################
+
+
+def test_get_autotune_cache_path_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(AUTOTUNE_CACHE_ENV, tmp_path.joinpath("tune.json").as_posix())
+    assert get_autotune_cache_path() == tmp_path.joinpath("tune.json")
+
+
+def test_get_autotune_cache_path_xdg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(AUTOTUNE_CACHE_ENV)
+    monkeypatch.setenv("XDG_CACHE_HOME", tmp_path.as_posix())
+    assert get_autotune_cache_path() == tmp_path.joinpath("hya", "autotune.json")
+
+
+def test_get_autotune_cache_path_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(AUTOTUNE_CACHE_ENV)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    assert get_autotune_cache_path().parts[-3:] == (".cache", "hya", "autotune.json")
+
+
+#####################################
+#     Tests for get_machine_key     #
+#####################################
+
+
+def test_get_machine_key() -> None:
+    hostname, cpu_model = get_machine_key()
+    assert isinstance(hostname, str)
+    assert isinstance(cpu_model, str)
+
+
+####################################
+#     Tests for register_probe     #
+####################################
+
+
+def test_register_probe() -> None:
+    def func(candidate: int) -> int:
+        return candidate
+
+    assert register_probe("test_register", version="4", exist_ok=True)(func) is func
+    probe = get_probe_registry().state["test_register"]
+    assert isinstance(probe, Probe)
+    assert probe.version == "4"
+
+
+def test_register_probe_duplicate() -> None:
+    register_probe("test_duplicate", exist_ok=True)(lambda candidate: candidate)
+    with pytest.raises(RuntimeError, match="A resolver is already registered"):
+        register_probe("test_duplicate")(lambda candidate: candidate)
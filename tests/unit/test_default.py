@@ -59,25 +59,44 @@ def test_get_default_registry_modifications_persist() -> None:
     "name",
     [
         "hya.add",
+        "hya.argmax",
         "hya.asinh",
+        "hya.autotune",
+        "hya.available_memory",
         "hya.ceildiv",
+        "hya.cpu_affinity_count",
+        "hya.cpu_count",
+        "hya.duration",
         "hya.exp",
+        "hya.fit_batch",
         "hya.floordiv",
+        "hya.glob",
+        "hya.include",
         "hya.len",
+        "hya.linspace",
         "hya.iter_join",
         "hya.log",
         "hya.log10",
+        "hya.logspace",
         "hya.max",
+        "hya.mean",
         "hya.min",
         "hya.mul",
         "hya.neg",
         "hya.path",
         "hya.pi",
         "hya.pow",
+        "hya.quantile",
+        "hya.range",
+        "hya.read_bytes",
+        "hya.read_text",
         "hya.sqrt",
         "hya.sha256",
         "hya.sinh",
+        "hya.size",
+        "hya.std",
         "hya.sub",
+        "hya.sum",
         "hya.to_path",
         "hya.truediv",
     ],
@@ -96,14 +115,42 @@ def test_get_default_registry_default_braceexpand_resolvers() -> None:
 
 
 @numpy_available
-def test_get_default_registry_default_numpy_resolvers() -> None:
+@pytest.mark.parametrize(
+    "name",
+    [
+        "hya.np.arange",
+        "hya.np.array",
+        "hya.np.dtype",
+        "hya.np.eye",
+        "hya.np.frombytes",
+        "hya.np.full",
+        "hya.np.interned_array",
+        "hya.np.linspace",
+        "hya.np.load",
+        "hya.np.memmap",
+        "hya.np.ones",
+        "hya.np.shared_array",
+        "hya.np.zeros",
+    ],
+)
+def test_get_default_registry_default_numpy_resolvers(name: str) -> None:
     """Test that get_default_registry returns a registry with default
     resolvers."""
-    assert get_default_registry().has_resolver("hya.np.array")
+    assert get_default_registry().has_resolver(name)
 
 
 @torch_available
-@pytest.mark.parametrize("name", ["hya.torch.tensor", "hya.torch.dtype"])
+@pytest.mark.parametrize(
+    "name",
+    [
+        "hya.torch.device",
+        "hya.torch.dtype",
+        "hya.torch.load",
+        "hya.torch.num_threads",
+        "hya.torch.shared_tensor",
+        "hya.torch.tensor",
+    ],
+)
 def test_get_default_registry_default_torch_resolvers(name: str) -> None:
     """Test that get_default_registry returns a registry with default
     resolvers."""
@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+import glob
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from omegaconf import DictConfig, ListConfig, OmegaConf
+from omegaconf.errors import InterpolationResolutionError
+
+from hya.files import DirectoryIndex, prefetch_includes
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    for name in ["b.txt", "a.txt", "c.csv", ".hidden.txt"]:
+        tmp_path.joinpath(name).touch()
+    for name in ["shard-2", "shard-1"]:
+        tmp_path.joinpath(name).mkdir()
+        tmp_path.joinpath(name, "data.bin").touch()
+    return tmp_path
+
+
+@pytest.fixture
+def text_path(tmp_path: Path) -> Path:
+    path = tmp_path.joinpath("vocab.txt")
+    path.write_text("cat\ndog\nbird\nfish\n")
+    return path
+
+
+@pytest.fixture(params=[False, True], ids=["read", "mmap"])
+def use_mmap(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    if request.param:
+        monkeypatch.setattr("hya.files.MMAP_MIN_SIZE", 0)
+    return request.param
+
+
+@pytest.fixture
+def yaml_dir(tmp_path: Path) -> Path:
+    tmp_path.joinpath("model.yaml").write_text(
+        "name: resnet\nlayers: ${num_layers}\nwidth: ${.layers}\n"
+    )
+    tmp_path.joinpath("shapes.yaml").write_text("- 1\n- 2\n- 3\n")
+    tmp_path.joinpath("nested.yaml").write_text(
+        f"model: ${{hya.include:{tmp_path.joinpath('model.yaml')}}}\n"
+    )
+    tmp_path.joinpath("invalid.yaml").write_text("key: [1, 2\n")
+    return tmp_path
+
+
+def touch_later(path: Path) -> None:
+    r"""Create a file and make sure the parent directory mtime
+    changes."""
+    mtime_ns = path.parent.stat().st_mtime_ns
+    path.touch()
+    os.utime(path.parent, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+
+
+####################################
+#     Tests for DirectoryIndex     #
+####################################
+
+
+def test_directory_index_glob(data_dir: Path) -> None:
+    assert DirectoryIndex().glob(f"{data_dir}/*.txt") == [
+        f"{data_dir}/a.txt",
+        f"{data_dir}/b.txt",
+    ]
+
+
+def test_directory_index_glob_hidden(data_dir: Path) -> None:
+    assert DirectoryIndex().glob(f"{data_dir}/.*.txt") == [f"{data_dir}/.hidden.txt"]
+
+
+def test_directory_index_glob_nested(data_dir: Path) -> None:
+    assert DirectoryIndex().glob(f"{data_dir}/shard-*/*.bin") == [
+        f"{data_dir}/shard-1/data.bin",
+        f"{data_dir}/shard-2/data.bin",
+    ]
+
+
+def test_directory_index_glob_directories_only(data_dir: Path) -> None:
+    assert DirectoryIndex().glob(f"{data_dir}/*/") == [
+        f"{data_dir}/shard-1/",
+        f"{data_dir}/shard-2/",
+    ]
+
+
+def test_directory_index_glob_literal(data_dir: Path) -> None:
+    assert DirectoryIndex().glob(f"{data_dir}/a.txt") == [f"{data_dir}/a.txt"]
+
+
+def test_directory_index_glob_literal_missing(data_dir: Path) -> None:
+    assert DirectoryIndex().glob(f"{data_dir}/missing.txt") == []
+
+
+def test_directory_index_glob_missing_directory(tmp_path: Path) -> None:
+    assert DirectoryIndex().glob(f"{tmp_path}/missing/*.txt") == []
+
+
+def test_directory_index_glob_relative(data_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(data_dir)
+    assert DirectoryIndex().glob("*.csv") == ["c.csv"]
+
+
+@pytest.mark.parametrize(
+    "pattern", ["./*.csv", "./shard-*/*.bin", "shard-1/./*.bin", "./shard-*/", "./a.txt", "."]
+)
+def test_directory_index_glob_same_as_glob(
+    data_dir: Path, monkeypatch: pytest.MonkeyPatch, pattern: str
+) -> None:
+    monkeypatch.chdir(data_dir)
+    assert DirectoryIndex().glob(pattern) == sorted(glob.glob(pattern))  # noqa: PTH207
+
+
+def test_directory_index_glob_curdir_prefix(data_dir: Path) -> None:
+    assert DirectoryIndex().glob(f"{data_dir}/./shard-1/*.bin") == [
+        f"{data_dir}/./shard-1/data.bin"
+    ]
+
+
+def test_directory_index_glob_pardir(data_dir: Path) -> None:
+    assert DirectoryIndex().glob(f"{data_dir}/shard-1/../*.csv") == [
+        f"{data_dir}/shard-1/../c.csv",
+    ]
+
+
+def test_directory_index_glob_root() -> None:
+    assert DirectoryIndex().glob("/") == ["/"]
+
+
+def test_directory_index_glob_empty() -> None:
+    assert DirectoryIndex().glob("") == []
+
+
+def test_directory_index_glob_cached(data_dir: Path) -> None:
+    index = DirectoryIndex()
+    assert len(index.glob(f"{data_dir}/*.txt")) == 2
+    assert len(index) == 1
+    # Removing a file without updating the directory mtime is not visible.
+    mtime_ns = data_dir.stat().st_mtime_ns
+    data_dir.joinpath("a.txt").unlink()
+    os.utime(data_dir, ns=(mtime_ns, mtime_ns))
+    assert len(index.glob(f"{data_dir}/*.txt")) == 2
+
+
+def test_directory_index_glob_invalidated(data_dir: Path) -> None:
+    index = DirectoryIndex()
+    assert len(index.glob(f"{data_dir}/*.txt")) == 2
+    touch_later(data_dir.joinpath("d.txt"))
+    assert index.glob(f"{data_dir}/*.txt") == [
+        f"{data_dir}/a.txt",
+        f"{data_dir}/b.txt",
+        f"{data_dir}/d.txt",
+    ]
+
+
+def test_directory_index_max_dirs(data_dir: Path) -> None:
+    index = DirectoryIndex(max_dirs=2)
+    assert len(index.glob(f"{data_dir}/shard-*/*.bin")) == 2
+    assert len(index) == 2
+    assert index.glob(f"{data_dir}/*.csv") == [f"{data_dir}/c.csv"]
+    assert len(index) == 2
+
+
+def test_directory_index_max_patterns(data_dir: Path) -> None:
+    index = DirectoryIndex(max_patterns=1)
+    index.glob(f"{data_dir}/*.txt")
+    index.glob(f"{data_dir}/*.csv")
+    assert len(index._entries.get(f"{data_dir}/").matches) == 1
+    assert index.glob(f"{data_dir}/*.txt") == [f"{data_dir}/a.txt", f"{data_dir}/b.txt"]
+
+
+def test_directory_index_clear(data_dir: Path) -> None:
+    index = DirectoryIndex()
+    index.glob(f"{data_dir}/*.txt")
+    index.clear()
+    assert len(index) == 0
+
+
+###################################
+#     Tests for glob_resolver     #
+###################################
+
+
+def test_glob_resolver(data_dir: Path) -> None:
+    assert OmegaConf.create({"key": f"${{hya.glob:{data_dir}/*.txt}}"}).key == [
+        f"{data_dir}/a.txt",
+        f"{data_dir}/b.txt",
+    ]
+
+
+def test_glob_resolver_rank(data_dir: Path) -> None:
+    conf = OmegaConf.create(
+        {
+            "rank0": f"${{hya.glob:{data_dir}/*.*,0,2}}",
+            "rank1": f"${{hya.glob:{data_dir}/*.*,1,2}}",
+        }
+    )
+    assert conf.rank0 == [f"{data_dir}/a.txt", f"{data_dir}/c.csv"]
+    assert conf.rank1 == [f"{data_dir}/b.txt"]
+
+
+def test_glob_resolver_no_match(data_dir: Path) -> None:
+    assert OmegaConf.create({"key": f"${{hya.glob:{data_dir}/*.json}}"}).key == []
+
+
+@pytest.mark.parametrize(("rank", "world_size"), [(0, 0), (2, 2), (-1, 2)])
+def test_glob_resolver_incorrect_rank(data_dir: Path, rank: int, world_size: int) -> None:
+    with pytest.raises(InterpolationResolutionError, match=r"ValueError"):
+        OmegaConf.create(  # noqa: B018
+            {"key": f"${{hya.glob:{data_dir}/*.txt,{rank},{world_size}}}"}
+        ).key
+
+
+#########################################
+#     Tests for read_bytes_resolver     #
+#########################################
+
+
+@pytest.mark.usefixtures("use_mmap")
+def test_read_bytes_resolver(text_path: Path) -> None:
+    assert (
+        OmegaConf.create({"key": f"${{hya.read_bytes:{text_path}}}"}).key
+        == b"cat\ndog\nbird\nfish\n"
+    )
+
+
+@pytest.mark.usefixtures("use_mmap")
+def test_read_bytes_resolver_range(text_path: Path) -> None:
+    assert OmegaConf.create({"key": f"${{hya.read_bytes:{text_path},4,7}}"}).key == b"dog"
+
+
+@pytest.mark.usefixtures("use_mmap")
+def test_read_bytes_resolver_start(text_path: Path) -> None:
+    assert OmegaConf.create({"key": f"${{hya.read_bytes:{text_path},13}}"}).key == b"fish\n"
+
+
+@pytest.mark.usefixtures("use_mmap")
+def test_read_bytes_resolver_empty(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("empty.bin")
+    path.touch()
+    assert OmegaConf.create({"key": f"${{hya.read_bytes:{path}}}"}).key == b""
+
+
+def test_read_bytes_resolver_cached(text_path: Path) -> None:
+    conf = OmegaConf.create({"key": f"${{hya.read_bytes:{text_path}}}"})
+    assert conf.key == b"cat\ndog\nbird\nfish\n"
+    # Same size and mtime, so the cached content is returned.
+    stat = text_path.stat()
+    text_path.write_text("CAT\ndog\nbird\nfish\n")
+    os.utime(text_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert conf.key == b"cat\ndog\nbird\nfish\n"
+
+
+def test_read_bytes_resolver_invalidated(text_path: Path) -> None:
+    conf = OmegaConf.create({"key": f"${{hya.read_bytes:{text_path}}}"})
+    assert conf.key == b"cat\ndog\nbird\nfish\n"
+    text_path.write_text("cow\n")
+    assert conf.key == b"cow\n"
+
+
+def test_read_bytes_resolver_missing(tmp_path: Path) -> None:
+    with pytest.raises(InterpolationResolutionError, match=r"FileNotFoundError"):
+        OmegaConf.create(  # noqa: B018
+            {"key": f"${{hya.read_bytes:{tmp_path.joinpath('missing.bin')}}}"}
+        ).key
+
+
+def test_read_bytes_resolver_negative(text_path: Path) -> None:
+    with pytest.raises(InterpolationResolutionError, match=r"ValueError"):
+        OmegaConf.create({"key": f"${{hya.read_bytes:{text_path},-1}}"}).key  # noqa: B018
+
+
+########################################
+#     Tests for read_text_resolver     #
+########################################
+
+
+@pytest.mark.usefixtures("use_mmap")
+def test_read_text_resolver(text_path: Path) -> None:
+    assert (
+        OmegaConf.create({"key": f"${{hya.read_text:{text_path}}}"}).key == "cat\ndog\nbird\nfish\n"
+    )
+
+
+@pytest.mark.usefixtures("use_mmap")
+@pytest.mark.parametrize(
+    ("start", "stop", "expected"),
+    [
+        (0, 1, "cat\n"),
+        (1, 3, "dog\nbird\n"),
+        (3, 10, "fish\n"),
+        (4, 10, ""),
+        (2, 1, ""),
+        (2, "null", "bird\nfish\n"),
+        ("null", 2, "cat\ndog\n"),
+    ],
+)
+def test_read_text_resolver_lines(
+    text_path: Path, start: int | str, stop: int | str, expected: str
+) -> None:
+    assert (
+        OmegaConf.create({"key": f"${{hya.read_text:{text_path},{start},{stop}}}"}).key == expected
+    )
+
+
+@pytest.mark.usefixtures("use_mmap")
+def test_read_text_resolver_no_trailing_newline(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("prompt.txt")
+    path.write_text("hello\nworld")
+    assert OmegaConf.create({"key": f"${{hya.read_text:{path},1}}"}).key == "world"
+
+
+def test_read_text_resolver_encoding(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("prompt.txt")
+    path.write_text("caf\u00e9", encoding="latin-1")
+    assert (
+        OmegaConf.create({"key": f"${{hya.read_text:{path},null,null,latin-1}}"}).key == "caf\u00e9"
+    )
+
+
+def test_read_text_resolver_invalidated(text_path: Path) -> None:
+    conf = OmegaConf.create({"key": f"${{hya.read_text:{text_path},0,1}}"})
+    assert conf.key == "cat\n"
+    text_path.write_text("cow\n")
+    assert conf.key == "cow\n"
+
+
+def test_read_text_resolver_negative(text_path: Path) -> None:
+    with pytest.raises(InterpolationResolutionError, match=r"ValueError"):
+        OmegaConf.create({"key": f"${{hya.read_text:{text_path},0,-1}}"}).key  # noqa: B018
+
+
+######################################
+#     Tests for include_resolver     #
+######################################
+
+
+def test_include_resolver(yaml_dir: Path) -> None:
+    conf = OmegaConf.create(
+        {"num_layers": 12, "model": f"${{hya.include:{yaml_dir.joinpath('model.yaml')}}}"}
+    )
+    assert isinstance(conf.model, DictConfig)
+    assert conf.model.name == "resnet"
+    assert OmegaConf.to_container(conf, resolve=True) == {
+        "num_layers": 12,
+        "model": {"name": "resnet", "layers": 12, "width": 12},
+    }
+
+
+def test_include_resolver_list(yaml_dir: Path) -> None:
+    conf = OmegaConf.create({"shapes": f"${{hya.include:{yaml_dir.joinpath('shapes.yaml')}}}"})
+    assert isinstance(conf.shapes, ListConfig)
+    assert conf.shapes == [1, 2, 3]
+
+
+def test_include_resolver_nested(yaml_dir: Path) -> None:
+    conf = OmegaConf.create(
+        {"num_layers": 6, "net": f"${{hya.include:{yaml_dir.joinpath('nested.yaml')}}}"}
+    )
+    assert conf.net.model.layers == 6
+
+
+def test_include_resolver_copy(yaml_dir: Path) -> None:
+    path = yaml_dir.joinpath("model.yaml")
+    conf1 = OmegaConf.create({"num_layers": 12, "model": f"${{hya.include:{path}}}"})
+    conf2 = OmegaConf.create({"num_layers": 12, "model": f"${{hya.include:{path}}}"})
+    model = conf1.model
+    model.name = "vit"
+    assert model.name == "vit"
+    assert conf2.model.name == "resnet"
+
+
+def test_include_resolver_cached(yaml_dir: Path) -> None:
+    path = yaml_dir.joinpath("shapes.yaml")
+    conf = OmegaConf.create({"shapes": f"${{hya.include:{path}}}"})
+    assert conf.shapes == [1, 2, 3]
+    # Same size and mtime, so the cached fragment is returned.
+    stat = path.stat()
+    path.write_text("- 4\n- 5\n- 6\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert conf.shapes == [1, 2, 3]
+
+
+def test_include_resolver_invalidated(yaml_dir: Path) -> None:
+    path = yaml_dir.joinpath("shapes.yaml")
+    conf = OmegaConf.create({"shapes": f"${{hya.include:{path}}}"})
+    assert conf.shapes == [1, 2, 3]
+    path.write_text("- 4\n- 5\n")
+    assert conf.shapes == [4, 5]
+
+
+def test_include_resolver_missing(tmp_path: Path) -> None:
+    with pytest.raises(InterpolationResolutionError, match=r"FileNotFoundError"):
+        OmegaConf.create(  # noqa: B018
+            {"key": f"${{hya.include:{tmp_path.joinpath('missing.yaml')}}}"}
+        ).key
+
+
+#######################################
+#     Tests for prefetch_includes     #
+#######################################
+
+
+def test_prefetch_includes(yaml_dir: Path) -> None:
+    conf = OmegaConf.create(
+        {
+            "model": f"${{hya.include:{yaml_dir.joinpath('model.yaml')}}}",
+            "data": {"shapes": [f"${{hya.include:{yaml_dir.joinpath('shapes.yaml')}}}"]},
+        }
+    )
+    assert prefetch_includes(conf) == [
+        yaml_dir.joinpath("model.yaml").as_posix(),
+        yaml_dir.joinpath("shapes.yaml").as_posix(),
+    ]
+
+
+def test_prefetch_includes_cached(yaml_dir: Path) -> None:
+    path = yaml_dir.joinpath("shapes.yaml")
+    conf = OmegaConf.create({"shapes": f"${{hya.include:{path}}}"})
+    prefetch_includes(conf)
+    # Same size and mtime, so the prefetched fragment is returned.
+    stat = path.stat()
+    path.write_text("- 4\n- 5\n- 6\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert conf.shapes == [1, 2, 3]
+
+
+def test_prefetch_includes_nested(yaml_dir: Path) -> None:
+    conf = {"net": f"${{hya.include:{yaml_dir.joinpath('nested.yaml')}}}"}
+    assert prefetch_includes(conf, max_workers=2) == [
+        yaml_dir.joinpath("model.yaml").as_posix(),
+        yaml_dir.joinpath("nested.yaml").as_posix(),
+    ]
+
+
+def test_prefetch_includes_invalid(yaml_dir: Path) -> None:
+    conf = OmegaConf.create(
+        {
+            "invalid": f"${{hya.include:{yaml_dir.joinpath('invalid.yaml')}}}",
+            "missing": f"${{hya.include:{yaml_dir.joinpath('missing.yaml')}}}",
+        }
+    )
+    assert prefetch_includes(conf) == [
+        yaml_dir.joinpath("invalid.yaml").as_posix(),
+        yaml_dir.joinpath("missing.yaml").as_posix(),
+    ]
+
+
+def test_prefetch_includes_interpolated_path(yaml_dir: Path) -> None:
+    conf = OmegaConf.create({"root": str(yaml_dir), "model": "${hya.include:${root}/model.yaml}"})
+    assert prefetch_includes(conf) == []
+
+
+def test_prefetch_includes_empty() -> None:
+    assert prefetch_includes(OmegaConf.create({"a": 1, "b": [1, 2]})) == []
@@ -7,9 +7,11 @@ import pytest
 from hya.imports import (
     check_braceexpand,
     check_numpy,
+    check_safetensors,
     check_torch,
     is_braceexpand_available,
     is_numpy_available,
+    is_safetensors_available,
     is_torch_available,
 )
 
@@ -57,6 +59,28 @@ def test_is_numpy_available() -> None:
     assert isinstance(is_numpy_available(), bool)
 
 
+#######################
+#     safetensors     #
+#######################
+
+
+def test_check_safetensors_with_package() -> None:
+    with patch("hya.imports.is_safetensors_available", lambda: True):
+        check_safetensors()
+
+
+def test_check_safetensors_without_package() -> None:
+    with (
+        patch("hya.imports.is_safetensors_available", lambda: False),
+        pytest.raises(RuntimeError, match=r"'safetensors' package is required but not installed."),
+    ):
+        check_safetensors()
+
+
+def test_is_safetensors_available() -> None:
+    assert isinstance(is_safetensors_available(), bool)
+
+
 #################
 #     torch     #
 #################
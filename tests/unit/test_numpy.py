@@ -1,14 +1,99 @@
 from __future__ import annotations
 
+import gc
+from typing import TYPE_CHECKING
+
+import pytest
 from omegaconf import OmegaConf
+from omegaconf.errors import InterpolationResolutionError
 
 from hya.imports import is_numpy_available
+from hya.numpy import (
+    array_to_base64,
+    frombytes_resolver,
+    intern_array,
+    get_dtype_table,
+    load_resolver,
+    memmap_resolver,
+    numpy_dtype_resolver,
+    shared_array_resolver,
+)
 from hya.testing import numpy_available
+from hya.utils.cache import InternTable
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 if is_numpy_available():
     import numpy as np
 
 
+@numpy_available
+def test_get_dtype_table() -> None:
+    table = get_dtype_table()
+    assert table["float32"] == np.float32
+    assert table["float"] == np.float64
+    assert table["fp16"] == np.float16
+    assert table["torch.int64"] == np.int64
+    assert "bf16" not in table
+
+
+@numpy_available
+def test_get_dtype_table_cached() -> None:
+    assert get_dtype_table() is get_dtype_table()
+
+
+@numpy_available
+def test_numpy_dtype_resolver() -> None:
+    assert OmegaConf.create({"key": "${hya.np.dtype:float32}"}).key == np.float32
+
+
+@numpy_available
+@pytest.mark.parametrize(
+    ("target", "dtype"),
+    [
+        ("float", "float64"),
+        ("fp16", "float16"),
+        ("half", "float16"),
+        ("double", "float64"),
+        ("np.int32", "int32"),
+        ("numpy.uint8", "uint8"),
+        ("torch.float32", "float32"),
+        ("torch.float", "float32"),
+        ("torch.int", "int32"),
+        ("torch.long", "int64"),
+        ("torch.half", "float16"),
+        ("torch.cfloat", "complex64"),
+        ("np.float", "float64"),
+        ("np.byte", "int8"),
+        ("f4", "float32"),
+        ("<i8", "int64"),
+        ("U10", "<U10"),
+    ],
+)
+def test_numpy_dtype_resolver_names(target: str, dtype: str) -> None:
+    assert numpy_dtype_resolver(target) == np.dtype(dtype)
+
+
+@numpy_available
+def test_numpy_dtype_resolver_dtype() -> None:
+    assert numpy_dtype_resolver(np.dtype("int16")) == np.int16
+    assert numpy_dtype_resolver(np.float32) == np.float32
+
+
+@numpy_available
+@pytest.mark.parametrize("target", ["torch.bfloat16", "torch.fp16", "torch.U10"])
+def test_numpy_dtype_resolver_incorrect_torch_name(target: str) -> None:
+    with pytest.raises(InterpolationResolutionError, match="Incorrect dtype"):
+        numpy_dtype_resolver(target)
+
+
+@numpy_available
+def test_numpy_dtype_resolver_incorrect() -> None:
+    with pytest.raises(InterpolationResolutionError, match=r"Incorrect dtype bool32"):
+        OmegaConf.create({"key": "${hya.np.dtype:bool32}"}).key  # noqa: B018
+
+
 @numpy_available
 def test_to_array_resolver_number() -> None:
     assert np.array_equal(OmegaConf.create({"key": "${hya.np.array:1.42}"}).key, np.array(1.42))
@@ -19,3 +104,640 @@ def test_to_array_resolver_list() -> None:
     assert np.array_equal(
         OmegaConf.create({"key": "${hya.np.array:[1, 2, 3]}"}).key, np.array([1, 2, 3])
     )
+
+
+@numpy_available
+def test_to_array_resolver_range() -> None:
+    assert np.array_equal(
+        OmegaConf.create({"key": "${hya.np.array:${hya.range:2,10,3}}"}).key, np.array([2, 5, 8])
+    )
+
+
+@numpy_available
+def test_to_array_resolver_linspace() -> None:
+    assert np.array_equal(
+        OmegaConf.create({"key": "${hya.np.array:${hya.linspace:0,1,11}}"}).key,
+        np.linspace(0, 1, 11),
+    )
+
+
+@numpy_available
+def test_to_array_resolver_logspace() -> None:
+    assert np.allclose(
+        OmegaConf.create({"key": "${hya.np.array:${hya.logspace:-3,0,4}}"}).key,
+        np.logspace(-3, 0, 4),
+    )
+
+
+@numpy_available
+def test_to_array_resolver_dtype() -> None:
+    array = OmegaConf.create({"key": "${hya.np.array:[1, 2, 3],fp16}"}).key
+    assert array.dtype == np.float16
+    assert np.array_equal(array, np.array([1, 2, 3], dtype=np.float16))
+
+
+@numpy_available
+def test_to_array_resolver_range_dtype() -> None:
+    array = OmegaConf.create({"key": "${hya.np.array:${hya.range:0,4},float32}"}).key
+    assert array.dtype == np.float32
+    assert np.array_equal(array, np.arange(4, dtype=np.float32))
+
+
+@numpy_available
+def test_to_array_resolver_shape() -> None:
+    assert np.array_equal(
+        OmegaConf.create({"key": "${hya.np.array:[1, 2, 3, 4, 5, 6],null,[2, 3]}"}).key,
+        np.array([[1, 2, 3], [4, 5, 6]]),
+    )
+
+
+@numpy_available
+def test_to_array_resolver_shape_int() -> None:
+    assert np.array_equal(
+        OmegaConf.create({"key": "${hya.np.array:[[1, 2], [3, 4]],null,4}"}).key,
+        np.array([1, 2, 3, 4]),
+    )
+
+
+@numpy_available
+def test_to_array_resolver_shape_incorrect() -> None:
+    conf = OmegaConf.create({"key": "${hya.np.array:[1, 2, 3],null,[2, 2]}"})
+    with pytest.raises(InterpolationResolutionError, match="cannot reshape"):
+        conf.key  # noqa: B018
+
+
+@numpy_available
+def test_to_array_resolver_order_f() -> None:
+    array = OmegaConf.create({"key": "${hya.np.array:[1, 2, 3, 4, 5, 6],null,[2, 3],F}"}).key
+    assert array.flags.f_contiguous
+    assert np.array_equal(array, np.array([[1, 3, 5], [2, 4, 6]]))
+
+
+@numpy_available
+def test_to_array_resolver_order_incorrect() -> None:
+    conf = OmegaConf.create({"key": "${hya.np.array:[1, 2, 3],null,null,K}"})
+    with pytest.raises(InterpolationResolutionError, match="Incorrect order 'K'"):
+        conf.key  # noqa: B018
+
+
+@numpy_available
+def test_to_array_resolver_list_config() -> None:
+    conf = OmegaConf.create(
+        {"a": 4.0, "data": [[1.0, "${a}"], [2.5, 3.0]], "key": "${hya.np.array:${data},fp32}"}
+    )
+    assert np.array_equal(conf.key, np.array([[1.0, 4.0], [2.5, 3.0]], dtype=np.float32))
+
+
+@numpy_available
+def test_frombytes_resolver() -> None:
+    array = OmegaConf.create({"key": "${hya.np.frombytes:AACAPwAAAEAAAEBAAACAQA,float32}"}).key
+    assert not array.flags.writeable
+    assert np.array_equal(array, np.array([1, 2, 3, 4], dtype=np.float32))
+
+
+@numpy_available
+def test_frombytes_resolver_shape() -> None:
+    conf = OmegaConf.create({"key": "${hya.np.frombytes:'AACAPwAAAEAAAEBAAACAQA==',fp32,[2, 2]}"})
+    assert np.array_equal(conf.key, np.array([[1, 2], [3, 4]], dtype=np.float32))
+
+
+@numpy_available
+def test_frombytes_resolver_reference() -> None:
+    array = np.random.default_rng(0).normal(size=(100, 10))
+    conf = OmegaConf.create(
+        {
+            "weights": {
+                "data": array_to_base64(array),
+                "value": "${hya.np.frombytes:${.data},float64,[100, 10]}",
+            }
+        }
+    )
+    assert np.array_equal(conf.weights.value, array)
+
+
+@numpy_available
+@pytest.mark.parametrize(
+    ("data", "dtype"),
+    [
+        ([1.5, -2.0, 3.25], "float16"),
+        (list(range(10)), "int64"),
+        ([True, False, True], "bool"),
+        ([1, 2, 3], ">i4"),
+        ([], "float32"),
+    ],
+)
+def test_frombytes_resolver_round_trip(data: list, dtype: str) -> None:
+    array = np.array(data, dtype=dtype)
+    assert np.array_equal(frombytes_resolver(array_to_base64(array), array.dtype.name), array)
+
+
+@numpy_available
+def test_frombytes_resolver_invalid_base64() -> None:
+    conf = OmegaConf.create({"key": "${hya.np.frombytes:'ab$c',float32}"})
+    with pytest.raises(InterpolationResolutionError, match="base64"):
+        conf.key  # noqa: B018
+
+
+@numpy_available
+def test_frombytes_resolver_size_mismatch() -> None:
+    conf = OmegaConf.create({"key": "${hya.np.frombytes:AACAPwAAAEAAAEBAAACAQA,float64,[3]}"})
+    with pytest.raises(InterpolationResolutionError, match="cannot reshape"):
+        conf.key  # noqa: B018
+
+
+@numpy_available
+def test_array_to_base64() -> None:
+    assert array_to_base64(np.array([1, 2, 3, 4], dtype=np.float32)) == "AACAPwAAAEAAAEBAAACAQA=="
+
+
+@numpy_available
+def test_array_to_base64_list() -> None:
+    assert array_to_base64([1, 2]) == array_to_base64(np.array([1, 2]))
+
+
+@numpy_available
+def test_array_to_base64_objects() -> None:
+    with pytest.raises(ValueError, match="Cannot encode an array of Python objects"):
+        array_to_base64(np.array([1, None]))
+
+
+@numpy_available
+def test_zeros_resolver() -> None:
+    array = OmegaConf.create({"key": "${hya.np.zeros:[2, 3]}"}).key
+    assert array.dtype == np.float64
+    assert np.array_equal(array, np.zeros((2, 3)))
+
+
+@numpy_available
+def test_zeros_resolver_dtype() -> None:
+    array = OmegaConf.create({"key": "${hya.np.zeros:4,int32}"}).key
+    assert array.dtype == np.int32
+    assert np.array_equal(array, np.zeros(4, dtype=np.int32))
+
+
+@numpy_available
+def test_ones_resolver() -> None:
+    assert np.array_equal(OmegaConf.create({"key": "${hya.np.ones:[2, 3]}"}).key, np.ones((2, 3)))
+
+
+@numpy_available
+def test_ones_resolver_dtype() -> None:
+    array = OmegaConf.create({"key": "${hya.np.ones:[3],bool}"}).key
+    assert array.dtype == np.bool_
+    assert array.all()
+
+
+@numpy_available
+def test_full_resolver() -> None:
+    assert np.array_equal(
+        OmegaConf.create({"key": "${hya.np.full:[2, 2],7}"}).key, np.full((2, 2), 7)
+    )
+
+
+@numpy_available
+def test_full_resolver_dtype() -> None:
+    array = OmegaConf.create({"key": "${hya.np.full:3,-1,int8}"}).key
+    assert array.dtype == np.int8
+    assert np.array_equal(array, np.full(3, -1, dtype=np.int8))
+
+
+@numpy_available
+def test_arange_resolver_stop() -> None:
+    assert np.array_equal(OmegaConf.create({"key": "${hya.np.arange:5}"}).key, np.arange(5))
+
+
+@numpy_available
+def test_arange_resolver_start_stop_step() -> None:
+    assert np.array_equal(
+        OmegaConf.create({"key": "${hya.np.arange:1,2,0.25,float32}"}).key,
+        np.arange(1, 2, 0.25, dtype=np.float32),
+    )
+
+
+@numpy_available
+def test_linspace_resolver() -> None:
+    array = OmegaConf.create({"key": "${hya.np.linspace:0,1,11}"}).key
+    assert isinstance(array, np.ndarray)
+    assert np.array_equal(array, np.linspace(0, 1, 11))
+
+
+@numpy_available
+def test_linspace_resolver_endpoint_dtype() -> None:
+    assert np.array_equal(
+        OmegaConf.create({"key": "${hya.np.linspace:0,1,4,false,fp32}"}).key,
+        np.linspace(0, 1, 4, endpoint=False, dtype=np.float32),
+    )
+
+
+@numpy_available
+def test_eye_resolver() -> None:
+    assert np.array_equal(OmegaConf.create({"key": "${hya.np.eye:3}"}).key, np.eye(3))
+
+
+@numpy_available
+def test_eye_resolver_rectangular() -> None:
+    assert np.array_equal(
+        OmegaConf.create({"key": "${hya.np.eye:2,4,1,int64}"}).key,
+        np.eye(2, 4, 1, dtype=np.int64),
+    )
+
+
+@numpy_available
+def test_zeros_resolver_incorrect_dtype() -> None:
+    conf = OmegaConf.create({"key": "${hya.np.zeros:3,float_32}"})
+    with pytest.raises(InterpolationResolutionError, match="Incorrect dtype"):
+        conf.key  # noqa: B018
+
+
+@numpy_available
+def test_interned_array_resolver() -> None:
+    conf = OmegaConf.create(
+        {
+            "a": "${hya.np.interned_array:[1.0, 2.0, 3.0]}",
+            "b": "${hya.np.interned_array:[1.0, 2.0, 3.0]}",
+            "c": "${hya.np.interned_array:[1.0, 2.0, 4.0]}",
+        }
+    )
+    assert np.array_equal(conf.a, np.array([1.0, 2.0, 3.0]))
+    assert not conf.a.flags.writeable
+    assert conf.a is conf.b
+    assert conf.a is not conf.c
+
+
+@numpy_available
+def test_interned_array_resolver_between_configs() -> None:
+    conf1 = OmegaConf.create({"key": "${hya.np.interned_array:[4, 5, 6],int32}"})
+    conf2 = OmegaConf.create({"table": "${hya.np.interned_array:[4, 5, 6],int32}"})
+    assert conf1.key is conf2.table
+
+
+@numpy_available
+def test_interned_array_resolver_dtype_shape() -> None:
+    conf = OmegaConf.create(
+        {
+            "a": "${hya.np.interned_array:[1, 2, 3, 4],int64}",
+            "b": "${hya.np.interned_array:[1, 2, 3, 4],int64,[2, 2]}",
+            "c": "${hya.np.interned_array:[1, 2, 3, 4],int32,[2, 2]}",
+            "d": "${hya.np.interned_array:[1, 2, 3, 4],int64,[2, 2],F}",
+        }
+    )
+    arrays = [conf.a, conf.b, conf.c, conf.d]
+    assert len({id(array) for array in arrays}) == 4
+    assert np.array_equal(arrays[3], np.array([[1, 3], [2, 4]]))
+
+
+@numpy_available
+def test_intern_array() -> None:
+    table = InternTable()
+    array = intern_array(np.arange(1000), table)
+    assert not array.flags.writeable
+    assert intern_array(np.arange(1000), table) is array
+    assert table.stats.hits == 1
+    assert table.stats.nbytes_saved == array.nbytes
+
+
+@numpy_available
+def test_intern_array_input_not_modified() -> None:
+    table = InternTable()
+    data1, data2 = np.arange(10), np.arange(10)
+    array = intern_array(data1, table)
+    assert array is not data1
+    assert not array.flags.writeable
+    assert intern_array(data2, table) is array
+    assert data1.flags.writeable
+    assert data2.flags.writeable
+    data1[0] = 100
+    assert array[0] == 0
+
+
+@numpy_available
+def test_intern_array_read_only_input() -> None:
+    table = InternTable()
+    data = np.arange(10)
+    data.flags.writeable = False
+    assert intern_array(data, table) is data
+
+
+@numpy_available
+def test_intern_array_read_only_view() -> None:
+    table = InternTable()
+    base = np.arange(10)
+    view = base[:5]
+    view.flags.writeable = False
+    array = intern_array(view, table)
+    assert array is not view
+    base[0] = 100
+    assert array[0] == 0
+
+
+@numpy_available
+def test_intern_array_fortran() -> None:
+    table = InternTable()
+    array = intern_array(np.asfortranarray(np.arange(6).reshape(2, 3)), table)
+    assert array.flags.f_contiguous
+    assert intern_array(np.asfortranarray(np.arange(6).reshape(2, 3)), table) is array
+    assert intern_array(np.arange(6).reshape(2, 3), table) is not array
+
+
+@numpy_available
+def test_intern_array_not_contiguous() -> None:
+    table = InternTable()
+    array = intern_array(np.arange(12).reshape(3, 4)[:, ::2], table)
+    assert intern_array(np.arange(12).reshape(3, 4)[:, ::2], table) is array
+    assert np.array_equal(array, np.array([[0, 2], [4, 6], [8, 10]]))
+
+
+@numpy_available
+def test_intern_array_freed() -> None:
+    table = InternTable()
+    intern_array(np.arange(10), table)
+    gc.collect()
+    assert len(table) == 0
+
+
+@numpy_available
+def test_intern_array_objects() -> None:
+    with pytest.raises(ValueError, match="Cannot intern an array of Python objects"):
+        intern_array(np.array([1, None]))
+
+
+@numpy_available
+def test_shared_array_resolver() -> None:
+    array = OmegaConf.create({"key": "${hya.np.shared_array:[[1, 2], [3, 4]]}"}).key
+    assert np.array_equal(array, np.array([[1, 2], [3, 4]]))
+    assert not array.flags.writeable
+
+
+@numpy_available
+def test_shared_array_resolver_same_memory() -> None:
+    array1 = shared_array_resolver([1.0, 2.0, 3.0])
+    array2 = shared_array_resolver([1.0, 2.0, 3.0])
+    assert np.shares_memory(array1, array2)
+
+
+@numpy_available
+def test_shared_array_resolver_different_data() -> None:
+    assert np.array_equal(shared_array_resolver([1, 2]), np.array([1, 2]))
+    assert np.array_equal(shared_array_resolver([1, 3]), np.array([1, 3]))
+
+
+@numpy_available
+def test_shared_array_resolver_dtype() -> None:
+    assert shared_array_resolver([1, 2]).dtype == np.array([1, 2]).dtype
+    assert shared_array_resolver([1.0, 2.0]).dtype == np.float64
+    assert shared_array_resolver(["a", "bc"]).dtype == np.dtype("<U2")
+
+
+@numpy_available
+def test_shared_array_resolver_scalar() -> None:
+    assert np.array_equal(shared_array_resolver(1.5), np.array(1.5))
+
+
+@numpy_available
+def test_shared_array_resolver_empty() -> None:
+    assert shared_array_resolver([]).shape == (0,)
+
+
+@numpy_available
+def test_shared_array_resolver_range() -> None:
+    assert np.array_equal(
+        OmegaConf.create({"key": "${hya.np.shared_array:${hya.range:2,10,3}}"}).key,
+        np.array([2, 5, 8]),
+    )
+
+
+@numpy_available
+def test_shared_array_resolver_config() -> None:
+    conf = OmegaConf.create({"data": [1, 2], "key": "${hya.np.shared_array:${data}}"})
+    assert np.shares_memory(conf.key, shared_array_resolver([1, 2]))
+
+
+@numpy_available
+def test_shared_array_resolver_not_hashable() -> None:
+    array = shared_array_resolver(np.array([object(), object()]))
+    assert array.shape == (2,)
+    assert not array.flags.writeable
+
+
+@numpy_available
+def test_shared_array_resolver_objects() -> None:
+    with pytest.raises(InterpolationResolutionError, match="Cannot share an array of Python"):
+        OmegaConf.create({"key": "${hya.np.shared_array:[1, null]}"}).key  # noqa: B018
+
+
+@numpy_available
+def test_load_resolver_npy(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npy")
+    np.save(path, np.arange(6).reshape(2, 3))
+    array = OmegaConf.create({"key": f"${{hya.np.load:{path}}}"}).key
+    assert isinstance(array, np.memmap)
+    assert not array.flags.writeable
+    assert np.array_equal(array, np.arange(6).reshape(2, 3))
+
+
+@numpy_available
+def test_load_resolver_npy_no_mmap(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npy")
+    np.save(path, np.arange(6))
+    array = OmegaConf.create({"key": f"${{hya.np.load:{path},null}}"}).key
+    assert not isinstance(array, np.memmap)
+    assert np.array_equal(array, np.arange(6))
+
+
+@numpy_available
+def test_load_resolver_npy_copy_on_write(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npy")
+    np.save(path, np.arange(6))
+    array = load_resolver(str(path), "c")
+    array[0] = 42
+    assert np.array_equal(np.load(path), np.arange(6))
+
+
+@numpy_available
+def test_load_resolver_shared_between_configs(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npy")
+    np.save(path, np.arange(6))
+    conf1 = OmegaConf.create({"key": f"${{hya.np.load:{path}}}"})
+    conf2 = OmegaConf.create({"table": f"${{hya.np.load:{path}}}"})
+    assert conf1.key is conf2.table
+
+
+@numpy_available
+@pytest.mark.parametrize("mmap_mode", [None, "r+", "c"])
+def test_load_resolver_writable_not_shared(tmp_path: Path, mmap_mode: str | None) -> None:
+    path = tmp_path.joinpath("data.npy")
+    np.save(path, np.arange(6))
+    array1 = load_resolver(str(path), mmap_mode)
+    array2 = load_resolver(str(path), mmap_mode)
+    assert array1 is not array2
+    if mmap_mode != "r+":
+        array1[0] = 42
+        assert array2[0] == 0
+
+
+@numpy_available
+def test_load_resolver_npz_member_read_only(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npz")
+    np.savez(path, a=np.arange(3))
+    array = load_resolver(str(path), "r", "a")
+    assert not array.flags.writeable
+
+
+@numpy_available
+def test_load_resolver_npz_member_writable(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npz")
+    np.savez(path, a=np.arange(3))
+    array = load_resolver(str(path), None, "a")
+    assert array.flags.writeable
+    array[0] = 42
+    assert load_resolver(str(path), None, "a")[0] == 0
+
+
+@numpy_available
+def test_load_resolver_file_changed(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npy")
+    np.save(path, np.arange(6))
+    assert np.array_equal(load_resolver(str(path)), np.arange(6))
+    np.save(path, np.arange(10))
+    assert np.array_equal(load_resolver(str(path)), np.arange(10))
+
+
+@numpy_available
+def test_load_resolver_npz(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npz")
+    np.savez(path, a=np.arange(3), b=np.ones((2, 2)))
+    data = OmegaConf.create({"key": f"${{hya.np.load:{path}}}"}).key
+    assert isinstance(data, np.lib.npyio.NpzFile)
+    assert sorted(data.files) == ["a", "b"]
+    assert np.array_equal(data["a"], np.arange(3))
+
+
+@numpy_available
+def test_load_resolver_npz_member(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npz")
+    np.savez_compressed(path, a=np.arange(3), b=np.ones((2, 2)))
+    conf = OmegaConf.create({"key": f"${{hya.np.load:{path},r,b}}"})
+    assert np.array_equal(conf.key, np.ones((2, 2)))
+    assert load_resolver(str(path), "r", "b") is load_resolver(str(path), "r", "b")
+
+
+@numpy_available
+def test_load_resolver_npz_member_missing(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npz")
+    np.savez(path, a=np.arange(3))
+    with pytest.raises(KeyError, match="c is not a file in the archive"):
+        load_resolver(str(path), "r", "c")
+
+
+@numpy_available
+def test_load_resolver_npy_member(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npy")
+    np.save(path, np.arange(3))
+    with pytest.raises(TypeError, match=r"member can only be used with a \.npz file"):
+        load_resolver(str(path), "r", "a")
+
+
+@numpy_available
+def test_load_resolver_incorrect_mmap_mode(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.npy")
+    np.save(path, np.arange(3))
+    with pytest.raises(ValueError, match="Incorrect mmap_mode 'w\\+'"):
+        load_resolver(str(path), "w+")
+
+
+@numpy_available
+def test_load_resolver_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        load_resolver(str(tmp_path.joinpath("missing.npy")))
+
+
+@numpy_available
+def test_memmap_resolver(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    np.arange(6, dtype=np.float32).tofile(path)
+    array = OmegaConf.create({"key": f"${{hya.np.memmap:{path},float32,[2, 3]}}"}).key
+    assert isinstance(array, np.memmap)
+    assert not array.flags.writeable
+    assert np.array_equal(array, np.arange(6, dtype=np.float32).reshape(2, 3))
+
+
+@numpy_available
+def test_memmap_resolver_shape_int(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    np.arange(6, dtype=np.int16).tofile(path)
+    assert np.array_equal(memmap_resolver(str(path), "int16", 6), np.arange(6, dtype=np.int16))
+
+
+@numpy_available
+def test_memmap_resolver_shape_inferred(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    np.arange(12, dtype=np.float64).tofile(path)
+    array = memmap_resolver(str(path), "fp64", [-1, 4])
+    assert array.shape == (3, 4)
+    assert np.array_equal(array, np.arange(12, dtype=np.float64).reshape(3, 4))
+
+
+@numpy_available
+def test_memmap_resolver_offset(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    path.write_bytes(b"header__" + np.arange(4, dtype=np.int32).tobytes())
+    conf = OmegaConf.create({"key": f"${{hya.np.memmap:{path},int32,[4],8}}"})
+    assert np.array_equal(conf.key, np.arange(4, dtype=np.int32))
+
+
+@numpy_available
+def test_memmap_resolver_empty(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    path.write_bytes(b"")
+    array = memmap_resolver(str(path), "float32", [0, 3])
+    assert array.shape == (0, 3)
+    assert not array.flags.writeable
+
+
+@numpy_available
+def test_memmap_resolver_shared_between_configs(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    np.arange(6, dtype=np.float32).tofile(path)
+    conf1 = OmegaConf.create({"key": f"${{hya.np.memmap:{path},float32,[2, 3]}}"})
+    conf2 = OmegaConf.create({"table": f"${{hya.np.memmap:{path},fp32,[2, 3]}}"})
+    assert conf1.key is conf2.table
+
+
+@numpy_available
+def test_memmap_resolver_size_mismatch(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    np.arange(6, dtype=np.float32).tofile(path)
+    with pytest.raises(ValueError, match=r"The data size \(24 bytes\) does not match"):
+        memmap_resolver(str(path), "float64", [2, 3])
+
+
+@numpy_available
+def test_memmap_resolver_shape_inferred_mismatch(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    np.arange(6, dtype=np.float32).tofile(path)
+    with pytest.raises(ValueError, match=r"The data size \(24 bytes\) does not match"):
+        memmap_resolver(str(path), "float32", [-1, 4])
+
+
+@numpy_available
+def test_memmap_resolver_incorrect_shape(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    np.arange(6, dtype=np.float32).tofile(path)
+    with pytest.raises(ValueError, match=r"Incorrect shape \(-1, -1\)"):
+        memmap_resolver(str(path), "float32", [-1, -1])
+
+
+@numpy_available
+def test_memmap_resolver_negative_offset(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    np.arange(6, dtype=np.float32).tofile(path)
+    with pytest.raises(ValueError, match="offset must be non-negative but received -4"):
+        memmap_resolver(str(path), "float32", 6, -4)
+
+
+@numpy_available
+def test_memmap_resolver_incorrect_dtype(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    np.arange(6, dtype=np.float32).tofile(path)
+    with pytest.raises(InterpolationResolutionError, match="Incorrect dtype"):
+        memmap_resolver(str(path), "float_32", 6)
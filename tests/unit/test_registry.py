@@ -9,9 +9,12 @@ from omegaconf import OmegaConf
 from hya.registry import (
     ResolverRegistry,
 )
+from hya.utils.cache import get_result_cache
+from hya.utils.disk_cache import DISK_CACHE_ENV
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 
 
 def add_two(value: int) -> int:
@@ -75,6 +78,75 @@ def test_resolver_registry_register_duplicate_exist_ok_true() -> None:
     registry.register("key", exist_ok=True)(Mock())
 
 
+def test_resolver_registry_register_persistent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(DISK_CACHE_ENV, tmp_path.joinpath("cache.sqlite").as_posix())
+    registry = ResolverRegistry()
+    resolver = Mock(side_effect=add_two)
+    assert registry.register("add2", persistent=True)(resolver) is resolver
+    assert registry.state["add2"] is not resolver
+    assert registry.state["add2"](1) == 3
+    assert registry.state["add2"](1) == 3
+    assert resolver.call_count == 1
+
+
+def test_resolver_registry_register_persistent_shared(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(DISK_CACHE_ENV, tmp_path.joinpath("cache.sqlite").as_posix())
+    resolver1, resolver2 = Mock(side_effect=add_two), Mock(side_effect=add_two)
+    registry1, registry2 = ResolverRegistry(), ResolverRegistry()
+    registry1.register("add2", persistent=True)(resolver1)
+    registry2.register("add2", persistent=True)(resolver2)
+    assert registry1.state["add2"](5) == 7
+    assert registry2.state["add2"](5) == 7
+    assert resolver1.call_count == 1
+    assert resolver2.call_count == 0
+
+
+def test_resolver_registry_register_persistent_parent() -> None:
+    def resolver(value: int, _parent_: Any) -> int:  # noqa: ARG001
+        return value
+
+    with pytest.raises(ValueError, match="cannot be cached"):
+        ResolverRegistry().register("key", persistent=True)(resolver)
+
+
+def test_resolver_registry_register_memoize() -> None:
+    get_result_cache().clear()
+    registry = ResolverRegistry()
+    resolver = Mock(side_effect=add_two)
+    assert registry.register("test_memoize_add2", memoize=True)(resolver) is resolver
+    registry.register_resolvers()
+    confs = [OmegaConf.create({"key": "${test_memoize_add2:5}"}) for _ in range(3)]
+    assert [conf.key for conf in confs] == [7, 7, 7]
+    assert resolver.call_count == 1
+    assert get_result_cache().stats.hits == 2
+
+
+def test_resolver_registry_register_memoize_persistent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(DISK_CACHE_ENV, tmp_path.joinpath("cache.sqlite").as_posix())
+    get_result_cache().clear()
+    registry = ResolverRegistry()
+    resolver = Mock(side_effect=add_two)
+    registry.register("add2", persistent=True, memoize=True)(resolver)
+    assert registry.state["add2"](1) == 3
+    get_result_cache().clear()
+    assert registry.state["add2"](1) == 3
+    assert resolver.call_count == 1
+
+
+def test_resolver_registry_register_memoize_parent() -> None:
+    def resolver(value: int, _parent_: Any) -> int:  # noqa: ARG001
+        return value
+
+    with pytest.raises(ValueError, match="cannot be cached"):
+        ResolverRegistry().register("key", memoize=True)(resolver)
+
+
 def test_resolver_registry_register_resolvers() -> None:
     registry = ResolverRegistry()
     registry.register("hya.custom_resolver")(Mock())
@@ -2,11 +2,45 @@ from __future__ import annotations
 
 import math
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from omegaconf import OmegaConf
 from omegaconf.errors import InterpolationResolutionError
 
+from hya.imports import is_numpy_available, is_torch_available
+from hya.resolvers import (
+    add_resolver,
+    argmax_resolver,
+    asinh_resolver,
+    exp_resolver,
+    iter_join_resolver,
+    log10_resolver,
+    log_resolver,
+    max_resolver,
+    mean_resolver,
+    min_resolver,
+    mul_resolver,
+    neg_resolver,
+    pow_resolver,
+    quantile_resolver,
+    sinh_resolver,
+    sqrt_resolver,
+    std_resolver,
+    sum_resolver,
+)
+from hya.sequences import LinspaceSequence
+from hya.testing import braceexpand_available, numpy_available, torch_available
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+if is_numpy_available():
+    import numpy as np
+
+if is_torch_available():
+    import torch
+
 
 def test_add_resolver_int2() -> None:
     assert OmegaConf.create({"key": "${hya.add:1,4}"}).key == 5
@@ -32,6 +66,135 @@ def test_add_resolver_str3() -> None:
     assert OmegaConf.create({"key": "${hya.add:abc,d,ef}"}).key == "abcdef"
 
 
+def test_add_resolver_float() -> None:
+    assert OmegaConf.create({"key": "${hya.add:0.1,0.2,0.3}"}).key == 0.6
+
+
+def test_add_resolver_int_float() -> None:
+    assert OmegaConf.create({"key": "${hya.add:1,2.5}"}).key == 3.5
+
+
+def test_add_resolver_inf() -> None:
+    assert OmegaConf.create({"key": "${hya.add:inf,1.0}"}).key == math.inf
+
+
+def test_add_resolver_inf_opposite_signs() -> None:
+    assert math.isnan(OmegaConf.create({"key": "${hya.add:inf,-inf}"}).key)
+
+
+def test_add_resolver_nan() -> None:
+    assert math.isnan(OmegaConf.create({"key": "${hya.add:nan,1.0}"}).key)
+
+
+def test_add_resolver_overflow() -> None:
+    assert add_resolver(1e308, 1e308, -1e308) == math.inf
+
+
+def test_add_resolver_int_type() -> None:
+    assert isinstance(OmegaConf.create({"key": "${hya.add:1,2,3}"}).key, int)
+
+
+def test_add_resolver_list_config_not_modified() -> None:
+    conf = OmegaConf.create({"a": [1, 2], "b": [3], "key": "${hya.add:${a},${b}}"})
+    assert conf.key == [1, 2, 3]
+    assert conf.a == [1, 2]
+
+
+def test_add_resolver_list_not_modified() -> None:
+    values = [1, 2]
+    assert add_resolver(values, [3]) == [1, 2, 3]
+    assert values == [1, 2]
+
+
+def test_add_resolver_list_single() -> None:
+    values = [1, 2]
+    output = add_resolver(values)
+    assert output == [1, 2]
+    assert output is not values
+
+
+def test_add_resolver_tuple() -> None:
+    assert add_resolver((1, 2), (3,), (4, 5)) == (1, 2, 3, 4, 5)
+
+
+def test_add_resolver_many_ints() -> None:
+    assert add_resolver(*range(10000)) == 49995000
+
+
+def test_add_resolver_many_lists() -> None:
+    assert add_resolver(*([i] for i in range(10000))) == list(range(10000))
+
+
+def test_add_resolver_many_strs() -> None:
+    assert add_resolver(*["ab"] * 10000) == "ab" * 10000
+
+
+@numpy_available
+def test_add_resolver_array() -> None:
+    x = np.array([1, 2, 3])
+    output = add_resolver(x, np.array([4, 5, 6]), np.array([7, 8, 9]))
+    assert np.array_equal(output, np.array([12, 15, 18]))
+    assert np.array_equal(x, np.array([1, 2, 3]))
+
+
+@numpy_available
+def test_add_resolver_array_broadcast() -> None:
+    assert np.array_equal(
+        add_resolver(np.array([[1], [2]]), np.array([1, 2, 3]), 1.5),
+        np.array([[3.5, 4.5, 5.5], [4.5, 5.5, 6.5]]),
+    )
+
+
+@numpy_available
+def test_add_resolver_array_dtype() -> None:
+    assert add_resolver(np.array([1, 2]), np.array([0.5, 1.5])).dtype == np.float64
+
+
+@numpy_available
+def test_add_resolver_array_single() -> None:
+    x = np.array([1, 2, 3])
+    output = add_resolver(x)
+    assert np.array_equal(output, x)
+    assert output is not x
+
+
+@pytest.fixture
+def no_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("hya.resolvers.is_numpy_available", lambda: False)
+
+
+def test_argmax_resolver() -> None:
+    assert OmegaConf.create({"key": "${hya.argmax:[3,1,4,1,5,9,2]}"}).key == 5
+
+
+def test_argmax_resolver_first_occurrence() -> None:
+    assert argmax_resolver([1, 3, 2, 3]) == 1
+
+
+def test_argmax_resolver_list_config() -> None:
+    conf = OmegaConf.create({"values": [0.1, 0.5, 0.2], "key": "${hya.argmax:${values}}"})
+    assert conf.key == 1
+
+
+@pytest.mark.usefixtures("no_numpy")
+def test_argmax_resolver_without_numpy() -> None:
+    assert argmax_resolver([1, 3, 2, 3]) == 1
+
+
+@numpy_available
+def test_argmax_resolver_array() -> None:
+    assert argmax_resolver(np.array([[1, 2], [5, 3]])) == 2
+
+
+def test_argmax_resolver_empty() -> None:
+    with pytest.raises(ValueError, match="Cannot compute the argmax of an empty sequence"):
+        argmax_resolver([])
+
+
+def test_asinh_resolver_list() -> None:
+    assert OmegaConf.create({"key": "${hya.asinh:[0,1]}"}).key == [0.0, 0.881373587019543]
+
+
 def test_asinh_resolver_int() -> None:
     assert OmegaConf.create({"key": "${hya.asinh:1}"}).key == 0.881373587019543
 
@@ -57,6 +220,31 @@ def test_exp_resolver_float() -> None:
     assert math.isclose(OmegaConf.create({"key": "${hya.exp:1.0}"}).key, math.e)
 
 
+def test_exp_resolver_list() -> None:
+    assert OmegaConf.create({"key": "${hya.exp:[0,1]}"}).key == [1.0, math.e]
+
+
+def test_exp_resolver_list_config() -> None:
+    conf = OmegaConf.create({"values": [0, 1], "key": "${hya.exp:${values}}"})
+    assert conf.key == [1.0, math.e]
+
+
+def test_exp_resolver_nested_list() -> None:
+    assert exp_resolver([[0], [1]]) == [[1.0], [math.e]]
+
+
+@pytest.mark.usefixtures("no_numpy")
+def test_exp_resolver_list_without_numpy() -> None:
+    assert exp_resolver([[0], [1]]) == [[1.0], [math.e]]
+
+
+@numpy_available
+def test_exp_resolver_array() -> None:
+    output = exp_resolver(np.array([0.0, 1.0]))
+    assert isinstance(output, np.ndarray)
+    assert np.allclose(output, np.array([1.0, math.e]))
+
+
 def test_floordiv_resolver() -> None:
     assert OmegaConf.create({"key": "${hya.floordiv:11,4}"}).key == 2
 
@@ -86,6 +274,53 @@ def test_iter_join_resolver_empty_separator() -> None:
     assert OmegaConf.create({"key": "${hya.iter_join:[a,b,c],''}"}).key == "abc"
 
 
+def test_iter_join_resolver_list_config() -> None:
+    conf = OmegaConf.create({"a": 4, "items": [1, 2, "${a}"], "key": "${hya.iter_join:${items},-}"})
+    assert conf.key == "1-2-4"
+
+
+def test_iter_join_resolver_format_spec() -> None:
+    assert OmegaConf.create({"key": "${hya.iter_join:[1,2,3],-,03d}"}).key == "001-002-003"
+
+
+def test_iter_join_resolver_format_spec_float() -> None:
+    assert OmegaConf.create({"key": "${hya.iter_join:[1.5,2.25],_,.1f}"}).key == "1.5_2.2"
+
+
+def test_iter_join_resolver_format_spec_numeric() -> None:
+    assert OmegaConf.create({"key": "${hya.iter_join:[1,2],-,5}"}).key == "    1-    2"
+
+
+def test_iter_join_resolver_format_spec_int() -> None:
+    assert iter_join_resolver(["a", "b"], ",", 3) == "a  ,b  "
+
+
+def test_iter_join_resolver_tuple() -> None:
+    assert iter_join_resolver(("a", "b", "c"), "/") == "a/b/c"
+
+
+def test_iter_join_resolver_generator() -> None:
+    assert iter_join_resolver((i for i in range(5)), ",") == "0,1,2,3,4"
+
+
+def test_iter_join_resolver_generator_empty() -> None:
+    assert iter_join_resolver(iter([]), ",") == ""
+
+
+def test_iter_join_resolver_generator_large() -> None:
+    assert iter_join_resolver(iter(range(200000)), ",", "x") == ",".join(
+        f"{i:x}" for i in range(200000)
+    )
+
+
+@braceexpand_available
+def test_iter_join_resolver_braceexpand() -> None:
+    assert (
+        OmegaConf.create({"key": r"${hya.iter_join:${hya.braceexpand:shard-\{1..3\}},\,}"}).key
+        == "shard-1,shard-2,shard-3"
+    )
+
+
 def test_log_resolver_int() -> None:
     assert math.isclose(OmegaConf.create({"key": "${hya.log:2}"}).key, 0.6931471805599453)
 
@@ -98,6 +333,23 @@ def test_log_resolver_base_10() -> None:
     assert math.isclose(OmegaConf.create({"key": "${hya.log:2.0,10}"}).key, 0.3010299956639812)
 
 
+def test_log_resolver_list() -> None:
+    assert log_resolver([1, math.e]) == pytest.approx([0.0, 1.0])
+
+
+def test_log_resolver_list_base() -> None:
+    assert OmegaConf.create({"key": "${hya.log:[1,100],10}"}).key == pytest.approx([0.0, 2.0])
+
+
+@pytest.mark.usefixtures("no_numpy")
+def test_log_resolver_list_base_without_numpy() -> None:
+    assert log_resolver([1, 8], 2) == [0.0, 3.0]
+
+
+def test_log10_resolver_list() -> None:
+    assert OmegaConf.create({"key": "${hya.log10:[1,10,100]}"}).key == [0.0, 1.0, 2.0]
+
+
 def test_log10_resolver_int() -> None:
     assert math.isclose(OmegaConf.create({"key": "${hya.log10:2}"}).key, 0.3010299956639812)
 
@@ -118,6 +370,62 @@ def test_max_resolver_float2() -> None:
     assert OmegaConf.create({"key": "${hya.max:1.2,3.4}"}).key == 3.4
 
 
+def test_max_resolver_list() -> None:
+    assert OmegaConf.create({"key": "${hya.max:[1,3,2]}"}).key == 3
+
+
+def test_max_resolver_list_config() -> None:
+    conf = OmegaConf.create({"values": [1, 3, 2], "key": "${hya.max:${values}}"})
+    assert conf.key == 3
+
+
+def test_max_resolver_range() -> None:
+    assert max_resolver(range(10)) == 9
+
+
+@numpy_available
+def test_max_resolver_array() -> None:
+    output = max_resolver(np.array([[1, 5], [3, 2]]))
+    assert output == 5
+    assert isinstance(output, int)
+
+
+@numpy_available
+def test_max_resolver_linspace() -> None:
+    assert OmegaConf.create({"key": "${hya.max:${hya.linspace:0,1,11}}"}).key == 1.0
+
+
+def test_max_resolver_empty() -> None:
+    with pytest.raises(ValueError, match="Cannot compute the max of an empty sequence"):
+        max_resolver([])
+
+
+def test_mean_resolver() -> None:
+    assert OmegaConf.create({"key": "${hya.mean:[1,2,3,4]}"}).key == 2.5
+
+
+def test_mean_resolver_list_config() -> None:
+    conf = OmegaConf.create({"values": [1, 2, 3, 4], "key": "${hya.mean:${values}}"})
+    assert conf.key == 2.5
+
+
+@numpy_available
+def test_mean_resolver_array() -> None:
+    output = mean_resolver(np.array([1, 2, 3, 4], dtype=np.float32))
+    assert output == 2.5
+    assert isinstance(output, float)
+
+
+@numpy_available
+def test_mean_resolver_linspace() -> None:
+    assert OmegaConf.create({"key": "${hya.mean:${hya.linspace:0,1,11}}"}).key == pytest.approx(0.5)
+
+
+def test_mean_resolver_empty() -> None:
+    with pytest.raises(InterpolationResolutionError, match="Cannot compute the mean"):
+        OmegaConf.create({"key": "${hya.mean:[]}"}).key  # noqa: B018
+
+
 def test_min_resolver_int2() -> None:
     assert OmegaConf.create({"key": "${hya.min:3,4}"}).key == 3
 
@@ -130,6 +438,25 @@ def test_min_resolver_float2() -> None:
     assert OmegaConf.create({"key": "${hya.min:1.2,3.4}"}).key == 1.2
 
 
+def test_min_resolver_list() -> None:
+    assert OmegaConf.create({"key": "${hya.min:[2,1,3]}"}).key == 1
+
+
+def test_min_resolver_list_config() -> None:
+    conf = OmegaConf.create({"values": [2, 1, 3], "key": "${hya.min:${values}}"})
+    assert conf.key == 1
+
+
+@numpy_available
+def test_min_resolver_array() -> None:
+    assert min_resolver(np.array([2.0, -1.5, 3.0])) == -1.5
+
+
+def test_min_resolver_empty() -> None:
+    with pytest.raises(ValueError, match="Cannot compute the min of an empty sequence"):
+        min_resolver(())
+
+
 def test_mul_resolver_int2() -> None:
     assert OmegaConf.create({"key": "${hya.mul:3,4}"}).key == 12
 
@@ -150,10 +477,160 @@ def test_mul_resolver_list() -> None:
     assert OmegaConf.create({"key": "${hya.mul:[1,2,3],3}"}).key == [1, 2, 3, 1, 2, 3, 1, 2, 3]
 
 
+def test_mul_resolver_list_not_modified() -> None:
+    values = [1, 2]
+    assert mul_resolver(values, 2, 2) == [1, 2, 1, 2, 1, 2, 1, 2]
+    assert values == [1, 2]
+
+
+def test_mul_resolver_int_type() -> None:
+    assert isinstance(OmegaConf.create({"key": "${hya.mul:1,2,3}"}).key, int)
+
+
+def test_mul_resolver_many_ints() -> None:
+    assert mul_resolver(*[2] * 10000) == 2**10000
+
+
+@numpy_available
+def test_mul_resolver_array() -> None:
+    x = np.array([1, 2, 3])
+    output = mul_resolver(x, np.array([4, 5, 6]), 2)
+    assert np.array_equal(output, np.array([8, 20, 36]))
+    assert np.array_equal(x, np.array([1, 2, 3]))
+
+
+@numpy_available
+def test_mul_resolver_array_dtype() -> None:
+    assert mul_resolver(np.array([1, 2]), 0.5).dtype == np.float64
+
+
 def test_neg_resolver() -> None:
     assert OmegaConf.create({"key": "${hya.neg:2}"}).key == -2
 
 
+def test_neg_resolver_list() -> None:
+    assert OmegaConf.create({"key": "${hya.neg:[1,-2,3.5]}"}).key == [-1, 2, -3.5]
+
+
+def test_neg_resolver_list_int_type() -> None:
+    assert all(isinstance(value, int) for value in neg_resolver([1, 2, 3]))
+
+
+@pytest.mark.usefixtures("no_numpy")
+def test_neg_resolver_list_without_numpy() -> None:
+    assert neg_resolver((1, -2)) == [-1, 2]
+
+
+@numpy_available
+def test_neg_resolver_array() -> None:
+    assert np.array_equal(neg_resolver(np.array([1, -2])), np.array([-1, 2]))
+
+
+@pytest.mark.parametrize(
+    ("resolver", "args"),
+    [
+        (asinh_resolver, (2.5,)),
+        (exp_resolver, (1.5,)),
+        (log_resolver, (2.0,)),
+        (log_resolver, (8, 2)),
+        (log10_resolver, (100,)),
+        (neg_resolver, (True,)),
+        (neg_resolver, (3,)),
+        (pow_resolver, (2, 70)),
+        (pow_resolver, (-3, 41)),
+        (pow_resolver, (2, -2)),
+        (pow_resolver, (2.5, 3)),
+        (sinh_resolver, (1,)),
+        (sqrt_resolver, (9,)),
+    ],
+)
+def test_elementwise_same_as_scalar(resolver: Callable[..., Any], args: tuple) -> None:
+    expected = resolver(*args)
+    output = resolver(*([arg] for arg in args))
+    assert output == [expected]
+    assert type(output[0]) is type(expected)
+
+
+@pytest.mark.parametrize(
+    ("resolver", "args", "error"),
+    [
+        (sqrt_resolver, (-1,), ValueError),
+        (log_resolver, (0,), ValueError),
+        (log_resolver, (-1,), ValueError),
+        (log10_resolver, (0,), ValueError),
+        (exp_resolver, (1000,), OverflowError),
+        (sinh_resolver, (1000,), OverflowError),
+        (pow_resolver, (10.0, 400), OverflowError),
+    ],
+)
+def test_elementwise_errors_same_as_scalar(
+    resolver: Callable[..., Any], args: tuple, error: type[Exception]
+) -> None:
+    with pytest.raises(error):
+        resolver(*args)
+    with pytest.raises(error):
+        resolver(*([arg] for arg in args))
+
+
+@numpy_available
+def test_elementwise_sqrt_array_negative() -> None:
+    with pytest.raises(ValueError, match="invalid value encountered in sqrt"):
+        sqrt_resolver(np.array([4.0, -1.0]))
+
+
+@numpy_available
+def test_elementwise_pow_array_overflow() -> None:
+    assert pow_resolver(np.array([2, 3]), 70).tolist() == [2**70, 3**70]
+
+
+@numpy_available
+def test_elementwise_lazy_sequence() -> None:
+    output = exp_resolver(LinspaceSequence(0, 1, 3))
+    assert isinstance(output, np.ndarray)
+    assert np.allclose(output, [math.exp(0), math.exp(0.5), math.exp(1)])
+
+
+@numpy_available
+def test_elementwise_lazy_sequence_config() -> None:
+    conf = OmegaConf.create({"key": "${hya.exp:${hya.linspace:0,1,3}}"})
+    assert np.allclose(conf.key, [math.exp(0), math.exp(0.5), math.exp(1)])
+
+
+@numpy_available
+def test_elementwise_numpy_scalar() -> None:
+    assert neg_resolver(np.float64(2.0)) == -2.0
+
+
+@torch_available
+def test_elementwise_tensor() -> None:
+    output = neg_resolver(torch.tensor([1.0, 2.0]))
+    assert isinstance(output, torch.Tensor)
+    assert output.equal(torch.tensor([-1.0, -2.0]))
+    output = pow_resolver(torch.tensor([2, 3]), 2)
+    assert isinstance(output, torch.Tensor)
+    assert output.equal(torch.tensor([4, 9]))
+
+
+@torch_available
+def test_elementwise_tensor_requires_grad() -> None:
+    tensor = torch.ones(2, requires_grad=True)
+    output = neg_resolver(tensor)
+    assert output.requires_grad
+    output.sum().backward()
+    assert tensor.grad.equal(torch.tensor([-1.0, -1.0]))
+
+
+@torch_available
+def test_elementwise_tensor_0d() -> None:
+    output = exp_resolver(torch.tensor(0.0))
+    assert type(output) is float
+    assert output == 1.0
+
+
+def test_neg_resolver_list_bool() -> None:
+    assert neg_resolver([True, False]) == [-1, 0]
+
+
 def test_path_resolver() -> None:
     assert OmegaConf.create({"key": "${hya.path:/my/path}"}).key == Path("/my/path")
 
@@ -170,6 +647,85 @@ def test_pow_resolver_float() -> None:
     assert OmegaConf.create({"key": "${hya.pow:2.5,3}"}).key == 15.625
 
 
+def test_pow_resolver_list_value() -> None:
+    assert OmegaConf.create({"key": "${hya.pow:[1,2,3],2}"}).key == [1, 4, 9]
+
+
+def test_pow_resolver_list_exponent() -> None:
+    assert OmegaConf.create({"key": "${hya.pow:10,[-1,0,1]}"}).key == [0.1, 1.0, 10.0]
+
+
+def test_pow_resolver_lists() -> None:
+    assert pow_resolver([2, 3], [3, 2]) == [8, 9]
+
+
+@pytest.mark.usefixtures("no_numpy")
+def test_pow_resolver_list_without_numpy() -> None:
+    assert pow_resolver(10, [-1, 0, 1]) == [0.1, 1, 10]
+
+
+@numpy_available
+def test_pow_resolver_array() -> None:
+    assert np.array_equal(pow_resolver(np.array([1, 2, 3]), 2), np.array([1, 4, 9]))
+
+
+def test_quantile_resolver() -> None:
+    assert OmegaConf.create({"key": "${hya.quantile:[1,2,3,4,5],0.5}"}).key == 3.0
+
+
+def test_quantile_resolver_list() -> None:
+    assert OmegaConf.create({"key": "${hya.quantile:[1,2,3,4,5],[0,0.1,0.9,1]}"}).key == (
+        pytest.approx([1.0, 1.4, 4.6, 5.0])
+    )
+
+
+def test_quantile_resolver_list_config() -> None:
+    conf = OmegaConf.create(
+        {"values": [5, 1, 4, 2, 3], "q": [0.25, 0.75], "key": "${hya.quantile:${values},${q}}"}
+    )
+    assert conf.key == [2.0, 4.0]
+
+
+@pytest.mark.usefixtures("no_numpy")
+def test_quantile_resolver_without_numpy() -> None:
+    assert quantile_resolver([5, 1, 4, 2, 3], [0, 0.1, 0.5, 0.9, 1]) == pytest.approx(
+        [1.0, 1.4, 3.0, 4.6, 5.0]
+    )
+
+
+@numpy_available
+def test_quantile_resolver_array() -> None:
+    data = np.random.default_rng(0).normal(size=1000)
+    assert quantile_resolver(data, [0.3, 0.6]) == pytest.approx(np.quantile(data, [0.3, 0.6]))
+
+
+@numpy_available
+def test_quantile_resolver_same_as_numpy() -> None:
+    data = np.random.default_rng(0).normal(size=101).tolist()
+    q = [0.0, 0.05, 0.33, 0.5, 0.999, 1.0]
+    assert quantile_resolver(data, q) == pytest.approx(np.quantile(data, q).tolist())
+
+
+@pytest.mark.parametrize("q", [-0.1, 1.5, [0.5, 2]])
+def test_quantile_resolver_incorrect_q(q: float | list[float]) -> None:
+    with pytest.raises(ValueError, match=r"The quantile probabilities must be in \[0, 1\]"):
+        quantile_resolver([1, 2, 3], q)
+
+
+def test_quantile_resolver_empty() -> None:
+    with pytest.raises(ValueError, match="Cannot compute the quantile of an empty sequence"):
+        quantile_resolver([], 0.5)
+
+
+def test_sqrt_resolver_list() -> None:
+    assert OmegaConf.create({"key": "${hya.sqrt:[4,9]}"}).key == [2.0, 3.0]
+
+
+@pytest.mark.usefixtures("no_numpy")
+def test_sqrt_resolver_list_without_numpy() -> None:
+    assert sqrt_resolver([4, 9]) == [2.0, 3.0]
+
+
 def test_sqrt_resolver() -> None:
     assert OmegaConf.create({"key": "${hya.sqrt:9}"}).key == 3.0
 
@@ -188,10 +744,98 @@ def test_sinh_resolver_float() -> None:
     assert OmegaConf.create({"key": "${hya.sinh:1.0}"}).key == 1.1752011936438014
 
 
+def test_sinh_resolver_list() -> None:
+    assert OmegaConf.create({"key": "${hya.sinh:[0,1]}"}).key == [0.0, 1.1752011936438014]
+
+
+def test_std_resolver() -> None:
+    assert OmegaConf.create({"key": "${hya.std:[2,4,4,4,5,5,7,9]}"}).key == 2.0
+
+
+def test_std_resolver_ddof() -> None:
+    assert OmegaConf.create({"key": "${hya.std:[1,2,3,4],1}"}).key == pytest.approx(
+        1.2909944487358056
+    )
+
+
+def test_std_resolver_list_config() -> None:
+    conf = OmegaConf.create({"values": [2, 4, 4, 4, 5, 5, 7, 9], "key": "${hya.std:${values}}"})
+    assert conf.key == 2.0
+
+
+@pytest.mark.usefixtures("no_numpy")
+@pytest.mark.parametrize("ddof", [0, 1, 2])
+def test_std_resolver_without_numpy(ddof: int) -> None:
+    data = [0.5, 1.5, -2.0, 3.25, 8.0]
+    mean = sum(data) / len(data)
+    expected = math.sqrt(sum((x - mean) ** 2 for x in data) / (len(data) - ddof))
+    assert std_resolver(data, ddof=ddof) == pytest.approx(expected)
+
+
+@numpy_available
+@pytest.mark.parametrize("ddof", [0, 1, 2])
+def test_std_resolver_array(ddof: int) -> None:
+    data = np.random.default_rng(0).normal(size=100)
+    assert std_resolver(data, ddof=ddof) == pytest.approx(data.std(ddof=ddof))
+
+
+@pytest.mark.parametrize("data", [[1.0], np.array([1.0])] if is_numpy_available() else [[1.0]])
+def test_std_resolver_ddof_too_large(data: list[float]) -> None:
+    with pytest.raises(ValueError, match=r"must be greater than ddof \(1\)"):
+        std_resolver(data, ddof=1)
+
+
+def test_std_resolver_empty() -> None:
+    with pytest.raises(ValueError, match="Cannot compute the std of an empty sequence"):
+        std_resolver([])
+
+
 def test_sub_resolver() -> None:
     assert OmegaConf.create({"key": "${hya.sub:1,4}"}).key == -3
 
 
+def test_sum_resolver_ints() -> None:
+    output = OmegaConf.create({"key": "${hya.sum:[1,2,3,4]}"}).key
+    assert output == 10
+    assert isinstance(output, int)
+
+
+def test_sum_resolver_floats() -> None:
+    assert OmegaConf.create({"key": "${hya.sum:[0.1,0.2,0.3]}"}).key == 0.6
+
+
+def test_sum_resolver_large_ints() -> None:
+    assert sum_resolver([2**60, 1, -(2**60)]) == 1
+
+
+def test_sum_resolver_list_config() -> None:
+    conf = OmegaConf.create({"values": [1, 2, 3, 4], "key": "${hya.sum:${values}}"})
+    assert conf.key == 10
+
+
+def test_sum_resolver_empty() -> None:
+    assert sum_resolver([]) == 0
+
+
+def test_sum_resolver_inf_opposite_signs() -> None:
+    assert math.isnan(sum_resolver([math.inf, -math.inf]))
+
+
+def test_sum_resolver_overflow() -> None:
+    assert sum_resolver([1e308, 1e308, -1e308]) == math.inf
+
+
+def test_sum_resolver_range() -> None:
+    assert OmegaConf.create({"key": "${hya.sum:${hya.range:101}}"}).key == 5050
+
+
+@numpy_available
+def test_sum_resolver_array() -> None:
+    output = sum_resolver(np.array([[1, 2], [3, 4]]))
+    assert output == 10
+    assert isinstance(output, int)
+
+
 def test_to_path_resolver() -> None:
     assert OmegaConf.create({"key": "${hya.to_path:/my/path/to}"}).key == Path("/my/path/to")
 
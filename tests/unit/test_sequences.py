@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import pytest
+from omegaconf import OmegaConf
+from omegaconf.errors import InterpolationResolutionError
+
+from hya.imports import is_numpy_available
+from hya.sequences import LinspaceSequence, LogspaceSequence
+from hya.testing import numpy_available
+
+if is_numpy_available():
+    import numpy as np
+
+######################################
+#     Tests for LinspaceSequence     #
+######################################
+
+
+def test_linspace_sequence_len() -> None:
+    assert len(LinspaceSequence(0, 1, num=5)) == 5
+
+
+def test_linspace_sequence_len_large() -> None:
+    assert len(LinspaceSequence(0, 1, num=10**18)) == 10**18
+
+
+def test_linspace_sequence_list() -> None:
+    assert list(LinspaceSequence(0, 1, num=5)) == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+
+def test_linspace_sequence_list_endpoint_false() -> None:
+    assert list(LinspaceSequence(0, 1, num=4, endpoint=False)) == [0.0, 0.25, 0.5, 0.75]
+
+
+def test_linspace_sequence_num_0() -> None:
+    assert list(LinspaceSequence(0, 1, num=0)) == []
+
+
+def test_linspace_sequence_num_1() -> None:
+    assert list(LinspaceSequence(2, 5, num=1)) == [2.0]
+
+
+def test_linspace_sequence_num_negative() -> None:
+    with pytest.raises(ValueError, match="num must be non-negative"):
+        LinspaceSequence(0, 1, num=-1)
+
+
+def test_linspace_sequence_getitem() -> None:
+    seq = LinspaceSequence(0, 1, num=5)
+    assert seq[1] == 0.25
+    assert seq[-1] == 1.0
+
+
+def test_linspace_sequence_getitem_endpoint_exact() -> None:
+    assert LinspaceSequence(0.1, 0.7, num=7)[-1] == 0.7
+
+
+def test_linspace_sequence_getitem_large() -> None:
+    assert LinspaceSequence(0, 10**18, num=10**18 + 1)[10**17] == 1e17
+
+
+def test_linspace_sequence_getitem_out_of_range() -> None:
+    with pytest.raises(IndexError):
+        LinspaceSequence(0, 1, num=5)[5]
+
+
+def test_linspace_sequence_slice() -> None:
+    seq = LinspaceSequence(0, 1, num=5)[::2]
+    assert isinstance(seq, LinspaceSequence)
+    assert seq.indices == range(0, 5, 2)
+    assert list(seq) == [0.0, 0.5, 1.0]
+
+
+def test_linspace_sequence_slice_reversed() -> None:
+    assert list(LinspaceSequence(0, 1, num=5)[::-1]) == [1.0, 0.75, 0.5, 0.25, 0.0]
+
+
+def test_linspace_sequence_slice_of_slice() -> None:
+    assert list(LinspaceSequence(0, 1, num=5)[1:][::2]) == [0.25, 0.75]
+
+
+def test_linspace_sequence_contains() -> None:
+    assert 0.5 in LinspaceSequence(0, 1, num=5)
+
+
+def test_linspace_sequence_repr() -> None:
+    assert repr(LinspaceSequence(0, 1, num=5)) == (
+        "LinspaceSequence(start=0, stop=1, num=5, endpoint=True)"
+    )
+
+
+def test_linspace_sequence_repr_slice() -> None:
+    assert repr(LinspaceSequence(0, 1, num=5)[1:]) == (
+        "LinspaceSequence(start=0, stop=1, num=5, endpoint=True)[1:5:1]"
+    )
+
+
+@numpy_available
+@pytest.mark.parametrize("num", [0, 1, 2, 7, 100])
+@pytest.mark.parametrize("endpoint", [True, False])
+def test_linspace_sequence_array(num: int, endpoint: bool) -> None:
+    seq = LinspaceSequence(-3, 7.5, num=num, endpoint=endpoint)
+    expected = np.linspace(-3, 7.5, num=num, endpoint=endpoint)
+    assert np.array_equal(np.asarray(seq), expected)
+    assert np.array_equal(np.array(list(seq)), expected)
+
+
+@numpy_available
+def test_linspace_sequence_array_slice() -> None:
+    assert np.array_equal(
+        np.asarray(LinspaceSequence(0, 1, num=11)[9:2:-3]), np.linspace(0, 1, num=11)[9:2:-3]
+    )
+
+
+@numpy_available
+def test_linspace_sequence_array_dtype() -> None:
+    assert np.asarray(LinspaceSequence(0, 1, num=5), dtype=np.float32).dtype == np.float32
+
+
+######################################
+#     Tests for LogspaceSequence     #
+######################################
+
+
+def test_logspace_sequence_len() -> None:
+    assert len(LogspaceSequence(0, 3, num=4)) == 4
+
+
+def test_logspace_sequence_list() -> None:
+    assert list(LogspaceSequence(0, 3, num=4)) == [1.0, 10.0, 100.0, 1000.0]
+
+
+def test_logspace_sequence_list_base() -> None:
+    assert list(LogspaceSequence(0, 4, num=3, base=2)) == [1.0, 4.0, 16.0]
+
+
+def test_logspace_sequence_slice() -> None:
+    seq = LogspaceSequence(0, 3, num=4, base=2.0)[1:]
+    assert isinstance(seq, LogspaceSequence)
+    assert list(seq) == [2.0, 4.0, 8.0]
+
+
+def test_logspace_sequence_repr() -> None:
+    assert repr(LogspaceSequence(0, 3, num=4)) == (
+        "LogspaceSequence(start=0, stop=3, num=4, endpoint=True, base=10.0)"
+    )
+
+
+@numpy_available
+@pytest.mark.parametrize("num", [0, 1, 2, 7, 100])
+@pytest.mark.parametrize("endpoint", [True, False])
+def test_logspace_sequence_array(num: int, endpoint: bool) -> None:
+    assert np.allclose(
+        np.asarray(LogspaceSequence(-3, 2, num=num, endpoint=endpoint, base=2.0)),
+        np.logspace(-3, 2, num=num, endpoint=endpoint, base=2.0),
+    )
+
+
+#######################################
+#     Tests for linspace_resolver     #
+#######################################
+
+
+def test_linspace_resolver() -> None:
+    assert list(OmegaConf.create({"key": "${hya.linspace:0,1,5}"}).key) == [
+        0.0,
+        0.25,
+        0.5,
+        0.75,
+        1.0,
+    ]
+
+
+def test_linspace_resolver_endpoint_false() -> None:
+    assert list(OmegaConf.create({"key": "${hya.linspace:0,1,4,false}"}).key) == [
+        0.0,
+        0.25,
+        0.5,
+        0.75,
+    ]
+
+
+def test_linspace_resolver_default_num() -> None:
+    assert len(OmegaConf.create({"key": "${hya.linspace:0,1}"}).key) == 50
+
+
+def test_linspace_resolver_len() -> None:
+    conf = OmegaConf.create({"seq": "${hya.linspace:0,1,1000001}", "key": "${hya.len:${seq}}"})
+    assert conf.key == 1000001
+
+
+def test_linspace_resolver_num_negative() -> None:
+    with pytest.raises(InterpolationResolutionError, match="num must be non-negative"):
+        OmegaConf.create({"key": "${hya.linspace:0,1,-1}"}).key  # noqa: B018
+
+
+#######################################
+#     Tests for logspace_resolver     #
+#######################################
+
+
+def test_logspace_resolver() -> None:
+    assert list(OmegaConf.create({"key": "${hya.logspace:0,3,4}"}).key) == [
+        1.0,
+        10.0,
+        100.0,
+        1000.0,
+    ]
+
+
+def test_logspace_resolver_base() -> None:
+    assert list(OmegaConf.create({"key": "${hya.logspace:0,3,4,true,2}"}).key) == [
+        1.0,
+        2.0,
+        4.0,
+        8.0,
+    ]
+
+
+####################################
+#     Tests for range_resolver     #
+####################################
+
+
+def test_range_resolver_stop() -> None:
+    assert OmegaConf.create({"key": "${hya.range:5}"}).key == range(5)
+
+
+def test_range_resolver_start_stop() -> None:
+    assert OmegaConf.create({"key": "${hya.range:2,5}"}).key == range(2, 5)
+
+
+def test_range_resolver_start_stop_step() -> None:
+    assert OmegaConf.create({"key": "${hya.range:10,0,-3}"}).key == range(10, 0, -3)
+
+
+def test_range_resolver_len() -> None:
+    assert OmegaConf.create({"key": "${hya.len:${hya.range:0,1000000000}}"}).key == 1000000000
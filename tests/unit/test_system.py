@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from omegaconf import OmegaConf
+
+from hya.system import (
+    _clear_caches,
+    get_available_memory,
+    get_cgroup_available_memory,
+    get_cgroup_cpu_quota,
+    get_cpu_affinity_count,
+    get_cpu_count,
+    get_meminfo_available,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def write_files(root: Path, files: dict[str, str]) -> Path:
+    for name, content in files.items():
+        path = root.joinpath(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+@pytest.fixture
+def proc_root(tmp_path: Path) -> Path:
+    return write_files(
+        tmp_path.joinpath("proc"),
+        {"meminfo": "MemTotal: 16384 kB\nMemFree: 4096 kB\nMemAvailable: 8192 kB\n"},
+    )
+
+
+@pytest.fixture
+def affinity_count(monkeypatch: pytest.MonkeyPatch) -> int:
+    monkeypatch.setattr("hya.system.get_cpu_affinity_count", lambda: 8)
+    return 8
+
+
+###############################################
+#     Tests for available_memory_resolver     #
+###############################################
+
+
+def test_available_memory_resolver() -> None:
+    memory = OmegaConf.create({"key": "${hya.available_memory:}"}).key
+    assert isinstance(memory, int)
+    assert memory > 0
+
+
+#################################################
+#     Tests for cpu_affinity_count_resolver     #
+#################################################
+
+
+def test_cpu_affinity_count_resolver() -> None:
+    assert OmegaConf.create({"key": "${hya.cpu_affinity_count:}"}).key == get_cpu_affinity_count()
+
+
+########################################
+#     Tests for cpu_count_resolver     #
+########################################
+
+
+def test_cpu_count_resolver() -> None:
+    assert 1 <= OmegaConf.create({"key": "${hya.cpu_count:}"}).key <= get_cpu_affinity_count()
+
+
+##########################################
+#     Tests for get_available_memory     #
+##########################################
+
+
+def test_get_available_memory_no_cgroup(tmp_path: Path, proc_root: Path) -> None:
+    assert get_available_memory(str(tmp_path.joinpath("cgroup")), str(proc_root)) == 8192 * 1024
+
+
+def test_get_available_memory_cgroup_limit(tmp_path: Path, proc_root: Path) -> None:
+    cgroup_root = write_files(
+        tmp_path.joinpath("cgroup"), {"memory.max": "4194304\n", "memory.current": "1048576\n"}
+    )
+    assert get_available_memory(str(cgroup_root), str(proc_root)) == 3145728
+
+
+def test_get_available_memory_cgroup_no_limit(tmp_path: Path, proc_root: Path) -> None:
+    cgroup_root = write_files(
+        tmp_path.joinpath("cgroup"), {"memory.max": "max\n", "memory.current": "1048576\n"}
+    )
+    assert get_available_memory(str(cgroup_root), str(proc_root)) == 8192 * 1024
+
+
+def test_get_available_memory_no_meminfo(tmp_path: Path) -> None:
+    assert get_available_memory(str(tmp_path), str(tmp_path)) > 0
+
+
+def test_get_available_memory_cached(tmp_path: Path, proc_root: Path) -> None:
+    cgroup_root = str(tmp_path.joinpath("cgroup"))
+    assert get_available_memory(cgroup_root, str(proc_root)) == 8192 * 1024
+    write_files(proc_root, {"meminfo": "MemAvailable:    1024 kB\n"})
+    assert get_available_memory(cgroup_root, str(proc_root)) == 8192 * 1024
+
+
+def test_get_available_memory_clear_caches(tmp_path: Path, proc_root: Path) -> None:
+    cgroup_root = str(tmp_path.joinpath("cgroup"))
+    assert get_available_memory(cgroup_root, str(proc_root)) == 8192 * 1024
+    write_files(proc_root, {"meminfo": "MemAvailable:    1024 kB\n"})
+    _clear_caches()
+    assert get_available_memory(cgroup_root, str(proc_root)) == 1024 * 1024
+
+
+#################################################
+#     Tests for get_cgroup_available_memory     #
+#################################################
+
+
+def test_get_cgroup_available_memory_v2(tmp_path: Path) -> None:
+    write_files(tmp_path, {"memory.max": "1073741824\n", "memory.current": "268435456\n"})
+    assert get_cgroup_available_memory(str(tmp_path)) == 805306368
+
+
+def test_get_cgroup_available_memory_v2_inactive_file(tmp_path: Path) -> None:
+    write_files(
+        tmp_path,
+        {
+            "memory.max": "1073741824\n",
+            "memory.current": "268435456\n",
+            "memory.stat": "anon 1024\ninactive_file 134217728\nactive_file 4096\n",
+        },
+    )
+    assert get_cgroup_available_memory(str(tmp_path)) == 939524096
+
+
+def test_get_cgroup_available_memory_v2_no_limit(tmp_path: Path) -> None:
+    write_files(tmp_path, {"memory.max": "max\n", "memory.current": "268435456\n"})
+    assert get_cgroup_available_memory(str(tmp_path)) is None
+
+
+def test_get_cgroup_available_memory_v2_usage_above_limit(tmp_path: Path) -> None:
+    write_files(tmp_path, {"memory.max": "1024\n", "memory.current": "2048\n"})
+    assert get_cgroup_available_memory(str(tmp_path)) == 0
+
+
+def test_get_cgroup_available_memory_v1(tmp_path: Path) -> None:
+    write_files(
+        tmp_path,
+        {
+            "memory/memory.limit_in_bytes": "1073741824\n",
+            "memory/memory.usage_in_bytes": "268435456\n",
+            "memory/memory.stat": "cache 0\ntotal_inactive_file 134217728\n",
+        },
+    )
+    assert get_cgroup_available_memory(str(tmp_path)) == 939524096
+
+
+def test_get_cgroup_available_memory_missing(tmp_path: Path) -> None:
+    assert get_cgroup_available_memory(str(tmp_path)) is None
+
+
+##########################################
+#     Tests for get_cgroup_cpu_quota     #
+##########################################
+
+
+def test_get_cgroup_cpu_quota_v2(tmp_path: Path) -> None:
+    write_files(tmp_path, {"cpu.max": "150000 100000\n"})
+    assert get_cgroup_cpu_quota(str(tmp_path)) == 1.5
+
+
+def test_get_cgroup_cpu_quota_v2_no_limit(tmp_path: Path) -> None:
+    write_files(tmp_path, {"cpu.max": "max 100000\n"})
+    assert get_cgroup_cpu_quota(str(tmp_path)) is None
+
+
+@pytest.mark.parametrize("directory", ["cpu", "cpu,cpuacct", "cpuacct,cpu"])
+def test_get_cgroup_cpu_quota_v1(tmp_path: Path, directory: str) -> None:
+    write_files(
+        tmp_path,
+        {f"{directory}/cpu.cfs_quota_us": "400000\n", f"{directory}/cpu.cfs_period_us": "100000\n"},
+    )
+    assert get_cgroup_cpu_quota(str(tmp_path)) == 4.0
+
+
+def test_get_cgroup_cpu_quota_v1_no_limit(tmp_path: Path) -> None:
+    write_files(tmp_path, {"cpu/cpu.cfs_quota_us": "-1\n", "cpu/cpu.cfs_period_us": "100000\n"})
+    assert get_cgroup_cpu_quota(str(tmp_path)) is None
+
+
+def test_get_cgroup_cpu_quota_invalid(tmp_path: Path) -> None:
+    write_files(tmp_path, {"cpu.max": "abc 0\n"})
+    assert get_cgroup_cpu_quota(str(tmp_path)) is None
+
+
+def test_get_cgroup_cpu_quota_missing(tmp_path: Path) -> None:
+    assert get_cgroup_cpu_quota(str(tmp_path)) is None
+
+
+############################################
+#     Tests for get_cpu_affinity_count     #
+############################################
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_getaffinity"), reason="requires sched_getaffinity")
+def test_get_cpu_affinity_count() -> None:
+    assert get_cpu_affinity_count() == len(os.sched_getaffinity(0))
+
+
+###################################
+#     Tests for get_cpu_count     #
+###################################
+
+
+@pytest.mark.usefixtures("affinity_count")
+def test_get_cpu_count_no_cgroup(tmp_path: Path) -> None:
+    assert get_cpu_count(str(tmp_path)) == 8
+
+
+@pytest.mark.usefixtures("affinity_count")
+@pytest.mark.parametrize(("cpu_max", "count"), [("150000 100000", 2), ("50000 100000", 1)])
+def test_get_cpu_count_quota(tmp_path: Path, cpu_max: str, count: int) -> None:
+    write_files(tmp_path, {"cpu.max": cpu_max})
+    assert get_cpu_count(str(tmp_path)) == count
+
+
+@pytest.mark.usefixtures("affinity_count")
+def test_get_cpu_count_quota_above_affinity(tmp_path: Path) -> None:
+    write_files(tmp_path, {"cpu.max": "3200000 100000"})
+    assert get_cpu_count(str(tmp_path)) == 8
+
+
+###########################################
+#     Tests for get_meminfo_available     #
+###########################################
+
+
+def test_get_meminfo_available(proc_root: Path) -> None:
+    assert get_meminfo_available(str(proc_root)) == 8192 * 1024
+
+
+def test_get_meminfo_available_missing_key(tmp_path: Path) -> None:
+    write_files(tmp_path, {"meminfo": "MemTotal:       16384 kB\n"})
+    assert get_meminfo_available(str(tmp_path)) is None
+
+
+def test_get_meminfo_available_missing_file(tmp_path: Path) -> None:
+    assert get_meminfo_available(str(tmp_path)) is None
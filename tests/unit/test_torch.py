@@ -1,12 +1,46 @@
 from __future__ import annotations
 
+import pickle
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock, patch
+
 import pytest
 from omegaconf import OmegaConf
 from omegaconf.errors import InterpolationResolutionError
 
-from hya.imports import is_torch_available
-from hya.testing import torch_available
-from hya.torch import get_dtypes
+from hya.imports import is_numpy_available, is_safetensors_available, is_torch_available
+from hya.testing import (
+    numpy_available,
+    safetensors_available,
+    safetensors_not_available,
+    torch_available,
+)
+from hya.sequences import LinspaceSequence
+from hya.torch import (
+    device_resolver,
+    get_auto_device,
+    get_auto_num_threads,
+    get_dtype_table,
+    get_dtypes,
+    load_resolver,
+    num_threads_resolver,
+    probe_device,
+    probe_num_threads,
+    set_auto_probe,
+    shared_tensor_resolver,
+    to_tensor_resolver,
+    torch_dtype_resolver,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+if is_numpy_available():
+    import numpy as np
+
+if is_safetensors_available():
+    from safetensors.torch import save_file
 
 if is_torch_available():
     import torch
@@ -24,6 +58,188 @@ def test_to_tensor_resolver_list() -> None:
     )
 
 
+@torch_available
+def test_to_tensor_resolver_range() -> None:
+    assert OmegaConf.create({"key": "${hya.torch.tensor:${hya.range:2,10,3}}"}).key.equal(
+        torch.tensor([2, 5, 8])
+    )
+
+
+@torch_available
+def test_to_tensor_resolver_linspace() -> None:
+    assert OmegaConf.create({"key": "${hya.torch.tensor:${hya.linspace:0,1,5}}"}).key.equal(
+        torch.tensor([0.0, 0.25, 0.5, 0.75, 1.0])
+    )
+
+
+@torch_available
+def test_to_tensor_resolver_linspace_slice() -> None:
+    assert to_tensor_resolver(LinspaceSequence(0, 1, num=5)[::-2]).equal(
+        torch.tensor([1.0, 0.5, 0.0])
+    )
+
+
+@torch_available
+def test_to_tensor_resolver_logspace() -> None:
+    assert OmegaConf.create({"key": "${hya.torch.tensor:${hya.logspace:0,3,4}}"}).key.allclose(
+        torch.tensor([1.0, 10.0, 100.0, 1000.0])
+    )
+
+
+@torch_available
+def test_to_tensor_resolver_list_config() -> None:
+    conf = OmegaConf.create(
+        {"a": 4.0, "data": [[1.0, "${a}"], [2.5, 3.0]], "key": "${hya.torch.tensor:${data}}"}
+    )
+    assert conf.key.equal(torch.tensor([[1.0, 4.0], [2.5, 3.0]]))
+
+
+@torch_available
+def test_to_tensor_resolver_dtype() -> None:
+    tensor = OmegaConf.create({"key": "${hya.torch.tensor:[1, 2, 3],fp16}"}).key
+    assert tensor.equal(torch.tensor([1, 2, 3], dtype=torch.float16))
+
+
+@torch_available
+def test_to_tensor_resolver_range_dtype() -> None:
+    assert OmegaConf.create({"key": "${hya.torch.tensor:${hya.range:4},float32}"}).key.equal(
+        torch.arange(4, dtype=torch.float32)
+    )
+
+
+@torch_available
+def test_to_tensor_resolver_linspace_dtype() -> None:
+    assert to_tensor_resolver(LinspaceSequence(0, 1, num=5), "float64").equal(
+        torch.linspace(0, 1, 5, dtype=torch.float64)
+    )
+
+
+@torch_available
+def test_to_tensor_resolver_incorrect_dtype() -> None:
+    conf = OmegaConf.create({"key": "${hya.torch.tensor:[1, 2, 3],float_32}"})
+    with pytest.raises(InterpolationResolutionError, match="Incorrect dtype float_32"):
+        conf.key  # noqa: B018
+
+
+@torch_available
+def test_to_tensor_resolver_device() -> None:
+    tensor = OmegaConf.create({"key": "${hya.torch.tensor:[1, 2, 3],null,cpu}"}).key
+    assert tensor.device == torch.device("cpu")
+    assert tensor.equal(torch.tensor([1, 2, 3]))
+
+
+@torch_available
+def test_to_tensor_resolver_pin_memory() -> None:
+    pinned = torch.tensor([1, 2, 3])
+    with patch.object(torch.Tensor, "pin_memory", return_value=pinned) as pin_memory:
+        assert to_tensor_resolver([1, 2, 3], pin_memory=True) is pinned
+    pin_memory.assert_called_once_with()
+
+
+@torch_available
+def test_to_tensor_resolver_bytearray_no_copy() -> None:
+    data = bytearray(b"\x01\x02\x03")
+    tensor = to_tensor_resolver(data)
+    assert tensor.equal(torch.tensor([1, 2, 3], dtype=torch.uint8))
+    tensor[0] = 42
+    assert data[0] == 42
+
+
+@torch_available
+def test_to_tensor_resolver_bytes_dtype() -> None:
+    data = b"\x01\x00\x02\x00"
+    tensor = to_tensor_resolver(data, "int16")
+    assert tensor.equal(torch.tensor([1, 2], dtype=torch.int16))
+    tensor[0] = 42
+    assert data == b"\x01\x00\x02\x00"
+
+
+@torch_available
+def test_to_tensor_resolver_bytes_empty() -> None:
+    assert to_tensor_resolver(b"", "float32").equal(torch.empty(0, dtype=torch.float32))
+
+
+@numpy_available
+@torch_available
+def test_to_tensor_resolver_numpy_dtype() -> None:
+    tensor = to_tensor_resolver(np.arange(3), "float32")
+    assert tensor.equal(torch.tensor([0.0, 1.0, 2.0]))
+
+
+@numpy_available
+@torch_available
+def test_to_tensor_resolver_numpy_same_dtype_no_copy() -> None:
+    array = np.zeros(3, dtype=np.float32)
+    to_tensor_resolver(array, "float32", "cpu")[0] = 1.0
+    assert array[0] == 1.0
+
+
+@numpy_available
+@torch_available
+def test_to_tensor_resolver_numpy_no_copy() -> None:
+    array = np.zeros(3, dtype=np.float32)
+    tensor = to_tensor_resolver(array)
+    tensor[0] = 1.0
+    assert tensor.equal(torch.tensor([1.0, 0.0, 0.0]))
+    assert array[0] == 1.0
+
+
+@numpy_available
+@torch_available
+def test_to_tensor_resolver_numpy_read_only() -> None:
+    array = np.arange(3)
+    array.flags.writeable = False
+    tensor = to_tensor_resolver(array)
+    tensor[0] = 5
+    assert tensor.equal(torch.tensor([5, 1, 2]))
+    assert array[0] == 0
+
+
+@numpy_available
+@torch_available
+def test_to_tensor_resolver_numpy_config() -> None:
+    conf = OmegaConf.create({"key": "${hya.torch.tensor:${hya.np.zeros:[2, 3],fp16}}"})
+    assert conf.key.equal(torch.zeros(2, 3, dtype=torch.float16))
+
+
+@torch_available
+def test_shared_tensor_resolver() -> None:
+    assert OmegaConf.create({"key": "${hya.torch.shared_tensor:[[1, 2], [3, 4]]}"}).key.equal(
+        torch.tensor([[1, 2], [3, 4]])
+    )
+
+
+@torch_available
+def test_shared_tensor_resolver_same_memory() -> None:
+    tensor1 = shared_tensor_resolver([1.0, 2.0, 3.0])
+    tensor2 = shared_tensor_resolver([1.0, 2.0, 3.0])
+    assert tensor1.data_ptr() == tensor2.data_ptr()
+
+
+@torch_available
+def test_shared_tensor_resolver_dtype() -> None:
+    assert shared_tensor_resolver([1, 2]).dtype == torch.long
+    assert shared_tensor_resolver([1.0, 2.0]).dtype == torch.get_default_dtype()
+    assert shared_tensor_resolver([True, False]).dtype == torch.bool
+
+
+@torch_available
+def test_shared_tensor_resolver_scalar() -> None:
+    assert shared_tensor_resolver(1.5).equal(torch.tensor(1.5))
+
+
+@torch_available
+def test_shared_tensor_resolver_empty() -> None:
+    assert shared_tensor_resolver([]).shape == (0,)
+
+
+@torch_available
+def test_shared_tensor_resolver_linspace() -> None:
+    assert OmegaConf.create({"key": "${hya.torch.shared_tensor:${hya.linspace:0,1,5}}"}).key.equal(
+        torch.tensor([0.0, 0.25, 0.5, 0.75, 1.0])
+    )
+
+
 @torch_available
 def test_torch_dtype_resolver_float() -> None:
     assert OmegaConf.create({"key": "${hya.torch.dtype:float}"}).key == torch.float
@@ -39,6 +255,77 @@ def test_torch_dtype_resolver_bool() -> None:
     assert OmegaConf.create({"key": "${hya.torch.dtype:bool}"}).key == torch.bool
 
 
+@torch_available
+@pytest.mark.parametrize(
+    ("target", "dtype"),
+    [
+        ("fp16", "float16"),
+        ("half", "float16"),
+        ("bf16", "bfloat16"),
+        ("fp32", "float32"),
+        ("double", "float64"),
+        ("torch.float32", "float32"),
+        ("torch.long", "int64"),
+        ("np.int32", "int32"),
+        ("numpy.uint8", "uint8"),
+        (" int8 ", "int8"),
+    ],
+)
+def test_torch_dtype_resolver_alias(target: str, dtype: str) -> None:
+    assert torch_dtype_resolver(target) == getattr(torch, dtype)
+
+
+@torch_available
+@numpy_available
+@pytest.mark.parametrize(
+    ("target", "dtype"),
+    [
+        ("np.byte", "int8"),
+        ("np.ubyte", "uint8"),
+        ("np.float", "float64"),
+        ("np.int", "int64"),
+        ("np.single", "float32"),
+        ("numpy.intc", "int32"),
+        ("torch.float", "float32"),
+        ("torch.int", "int32"),
+    ],
+)
+def test_torch_dtype_resolver_numpy_names(target: str, dtype: str) -> None:
+    assert torch_dtype_resolver(target) == getattr(torch, dtype)
+
+
+@torch_available
+@pytest.mark.parametrize("target", ["np.bf16", "np.chalf", "torch.np.float32"])
+def test_torch_dtype_resolver_incorrect_numpy_name(target: str) -> None:
+    with pytest.raises(InterpolationResolutionError):
+        torch_dtype_resolver(target)
+
+
+@torch_available
+@pytest.mark.parametrize(
+    ("target", "dtype"), [("<f4", "float32"), ("f8", "float64"), ("i8", "int64"), ("b1", "bool")]
+)
+def test_torch_dtype_resolver_numpy_code(target: str, dtype: str) -> None:
+    assert torch_dtype_resolver(target) == getattr(torch, dtype)
+
+
+@torch_available
+def test_torch_dtype_resolver_config_alias() -> None:
+    assert OmegaConf.create({"key": "${hya.torch.dtype:bf16}"}).key == torch.bfloat16
+
+
+@torch_available
+def test_torch_dtype_resolver_torch_dtype() -> None:
+    assert torch_dtype_resolver(torch.float16) == torch.float16
+
+
+@torch_available
+@numpy_available
+def test_torch_dtype_resolver_numpy_dtype() -> None:
+    assert torch_dtype_resolver(np.dtype("float32")) == torch.float32
+    assert torch_dtype_resolver(np.int16) == torch.int16
+
+
 @torch_available
 def test_torch_dtype_resolver_incorrect_attribute() -> None:
     with pytest.raises(InterpolationResolutionError, match=r"Incorrect dtype bool32."):
@@ -51,9 +338,338 @@ def test_torch_dtype_resolver_incorrect_dtype() -> None:
         OmegaConf.create({"key": "${hya.torch.dtype:ones}"}).key  # noqa: B018
 
 
+@torch_available
+def test_get_dtype_table() -> None:
+    table = get_dtype_table()
+    assert table["float32"] == torch.float32
+    assert table["float"] == torch.float32
+    assert table["fp16"] == torch.float16
+    assert table["torch.bfloat16"] == torch.bfloat16
+    assert "ones" not in table
+
+
+@torch_available
+def test_get_dtype_table_cached() -> None:
+    assert get_dtype_table() is get_dtype_table()
+
+
 @torch_available
 def test_get_dtypes() -> None:
     dtypes = get_dtypes()
     assert len(dtypes) > 1
     assert torch.float in dtypes
     assert torch.long in dtypes
+
+
+@torch_available
+def test_load_resolver(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.pt")
+    torch.save({"weight": torch.ones(2, 3), "step": 10}, path)
+    data = OmegaConf.create({"key": f"${{hya.torch.load:{path}}}"}).key
+    assert data["weight"].equal(torch.ones(2, 3))
+    assert data["step"] == 10
+
+
+@torch_available
+def test_load_resolver_tensor(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("mask.pt")
+    torch.save(torch.tensor([True, False]), path)
+    assert load_resolver(str(path)).equal(torch.tensor([True, False]))
+
+
+@torch_available
+def test_load_resolver_legacy_format(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.pt")
+    torch.save({"weight": torch.ones(2)}, path, _use_new_zipfile_serialization=False)
+    with pytest.raises(RuntimeError, match=r"saved with the legacy format of torch\.save"):
+        load_resolver(str(path))
+
+
+@torch_available
+def test_load_resolver_without_mmap(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.pt")
+    torch.save({"weight": torch.ones(2)}, path, _use_new_zipfile_serialization=False)
+    with (
+        patch("hya.torch._supports_mmap", return_value=False),
+        patch("torch.load", wraps=torch.load) as load,
+    ):
+        assert load_resolver(str(path), "weight").equal(torch.ones(2))
+    load.assert_called_once_with(str(path), map_location="cpu", weights_only=True)
+
+
+@torch_available
+def test_load_resolver_key(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.pt")
+    torch.save({"encoder.weight": torch.ones(2), "decoder.weight": torch.zeros(2)}, path)
+    conf = OmegaConf.create({"key": f"${{hya.torch.load:{path},encoder.weight}}"})
+    assert conf.key.equal(torch.ones(2))
+
+
+@torch_available
+def test_load_resolver_nested_key(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("checkpoint.pt")
+    torch.save({"state_dict": {"layer.0.weight": torch.ones(2)}, "epoch": 3}, path)
+    assert load_resolver(str(path), "state_dict.layer.0.weight").equal(torch.ones(2))
+    assert load_resolver(str(path), "epoch") == 3
+
+
+@torch_available
+def test_load_resolver_missing_key(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.pt")
+    torch.save({"state_dict": {"weight": torch.ones(2)}}, path)
+    with pytest.raises(KeyError, match=r"'state_dict\.bias' is not in the loaded data"):
+        load_resolver(str(path), "state_dict.bias")
+
+
+@torch_available
+def test_load_resolver_key_not_mapping(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("mask.pt")
+    torch.save(torch.ones(2), path)
+    with pytest.raises(KeyError, match="'weight' is not in the loaded data"):
+        load_resolver(str(path), "weight")
+
+
+@torch_available
+@pytest.mark.parametrize("mmap", [True, False])
+def test_load_resolver_not_shared_between_configs(tmp_path: Path, mmap: bool) -> None:
+    path = tmp_path.joinpath("model.pt")
+    torch.save({"weight": torch.zeros(3)}, path)
+    with patch("hya.torch._supports_mmap", return_value=mmap):
+        conf1 = OmegaConf.create({"key": f"${{hya.torch.load:{path},weight}}"})
+        conf2 = OmegaConf.create({"table": f"${{hya.torch.load:{path},weight}}"})
+        conf1.key.add_(5)
+        assert conf2.table.equal(torch.zeros(3))
+        assert load_resolver(str(path))["weight"].equal(torch.zeros(3))
+    assert torch.load(path, weights_only=True)["weight"].equal(torch.zeros(3))
+
+
+@torch_available
+def test_load_resolver_without_mmap_cached(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.pt")
+    torch.save({"weight": torch.ones(2), "layers": [torch.zeros(2)]}, path)
+    with (
+        patch("hya.torch._supports_mmap", return_value=False),
+        patch("torch.load", wraps=torch.load) as load,
+    ):
+        data1 = load_resolver(str(path))
+        data2 = load_resolver(str(path))
+    load.assert_called_once()
+    assert data1["weight"].equal(data2["weight"])
+    assert data1["weight"] is not data2["weight"]
+    assert data1["layers"][0] is not data2["layers"][0]
+
+
+@torch_available
+def test_load_resolver_file_changed(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.pt")
+    torch.save({"weight": torch.ones(2)}, path)
+    assert load_resolver(str(path), "weight").equal(torch.ones(2))
+    torch.save({"weight": torch.zeros(5)}, path)
+    assert load_resolver(str(path), "weight").equal(torch.zeros(5))
+
+
+@torch_available
+def test_load_resolver_weights_only(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.pt")
+    torch.save({"loader": LinspaceSequence(0, 1, num=5)}, path)
+    with pytest.raises(pickle.UnpicklingError, match="Weights only load failed"):
+        load_resolver(str(path))
+
+
+@safetensors_available
+@torch_available
+def test_load_resolver_safetensors(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.safetensors")
+    save_file({"encoder.weight": torch.ones(2, 2), "bias": torch.zeros(2)}, path)
+    data = OmegaConf.create({"key": f"${{hya.torch.load:{path}}}"}).key
+    assert sorted(data) == ["bias", "encoder.weight"]
+    assert data["encoder.weight"].equal(torch.ones(2, 2))
+
+
+@safetensors_available
+@torch_available
+def test_load_resolver_safetensors_key(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.safetensors")
+    save_file({"encoder.weight": torch.ones(2, 2), "bias": torch.zeros(2)}, path)
+    conf = OmegaConf.create({"key": f"${{hya.torch.load:{path},encoder.weight}}"})
+    assert conf.key.equal(torch.ones(2, 2))
+
+
+@safetensors_available
+@torch_available
+def test_load_resolver_safetensors_not_shared(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.safetensors")
+    save_file({"bias": torch.zeros(2)}, path)
+    load_resolver(str(path), "bias").add_(5)
+    assert load_resolver(str(path), "bias").equal(torch.zeros(2))
+    assert load_resolver(str(path))["bias"].equal(torch.zeros(2))
+
+
+@safetensors_available
+@torch_available
+@pytest.mark.parametrize("key", ["safetensors", "handle", "data"])
+def test_load_resolver_safetensors_key_name(tmp_path: Path, key: str) -> None:
+    path = tmp_path.joinpath("model.safetensors")
+    save_file({key: torch.ones(2), "bias": torch.zeros(2)}, path)
+    assert sorted(load_resolver(str(path))) == ["bias", key]
+    assert load_resolver(str(path), key).equal(torch.ones(2))
+
+
+@safetensors_available
+@torch_available
+def test_load_resolver_safetensors_missing_key(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.safetensors")
+    save_file({"bias": torch.zeros(2)}, path)
+    with pytest.raises(KeyError, match="'weight' is not in"):
+        load_resolver(str(path), "weight")
+
+
+@safetensors_not_available
+@torch_available
+def test_load_resolver_safetensors_not_available(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("model.safetensors")
+    path.write_bytes(b"")
+    with pytest.raises(RuntimeError, match="'safetensors' package is required but not installed"):
+        load_resolver(str(path))
+
+
+@pytest.fixture
+def auto_probes() -> Generator[None]:
+    yield
+    set_auto_probe("device", None)
+    set_auto_probe("num_threads", None)
+
+
+@torch_available
+@pytest.mark.parametrize(
+    ("device", "expected"), [("cpu", "cpu"), ("cuda:1", "cuda:1"), ("meta", "meta"), (0, "cuda:0")]
+)
+def test_device_resolver(device: Any, expected: str) -> None:
+    assert device_resolver(device) == torch.device(expected)
+
+
+@torch_available
+def test_device_resolver_incorrect() -> None:
+    conf = OmegaConf.create({"key": "${hya.torch.device:abc}"})
+    with pytest.raises(InterpolationResolutionError):
+        conf.key  # noqa: B018
+
+
+@torch_available
+@pytest.mark.usefixtures("auto_probes")
+def test_device_resolver_auto() -> None:
+    probe = Mock(return_value="cuda:1")
+    set_auto_probe("device", probe)
+    conf = OmegaConf.create({f"key{i}": "${hya.torch.device:auto}" for i in range(10)})
+    assert all(conf[f"key{i}"] == torch.device("cuda", 1) for i in range(10))
+    probe.assert_called_once_with()
+
+
+@torch_available
+@pytest.mark.usefixtures("auto_probes")
+def test_device_resolver_auto_default_probe() -> None:
+    assert OmegaConf.create({"key": "${hya.torch.device:}"}).key == probe_device()
+
+
+@torch_available
+@pytest.mark.usefixtures("auto_probes")
+def test_get_auto_device() -> None:
+    set_auto_probe("device", lambda: torch.device("meta"))
+    assert get_auto_device() == torch.device("meta")
+    set_auto_probe("device", lambda: "cpu")
+    assert get_auto_device() == torch.device("cpu")
+
+
+@torch_available
+def test_probe_device_cpu() -> None:
+    with (
+        patch("torch.cuda.is_available", return_value=False),
+        patch("torch.backends.mps.is_available", return_value=False),
+    ):
+        assert probe_device() == torch.device("cpu")
+
+
+@torch_available
+def test_probe_device_mps() -> None:
+    with (
+        patch("torch.cuda.is_available", return_value=False),
+        patch("torch.backends.mps.is_available", return_value=True),
+    ):
+        assert probe_device() == torch.device("mps")
+
+
+@torch_available
+def test_probe_device_cuda(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("LOCAL_RANK", raising=False)
+    with (
+        patch("torch.cuda.is_available", return_value=True),
+        patch("torch.cuda.device_count", return_value=2),
+    ):
+        assert probe_device() == torch.device("cuda", 0)
+
+
+@torch_available
+@pytest.mark.parametrize(("local_rank", "index"), [("1", 1), ("3", 1), ("abc", 0)])
+def test_probe_device_cuda_local_rank(
+    monkeypatch: pytest.MonkeyPatch, local_rank: str, index: int
+) -> None:
+    monkeypatch.setenv("LOCAL_RANK", local_rank)
+    with (
+        patch("torch.cuda.is_available", return_value=True),
+        patch("torch.cuda.device_count", return_value=2),
+    ):
+        assert probe_device() == torch.device("cuda", index)
+
+
+@pytest.mark.parametrize("num_threads", [1, 4, "8"])
+def test_num_threads_resolver(num_threads: Any) -> None:
+    assert num_threads_resolver(num_threads) == int(num_threads)
+
+
+@pytest.mark.parametrize("num_threads", [0, -1])
+def test_num_threads_resolver_incorrect(num_threads: int) -> None:
+    with pytest.raises(ValueError, match="The number of threads must be greater than 0"):
+        num_threads_resolver(num_threads)
+
+
+@torch_available
+@pytest.mark.usefixtures("auto_probes")
+def test_num_threads_resolver_auto() -> None:
+    probe = Mock(return_value=6)
+    set_auto_probe("num_threads", probe)
+    conf = OmegaConf.create({f"key{i}": "${hya.torch.num_threads:auto}" for i in range(10)})
+    assert [conf[f"key{i}"] for i in range(10)] == [6] * 10
+    probe.assert_called_once_with()
+
+
+@pytest.mark.usefixtures("auto_probes")
+def test_get_auto_num_threads_min() -> None:
+    set_auto_probe("num_threads", lambda: 0)
+    assert get_auto_num_threads() == 1
+
+
+@pytest.mark.parametrize(
+    ("local_world_size", "num_threads"), [(None, 8), ("1", 8), ("3", 2), ("16", 1), ("abc", 8)]
+)
+def test_probe_num_threads(
+    monkeypatch: pytest.MonkeyPatch, local_world_size: str | None, num_threads: int
+) -> None:
+    if local_world_size is None:
+        monkeypatch.delenv("LOCAL_WORLD_SIZE", raising=False)
+    else:
+        monkeypatch.setenv("LOCAL_WORLD_SIZE", local_world_size)
+    with patch("hya.torch.get_cpu_count", return_value=8):
+        assert probe_num_threads() == num_threads
+
+
+def test_set_auto_probe_incorrect_name() -> None:
+    with pytest.raises(KeyError, match="Incorrect probe name: 'abc'"):
+        set_auto_probe("abc", lambda: 1)
+
+
+@pytest.mark.usefixtures("auto_probes")
+def test_set_auto_probe_none() -> None:
+    set_auto_probe("num_threads", lambda: 1234)
+    assert get_auto_num_threads() == 1234
+    set_auto_probe("num_threads", None)
+    assert get_auto_num_threads() == probe_num_threads()
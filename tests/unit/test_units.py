@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import pytest
+from omegaconf import OmegaConf
+from omegaconf.errors import InterpolationResolutionError
+
+from hya.units import fit_batch_resolver, parse_duration, parse_size
+
+#######################################
+#     Tests for duration_resolver     #
+#######################################
+
+
+def test_duration_resolver() -> None:
+    assert OmegaConf.create({"key": "${hya.duration:250ms}"}).key == 0.25
+
+
+def test_duration_resolver_incorrect() -> None:
+    with pytest.raises(InterpolationResolutionError, match="Incorrect duration"):
+        OmegaConf.create({"key": "${hya.duration:5 parsecs}"}).key  # noqa: B018
+
+
+########################################
+#     Tests for fit_batch_resolver     #
+########################################
+
+
+def test_fit_batch_resolver() -> None:
+    assert OmegaConf.create({"key": "${hya.fit_batch:12GiB,48MiB}"}).key == 230
+
+
+def test_fit_batch_resolver_multiple() -> None:
+    assert OmegaConf.create({"key": "${hya.fit_batch:12GiB,48MiB,0.8,64}"}).key == 192
+
+
+def test_fit_batch_resolver_bytes() -> None:
+    assert fit_batch_resolver(1000, 10, safety=1.0) == 100
+
+
+def test_fit_batch_resolver_available_memory() -> None:
+    conf = OmegaConf.create({"key": "${hya.fit_batch:${hya.available_memory:},1KiB}"})
+    assert conf.key >= 1
+
+
+def test_fit_batch_resolver_interpolations() -> None:
+    conf = OmegaConf.create(
+        {
+            "budget": "16GiB",
+            "per_sample": "${hya.mul:1024,1024,3,4}",
+            "key": "${hya.fit_batch:${budget},${per_sample},1.0,8}",
+        }
+    )
+    assert conf.key == 1360
+
+
+def test_fit_batch_resolver_too_small() -> None:
+    with pytest.raises(ValueError, match="is too small to fit a batch of 8 samples"):
+        fit_batch_resolver("1MiB", "256KiB", multiple=8)
+
+
+@pytest.mark.parametrize("safety", [0, -0.5, 1.5])
+def test_fit_batch_resolver_incorrect_safety(safety: float) -> None:
+    with pytest.raises(ValueError, match=r"safety must be in \(0, 1\]"):
+        fit_batch_resolver("1GiB", "1MiB", safety=safety)
+
+
+def test_fit_batch_resolver_incorrect_multiple() -> None:
+    with pytest.raises(ValueError, match="multiple must be greater than 0"):
+        fit_batch_resolver("1GiB", "1MiB", multiple=0)
+
+
+@pytest.mark.parametrize("budget", [-100, -1])
+def test_fit_batch_resolver_negative_budget(budget: int) -> None:
+    with pytest.raises(ValueError, match="budget must be greater than or equal to 0"):
+        fit_batch_resolver(budget, 4)
+
+
+def test_fit_batch_resolver_negative_budget_config() -> None:
+    conf = OmegaConf.create({"key": "${hya.fit_batch:-100,4}"})
+    with pytest.raises(InterpolationResolutionError, match="budget must be greater"):
+        conf.key  # noqa: B018
+
+
+def test_fit_batch_resolver_incorrect_per_sample() -> None:
+    with pytest.raises(ValueError, match="per_sample must be greater than 0"):
+        fit_batch_resolver("1GiB", 0)
+
+
+####################################
+#     Tests for parse_duration     #
+####################################
+
+
+@pytest.mark.parametrize(
+    ("duration", "seconds"),
+    [
+        ("10ns", 1e-8),
+        ("500us", 5e-4),
+        ("250ms", 0.25),
+        ("1.5s", 1.5),
+        ("2", 2.0),
+        ("2m", 120.0),
+        ("2 min", 120.0),
+        ("1h", 3600.0),
+        ("1.5MS", 1.5e-3),
+        (3, 3.0),
+        (0.5, 0.5),
+    ],
+)
+def test_parse_duration(duration: str | float, seconds: float) -> None:
+    output = parse_duration(duration)
+    assert output == pytest.approx(seconds)
+    assert isinstance(output, float)
+
+
+@pytest.mark.parametrize("duration", ["", "ms", "1 day", "1.2.3s", "-1s", True])
+def test_parse_duration_incorrect(duration: str) -> None:
+    with pytest.raises(ValueError, match="Incorrect duration"):
+        parse_duration(duration)
+
+
+################################
+#     Tests for parse_size     #
+################################
+
+
+@pytest.mark.parametrize(
+    ("size", "num_bytes"),
+    [
+        ("0", 0),
+        ("512", 512),
+        ("512B", 512),
+        ("4KiB", 4096),
+        ("4kib", 4096),
+        ("4K", 4096),
+        ("1.5MiB", 1572864),
+        ("12GiB", 12884901888),
+        ("2TiB", 2199023255552),
+        ("1KB", 1000),
+        ("1.5 MB", 1500000),
+        ("3GB", 3000000000),
+        ("1e3", 1000),
+        (" 8 MiB ", 8388608),
+        (1024, 1024),
+        (1.5, 1),
+    ],
+)
+def test_parse_size(size: str | float, num_bytes: int) -> None:
+    output = parse_size(size)
+    assert output == num_bytes
+    assert isinstance(output, int)
+
+
+def test_parse_size_large_exact() -> None:
+    assert parse_size("123456789123456789TiB") == 123456789123456789 * 1024**4
+
+
+@pytest.mark.parametrize("size", ["", "GiB", "12 gigabytes", "1,5GiB", "-1KiB", "12ms"])
+def test_parse_size_incorrect(size: str) -> None:
+    with pytest.raises(ValueError, match="Incorrect size"):
+        parse_size(size)
+
+
+###################################
+#     Tests for size_resolver     #
+###################################
+
+
+def test_size_resolver() -> None:
+    assert OmegaConf.create({"key": "${hya.size:4KiB}"}).key == 4096
+
+
+def test_size_resolver_incorrect() -> None:
+    with pytest.raises(InterpolationResolutionError, match="Incorrect size"):
+        OmegaConf.create({"key": "${hya.size:4 bananas}"}).key  # noqa: B018
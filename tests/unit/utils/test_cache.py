@@ -0,0 +1,470 @@
+from __future__ import annotations
+
+import gc
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
+
+import pytest
+from omegaconf import OmegaConf
+
+from hya.imports import is_numpy_available
+from hya.testing import numpy_available
+from hya.utils.cache import (
+    CacheStats,
+    InternTable,
+    LRUCache,
+    ResultCache,
+    get_file_key,
+    get_intern_table,
+    get_nbytes,
+    get_result_cache,
+    memoize,
+)
+
+if is_numpy_available():
+    import numpy as np
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+##############################
+#     Tests for LRUCache     #
+##############################
+
+
+def test_lru_cache_get() -> None:
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+
+
+def test_lru_cache_get_missing() -> None:
+    assert LRUCache(max_size=2).get("a") is None
+
+
+def test_lru_cache_get_default() -> None:
+    assert LRUCache(max_size=2).get("a", 42) == 42
+
+
+def test_lru_cache_contains() -> None:
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_lru_cache_repr() -> None:
+    assert repr(LRUCache(max_size=2)).startswith("LRUCache(")
+
+
+def test_lru_cache_put_overwrite() -> None:
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("a", 2)
+    assert len(cache) == 1
+    assert cache.get("a") == 2
+
+
+def test_lru_cache_evict_max_size() -> None:
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_lru_cache_evict_max_bytes() -> None:
+    cache = LRUCache(max_size=10, max_bytes=10, sizeof=len)
+    cache.put("a", b"0123")
+    cache.put("b", b"0123")
+    cache.put("c", b"0123")
+    assert cache.nbytes == 8
+    assert "a" not in cache
+    assert "b" in cache
+    assert "c" in cache
+
+
+def test_lru_cache_put_too_large() -> None:
+    cache = LRUCache(max_size=10, max_bytes=10, sizeof=len)
+    cache.put("a", b"0123456789abc")
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_lru_cache_nbytes_overwrite() -> None:
+    cache = LRUCache(max_size=10, max_bytes=10, sizeof=len)
+    cache.put("a", b"0123")
+    cache.put("a", b"01")
+    assert cache.nbytes == 2
+
+
+def test_lru_cache_nbytes_unbounded() -> None:
+    cache = LRUCache(max_size=10)
+    cache.put("a", b"0123")
+    assert cache.nbytes == 0
+
+
+def test_lru_cache_clear() -> None:
+    cache = LRUCache(max_size=10, max_bytes=10, sizeof=len)
+    cache.put("a", b"0123")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_lru_cache_pop() -> None:
+    cache = LRUCache(max_size=2, max_bytes=100, sizeof=len)
+    cache.put("a", "abc")
+    assert cache.pop("a") == "abc"
+    assert "a" not in cache
+    assert cache.nbytes == 0
+
+
+def test_lru_cache_pop_missing() -> None:
+    assert LRUCache(max_size=2).pop("a", 42) == 42
+
+
+class Large:
+    r"""Define a large value that supports weak references."""
+
+    nbytes = 1 << 21
+
+
+#################################
+#     Tests for ResultCache     #
+#################################
+
+
+def test_result_cache_get() -> None:
+    cache = ResultCache()
+    cache.put("a", [1, 2, 3])
+    assert cache.get("a") == [1, 2, 3]
+
+
+def test_result_cache_get_missing() -> None:
+    assert ResultCache().get("a") is None
+
+
+def test_result_cache_get_default() -> None:
+    assert ResultCache().get("a", 42) == 42
+
+
+def test_result_cache_get_same_object() -> None:
+    cache = ResultCache()
+    value = [1, 2, 3]
+    cache.put("a", value)
+    assert cache.get("a") is value
+
+
+def test_result_cache_get_none() -> None:
+    cache = ResultCache()
+    cache.put("a", None)
+    assert cache.get("a", 42) is None
+
+
+def test_result_cache_contains() -> None:
+    cache = ResultCache()
+    cache.put("a", 1)
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_result_cache_len() -> None:
+    cache = ResultCache()
+    cache.put("a", 1)
+    cache.put("b", Large())
+    assert len(cache) == 1
+
+
+def test_result_cache_repr() -> None:
+    assert repr(ResultCache()).startswith("ResultCache(")
+
+
+def test_result_cache_stats() -> None:
+    cache = ResultCache()
+    cache.put("a", "abc")
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    assert cache.stats == CacheStats(hits=2, misses=1, nbytes_saved=6, size=1, nbytes=3)
+
+
+def test_result_cache_weak_value() -> None:
+    cache = ResultCache()
+    value = Large()
+    cache.put("a", value)
+    assert cache.get("a") is value
+    assert cache.stats.nbytes == 0
+    assert cache.stats.nbytes_saved == 1 << 21
+
+
+def test_result_cache_weak_value_collected() -> None:
+    cache = ResultCache()
+    cache.put("a", Large())
+    gc.collect()
+    assert "a" not in cache
+    assert cache.get("a") is None
+
+
+def test_result_cache_weak_value_not_weakrefable() -> None:
+    cache = ResultCache(max_bytes=10 << 20, weak_bytes=100)
+    cache.put("a", "x" * 1000)
+    assert cache.get("a") == "x" * 1000
+    assert cache.stats.nbytes == 1000
+
+
+def test_result_cache_weak_value_replaced() -> None:
+    cache = ResultCache()
+    value = Large()
+    cache.put("a", value)
+    cache.put("a", 1)
+    del value
+    gc.collect()
+    assert cache.get("a") == 1
+
+
+def test_result_cache_strong_value_replaced() -> None:
+    cache = ResultCache()
+    cache.put("a", 1)
+    value = Large()
+    cache.put("a", value)
+    assert cache.get("a") is value
+    assert len(cache) == 1
+
+
+def test_result_cache_evict_max_size() -> None:
+    cache = ResultCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    assert "a" not in cache
+    assert len(cache) == 2
+
+
+def test_result_cache_sizeof() -> None:
+    cache = ResultCache(max_bytes=10, sizeof=lambda _: 5)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    assert "a" not in cache
+    assert cache.stats.nbytes == 10
+
+
+def test_result_cache_clear() -> None:
+    cache = ResultCache()
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert cache.stats == CacheStats(hits=0, misses=0, nbytes_saved=0, size=0, nbytes=0)
+
+
+#################################
+#     Tests for InternTable     #
+#################################
+
+
+def test_intern_table_intern() -> None:
+    table = InternTable()
+    value = Large()
+    assert table.intern("a", value) is value
+    assert table.intern("a", Large()) is value
+    assert table.stats == CacheStats(hits=1, misses=1, nbytes_saved=1 << 21, size=1, nbytes=1 << 21)
+
+
+def test_intern_table_intern_factory() -> None:
+    table = InternTable()
+    value = Large()
+    factory = Mock(return_value=value)
+    assert table.intern("a", Large(), factory) is value
+    assert table.intern("a", Large(), factory) is value
+    factory.assert_called_once()
+
+
+def test_intern_table_different_keys() -> None:
+    table = InternTable()
+    value1, value2 = Large(), Large()
+    assert table.intern("a", value1) is value1
+    assert table.intern("b", value2) is value2
+    assert len(table) == 2
+
+
+def test_intern_table_value_collected() -> None:
+    table = InternTable()
+    table.intern("a", Large())
+    gc.collect()
+    assert "a" not in table
+    value = Large()
+    assert table.intern("a", value) is value
+    assert table.stats.misses == 2
+
+
+def test_intern_table_not_weakrefable() -> None:
+    with pytest.raises(TypeError):
+        InternTable().intern("a", 1)
+
+
+def test_intern_table_sizeof() -> None:
+    table = InternTable(sizeof=lambda _: 5)
+    value = Large()
+    table.intern("a", value)
+    table.intern("a", value)
+    assert table.stats.nbytes_saved == 5
+    assert table.stats.nbytes == 5
+
+
+def test_intern_table_clear() -> None:
+    table = InternTable()
+    value = Large()
+    table.intern("a", value)
+    table.intern("a", value)
+    table.clear()
+    assert table.stats == CacheStats(hits=0, misses=0, nbytes_saved=0, size=0, nbytes=0)
+
+
+def test_intern_table_repr() -> None:
+    assert repr(InternTable()).startswith("InternTable(")
+
+
+################################
+#     Tests for get_nbytes     #
+################################
+
+
+@pytest.mark.parametrize(("value", "nbytes"), [(b"abc", 3), ("abcd", 4), (bytearray(5), 5)])
+def test_get_nbytes(value: Any, nbytes: int) -> None:
+    assert get_nbytes(value) == nbytes
+
+
+@numpy_available
+def test_get_nbytes_ndarray() -> None:
+    assert get_nbytes(np.zeros(10, dtype=np.float32)) == 40
+
+
+def test_get_nbytes_object() -> None:
+    assert get_nbytes([1, 2, 3]) > 0
+
+
+######################################
+#     Tests for get_result_cache     #
+######################################
+
+
+def test_get_result_cache() -> None:
+    assert isinstance(get_result_cache(), ResultCache)
+    assert get_result_cache() is get_result_cache()
+
+
+######################################
+#     Tests for get_intern_table     #
+######################################
+
+
+def test_get_intern_table() -> None:
+    assert isinstance(get_intern_table(), InternTable)
+    assert get_intern_table() is get_intern_table()
+
+
+#############################
+#     Tests for memoize     #
+#############################
+
+
+def test_memoize() -> None:
+    cache = ResultCache()
+    resolver = Mock(side_effect=lambda x: x * 2)
+    func = memoize("double", cache)(resolver)
+    assert func(3) == 6
+    assert func(3) == 6
+    assert func(4) == 8
+    assert resolver.call_count == 2
+    assert cache.stats.hits == 1
+
+
+def test_memoize_same_result() -> None:
+    func = memoize("list", ResultCache())(lambda n: list(range(n)))
+    assert func(3) is func(3)
+
+
+def test_memoize_different_keys() -> None:
+    cache = ResultCache()
+    resolver = Mock(side_effect=lambda x: x * 2)
+    memoize("double1", cache)(resolver)(3)
+    memoize("double2", cache)(resolver)(3)
+    assert resolver.call_count == 2
+
+
+def test_memoize_configs() -> None:
+    cache = ResultCache()
+    resolver = Mock(side_effect=sum)
+    func = memoize("sum", cache)(resolver)
+    assert func(OmegaConf.create({"a": [1, 2]}).a) == 3
+    assert func(OmegaConf.create({"b": [1, 2]}).b) == 3
+    assert resolver.call_count == 1
+
+
+def test_memoize_unhashable_arguments() -> None:
+    cache = ResultCache()
+    resolver = Mock(return_value=1)
+    func = memoize("func", cache)(resolver)
+    assert func(object()) == 1
+    assert func(object()) == 1
+    assert resolver.call_count == 2
+    assert len(cache) == 0
+
+
+def test_memoize_default_cache() -> None:
+    get_result_cache().clear()
+    func = memoize("test_memoize_default_cache")(lambda x: x * 2)
+    assert func(3) == 6
+    assert func(3) == 6
+    assert get_result_cache().stats.hits == 1
+
+
+def test_memoize_wraps() -> None:
+    def double(x: int) -> int:
+        return x * 2
+
+    assert memoize("double", ResultCache())(double).__name__ == "double"
+
+
+def test_memoize_root_argument() -> None:
+    def resolver(value: int, _root_: Any) -> int:  # noqa: ARG001
+        return value
+
+    with pytest.raises(ValueError, match="cannot be cached"):
+        memoize("func", ResultCache())(resolver)
+
+
+##################################
+#     Tests for get_file_key     #
+##################################
+
+
+def test_get_file_key(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    path.write_text("abc")
+    key = get_file_key(path)
+    assert key == (path.as_posix(), path.stat().st_mtime_ns, 3)
+
+
+def test_get_file_key_str(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    path.write_text("abc")
+    assert get_file_key(str(path)) == get_file_key(path)
+
+
+def test_get_file_key_changed(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    path.write_text("abc")
+    key = get_file_key(path)
+    path.write_text("abcdef")
+    assert get_file_key(path) != key
+
+
+def test_get_file_key_missing(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        get_file_key(tmp_path.joinpath("missing.txt"))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+from omegaconf import ListConfig, OmegaConf
+from omegaconf.errors import MissingMandatoryValue
+
+from hya.utils.containers import to_primitive
+
+##################################
+#     Tests for to_primitive     #
+##################################
+
+
+def test_to_primitive_list_config() -> None:
+    output = to_primitive(OmegaConf.create([1, 2.5, "abc", None, True]))
+    assert output == [1, 2.5, "abc", None, True]
+    assert type(output) is list
+
+
+def test_to_primitive_list_config_numbers() -> None:
+    output = to_primitive(OmegaConf.create([1, 2.5, None, True, -3]))
+    assert output == [1, 2.5, None, True, -3]
+    assert [type(value) for value in output] == [int, float, type(None), bool, int]
+
+
+def test_to_primitive_list_config_nested() -> None:
+    assert to_primitive(OmegaConf.create([[1, 2], [3, [4]], {"a": 5}])) == [
+        [1, 2],
+        [3, [4]],
+        {"a": 5},
+    ]
+
+
+def test_to_primitive_list_config_interpolation() -> None:
+    conf = OmegaConf.create({"a": 1, "b": [3, 4], "c": ["${a}", "x${a}", "${b}"]})
+    assert to_primitive(conf.c) == [1, "x1", [3, 4]]
+
+
+def test_to_primitive_list_config_escaped_interpolation() -> None:
+    conf = OmegaConf.create({"a": [r"\${b}"]})
+    assert to_primitive(conf.a) == ["${b}"]
+
+
+def test_to_primitive_list_config_resolver() -> None:
+    conf = OmegaConf.create({"a": ["${hya.add:1,2}"]})
+    assert to_primitive(conf.a) == [3]
+
+
+def test_to_primitive_list_config_missing_value() -> None:
+    conf = OmegaConf.create({"a": [1, "???"]})
+    with pytest.raises(MissingMandatoryValue):
+        to_primitive(conf.a)
+
+
+def test_to_primitive_list_config_none() -> None:
+    assert to_primitive(ListConfig(content=None)) is None
+
+
+def test_to_primitive_list_config_empty() -> None:
+    assert to_primitive(OmegaConf.create([])) == []
+
+
+def test_to_primitive_dict_config() -> None:
+    conf = OmegaConf.create({"a": 1, "b": {"c": "${a}"}})
+    assert to_primitive(conf.b) == {"c": 1}
+
+
+@pytest.mark.parametrize("data", [1, 2.5, "abc", None, [1, 2], (1, 2), {"a": 1}])
+def test_to_primitive_unchanged(data: object) -> None:
+    assert to_primitive(data) is data
@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock, patch
+
+import pytest
+from omegaconf import OmegaConf
+
+from hya.imports import is_numpy_available
+from hya.testing import numpy_available
+from hya.utils.disk_cache import (
+    DISK_CACHE_ENV,
+    DiskCache,
+    get_code_hash,
+    get_default_disk_cache,
+    hash_arguments,
+    persistent_cache,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+if is_numpy_available():
+    import numpy as np
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Generator[DiskCache]:
+    cache = DiskCache(tmp_path.joinpath("cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+def put_values(cache: DiskCache | str, start: int) -> None:
+    if isinstance(cache, str):
+        cache = DiskCache(cache)
+    for i in range(start, start + 20):
+        cache.put(f"key{i}", i)
+    cache.close()
+
+
+###############################
+#     Tests for DiskCache     #
+###############################
+
+
+def test_disk_cache_get(cache: DiskCache) -> None:
+    cache.put("a", {"b": [1, 2, 3]})
+    assert cache.get("a") == {"b": [1, 2, 3]}
+
+
+def test_disk_cache_get_missing(cache: DiskCache) -> None:
+    assert cache.get("a") is None
+
+
+def test_disk_cache_get_default(cache: DiskCache) -> None:
+    assert cache.get("a", 42) == 42
+
+
+def test_disk_cache_get_corrupted(cache: DiskCache, caplog: pytest.LogCaptureFixture) -> None:
+    cache.put("a", 1)
+    with sqlite3.connect(cache.path) as connection:
+        connection.execute("UPDATE entries SET value = ? WHERE key = 'a'", (b"invalid",))
+    assert cache.get("a", 42) == 42
+    assert "a" not in cache
+    assert "Failed to unpickle the cached value" in caplog.text
+
+
+def test_disk_cache_put_replace(cache: DiskCache) -> None:
+    cache.put("a", 1)
+    cache.put("a", 2)
+    assert cache.get("a") == 2
+    assert len(cache) == 1
+
+
+def test_disk_cache_put_too_large(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path.joinpath("cache.sqlite"), max_bytes=100)
+    cache.put("a", "x" * 1000)
+    assert "a" not in cache
+    cache.close()
+
+
+def test_disk_cache_put_evict_least_recently_used(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path.joinpath("cache.sqlite"), max_bytes=250)
+    cache.put("a", "a" * 100)
+    cache.put("b", "b" * 100)
+    cache.get("a")
+    cache.put("c", "c" * 10)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.nbytes <= 250
+    cache.close()
+
+
+def test_disk_cache_put_not_picklable(cache: DiskCache) -> None:
+    with pytest.raises(AttributeError):
+        cache.put("a", lambda x: x)
+    assert "a" not in cache
+
+
+def test_disk_cache_contains(cache: DiskCache) -> None:
+    cache.put("a", 1)
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_disk_cache_len(cache: DiskCache) -> None:
+    assert len(cache) == 0
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert len(cache) == 2
+
+
+def test_disk_cache_nbytes(cache: DiskCache) -> None:
+    assert cache.nbytes == 0
+    cache.put("a", 1)
+    assert cache.nbytes > 0
+
+
+def test_disk_cache_path(tmp_path: Path) -> None:
+    assert DiskCache(tmp_path.joinpath("cache.sqlite")).path == tmp_path.joinpath("cache.sqlite")
+
+
+def test_disk_cache_repr(cache: DiskCache) -> None:
+    assert repr(cache).startswith("DiskCache(")
+
+
+def test_disk_cache_clear(cache: DiskCache) -> None:
+    cache.put("a", 1)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_disk_cache_close(cache: DiskCache) -> None:
+    cache.put("a", 1)
+    cache.close()
+    assert cache.get("a") == 1
+
+
+def test_disk_cache_persistent(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path.joinpath("cache.sqlite"))
+    cache.put("a", 1)
+    cache.close()
+    assert DiskCache(tmp_path.joinpath("cache.sqlite")).get("a") == 1
+
+
+def test_disk_cache_create_parent(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path.joinpath("a", "b", "cache.sqlite"))
+    cache.put("a", 1)
+    assert cache.path.is_file()
+    cache.close()
+
+
+def test_disk_cache_threads(cache: DiskCache) -> None:
+    threads = [
+        threading.Thread(target=put_values, args=(cache, start)) for start in range(0, 80, 20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) == 80
+    assert cache.get("key42") == 42
+
+
+def test_disk_cache_processes(cache: DiskCache) -> None:
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=put_values, args=(cache.path.as_posix(), start))
+        for start in range(0, 40, 20)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert all(process.exitcode == 0 for process in processes)
+    assert len(cache) == 40
+    assert cache.get("key32") == 32
+
+
+###################################
+#     Tests for get_code_hash     #
+###################################
+
+
+def test_get_code_hash_same_code() -> None:
+    def func1(x: int) -> int:
+        return x + 1
+
+    def func2(x: int) -> int:
+        return x + 1
+
+    assert get_code_hash(func1) == get_code_hash(func2)
+
+
+def test_get_code_hash_different_constants() -> None:
+    assert get_code_hash(lambda x: x + 1) != get_code_hash(lambda x: x + 2)
+
+
+def test_get_code_hash_different_names() -> None:
+    assert get_code_hash(lambda x: x.real) != get_code_hash(lambda x: x.imag)
+
+
+def test_get_code_hash_nested_function() -> None:
+    def func1() -> int:
+        return sum(map(lambda x: x + 1, [1, 2]))  # noqa: C417
+
+    def func2() -> int:
+        return sum(map(lambda x: x + 2, [1, 2]))  # noqa: C417
+
+    assert get_code_hash(func1) != get_code_hash(func2)
+
+
+def test_get_code_hash_different_defaults() -> None:
+    def func1(x: int, scale: int = 2) -> int:
+        return x * scale
+
+    def func2(x: int, scale: int = 3) -> int:
+        return x * scale
+
+    assert get_code_hash(func1) != get_code_hash(func2)
+
+
+def test_get_code_hash_different_kwdefaults() -> None:
+    def func1(x: int, *, scale: int = 2) -> int:
+        return x * scale
+
+    def func2(x: int, *, scale: int = 3) -> int:
+        return x * scale
+
+    assert get_code_hash(func1) != get_code_hash(func2)
+
+
+def make_scaler(scale: Any) -> Callable[[int], int]:
+    def func(x: int) -> int:
+        return x * scale
+
+    return func
+
+
+def test_get_code_hash_different_closures() -> None:
+    assert get_code_hash(make_scaler(2)) == get_code_hash(make_scaler(2))
+    assert get_code_hash(make_scaler(2)) != get_code_hash(make_scaler(3))
+    assert get_code_hash(make_scaler([1, 2])) != get_code_hash(make_scaler([1, 3]))
+
+
+def test_get_code_hash_closure_function() -> None:
+    assert get_code_hash(make_scaler(lambda x: x + 1)) != get_code_hash(
+        make_scaler(lambda x: x + 2)
+    )
+
+
+def test_get_code_hash_closure_object() -> None:
+    # The objects without a canonical hash only contribute their type.
+    assert get_code_hash(make_scaler(object())) == get_code_hash(make_scaler(object()))
+    assert get_code_hash(make_scaler(object())) != get_code_hash(make_scaler(Mock()))
+
+
+def test_get_code_hash_empty_cell() -> None:
+    def func() -> int:
+        return value
+
+    code_hash = get_code_hash(func)
+    value = 1
+    assert get_code_hash(func) != code_hash
+
+
+def test_get_code_hash_mock() -> None:
+    assert get_code_hash(Mock()) == get_code_hash(Mock())
+
+
+####################################
+#     Tests for hash_arguments     #
+####################################
+
+
+def test_hash_arguments_same() -> None:
+    assert hash_arguments(1, "a", key=[1.5, None]) == hash_arguments(1, "a", key=[1.5, None])
+
+
+@pytest.mark.parametrize(
+    ("args1", "args2"),
+    [
+        ((1,), (1.0,)),
+        ((1,), (True,)),
+        (("1",), (1,)),
+        (([1, 2],), ((1, 2),)),
+        (([1, 2],), ([2, 1],)),
+        (([[1], 2],), ([1, [2]],)),
+        ((b"a",), ("a",)),
+    ],
+)
+def test_hash_arguments_different(args1: tuple, args2: tuple) -> None:
+    assert hash_arguments(*args1) != hash_arguments(*args2)
+
+
+def test_hash_arguments_args_kwargs() -> None:
+    assert hash_arguments(1) != hash_arguments(a=1)
+
+
+def test_hash_arguments_dict_order() -> None:
+    assert hash_arguments({"a": 1, "b": 2}) == hash_arguments({"b": 2, "a": 1})
+
+
+def test_hash_arguments_config() -> None:
+    conf = OmegaConf.create({"a": [1, {"b": 2}]})
+    assert hash_arguments(conf) == hash_arguments({"a": [1, {"b": 2}]})
+
+
+def test_hash_arguments_path() -> None:
+    assert hash_arguments(Path("/tmp/a")) == hash_arguments(Path("/tmp/a"))  # noqa: S108
+    assert hash_arguments(Path("/tmp/a")) != hash_arguments("/tmp/a")  # noqa: S108
+
+
+@numpy_available
+def test_hash_arguments_ndarray() -> None:
+    assert hash_arguments(np.arange(6).reshape(2, 3)) == hash_arguments(np.arange(6).reshape(2, 3))
+    assert hash_arguments(np.arange(6).reshape(2, 3)) != hash_arguments(np.arange(6).reshape(3, 2))
+    assert hash_arguments(np.arange(6).reshape(2, 3).T) == hash_arguments(
+        np.ascontiguousarray(np.arange(6).reshape(2, 3).T)
+    )
+
+
+def test_hash_arguments_unsupported() -> None:
+    with pytest.raises(TypeError, match="Cannot hash an object of type object"):
+        hash_arguments(object())
+
+
+######################################
+#     Tests for persistent_cache     #
+######################################
+
+
+def test_persistent_cache(cache: DiskCache) -> None:
+    resolver = Mock(side_effect=lambda x: x * 2)
+    func = persistent_cache("double", cache)(resolver)
+    assert func(3) == 6
+    assert func(3) == 6
+    assert func(4) == 8
+    assert resolver.call_count == 2
+    assert len(cache) == 2
+
+
+def test_persistent_cache_shared(cache: DiskCache) -> None:
+    resolver1 = Mock(side_effect=lambda x: x * 2)
+    resolver2 = Mock(side_effect=lambda x: x * 2)
+    assert persistent_cache("double", cache)(resolver1)(3) == 6
+    assert persistent_cache("double", cache)(resolver2)(3) == 6
+    assert resolver1.call_count == 1
+    assert resolver2.call_count == 0
+
+
+def test_persistent_cache_different_keys(cache: DiskCache) -> None:
+    resolver = Mock(side_effect=lambda x: x * 2)
+    assert persistent_cache("double1", cache)(resolver)(3) == 6
+    assert persistent_cache("double2", cache)(resolver)(3) == 6
+    assert resolver.call_count == 2
+
+
+def test_persistent_cache_code_changed(cache: DiskCache) -> None:
+    assert persistent_cache("func", cache)(lambda x: x + 1)(3) == 4
+    assert persistent_cache("func", cache)(lambda x: x + 2)(3) == 5
+
+
+def test_persistent_cache_unhashable_arguments(cache: DiskCache) -> None:
+    resolver = Mock(return_value=1)
+    func = persistent_cache("func", cache)(resolver)
+    assert func(object()) == 1
+    assert func(object()) == 1
+    assert resolver.call_count == 2
+    assert len(cache) == 0
+
+
+def test_persistent_cache_not_picklable(cache: DiskCache) -> None:
+    func = persistent_cache("func", cache)(lambda x: lambda: x)
+    assert func(3)() == 3
+    assert len(cache) == 0
+
+
+def test_persistent_cache_wraps(cache: DiskCache) -> None:
+    def double(x: int) -> int:
+        return x * 2
+
+    assert persistent_cache("double", cache)(double).__name__ == "double"
+
+
+def test_persistent_cache_default_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(DISK_CACHE_ENV, tmp_path.joinpath("cache.sqlite").as_posix())
+    assert persistent_cache("double")(lambda x: x * 2)(3) == 6
+    assert len(get_default_disk_cache()) == 1
+
+
+def test_persistent_cache_unwritable_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    # The parent of the database is a file, so the database cannot be created.
+    tmp_path.joinpath("file").write_text("")
+    monkeypatch.setenv(DISK_CACHE_ENV, tmp_path.joinpath("file", "cache.sqlite").as_posix())
+    OmegaConf.register_new_resolver(
+        "test.persistent_double", persistent_cache("double")(lambda x: x * 2), replace=True
+    )
+    try:
+        with caplog.at_level(logging.WARNING):
+            assert OmegaConf.create({"key": "${test.persistent_double:21}"}).key == 42
+    finally:
+        OmegaConf.clear_resolver("test.persistent_double")
+    assert "Failed to read the disk cache" in caplog.text
+
+
+def test_persistent_cache_put_error(cache: DiskCache, caplog: pytest.LogCaptureFixture) -> None:
+    with (
+        patch.object(cache, "put", side_effect=sqlite3.OperationalError("database is locked")),
+        caplog.at_level(logging.WARNING),
+    ):
+        assert persistent_cache("double", cache)(lambda x: x * 2)(3) == 6
+    assert "Failed to write the disk cache" in caplog.text
+    assert len(cache) == 0
+
+
+def test_persistent_cache_root_argument(cache: DiskCache) -> None:
+    def resolver(value: int, _root_: Any) -> int:  # noqa: ARG001
+        return value
+
+    with pytest.raises(ValueError, match="cannot be cached"):
+        persistent_cache("func", cache)(resolver)
+
+
+############################################
+#     Tests for get_default_disk_cache     #
+############################################
+
+
+def test_get_default_disk_cache_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(DISK_CACHE_ENV, tmp_path.joinpath("cache.sqlite").as_posix())
+    cache = get_default_disk_cache()
+    assert cache.path == tmp_path.joinpath("cache.sqlite")
+    assert get_default_disk_cache() is cache
+
+
+def test_get_default_disk_cache_xdg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(DISK_CACHE_ENV, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", tmp_path.as_posix())
+    assert get_default_disk_cache().path == tmp_path.joinpath("hya", "resolvers.sqlite")
+
+
+def test_get_default_disk_cache_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(DISK_CACHE_ENV, raising=False)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    assert get_default_disk_cache().path.parts[-3:] == (".cache", "hya", "resolvers.sqlite")
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from hya.imports import is_numpy_available
+from hya.testing import numpy_available
+from hya.utils.dtypes import (
+    DTYPE_ALIASES,
+    NUMPY_DTYPE_PREFIXES,
+    TORCH_DTYPE_NAMES,
+    TORCH_DTYPE_PREFIXES,
+    build_dtype_table,
+    get_dtype_name,
+)
+
+if is_numpy_available():
+    import numpy as np
+
+#######################################
+#     Tests for build_dtype_table     #
+#######################################
+
+
+def test_build_dtype_table() -> None:
+    table = build_dtype_table({"float16": 16, "float32": 32})
+    assert table["float16"] == 16
+    assert table["fp16"] == 16
+    assert table["half"] == 16
+    assert table["single"] == 32
+    assert "np.float32" not in table
+    assert "torch.float32" not in table
+
+
+def test_build_dtype_table_prefixes() -> None:
+    table = build_dtype_table({"float32": 32}, prefixes=NUMPY_DTYPE_PREFIXES)
+    assert table["np.float32"] == 32
+    assert table["numpy.float32"] == 32
+    assert "torch.float32" not in table
+
+
+def test_build_dtype_table_prefixed_aliases() -> None:
+    assert build_dtype_table({"float16": 16}, prefixes=TORCH_DTYPE_PREFIXES)["torch.half"] == 16
+
+
+def test_build_dtype_table_foreign_names() -> None:
+    table = build_dtype_table(
+        {"float32": 32, "float64": 64, "float": "native"},
+        prefixes=NUMPY_DTYPE_PREFIXES,
+        foreign_names={"torch.float": "float32", "torch.bfloat16": "bfloat16"},
+    )
+    assert table["torch.float"] == 32
+    assert table["np.float"] == "native"
+    assert "torch.bfloat16" not in table
+
+
+def test_torch_dtype_names() -> None:
+    assert TORCH_DTYPE_NAMES["float"] == "float32"
+    assert TORCH_DTYPE_NAMES["int"] == "int32"
+    assert TORCH_DTYPE_NAMES["long"] == "int64"
+
+
+def test_build_dtype_table_missing_names() -> None:
+    table = build_dtype_table({"float32": 32})
+    assert "bf16" not in table
+    assert "fp16" not in table
+
+
+def test_build_dtype_table_native_names_first() -> None:
+    assert build_dtype_table({"float64": 64, "double": "native"})["double"] == "native"
+
+
+def test_build_dtype_table_empty() -> None:
+    assert build_dtype_table({}) == {}
+
+
+def test_dtype_aliases() -> None:
+    assert DTYPE_ALIASES["bf16"] == "bfloat16"
+    assert DTYPE_ALIASES["fp16"] == "float16"
+
+
+####################################
+#     Tests for get_dtype_name     #
+####################################
+
+
+def test_get_dtype_name_str() -> None:
+    assert get_dtype_name(" fp16 ") == "fp16"
+
+
+@numpy_available
+def test_get_dtype_name_numpy_dtype() -> None:
+    assert get_dtype_name(np.dtype("float32")) == "float32"
+
+
+@numpy_available
+def test_get_dtype_name_numpy_type() -> None:
+    assert get_dtype_name(np.int64) == "int64"
+
+
+def test_get_dtype_name_other() -> None:
+    assert get_dtype_name(object()).startswith("<object object")
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import ctypes
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import threading
+import time
+import uuid
+
+import pytest
+
+from hya.utils.shared_memory import (
+    SHARED_MEMORY_PREFIX,
+    get_shared_buffer,
+    get_shared_memory_name,
+    release_shared_memory,
+)
+
+
+@pytest.fixture
+def key() -> str:
+    return f"test_{uuid.uuid4().hex}"
+
+
+def create_segment(key: str) -> None:
+    get_shared_buffer(key, lambda: ({"value": "child"}, b"child"))
+
+
+def read_segment(key: str, queue: multiprocessing.Queue) -> None:
+    def factory() -> tuple[dict, bytes]:
+        msg = "the segment should exist"
+        raise RuntimeError(msg)
+
+    metadata, data = get_shared_buffer(key, factory)
+    queue.put((metadata, bytes(data)))
+
+
+def segment_exists(key: str) -> bool:
+    try:
+        segment = SharedMemory(get_shared_memory_name(key))
+    except FileNotFoundError:
+        return False
+    segment.close()
+    return True
+
+
+#######################################
+#     Tests for get_shared_buffer     #
+#######################################
+
+
+def test_get_shared_buffer(key: str) -> None:
+    metadata, data = get_shared_buffer(key, lambda: ({"shape": [3]}, b"abc"))
+    assert metadata == {"shape": [3]}
+    assert bytes(data) == b"abc"
+    assert segment_exists(key)
+
+
+def test_get_shared_buffer_factory_called_once(key: str) -> None:
+    calls = []
+
+    def factory() -> tuple[dict, bytes]:
+        calls.append(1)
+        return {}, b"abc"
+
+    get_shared_buffer(key, factory)
+    _, data = get_shared_buffer(key, factory)
+    assert bytes(data) == b"abc"
+    assert len(calls) == 1
+
+
+def test_get_shared_buffer_empty(key: str) -> None:
+    metadata, data = get_shared_buffer(key, lambda: ({}, b""))
+    assert metadata == {}
+    assert data.nbytes == 0
+
+
+def test_get_shared_buffer_aligned(key: str) -> None:
+    _, data = get_shared_buffer(key, lambda: ({"name": "x" * 100}, b"abc"))
+    assert bytes(data) == b"abc"
+    assert ctypes.addressof(ctypes.c_char.from_buffer(data)) % 64 == 0
+
+
+def test_get_shared_buffer_shared_memory(key: str) -> None:
+    _, data1 = get_shared_buffer(key, lambda: ({}, bytearray(b"abc")))
+    _, data2 = get_shared_buffer(key, lambda: ({}, bytearray(b"xyz")))
+    data1[0] = ord("z")
+    assert bytes(data2) == b"zbc"
+
+
+def test_get_shared_buffer_other_process(key: str) -> None:
+    get_shared_buffer(key, lambda: ({"value": "parent"}, b"parent"))
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=read_segment, args=(key, queue))
+    process.start()
+    result = queue.get(timeout=60)
+    process.join()
+    assert result == ({"value": "parent"}, b"parent")
+    assert process.exitcode == 0
+    # The segment is not unlinked when the attached process exits.
+    assert segment_exists(key)
+
+
+def test_get_shared_buffer_owner_exits(key: str) -> None:
+    context = multiprocessing.get_context("spawn")
+    process = context.Process(target=create_segment, args=(key,))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    assert not segment_exists(key)
+
+
+def test_get_shared_buffer_timeout(key: str) -> None:
+    segment = SharedMemory(get_shared_memory_name(key), create=True, size=64)
+    try:
+        with pytest.raises(TimeoutError, match="is not ready after"):
+            get_shared_buffer(key, lambda: ({}, b""), timeout=0.01)
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def test_get_shared_buffer_nested(key: str) -> None:
+    def factory() -> tuple[dict, bytes]:
+        _, data = get_shared_buffer(f"{key}_inner", lambda: ({}, b"inner"))
+        return {}, bytes(data) + b"outer"
+
+    _, data = get_shared_buffer(key, factory)
+    assert bytes(data) == b"innerouter"
+
+
+def test_get_shared_buffer_slow_factory_does_not_block(key: str) -> None:
+    started, release = threading.Event(), threading.Event()
+
+    def slow_factory() -> tuple[dict, bytes]:
+        started.set()
+        release.wait(timeout=10)
+        return {}, b"slow"
+
+    thread = threading.Thread(target=get_shared_buffer, args=(f"{key}_slow", slow_factory))
+    thread.start()
+    try:
+        assert started.wait(timeout=10)
+        # Another segment is created while the slow factory is running.
+        _, data = get_shared_buffer(key, lambda: ({}, b"fast"))
+        assert bytes(data) == b"fast"
+    finally:
+        release.set()
+        thread.join()
+
+
+def test_get_shared_buffer_threads_factory_called_once(key: str) -> None:
+    calls = []
+
+    def factory() -> tuple[dict, bytes]:
+        calls.append(1)
+        time.sleep(0.05)
+        return {}, b"abc"
+
+    threads = [threading.Thread(target=get_shared_buffer, args=(key, factory)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+
+############################################
+#     Tests for get_shared_memory_name     #
+############################################
+
+
+def test_get_shared_memory_name() -> None:
+    name = get_shared_memory_name("key")
+    assert name.startswith(SHARED_MEMORY_PREFIX)
+    assert len(name) <= 30
+
+
+def test_get_shared_memory_name_same_key() -> None:
+    assert get_shared_memory_name("key") == get_shared_memory_name("key")
+
+
+def test_get_shared_memory_name_different_keys() -> None:
+    assert get_shared_memory_name("key1") != get_shared_memory_name("key2")
+
+
+###########################################
+#     Tests for release_shared_memory     #
+###########################################
+
+
+def test_release_shared_memory(key: str) -> None:
+    _, data = get_shared_buffer(key, lambda: ({}, b"abc"))
+    release_shared_memory()
+    assert not segment_exists(key)
+    # The buffers are still valid after the segment is unlinked.
+    assert bytes(data) == b"abc"
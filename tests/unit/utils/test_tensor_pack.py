@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import itertools
+from unittest.mock import patch
+
+import pytest
+from omegaconf import OmegaConf
+
+from hya.imports import is_torch_available
+from hya.testing import torch_available
+from hya.utils.tensor_pack import TensorPack, _concat_buffers, pack_tensors
+
+if is_torch_available():
+    import torch
+
+
+################################
+#     Tests for TensorPack     #
+################################
+
+
+@torch_available
+def test_tensor_pack_values() -> None:
+    tensors = {"a": torch.ones(2, 3), "b": torch.arange(4), "c": torch.tensor([0.5])}
+    pack = TensorPack(tensors)
+    assert len(pack) == 3
+    assert list(pack) == ["a", "b", "c"]
+    for key, tensor in tensors.items():
+        assert pack[key].equal(tensor)
+        assert pack[key].dtype == tensor.dtype
+        assert pack[key].is_contiguous()
+
+
+@torch_available
+def test_tensor_pack_one_buffer_per_dtype() -> None:
+    pack = TensorPack(
+        {
+            "a": torch.ones(2),
+            "b": torch.zeros(3),
+            "c": torch.arange(4),
+            "d": torch.tensor([True, False]),
+        }
+    )
+    buffers = pack.buffers
+    assert set(buffers) == {
+        (torch.device("cpu"), torch.float32),
+        (torch.device("cpu"), torch.int64),
+        (torch.device("cpu"), torch.bool),
+    }
+    buffer = buffers[torch.device("cpu"), torch.float32]
+    assert pack["a"].untyped_storage().data_ptr() == buffer.untyped_storage().data_ptr()
+    assert pack["b"].untyped_storage().data_ptr() == buffer.untyped_storage().data_ptr()
+
+
+@torch_available
+def test_tensor_pack_alignment() -> None:
+    pack = TensorPack({"a": torch.ones(3), "b": torch.ones(5), "c": torch.ones(1)})
+    assert [pack[key].storage_offset() for key in pack] == [0, 16, 32]
+    assert pack["c"].data_ptr() % 64 == pack["a"].data_ptr() % 64
+
+
+@torch_available
+def test_tensor_pack_copies_data() -> None:
+    tensor = torch.ones(3)
+    pack = TensorPack({"a": tensor})
+    tensor.fill_(2.0)
+    assert pack["a"].equal(torch.ones(3))
+
+
+@torch_available
+def test_tensor_pack_non_contiguous() -> None:
+    tensor = torch.arange(6).view(2, 3).t()
+    pack = TensorPack({"a": tensor})
+    assert pack["a"].equal(tensor)
+    assert pack["a"].is_contiguous()
+
+
+@torch_available
+def test_tensor_pack_empty_and_scalar() -> None:
+    pack = TensorPack({"a": torch.ones(0, 2), "b": torch.tensor(1.5)})
+    assert pack["a"].shape == (0, 2)
+    assert pack["b"].shape == ()
+    assert pack["b"].item() == 1.5
+
+
+@torch_available
+def test_tensor_pack_shared_tensor() -> None:
+    tensor = torch.ones(3)
+    pack = TensorPack({"a": tensor, "b": tensor})
+    assert pack["a"] is pack["b"]
+    assert pack.nbytes == 12
+
+
+@torch_available
+def test_tensor_pack_sparse_tensor() -> None:
+    tensor = torch.eye(2).to_sparse()
+    pack = TensorPack({"b": tensor, "a": torch.ones(2)})
+    assert pack["b"] is tensor
+    assert list(pack) == ["b", "a"]
+    assert len(pack.buffers) == 1
+
+
+@torch_available
+def test_tensor_pack_requires_grad() -> None:
+    with pytest.raises(
+        ValueError, match="Cannot pack the tensor 'b' because it requires gradients"
+    ):
+        TensorPack({"a": torch.ones(2), "b": torch.ones(2, requires_grad=True)})
+
+
+@torch_available
+def test_tensor_pack_no_grad_fn() -> None:
+    with torch.enable_grad():
+        pack = TensorPack({"a": torch.ones(2)})
+    assert pack["a"].grad_fn is None
+    assert pack["a"].is_leaf
+    assert not pack["a"].requires_grad
+
+
+@torch_available
+def test_tensor_pack_empty() -> None:
+    pack = TensorPack({})
+    assert len(pack) == 0
+    assert pack.buffers == {}
+    assert pack.nbytes == 0
+
+
+@torch_available
+def test_tensor_pack_missing_key() -> None:
+    with pytest.raises(KeyError, match="missing"):
+        TensorPack({"a": torch.ones(2)})["missing"]
+
+
+@torch_available
+def test_tensor_pack_repr() -> None:
+    assert repr(TensorPack({"a": torch.ones(2), "b": torch.arange(2)})) == (
+        "TensorPack(size=2, num_buffers=2, nbytes=24)"
+    )
+
+
+@torch_available
+def test_tensor_pack_to() -> None:
+    tensor = torch.eye(2).to_sparse()
+    pack = TensorPack({"a": torch.ones(2), "b": torch.arange(3).view(1, 3), "c": tensor})
+    moved = pack.to("meta")
+    assert list(moved) == ["a", "b", "c"]
+    assert set(moved.buffers) == {
+        (torch.device("meta"), torch.float32),
+        (torch.device("meta"), torch.int64),
+    }
+    for key in pack:
+        assert moved[key].device == torch.device("meta")
+        assert moved[key].shape == pack[key].shape
+        assert moved[key].dtype == pack[key].dtype
+    assert pack["a"].device == torch.device("cpu")
+
+
+@torch_available
+def test_tensor_pack_to_merge_devices() -> None:
+    tensors = {
+        "a": torch.arange(3, dtype=torch.float32),
+        "b": torch.ones(5, device="meta"),
+        "c": torch.full((2, 2), 7.0),
+        "d": torch.zeros(1, device="meta"),
+    }
+    pack = TensorPack(tensors)
+    assert len(pack.buffers) == 2
+    moved = pack.to("meta")
+    assert list(moved.buffers) == [(torch.device("meta"), torch.float32)]
+    buffer = moved.buffers[torch.device("meta"), torch.float32]
+    for key, tensor in tensors.items():
+        assert moved[key].device == torch.device("meta")
+        assert moved[key].shape == tensor.shape
+        assert moved[key].untyped_storage().nbytes() == buffer.untyped_storage().nbytes()
+    # The views do not overlap and are inside the buffer.
+    spans = sorted(
+        (moved[key].storage_offset(), moved[key].storage_offset() + moved[key].numel())
+        for key in tensors
+    )
+    assert all(end <= start for (_, end), (start, _) in itertools.pairwise(spans))
+    assert spans[-1][1] <= buffer.numel()
+
+
+@torch_available
+def test_concat_buffers() -> None:
+    buffer, shift = _concat_buffers(torch.arange(3.0), torch.tensor([7.0, 8.0]))
+    assert shift == 16
+    assert buffer[:3].equal(torch.arange(3.0))
+    assert buffer[16:].equal(torch.tensor([7.0, 8.0]))
+
+
+@torch_available
+def test_tensor_pack_to_same_device() -> None:
+    pack = TensorPack({"a": torch.ones(2), "b": torch.eye(2).to_sparse()})
+    assert pack.to("cpu") is pack
+
+
+@torch_available
+def test_tensor_pack_to_one_transfer_per_buffer() -> None:
+    pack = TensorPack({f"layer{i}": torch.full((4,), float(i)) for i in range(100)})
+    buffer = pack.buffers[torch.device("cpu"), torch.float32].clone()
+    with patch.object(torch.Tensor, "to", return_value=buffer) as to:
+        moved = pack.to("cpu", non_blocking=True)
+    to.assert_called_once_with(torch.device("cpu"), non_blocking=True)
+    assert moved.buffers == {(torch.device("cpu"), torch.float32): buffer}
+    assert moved["layer7"].untyped_storage().data_ptr() == buffer.untyped_storage().data_ptr()
+    assert moved["layer7"].equal(torch.full((4,), 7.0))
+
+
+##################################
+#     Tests for pack_tensors     #
+##################################
+
+
+@torch_available
+def test_pack_tensors_config() -> None:
+    data, pack = pack_tensors(
+        OmegaConf.create(
+            {
+                "model": {
+                    "layers": [
+                        {"scale": "${hya.torch.tensor:[1.0, 2.0]}", "name": "layer0"},
+                        {"scale": "${hya.torch.tensor:[3.0]}", "name": "layer1"},
+                    ],
+                    "mask": "${hya.torch.tensor:[true, false]}",
+                },
+                "lr": 0.1,
+            }
+        )
+    )
+    assert sorted(pack) == ["model.layers.0.scale", "model.layers.1.scale", "model.mask"]
+    assert data["lr"] == 0.1
+    assert data["model"]["layers"][0]["name"] == "layer0"
+    assert data["model"]["layers"][0]["scale"] is pack["model.layers.0.scale"]
+    assert data["model"]["layers"][1]["scale"].equal(torch.tensor([3.0]))
+    assert data["model"]["mask"].equal(torch.tensor([True, False]))
+    assert len(pack.buffers) == 2
+
+
+@torch_available
+def test_pack_tensors_list_config() -> None:
+    data, pack = pack_tensors(OmegaConf.create(["${hya.torch.tensor:[1, 2]}", "abc"]))
+    assert data[0].equal(torch.tensor([1, 2]))
+    assert data[1] == "abc"
+    assert list(pack) == ["0"]
+
+
+@torch_available
+def test_pack_tensors_container() -> None:
+    tensor = torch.ones(2)
+    data, pack = pack_tensors({"a": (tensor, 1), "b": {"c": tensor}})
+    assert isinstance(data["a"], tuple)
+    assert data["a"][0] is data["b"]["c"]
+    assert data["a"][1] == 1
+    assert pack.nbytes == 8
+
+
+@torch_available
+def test_pack_tensors_duplicate_path() -> None:
+    with pytest.raises(ValueError, match=r"Two tensors have the same path 'a\.b'"):
+        pack_tensors({"a.b": torch.ones(2), "a": {"b": torch.zeros(2)}})
+
+
+@torch_available
+def test_pack_tensors_no_tensor() -> None:
+    data, pack = pack_tensors(OmegaConf.create({"a": 1, "b": [2, 3]}))
+    assert data == {"a": 1, "b": [2, 3]}
+    assert len(pack) == 0